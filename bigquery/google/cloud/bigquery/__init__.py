@@ -34,9 +34,10 @@ from google.cloud.bigquery.dataset import AccessGrant
 from google.cloud.bigquery.dataset import Dataset
 from google.cloud.bigquery.schema import SchemaField
 from google.cloud.bigquery.table import Table
+from google.cloud.bigquery.writer import StreamingWriter
 
 __all__ = [
     '__version__', 'AccessGrant', 'ArrayQueryParameter', 'Client',
-    'Dataset', 'ScalarQueryParameter', 'SchemaField', 'StructQueryParameter',
-    'Table',
+    'Dataset', 'ScalarQueryParameter', 'SchemaField', 'StreamingWriter',
+    'StructQueryParameter', 'Table',
 ]
@@ -17,16 +17,35 @@
 import base64
 from collections import OrderedDict
 import datetime
+import json
+
+import six
 
 from google.cloud._helpers import UTC
 from google.cloud._helpers import _date_from_iso8601_date
 from google.cloud._helpers import _datetime_from_microseconds
-from google.cloud._helpers import _microseconds_from_datetime
+from google.cloud._helpers import _EPOCH
 from google.cloud._helpers import _RFC3339_NO_FRACTION
 from google.cloud._helpers import _time_from_iso8601_time_naive
 from google.cloud._helpers import _to_bytes
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 _RFC3339_MICROS_NO_ZULU = '%Y-%m-%dT%H:%M:%S.%f'
+_NAIVE_EPOCH = datetime.datetime(1970, 1, 1)
 
 
 def _not_null(value, field):
@@ -152,7 +171,356 @@ def _row_from_json(row, schema):
 
 def _rows_from_json(rows, schema):
     """Convert JSON row data to rows with appropriate types."""
-    return [_row_from_json(row, schema) for row in rows]
+    if not rows:
+        return []
+    return _RowsDecoder(schema).rows(rows)
+
+
+_TRUE_STRINGS = frozenset(['t', 'true', '1'])
+
+
+def _bools_from_json(values):
+    """Coerce non-null JSON values to bools."""
+    return [value.lower() in _TRUE_STRINGS for value in values]
+
+
+def _bytes_values_from_json(values):
+    """Base64-decode non-null JSON values."""
+    return [base64.standard_b64decode(_to_bytes(value)) for value in values]
+
+
+def _timestamps_from_json(values):
+    """Coerce non-null JSON values (float seconds, in UTC) to datetimes."""
+    return [_datetime_from_microseconds(1e6 * float(value))
+            for value in values]
+
+
+def _datetimes_from_json(values):
+    """Coerce non-null JSON values (YYYY-MM-DDTHH:MM:SS) to datetimes."""
+    strptime = datetime.datetime.strptime
+    return [strptime(value, _RFC3339_NO_FRACTION) for value in values]
+
+
+def _dates_from_json(values):
+    """Coerce non-null JSON values (YYYY-MM-DD) to dates."""
+    date = datetime.date
+    return [date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+            for value in values]
+
+
+def _map_values(converter):
+    """Build a converter for non-null values from a single value converter."""
+    return lambda values: list(map(converter, values))
+
+
+_VALUES_FROM_JSON = {
+    'INTEGER': _map_values(int),
+    'INT64': _map_values(int),
+    'FLOAT': _map_values(float),
+    'FLOAT64': _map_values(float),
+    'BOOLEAN': _bools_from_json,
+    'BOOL': _bools_from_json,
+    'STRING': list,
+    'BYTES': _bytes_values_from_json,
+    'TIMESTAMP': _timestamps_from_json,
+    'DATETIME': _datetimes_from_json,
+    'DATE': _dates_from_json,
+    'TIME': _map_values(_time_from_iso8601_time_naive),
+}
+"""Converters from a list of non-null JSON values to native values."""
+
+
+def _column_converter(field):
+    """Build a converter for a column of JSON cell values of a field.
+
+    The converter takes the list of ``'v'`` values of the field in a page
+    of rows and returns the list of native values. Each type's conversion
+    is looked up once, rather than once per cell, and is applied to all the
+    values of a column at once.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field of the column.
+
+    :rtype: callable
+    :returns: The converter for the column.
+    """
+    if field.field_type == 'RECORD':
+        convert_values = _records_converter(field.fields)
+    else:
+        convert_values = _VALUES_FROM_JSON[field.field_type]
+
+    if field.mode == 'REPEATED':
+        return lambda column: _convert_repeated(convert_values, column)
+    elif field.mode == 'NULLABLE':
+        return lambda column: _convert_nullable(convert_values, column)
+    return convert_values
+
+
+def _convert_nullable(convert_values, column):
+    """Convert the values of a column, passing through nulls."""
+    if None not in column:
+        return convert_values(column)
+    values = iter(convert_values(
+        [value for value in column if value is not None]))
+    return [None if value is None else next(values) for value in column]
+
+
+def _convert_repeated(convert_values, column):
+    """Convert the items of a column of arrays, as one list of items."""
+    values = iter(convert_values(
+        [item['v'] for array in column for item in array]))
+    return [[next(values) for _ in array] for array in column]
+
+
+def _records_converter(fields):
+    """Build a converter for non-null JSON records with the given fields."""
+    names = [field.name for field in fields]
+    decoder = _RowsDecoder(fields)
+
+    def convert_records(values):
+        return [dict(zip(names, row)) for row in decoder.rows(values)]
+
+    return convert_records
+
+
+def _numpy_from_column(field, column):
+    """Convert a column of JSON cell values to a NumPy array.
+
+    Scalar numeric and time values are parsed by NumPy directly into typed
+    arrays. Nulls become ``NaN`` (or ``NaT``); an ``INTEGER`` column with
+    nulls is therefore a ``float64`` array.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field of the column.
+
+    :type column: list
+    :param column: The JSON values of the column.
+
+    :rtype: :class:`numpy.ndarray`
+    :returns: The native values, in an array of the field's type or of
+              Python objects.
+    """
+    field_type = field.field_type
+    if field.mode != 'REPEATED':
+        if field_type in ('INTEGER', 'INT64'):
+            if None in column:
+                return numpy.array(column, dtype='float64')
+            return numpy.array(column, dtype='int64')
+        elif field_type in ('FLOAT', 'FLOAT64'):
+            return numpy.array(column, dtype='float64')
+        elif field_type == 'TIMESTAMP':
+            seconds = numpy.array(column, dtype='float64')
+            return (seconds * 1e6).astype('datetime64[us]')
+        elif field_type == 'DATETIME':
+            return numpy.array(column, dtype='datetime64[us]')
+        elif field_type == 'DATE':
+            return numpy.array(column, dtype='datetime64[D]')
+        elif field_type in ('BOOLEAN', 'BOOL') and None not in column:
+            return numpy.array(_bools_from_json(column), dtype='bool')
+
+    values = numpy.empty(len(column), dtype='object')
+    values[:] = _column_converter(field)(column)
+    return values
+
+
+_ARROW_TYPES = {
+    'INTEGER': lambda: pyarrow.int64(),
+    'INT64': lambda: pyarrow.int64(),
+    'FLOAT': lambda: pyarrow.float64(),
+    'FLOAT64': lambda: pyarrow.float64(),
+    'BOOLEAN': lambda: pyarrow.bool_(),
+    'BOOL': lambda: pyarrow.bool_(),
+    'STRING': lambda: pyarrow.string(),
+    'BYTES': lambda: pyarrow.binary(),
+    'TIMESTAMP': lambda: pyarrow.timestamp('us', tz='UTC'),
+    'DATETIME': lambda: pyarrow.timestamp('us'),
+    'DATE': lambda: pyarrow.date32(),
+    'TIME': lambda: pyarrow.time64('us'),
+}
+"""Factories of the Arrow type of each scalar field type."""
+
+_ARROW_FROM_NUMPY = frozenset([
+    'INTEGER', 'INT64', 'FLOAT', 'FLOAT64', 'TIMESTAMP', 'DATETIME', 'DATE'])
+"""Field types whose Arrow arrays are built from typed NumPy arrays."""
+
+
+def _arrow_type(field):
+    """Get the Arrow type of a field.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field.
+
+    :rtype: :class:`pyarrow.DataType`
+    :returns: The type of the field's values.
+    """
+    if field.field_type == 'RECORD':
+        arrow_type = pyarrow.struct([
+            pyarrow.field(subfield.name, _arrow_type(subfield))
+            for subfield in field.fields])
+    else:
+        arrow_type = _ARROW_TYPES[field.field_type]()
+    if field.mode == 'REPEATED':
+        arrow_type = pyarrow.list_(arrow_type)
+    return arrow_type
+
+
+def _arrow_from_column(field, column):
+    """Convert a column of JSON cell values to an Arrow array.
+
+    Unlike with :func:`_numpy_from_column`, nulls stay nulls, and
+    ``INTEGER`` columns with nulls stay integers.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field of the column.
+
+    :type column: list
+    :param column: The JSON values of the column.
+
+    :rtype: :class:`pyarrow.Array`
+    :returns: The native values, in an array of the field's type.
+    """
+    arrow_type = _arrow_type(field)
+    if (field.mode == 'REPEATED' or
+            field.field_type not in _ARROW_FROM_NUMPY):
+        return pyarrow.array(_column_converter(field)(column),
+                             type=arrow_type)
+
+    mask = None
+    if None in column:
+        mask = numpy.array([value is None for value in column], dtype='bool')
+        if field.field_type in ('INTEGER', 'INT64'):
+            column = [0 if value is None else value for value in column]
+    return pyarrow.array(_numpy_from_column(field, column),
+                         type=arrow_type, mask=mask)
+
+
+class _RowsDecoder(object):
+    """Decode pages of JSON rows column by column.
+
+    The conversion for each field of the schema is looked up once, when
+    the decoder is created, so a decoder should be reused for every page of
+    rows with the same schema.
+
+    :type schema: list of :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param schema: The schema of the rows.
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self._converters = [_column_converter(field) for field in schema]
+
+    def _json_columns(self, rows):
+        """Transpose JSON rows to lists of JSON values, one per field."""
+        if not rows:
+            return [[] for _ in self.schema]
+        cells = [row['f'] for row in rows]
+        return [[row_cells[index]['v'] for row_cells in cells]
+                for index in six.moves.range(len(self.schema))]
+
+    def columns(self, rows):
+        """Decode JSON rows to one list of native values per field.
+
+        :type rows: list of dict
+        :param rows: JSON rows, as in the ``rows`` of an API response.
+
+        :rtype: list of list
+        :returns: The native values of each field, in schema order.
+        """
+        columns = self._json_columns(rows)
+        return [convert(column)
+                for convert, column in zip(self._converters, columns)]
+
+    def rows(self, rows):
+        """Decode JSON rows to tuples of native values.
+
+        :type rows: list of dict
+        :param rows: JSON rows, as in the ``rows`` of an API response.
+
+        :rtype: list of tuple
+        :returns: The native values of each row.
+        """
+        if not rows:
+            return []
+        return list(zip(*self.columns(rows)))
+
+    def to_numpy(self, rows):
+        """Decode JSON rows to one NumPy array per field.
+
+        Requires :mod:`numpy`.
+
+        :type rows: list of dict
+        :param rows: JSON rows, as in the ``rows`` of an API response.
+
+        :rtype: :class:`collections.OrderedDict`
+        :returns: The array of each field, keyed by field name, in schema
+                  order.
+        """
+        columns = self._json_columns(rows)
+        return OrderedDict(
+            (field.name, _numpy_from_column(field, column))
+            for field, column in zip(self.schema, columns))
+
+    def to_dataframe(self, rows):
+        """Decode JSON rows to a DataFrame.
+
+        Requires :mod:`pandas`. ``TIMESTAMP`` columns are time zone aware,
+        in UTC.
+
+        :type rows: list of dict
+        :param rows: JSON rows, as in the ``rows`` of an API response.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: A DataFrame with one column per field.
+        """
+        return _dataframe_from_numpy(self.schema, self.to_numpy(rows))
+
+    def arrow_schema(self):
+        """Get the Arrow schema of the decoded rows.
+
+        Requires :mod:`pyarrow`.
+
+        :rtype: :class:`pyarrow.Schema`
+        :returns: The Arrow schema, with one field per schema field.
+        """
+        return pyarrow.schema([
+            pyarrow.field(field.name, _arrow_type(field))
+            for field in self.schema])
+
+    def to_arrow(self, rows):
+        """Decode JSON rows to an Arrow record batch.
+
+        Requires :mod:`pyarrow`.
+
+        :type rows: list of dict
+        :param rows: JSON rows, as in the ``rows`` of an API response.
+
+        :rtype: :class:`pyarrow.RecordBatch`
+        :returns: A record batch with one typed column per field.
+        """
+        columns = self._json_columns(rows)
+        return pyarrow.RecordBatch.from_arrays(
+            [_arrow_from_column(field, column)
+             for field, column in zip(self.schema, columns)],
+            [field.name for field in self.schema])
+
+
+def _dataframe_from_numpy(schema, arrays):
+    """Build a DataFrame from the NumPy arrays of each field.
+
+    :type schema: list of :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param schema: The schema of the rows.
+
+    :type arrays: :class:`collections.OrderedDict`
+    :param arrays: The array of each field, keyed by field name.
+
+    :rtype: :class:`pandas.DataFrame`
+    :returns: A DataFrame with one column per field.
+    """
+    frame = pandas.DataFrame(arrays, columns=list(arrays))
+    for field in schema:
+        if field.field_type == 'TIMESTAMP' and field.mode != 'REPEATED':
+            frame[field.name] = frame[field.name].dt.tz_localize('UTC')
+    return frame
 
 
 def _int_to_json(value):
@@ -201,7 +569,14 @@ def _timestamp_to_json_row(value):
     This version returns floating-point seconds value used in row data.
     """
     if isinstance(value, datetime.datetime):
-        value = _microseconds_from_datetime(value) * 1e-6
+        # Same result as ``_microseconds_from_datetime(value) * 1e-6``,
+        # without a round trip through a time tuple.
+        if value.tzinfo is None:
+            delta = value - _NAIVE_EPOCH
+        else:
+            delta = value - _EPOCH
+        value = ((delta.days * 86400 + delta.seconds) * 1000000 +
+                 delta.microseconds) * 1e-6
     return value
 
 
@@ -247,6 +622,188 @@ _SCALAR_VALUE_TO_JSON_PARAM = _SCALAR_VALUE_TO_JSON_ROW.copy()
 _SCALAR_VALUE_TO_JSON_PARAM['TIMESTAMP'] = _timestamp_to_json_parameter
 
 
+def _json_converter(field):
+    """Build a converter for the native values of a field to JSON values.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field of the values.
+
+    :rtype: callable
+    :returns: The converter for a single value, or ``None`` if the values
+              need no conversion.
+    """
+    if field.field_type == 'RECORD':
+        convert = _record_to_json_converter(field.fields)
+    else:
+        convert = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
+        if convert is None:  # STRING doesn't need converting
+            return None
+
+    if field.mode == 'REPEATED':
+        return lambda values: _repeated_to_json(convert, values)
+    return convert
+
+
+def _repeated_to_json(convert, values):
+    """Convert the items of an array, passing through a null array."""
+    if values is None:
+        return None
+    return [convert(value) for value in values]
+
+
+def _record_to_json_converter(fields):
+    """Build a converter for records (mappings or tuples) with the fields."""
+    names = [field.name for field in fields]
+    converters = dict(
+        (field.name, _json_converter(field)) for field in fields)
+
+    def convert_record(value):
+        if value is None:
+            return None
+        if not isinstance(value, dict):
+            value = dict(zip(names, value))
+        record = {}
+        for name, item in six.iteritems(value):
+            convert = converters.get(name)
+            record[name] = item if convert is None else convert(item)
+        return record
+
+    return convert_record
+
+
+def _column_from_series(field, series):
+    """Get the values of a :class:`pandas.Series`, with ``None`` for nulls.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field of the values.
+
+    :type series: :class:`pandas.Series`
+    :param series: The values.
+
+    :rtype: list
+    :returns: The native values.
+    """
+    if field.field_type == 'TIMESTAMP' and series.dtype.kind == 'M':
+        # Convert to float seconds in one pass, rather than through a
+        # ``pandas.Timestamp`` per value.
+        micros = series.values.astype('datetime64[us]').astype('int64')
+        values = (micros * 1e-6).tolist()
+    elif field.field_type == 'DATE' and series.dtype.kind == 'M':
+        # pandas stores dates as datetimes (at midnight).
+        values = series.dt.date.tolist()
+    else:
+        values = series.tolist()
+    nulls = series.isnull()
+    if field.field_type in _INTEGER_TYPES and series.dtype.kind == 'f':
+        # pandas stores integers as floats in columns with nulls.
+        values = [None if null else int(value)
+                  for value, null in zip(values, nulls.tolist())]
+    elif nulls.any():
+        values = [None if null else value
+                  for value, null in zip(values, nulls.tolist())]
+    return values
+
+
+_INTEGER_TYPES = frozenset(['INTEGER', 'INT64'])
+
+
+def _json_bytes(value):
+    """Serialize a JSON value compactly, as ASCII bytes.
+
+    :type value: dict
+    :param value: The value, e.g. the body of a request.
+
+    :rtype: bytes
+    :returns: The JSON document, without insignificant whitespace.
+    """
+    return json.dumps(value, separators=(',', ':')).encode('ascii')
+
+
+class _RowsEncoder(object):
+    """Encode rows of native values as JSON rows, column by column.
+
+    The mirror image of :class:`_RowsDecoder`, for ``insertAll`` requests.
+    The conversion for each field of the schema is looked up once, when the
+    encoder is created, and is applied to all the values of a column at
+    once.
+
+    Rows can be given as tuples of values in schema order, as mappings of
+    values keyed by field name, or as columns: a mapping of the sequence of
+    values of each field, keyed by field name (all of the same length), or
+    a :class:`pandas.DataFrame`. Missing fields are null; values of names
+    not in the schema are ignored.
+
+    :type schema: list of :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param schema: The schema of the rows.
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self._names = [field.name for field in schema]
+        self._converters = [_json_converter(field) for field in schema]
+
+    def _native_columns(self, rows):
+        """Transpose rows to lists of native values, one per field."""
+        if pandas is not None and isinstance(rows, pandas.DataFrame):
+            return [_column_from_series(field, rows[field.name])
+                    if field.name in rows else [None] * len(rows)
+                    for field in self.schema]
+
+        if isinstance(rows, dict):
+            lengths = set(len(column) for column in rows.values())
+            if len(lengths) > 1:
+                raise ValueError(
+                    'Columns have different lengths: %s' % (
+                        ', '.join('%s=%d' % (name, len(column))
+                                  for name, column in sorted(rows.items())),))
+            num_rows = lengths.pop() if lengths else 0
+            return [list(rows[name]) if name in rows
+                    else [None] * num_rows for name in self._names]
+
+        if not isinstance(rows, (list, tuple)):
+            rows = list(rows)
+        if not rows:
+            return [[] for _ in self._names]
+        if isinstance(rows[0], dict):
+            return [[row.get(name) for row in rows] for name in self._names]
+        try:
+            return [[row[index] for row in rows]
+                    for index in six.moves.range(len(self._names))]
+        except IndexError:  # A row has fewer values than the schema.
+            return [[row[index] if index < len(row) else None
+                     for row in rows]
+                    for index in six.moves.range(len(self._names))]
+
+    def columns(self, rows):
+        """Encode rows to one list of JSON values per field.
+
+        :type rows: list of tuple, list of dict, dict of list or
+                    :class:`pandas.DataFrame`
+        :param rows: The rows to encode.
+
+        :rtype: list of list
+        :returns: The JSON values of each field, in schema order.
+        """
+        columns = self._native_columns(rows)
+        return [column if convert is None else list(map(convert, column))
+                for convert, column in zip(self._converters, columns)]
+
+    def rows(self, rows):
+        """Encode rows to JSON rows.
+
+        :type rows: list of tuple, list of dict, dict of list or
+                    :class:`pandas.DataFrame`
+        :param rows: The rows to encode.
+
+        :rtype: list of dict
+        :returns: The JSON values of each row, keyed by field name, as in
+                  the ``json`` of the rows of an ``insertAll`` request.
+        """
+        names = self._names
+        return [dict(zip(names, values))
+                for values in zip(*self.columns(rows))]
+
+
 class _ConfigurationProperty(object):
     """Base property implementation.
 
@@ -678,3 +1235,70 @@ class QueryParametersProperty(object):
             raise ValueError(
                 "query parameters must be derived from AbstractQueryParameter")
         instance._query_parameters = tuple(value)
+
+
+def _numpy_from_pages(pages):
+    """Decode pages of JSON rows to one NumPy array per field.
+
+    :type pages: iterable
+    :param pages: ``(decoder, rows)`` pairs, one per page: the
+                  :class:`_RowsDecoder` for the schema of the page, and its
+                  JSON rows. There must be at least one page.
+
+    :rtype: tuple
+    :returns: The decoder of the last page and a
+              :class:`collections.OrderedDict` holding the array of each
+              field, keyed by field name, with the values of all the pages.
+    """
+    page_arrays = []
+    for decoder, rows in pages:
+        page_arrays.append(decoder.to_numpy(rows))
+    arrays = OrderedDict(
+        (name, numpy.concatenate([page[name] for page in page_arrays]))
+        for name in page_arrays[-1])
+    return decoder, arrays
+
+
+def _dataframe_from_pages(pages):
+    """Decode pages of JSON rows to one DataFrame.
+
+    :type pages: iterable
+    :param pages: ``(decoder, rows)`` pairs, as for
+                  :func:`_numpy_from_pages`.
+
+    :rtype: :class:`pandas.DataFrame`
+    :returns: A DataFrame with one column per field.
+
+    :raises ValueError: If :mod:`pandas` is not installed.
+    """
+    if pandas is None:
+        raise ValueError(
+            'Decoding rows to a DataFrame requires pandas: install '
+            'google-cloud-bigquery[pandas].')
+    decoder, arrays = _numpy_from_pages(pages)
+    return _dataframe_from_numpy(decoder.schema, arrays)
+
+
+def _arrow_from_pages(pages):
+    """Decode pages of JSON rows to one Arrow table.
+
+    Each page becomes one record batch (chunk) of the table, so the pages
+    are not copied again to join them.
+
+    :type pages: iterable
+    :param pages: ``(decoder, rows)`` pairs, as for
+                  :func:`_numpy_from_pages`.
+
+    :rtype: :class:`pyarrow.Table`
+    :returns: A table with one column per field.
+
+    :raises ValueError: If :mod:`pyarrow` is not installed.
+    """
+    if pyarrow is None:
+        raise ValueError(
+            'Decoding rows to an Arrow table requires pyarrow: install '
+            'google-cloud-bigquery[pyarrow].')
+    batches = []
+    for decoder, rows in pages:
+        batches.append(decoder.to_arrow(rows))
+    return pyarrow.Table.from_batches(batches, schema=decoder.arrow_schema())
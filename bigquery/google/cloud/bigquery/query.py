@@ -20,7 +20,9 @@ from google.cloud.bigquery._helpers import _TypedProperty
 from google.cloud.bigquery._helpers import _rows_from_json
 from google.cloud.bigquery.dataset import Dataset
 from google.cloud.bigquery.job import QueryJob
+from google.cloud.bigquery.table import RowIterator
 from google.cloud.bigquery.table import _parse_schema_resource
+from google.cloud.bigquery.table import _rows_page_start
 from google.cloud.bigquery._helpers import QueryParametersProperty
 from google.cloud.bigquery._helpers import UDFResourcesProperty
 
@@ -437,3 +439,110 @@ class QueryResults(object):
         rows_data = _rows_from_json(response.get('rows', ()), self.schema)
 
         return rows_data, total_rows, page_token
+
+    def _rows_page_start(self, iterator, page, response):
+        """Update from each page of a :meth:`_row_iterator`.
+
+        :type iterator: :class:`~google.cloud.bigquery.table.RowIterator`
+        :param iterator: The iterator that is currently in use.
+
+        :type page: :class:`~google.cloud.iterator.Page`
+        :param page: The page that was just created.
+
+        :type response: dict
+        :param response: The JSON API response for a page of results.
+
+        :raises: ValueError if the query is not complete.
+        """
+        self._set_properties(response)
+        if not self.complete:
+            raise ValueError('Query not yet complete:  pass a longer '
+                             "'timeout_ms', or wait for the job to finish")
+        if iterator.schema is None:
+            iterator.schema = self.schema
+        _rows_page_start(iterator, page, response)
+
+    def _row_iterator(self, max_results, start_index, timeout_ms, client):
+        """Build an iterator over all the pages of result data.
+
+        :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
+        :returns: An iterator, with the arguments of :meth:`fetch_data`.
+        :raises: ValueError if the query has not yet been executed.
+        """
+        if self.name is None:
+            raise ValueError("Query not yet executed:  call 'run()'")
+
+        client = self._require_client(client)
+        params = {}
+
+        if start_index is not None:
+            params['startIndex'] = start_index
+
+        if timeout_ms is not None:
+            params['timeoutMs'] = timeout_ms
+
+        path = '/projects/%s/queries/%s' % (self.project, self.name)
+        return RowIterator(client, path, self.schema,
+                           max_results=max_results, extra_params=params,
+                           page_start=self._rows_page_start)
+
+    def to_dataframe(self, max_results=None, start_index=None,
+                     timeout_ms=None, client=None):
+        """API call:  fetch all the query result data into a DataFrame
+
+        Fetches every page of results, as :meth:`fetch_data` does for one
+        page, and decodes them column by column. Requires :mod:`pandas`.
+        See :meth:`~google.cloud.bigquery.table.RowIterator.to_dataframe`.
+
+        :type max_results: int
+        :param max_results: (Optional) maximum number of rows to return.
+
+        :type start_index: int
+        :param start_index: (Optional) zero-based index of starting row
+
+        :type timeout_ms: int
+        :param timeout_ms: (Optional) How long to wait for the query to
+                           complete, in milliseconds, on each request.
+
+        :type client: :class:`~google.cloud.bigquery.client.Client` or
+                      ``NoneType``
+        :param client: the client to use.  If not passed, falls back to the
+                       ``client`` stored on the current dataset.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: A DataFrame with one column per field of the schema.
+        :raises: ValueError if the query has not yet been executed or is not
+                 complete, or if :mod:`pandas` is not installed.
+        """
+        return self._row_iterator(
+            max_results, start_index, timeout_ms, client).to_dataframe()
+
+    def to_arrow(self, max_results=None, start_index=None, timeout_ms=None,
+                 client=None):
+        """API call:  fetch all the query result data into an Arrow table
+
+        Like :meth:`to_dataframe`, but requires :mod:`pyarrow`. See
+        :meth:`~google.cloud.bigquery.table.RowIterator.to_arrow`.
+
+        :type max_results: int
+        :param max_results: (Optional) maximum number of rows to return.
+
+        :type start_index: int
+        :param start_index: (Optional) zero-based index of starting row
+
+        :type timeout_ms: int
+        :param timeout_ms: (Optional) How long to wait for the query to
+                           complete, in milliseconds, on each request.
+
+        :type client: :class:`~google.cloud.bigquery.client.Client` or
+                      ``NoneType``
+        :param client: the client to use.  If not passed, falls back to the
+                       ``client`` stored on the current dataset.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: A table with one column per field of the schema.
+        :raises: ValueError if the query has not yet been executed or is not
+                 complete, or if :mod:`pyarrow` is not installed.
+        """
+        return self._row_iterator(
+            max_results, start_index, timeout_ms, client).to_arrow()
@@ -14,15 +14,24 @@
 
 """Define API Datasets."""
 
+import collections
+import concurrent.futures
+import csv
 import datetime
+import itertools
 import json
 import os
+import zlib
 
 import httplib2
 import six
 
 from google.cloud._helpers import _datetime_from_microseconds
 from google.cloud._helpers import _millis_from_datetime
+from google.cloud._helpers import _to_bytes
+from google.cloud._http import DEFAULT_POOL_SIZE
+from google.cloud._http import PooledHttp
+from google.cloud._http import _max_concurrent_requests
 from google.cloud.exceptions import NotFound
 from google.cloud.exceptions import make_exception
 from google.cloud.iterator import HTTPIterator
@@ -32,12 +41,28 @@ from google.cloud.streaming.http_wrapper import make_api_request
 from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
 from google.cloud.streaming.transfer import Upload
 from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery._http import Connection
+from google.cloud.bigquery._helpers import _arrow_from_pages
+from google.cloud.bigquery._helpers import _dataframe_from_pages
+from google.cloud.bigquery._helpers import _json_bytes
 from google.cloud.bigquery._helpers import _row_from_json
-from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_ROW
+from google.cloud.bigquery._helpers import _RowsDecoder
+from google.cloud.bigquery._helpers import _RowsEncoder
 
 
 _TABLE_HAS_NO_SCHEMA = "Table has no schema:  call 'table.reload()'"
 _MARKER = object()
+_SHARDS_PER_WORKER = 4
+"""Default number of shards per worker of :meth:`Table.fetch_data_parallel`.
+
+Smaller shards keep the workers busy until the end of the read."""
+_MIN_SHARD_ROWS = 10000
+"""Minimum default shard size of :meth:`Table.fetch_data_parallel`."""
+_UPLOAD_CONTENT_TYPE = 'application/octet-stream'
+_LOAD_BATCH_ROWS = 1000
+"""Rows serialized at a time by :meth:`Table.load_from_iterable`."""
+_LOAD_CHUNKSIZE = 1 << 20
+"""Bytes sent per request by :meth:`Table.load_from_iterable`."""
 
 
 class Table(object):
@@ -666,26 +691,99 @@ class Table(object):
         :param client: (Optional) The client to use.  If not passed, falls
                        back to the ``client`` stored on the current dataset.
 
-        :rtype: :class:`~google.cloud.iterator.Iterator`
+        :rtype: :class:`RowIterator`
         :returns: Iterator of row data :class:`tuple`s. During each page, the
                   iterator will have the ``total_rows`` attribute set,
                   which counts the total number of rows **in the table**
                   (this is distinct from the total number of rows in the
-                  current page: ``iterator.page.num_items``).
+                  current page: ``iterator.page.num_items``). Call its
+                  :meth:`~RowIterator.to_dataframe` or
+                  :meth:`~RowIterator.to_arrow` method to get all the rows
+                  at once instead.
         """
         if len(self._schema) == 0:
             raise ValueError(_TABLE_HAS_NO_SCHEMA)
 
         client = self._require_client(client)
         path = '%s/data' % (self.path,)
-        iterator = HTTPIterator(client=client, path=path,
-                                item_to_value=_item_to_row, items_key='rows',
-                                page_token=page_token, max_results=max_results,
-                                page_start=_rows_page_start)
-        iterator.schema = self._schema
-        # Over-ride the key used to retrieve the next page token.
-        iterator._NEXT_TOKEN = 'pageToken'
-        return iterator
+        return RowIterator(client, path, self._schema,
+                           page_token=page_token, max_results=max_results)
+
+    def fetch_data_parallel(self, max_workers=None, shard_size=None,
+                            ordered=True, client=None):
+        """API call:  fetch the table data in shards, concurrently
+
+        See:
+        https://cloud.google.com/bigquery/docs/reference/rest/v2/tabledata/list
+
+        Splits the ``num_rows`` rows of the table into shards of
+        consecutive rows, and fetches each shard (starting at its
+        ``startIndex``) in a pool of threads. Only the rows counted in
+        ``num_rows`` are read: if it is not known, the table is reloaded
+        first.
+
+        A single :class:`httplib2.Http` is not thread-safe, so unless the
+        client's ``_http`` is a :class:`~google.cloud._http.PooledHttp`,
+        the shards are fetched through a new pool of HTTP objects
+        authorized with the client's credentials, one per worker.
+
+        .. note::
+
+           Like :meth:`fetch_data`, this method assumes that the table's
+           ``schema`` is up-to-date.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of shards fetched
+                            at once. Defaults to the size of the client's
+                            ``PooledHttp`` if it uses one, otherwise to
+                            :data:`~google.cloud._http.DEFAULT_POOL_SIZE`.
+
+        :type shard_size: int
+        :param shard_size: (Optional) The number of rows in each shard.
+                           Defaults to enough to give each worker a few
+                           shards, but at least 10000 rows.
+
+        :type ordered: bool
+        :param ordered: (Optional) If False, yield the rows of each shard as
+                        soon as it is fetched, rather than in table order.
+                        The rows within a shard are always in order.
+
+        :type client: :class:`~google.cloud.bigquery.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls
+                       back to the ``client`` stored on the current dataset.
+
+        :rtype: :class:`~types.GeneratorType`
+        :returns: A generator of row data :class:`tuple`s. At most
+                  ``2 * max_workers`` fetched shards are held at once.
+        """
+        client = self._require_client(client)
+        if self.num_rows is None:
+            self.reload(client=client)
+        if len(self._schema) == 0:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+
+        if max_workers is None:
+            max_workers = _max_concurrent_requests(
+                client, default=DEFAULT_POOL_SIZE)
+        if not isinstance(client._http, PooledHttp):
+            client = _PooledClient(client, PooledHttp.from_credentials(
+                client._credentials, size=max_workers))
+        num_rows = self.num_rows or 0
+        if shard_size is None:
+            shard_size = max(_MIN_SHARD_ROWS, -(-num_rows // (
+                _SHARDS_PER_WORKER * max_workers)))
+        shards = [(start, min(shard_size, num_rows - start))
+                  for start in six.moves.range(0, num_rows, shard_size)]
+
+        path = '%s/data' % (self.path,)
+        schema = self._schema
+
+        def fetch_shard(start, count):
+            iterator = RowIterator(client, path, schema, max_results=count,
+                                   extra_params={'startIndex': start})
+            return list(iterator)
+
+        return _fetch_shards(fetch_shard, shards, max_workers, ordered)
 
     def insert_data(self,
                     rows,
@@ -699,10 +797,13 @@ class Table(object):
         See:
         https://cloud.google.com/bigquery/docs/reference/rest/v2/tabledata/insertAll
 
-        :type rows: list of tuples
+        :type rows: list of tuples, list of dicts, dict of lists or
+                    :class:`pandas.DataFrame`
         :param rows: Row data to be inserted. Each tuple should contain data
                      for each schema field on the current table and in the
-                     same order as the schema fields.
+                     same order as the schema fields. Each dict maps field
+                     names to values. A dict of lists (or a DataFrame) holds
+                     the column of values of each field, keyed by name.
 
         :type row_ids: list of string
         :param row_ids: Unique ids, one per row being inserted.  If not
@@ -731,29 +832,83 @@ class Table(object):
                   identifies the row, and the "errors" key contains a list
                   of the mappings describing one or more problems with the
                   row.
-        :raises: ValueError if table's schema is not set
+        :raises: ValueError if table's schema is not set, or if
+                 ``row_ids`` is passed but does not have one id per row
         """
         if len(self._schema) == 0:
             raise ValueError(_TABLE_HAS_NO_SCHEMA)
 
-        client = self._require_client(client)
-        rows_info = []
-        data = {'rows': rows_info}
+        rows_info = [{'json': row_info}
+                     for row_info in _RowsEncoder(self._schema).rows(rows)]
+        if row_ids is not None:
+            if len(row_ids) != len(rows_info):
+                raise ValueError(
+                    'Expected %d row ids, got %d' % (
+                        len(rows_info), len(row_ids)))
+            for info, row_id in zip(rows_info, row_ids):
+                info['insertId'] = row_id
 
-        for index, row in enumerate(rows):
-            row_info = {}
+        return self._insert_all(
+            rows_info, skip_invalid_rows=skip_invalid_rows,
+            ignore_unknown_values=ignore_unknown_values,
+            template_suffix=template_suffix, client=client)
 
-            for field, value in zip(self._schema, row):
-                converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
-                if converter is not None:  # STRING doesn't need converting
-                    value = converter(value)
-                row_info[field.name] = value
+    def streaming_writer(self, client=None, **kwargs):
+        """Create a buffer which inserts rows written to it in batches.
 
-            info = {'json': row_info}
-            if row_ids is not None:
-                info['insertId'] = row_ids[index]
+        See :class:`~google.cloud.bigquery.writer.StreamingWriter`.
 
-            rows_info.append(info)
+        :type client: :class:`~google.cloud.bigquery.client.Client` or
+                      ``NoneType``
+        :param client: the client to use.  If not passed, falls back to the
+                       ``client`` stored on the current dataset.
+
+        :type kwargs: dict
+        :param kwargs: Remaining keyword arguments to pass to the
+                       :class:`~google.cloud.bigquery.writer.StreamingWriter`
+                       constructor.
+
+        :rtype: :class:`~google.cloud.bigquery.writer.StreamingWriter`
+        :returns: A new writer, with its background thread started.
+        :raises: ValueError if table's schema is not set
+        """
+        from google.cloud.bigquery.writer import StreamingWriter
+
+        return StreamingWriter(self, client=client, **kwargs)
+
+    def _insert_all(self, rows_info, skip_invalid_rows=None,
+                    ignore_unknown_values=None, template_suffix=None,
+                    client=None):
+        """Send rows already converted to JSON in an ``insertAll`` request.
+
+        Helper for :meth:`insert_data` and
+        :class:`~google.cloud.bigquery.writer.StreamingWriter`.
+
+        :type rows_info: list of dict
+        :param rows_info: The ``rows`` of the request: mappings with the
+                          ``json`` row and optionally its ``insertId``.
+
+        :type skip_invalid_rows: bool
+        :param skip_invalid_rows: (Optional) skip rows w/ invalid data?
+
+        :type ignore_unknown_values: bool
+        :param ignore_unknown_values: (Optional) ignore columns beyond schema?
+
+        :type template_suffix: str
+        :param template_suffix: (Optional) treat ``name`` as a template table
+                                and provide a suffix.
+
+        :type client: :class:`~google.cloud.bigquery.client.Client` or
+                      ``NoneType``
+        :param client: the client to use.  If not passed, falls back to the
+                       ``client`` stored on the current dataset.
+
+        :rtype: list of mappings
+        :returns: One mapping per row with insert errors, as returned by
+                  :meth:`insert_data`.
+        """
+        client = self._require_client(client)
+        data = {'rows': rows_info}
 
         if skip_invalid_rows is not None:
             data['skipInvalidRows'] = skip_invalid_rows
@@ -764,10 +919,13 @@ class Table(object):
         if template_suffix is not None:
             data['templateSuffix'] = template_suffix
 
+        # Serialize the body here, in one pass and without whitespace,
+        # rather than leaving it to ``api_request``.
         response = client._connection.api_request(
             method='POST',
             path='%s/insertAll' % self.path,
-            data=data)
+            data=_json_bytes(data),
+            content_type='application/json')
         errors = []
 
         for error in response.get('insertErrors', ()):
@@ -803,7 +961,8 @@ class Table(object):
                          quote_character=None,
                          skip_leading_rows=None,
                          write_disposition=None,
-                         client=None):
+                         client=None,
+                         adaptive_chunksize=False):
         """Upload the contents of this table from a file-like object.
 
         The content type of the upload will either be
@@ -876,6 +1035,13 @@ class Table(object):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the current dataset.
 
+        :type adaptive_chunksize: bool
+        :param adaptive_chunksize: (Optional) If True, the chunks of a
+                                   resumable upload are sized from the
+                                   measured throughput (see
+                                   :class:`~.streaming.transfer.Upload`)
+                                   rather than fixed. Defaults to False.
+
         :rtype: :class:`google.cloud.bigquery.jobs.LoadTableFromStorageJob`
         :returns: the job instance used to load the data (e.g., for
                   querying status). Note that the job is already started:
@@ -884,10 +1050,6 @@ class Table(object):
                  be determined, or if the ``file_obj`` can be detected to be
                  a file opened in text mode.
         """
-        client = self._require_client(client)
-        connection = client._connection
-        content_type = 'application/octet-stream'
-
         # Rewind the file if desired.
         if rewind:
             file_obj.seek(0, os.SEEK_SET)
@@ -907,13 +1069,192 @@ class Table(object):
             else:
                 raise ValueError('total bytes could not be determined. Please '
                                  'pass an explicit size.')
-        headers = {
-            'Accept': 'application/json',
-            'Accept-Encoding': 'gzip, deflate',
-            'User-Agent': connection.USER_AGENT,
-            'content-type': 'application/json',
-        }
 
+        metadata = self._load_metadata(source_format)
+        _configure_job_metadata(metadata, allow_jagged_rows,
+                                allow_quoted_newlines, create_disposition,
+                                encoding, field_delimiter,
+                                ignore_unknown_values, max_bad_records,
+                                quote_character, skip_leading_rows,
+                                write_disposition)
+
+        upload = Upload(file_obj, _UPLOAD_CONTENT_TYPE, total_bytes,
+                        auto_transfer=False, memory_map=True,
+                        adaptive_chunksize=adaptive_chunksize)
+        return self._upload(upload, metadata, num_retries, client)
+    # pylint: enable=too-many-arguments,too-many-locals
+
+    def load_from_iterable(self, rows,
+                           source_format='NEWLINE_DELIMITED_JSON',
+                           compression=None,
+                           num_retries=6,
+                           create_disposition=None,
+                           ignore_unknown_values=None,
+                           max_bad_records=None,
+                           write_disposition=None,
+                           client=None,
+                           adaptive_chunksize=False):
+        """Load rows into this table, streaming them to a load job.
+
+        The rows are serialized (and optionally compressed) a batch at a
+        time, as the upload reads them: no temporary file is written and
+        the whole upload is never held in memory.
+
+        :type rows: iterable of tuples or dicts
+        :param rows: Row data to be loaded, as for :meth:`insert_data`: each
+                     tuple holds the value of each schema field, in schema
+                     order; each dict maps field names to values.
+
+        :type source_format: str
+        :param source_format: The format the rows are serialized to: one of
+                              'NEWLINE_DELIMITED_JSON' (the default) or
+                              'CSV' (for schemas without ``RECORD`` or
+                              ``REPEATED`` fields).
+
+        :type compression: str
+        :param compression: (Optional) One of the values of
+                            :class:`~google.cloud.bigquery.job.Compression`:
+                            'GZIP' to compress the upload.
+
+        :type num_retries: int
+        :param num_retries: Number of upload retries. Defaults to 6.
+
+        :type create_disposition: str
+        :param create_disposition: job configuration option; see
+                                   :meth:`google.cloud.bigquery.job.LoadJob`.
+
+        :type ignore_unknown_values: bool
+        :param ignore_unknown_values: job configuration option; see
+                                      :meth:`google.cloud.bigquery.job.LoadJob`.
+
+        :type max_bad_records: int
+        :param max_bad_records: job configuration option; see
+                                :meth:`google.cloud.bigquery.job.LoadJob`.
+
+        :type write_disposition: str
+        :param write_disposition: job configuration option; see
+                                  :meth:`google.cloud.bigquery.job.LoadJob`.
+
+        :type client: :class:`~google.cloud.bigquery.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current dataset.
+
+        :type adaptive_chunksize: bool
+        :param adaptive_chunksize: (Optional) If True, the chunks of a
+                                   resumable upload are sized from the
+                                   measured throughput (see
+                                   :class:`~.streaming.transfer.Upload`)
+                                   rather than fixed. Defaults to False.
+
+        :rtype: :class:`google.cloud.bigquery.jobs.LoadTableFromStorageJob`
+        :returns: the job instance used to load the data (e.g., for
+                  querying status). Note that the job is already started:
+                  do not call ``job.begin()``.
+        :raises: ValueError if table's schema is not set, or if the format
+                 or compression is not supported.
+        """
+        return self._load_from_batches(
+            _batches(rows, _LOAD_BATCH_ROWS), source_format, compression,
+            num_retries, create_disposition, ignore_unknown_values,
+            max_bad_records, write_disposition, client, adaptive_chunksize)
+
+    def load_from_dataframe(self, frame,
+                            source_format='NEWLINE_DELIMITED_JSON',
+                            compression=None,
+                            num_retries=6,
+                            create_disposition=None,
+                            ignore_unknown_values=None,
+                            max_bad_records=None,
+                            write_disposition=None,
+                            client=None,
+                            adaptive_chunksize=False):
+        """Load the rows of a DataFrame into this table.
+
+        The DataFrame's columns are matched to the table's schema fields by
+        name; missing columns are null. See :meth:`load_from_iterable` for
+        the other arguments.
+
+        :type frame: :class:`pandas.DataFrame`
+        :param frame: The rows to load.
+
+        :rtype: :class:`google.cloud.bigquery.jobs.LoadTableFromStorageJob`
+        :returns: the job instance used to load the data (e.g., for
+                  querying status). Note that the job is already started:
+                  do not call ``job.begin()``.
+        :raises: ValueError if table's schema is not set, or if the format
+                 or compression is not supported.
+        """
+        batches = (frame.iloc[start:start + _LOAD_BATCH_ROWS]
+                   for start in six.moves.range(
+                       0, len(frame), _LOAD_BATCH_ROWS))
+        return self._load_from_batches(
+            batches, source_format, compression, num_retries,
+            create_disposition, ignore_unknown_values, max_bad_records,
+            write_disposition, client, adaptive_chunksize)
+
+    # pylint: disable=too-many-arguments
+    def _load_from_batches(self, batches, source_format, compression,
+                           num_retries, create_disposition,
+                           ignore_unknown_values, max_bad_records,
+                           write_disposition, client, adaptive_chunksize):
+        """Load batches of rows, serialized as the upload reads them.
+
+        Helper for :meth:`load_from_iterable` and :meth:`load_from_dataframe`.
+        """
+        from google.cloud.bigquery.job import Compression
+
+        if len(self._schema) == 0:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+        if compression not in (None,) + Compression.ALLOWED:
+            raise ValueError('Unsupported compression', compression)
+
+        encoder = _RowsEncoder(self._schema)
+        allow_quoted_newlines = None
+        if source_format == 'CSV':
+            if any(field.field_type == 'RECORD' or field.mode == 'REPEATED'
+                   for field in self._schema):
+                raise ValueError(
+                    'CSV cannot hold RECORD or REPEATED fields')
+            chunks = (_csv_bytes(zip(*encoder.columns(batch)))
+                      for batch in batches)
+            # String values may hold newlines, which are quoted.
+            allow_quoted_newlines = True
+        elif source_format == 'NEWLINE_DELIMITED_JSON':
+            chunks = (b''.join(_json_bytes(row) + b'\n'
+                               for row in encoder.rows(batch))
+                      for batch in batches)
+        else:
+            raise ValueError('Unsupported source format', source_format)
+        if compression == Compression.GZIP:
+            chunks = _gzip_chunks(chunks)
+
+        metadata = self._load_metadata(source_format)
+        _configure_job_metadata(metadata, None, allow_quoted_newlines,
+                                create_disposition, None, None,
+                                ignore_unknown_values, max_bad_records,
+                                None, None, write_disposition)
+
+        # The size of the upload is not known until the rows run out, so
+        # the upload must be resumable.
+        upload = Upload(_ChunkStream(chunks), _UPLOAD_CONTENT_TYPE,
+                        auto_transfer=False, chunksize=_LOAD_CHUNKSIZE,
+                        adaptive_chunksize=adaptive_chunksize)
+        upload.strategy = RESUMABLE_UPLOAD
+        return self._upload(upload, metadata, num_retries, client)
+    # pylint: enable=too-many-arguments
+
+    def _load_metadata(self, source_format):
+        """Build the configuration of a load job into this table.
+
+        Helper for :meth:`upload_from_file` and :meth:`_load_from_batches`.
+
+        :type source_format: str
+        :param source_format: The format of the uploaded data.
+
+        :rtype: dict
+        :returns: The job resource to send with the upload.
+        """
         metadata = {
             'configuration': {
                 'load': {
@@ -932,16 +1273,38 @@ class Table(object):
             load_config['schema'] = {
                 'fields': _build_schema_resource(self._schema)
             }
+        return metadata
 
-        _configure_job_metadata(metadata, allow_jagged_rows,
-                                allow_quoted_newlines, create_disposition,
-                                encoding, field_delimiter,
-                                ignore_unknown_values, max_bad_records,
-                                quote_character, skip_leading_rows,
-                                write_disposition)
+    def _upload(self, upload, metadata, num_retries, client):
+        """Start a load job, uploading its data.
+
+        Helper for :meth:`upload_from_file` and :meth:`_load_from_batches`.
+
+        :type upload: :class:`~google.cloud.streaming.transfer.Upload`
+        :param upload: The (not yet configured) upload of the data.
+
+        :type metadata: dict
+        :param metadata: The job resource to send with the upload.
 
-        upload = Upload(file_obj, content_type, total_bytes,
-                        auto_transfer=False)
+        :type num_retries: int
+        :param num_retries: Number of upload retries.
+
+        :type client: :class:`~google.cloud.bigquery.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current dataset.
+
+        :rtype: :class:`google.cloud.bigquery.jobs.LoadTableFromStorageJob`
+        :returns: the job instance used to load the data.
+        """
+        client = self._require_client(client)
+        connection = client._connection
+        headers = {
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'User-Agent': connection.USER_AGENT,
+            'content-type': 'application/json',
+        }
 
         url_builder = _UrlBuilder()
         upload_config = _UploadConfig()
@@ -981,7 +1344,6 @@ class Table(object):
                           six.string_types):  # pragma: NO COVER  Python3
             response_content = response_content.decode('utf-8')
         return client.job_from_resource(json.loads(response_content))
-    # pylint: enable=too-many-arguments,too-many-locals
 
 
 def _configure_job_metadata(metadata,  # pylint: disable=too-many-arguments
@@ -1098,9 +1460,28 @@ def _item_to_row(iterator, resource):
 
 
 # pylint: disable=unused-argument
+def _item_to_decoded_row(iterator, row):
+    """Pass through a row already decoded by :func:`_rows_page_start`.
+
+    :type iterator: :class:`~google.cloud.iterator.Iterator`
+    :param iterator: The iterator that is currently in use.
+
+    :type row: tuple
+    :param row: The next row in the page.
+
+    :rtype: tuple
+    :returns: ``row``, unchanged.
+    """
+    return row
+# pylint: enable=unused-argument
+
+
 def _rows_page_start(iterator, page, response):
     """Grab total rows after a :class:`~google.cloud.iterator.Page` started.
 
+    Unless the iterator streams items, also decodes all the rows of the
+    page at once, column by column.
+
     :type iterator: :class:`~google.cloud.iterator.Iterator`
     :param iterator: The iterator that is currently in use.
 
@@ -1114,7 +1495,343 @@ def _rows_page_start(iterator, page, response):
     if total_rows is not None:
         total_rows = int(total_rows)
     iterator.total_rows = total_rows
-# pylint: enable=unused-argument
+
+    rows = response.get('rows', ())
+    page._json_rows = rows
+    if isinstance(rows, list):
+        page._item_iter = _decode_page(iterator._rows_decoder, rows)
+        page._item_to_value = _item_to_decoded_row
+
+
+def _decode_page(decoder, rows):
+    """Decode all the rows of a page when the first one is needed.
+
+    :type decoder: :class:`~google.cloud.bigquery._helpers._RowsDecoder`
+    :param decoder: The decoder for the schema of the rows.
+
+    :type rows: list of dict
+    :param rows: The JSON rows of the page.
+
+    :rtype: :class:`~types.GeneratorType`
+    :returns: A generator of the rows, as :class:`tuple`s.
+    """
+    for row in decoder.rows(rows):
+        yield row
+
+
+class RowIterator(HTTPIterator):
+    """Iterator over the rows of a table or of query results.
+
+    The rows of each page are decoded together, column by column.
+
+    :type client: :class:`~google.cloud.bigquery.client.Client`
+    :param client: The client used to fetch the rows.
+
+    :type path: str
+    :param path: The API path of the rows.
+
+    :type schema: list of :class:`SchemaField`
+    :param schema: The schema of the rows. May be updated by
+                   ``page_start`` before the rows of a page are decoded.
+
+    :type page_token: str
+    :param page_token: (Optional) Token representing a cursor into the rows.
+
+    :type max_results: int
+    :param max_results: (Optional) Maximum number of rows to return.
+
+    :type extra_params: dict
+    :param extra_params: (Optional) Extra query string parameters for the
+                         API call.
+
+    :type page_start: callable
+    :param page_start: (Optional) Callable run after each page is fetched,
+                       which must set ``total_rows`` and decode the page as
+                       :func:`_rows_page_start` does.
+    """
+
+    _NEXT_TOKEN = 'pageToken'
+
+    def __init__(self, client, path, schema, page_token=None,
+                 max_results=None, extra_params=None,
+                 page_start=_rows_page_start):
+        super(RowIterator, self).__init__(
+            client=client, path=path, item_to_value=_item_to_row,
+            items_key='rows', page_token=page_token,
+            max_results=max_results, extra_params=extra_params,
+            page_start=page_start)
+        self.schema = schema
+        self._decoder = None
+
+    @property
+    def _rows_decoder(self):
+        """The decoder for the current schema.
+
+        :rtype: :class:`~google.cloud.bigquery._helpers._RowsDecoder`
+        :returns: A decoder, reused while the schema is unchanged.
+        """
+        if self._decoder is None or self._decoder.schema is not self.schema:
+            self._decoder = _RowsDecoder(self.schema)
+        return self._decoder
+
+    def _json_pages(self):
+        """Fetch the pages, fetching the next while the last is decoded.
+
+        :rtype: :class:`~types.GeneratorType`
+        :returns: A generator of ``(decoder, rows)`` pairs: the decoder for
+                  the schema of each page, and its JSON rows. At least one
+                  pair is generated, since the first page is always
+                  fetched (even for an empty table).
+        """
+        if self.prefetch <= 0:
+            self.prefetch = 1
+        for page in self.pages:
+            yield self._rows_decoder, page._json_rows
+
+    def to_dataframe(self):
+        """Fetch all the remaining rows into a DataFrame.
+
+        Requires :mod:`pandas`. The rows of each page are decoded column by
+        column, into arrays typed after the schema (see
+        :meth:`~google.cloud.bigquery._helpers._RowsDecoder.to_numpy`),
+        without building a tuple per row. Pages are fetched on a background
+        thread while the previous one is decoded, unless :attr:`prefetch`
+        was set.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: A DataFrame with one column per field of the schema.
+
+        :raises ValueError: If :mod:`pandas` is not installed, or the
+                            iterator has already been started.
+        """
+        return _dataframe_from_pages(self._json_pages())
+
+    def to_arrow(self):
+        """Fetch all the remaining rows into an Arrow table.
+
+        Requires :mod:`pyarrow`. As with :meth:`to_dataframe`, rows are
+        decoded column by column. Each page becomes one chunk of the
+        table, with null values kept as nulls.
+
+        :rtype: :class:`pyarrow.Table`
+        :returns: A table with one column per field of the schema.
+
+        :raises ValueError: If :mod:`pyarrow` is not installed, or the
+                            iterator has already been started.
+        """
+        return _arrow_from_pages(self._json_pages())
+
+
+class _PooledClient(object):
+    """Stand-in for a client, sending its requests through an HTTP pool.
+
+    Helper for :meth:`Table.fetch_data_parallel`.
+
+    :type client: :class:`~google.cloud.bigquery.client.Client`
+    :param client: The client whose project and credentials are used.
+
+    :type http: :class:`~google.cloud._http.PooledHttp`
+    :param http: The pool of HTTP objects sending the requests.
+    """
+
+    def __init__(self, client, http):
+        self.project = client.project
+        self._credentials = client._credentials
+        self._http = http
+        self._connection = Connection(self)
+
+
+def _fetch_shards(fetch_shard, shards, max_workers, ordered):
+    """Fetch shards of rows concurrently.
+
+    Helper for :meth:`Table.fetch_data_parallel`.
+
+    :type fetch_shard: callable
+    :param fetch_shard: Called with the start and size of a shard, and
+                        returning its rows.
+
+    :type shards: list of tuple
+    :param shards: The ``(start, count)`` of each shard, in order.
+
+    :type max_workers: int
+    :param max_workers: The maximum number of concurrent fetches.
+
+    :type ordered: bool
+    :param ordered: If False, yield the rows of each shard as soon as it is
+                    fetched, rather than in the order of ``shards``.
+
+    :rtype: :class:`~types.GeneratorType`
+    :returns: A generator of the rows of every shard. If a fetch fails, the
+              shards not yet started are cancelled and its error is raised.
+    """
+    shards = iter(shards)
+    pending = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        try:
+            while True:
+                # Keep the workers busy, but bound the finished shards held.
+                while len(pending) < 2 * max_workers:
+                    shard = next(shards, None)
+                    if shard is None:
+                        break
+                    pending.append(executor.submit(fetch_shard, *shard))
+                if not pending:
+                    return
+
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = concurrent.futures.wait(
+                        pending,
+                        return_when=concurrent.futures.FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+                for row in future.result():
+                    yield row
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _batches(rows, size):
+    """Split an iterable of rows into lists of at most ``size`` rows.
+
+    :type rows: iterable
+    :param rows: The rows.
+
+    :type size: int
+    :param size: The maximum number of rows per batch.
+
+    :rtype: :class:`~types.GeneratorType`
+    :returns: A generator of lists of rows, consuming ``rows`` lazily.
+    """
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _csv_bytes(rows):
+    """Serialize rows of JSON values as CSV lines.
+
+    :type rows: iterable of tuple
+    :param rows: The JSON values of each row, in schema order.
+
+    :rtype: bytes
+    :returns: The CSV lines, encoded as UTF-8.
+    """
+    buf = six.StringIO()
+    if six.PY2:  # pragma: NO COVER  Python2
+        rows = ([_to_bytes(value, 'utf-8')
+                 if isinstance(value, six.text_type) else value
+                 for value in row] for row in rows)
+    csv.writer(buf, lineterminator='\n').writerows(rows)
+    return _to_bytes(buf.getvalue(), 'utf-8')
+
+
+def _gzip_chunks(chunks):
+    """Compress a stream of byte strings in the gzip format.
+
+    :type chunks: iterable of bytes
+    :param chunks: The data to compress.
+
+    :rtype: :class:`~types.GeneratorType`
+    :returns: A generator of the compressed data.
+    """
+    compressor = zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class _ChunkStream(object):
+    """Read-only file-like object over an iterable of byte strings.
+
+    Chunks are pulled from the iterable only as they are read. The stream
+    can only seek back over the data returned by the last :meth:`read`
+    (for an upload to resend its last chunk).
+
+    :type chunks: iterable of bytes
+    :param chunks: The data of the stream.
+    """
+
+    closed = False
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffered = b''
+        self._last_read = b''
+        self._position = 0
+
+    def read(self, size=-1):
+        """Read bytes from the stream.
+
+        :type size: int
+        :param size: (Optional) The maximum number of bytes to read; if
+                     negative, read until the end of the stream.
+
+        :rtype: bytes
+        :returns: The data read: less than ``size`` only at the end of the
+                  stream.
+        """
+        pieces = [self._buffered]
+        length = len(self._buffered)
+        while size < 0 or length < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            pieces.append(chunk)
+            length += len(chunk)
+        data = b''.join(pieces)
+        if 0 <= size < length:
+            data, self._buffered = data[:size], data[size:]
+        else:
+            self._buffered = b''
+        self._last_read = data
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        """Get the position of the stream.
+
+        :rtype: int
+        :returns: The number of bytes read.
+        """
+        return self._position
+
+    @staticmethod
+    def seekable():
+        """Whether the stream supports arbitrary seeks.
+
+        :rtype: bool
+        :returns: False.
+        """
+        return False
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move back to a position within the data of the last read.
+
+        :type offset: int
+        :param offset: The position to move to.
+
+        :type whence: int
+        :param whence: Must be :data:`os.SEEK_SET`.
+
+        :raises: ValueError if the position is outside the last read.
+        """
+        back = self._position - offset
+        if whence != os.SEEK_SET or not 0 <= back <= len(self._last_read):
+            raise ValueError('Cannot seek outside the last read', offset)
+        if back:
+            keep = len(self._last_read) - back
+            self._buffered = self._last_read[keep:] + self._buffered
+            self._last_read = self._last_read[:keep]
+            self._position = offset
 
 
 class _UploadConfig(object):
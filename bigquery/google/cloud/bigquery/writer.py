@@ -0,0 +1,367 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Buffer rows streamed into a table, inserting them in batches.
+
+:meth:`Table.insert_data() <google.cloud.bigquery.table.Table.insert_data>`
+sends the rows it is given in a single request. A
+:class:`StreamingWriter` accepts rows one at a time (from any number of
+threads) and sends them in ``insertAll`` requests from a background thread::
+
+    >>> from google.cloud import bigquery
+    >>> client = bigquery.Client()
+    >>> table = client.dataset('dataset_name').table('table_name')
+    >>> table.reload()
+    >>> with table.streaming_writer() as writer:
+    ...     for row in rows:
+    ...         writer.write(row)
+    >>> writer.errors
+    []
+
+A batch is sent once it has ``max_rows`` rows, once it is as large as an
+``insertAll`` request may be, or ``max_latency`` seconds after its first
+row was written. Each row is given an ``insertId``, so that BigQuery can
+discard duplicates if a request is retried.
+"""
+
+import threading
+import time
+import uuid
+
+from google.cloud.exceptions import ClientError
+from google.cloud.bigquery._helpers import _json_bytes
+from google.cloud.bigquery._helpers import _RowsEncoder
+from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
+
+
+MAX_REQUEST_BYTES = 10 * 1024 * 1024
+"""The maximum size of an ``insertAll`` request."""
+
+_REQUEST_OVERHEAD_BYTES = 4096
+"""Room left in each request for everything other than its rows."""
+
+_PERMANENT_REASONS = frozenset(['invalid'])
+"""Reasons of row errors which a retry cannot fix."""
+
+_RETRY_DELAY_SECONDS = 1.0
+"""Delay before the first retry of a request; doubled for each retry."""
+
+
+class StreamingWriter(object):
+    """Insert rows into a table in batches, from a background thread.
+
+    Rows written are converted to JSON immediately, then buffered. Use as
+    a context manager, or call :meth:`close` once every row is written.
+
+    Rows listed in the ``insertErrors`` of a response, and the rows of
+    requests failing with a server or connection error, are sent again
+    (with the same ``insertId``), up to ``max_retries`` times. Rows
+    rejected as ``invalid``, and the rows of requests failing with a client
+    error, are not retried. Rows which could not be inserted are listed in
+    :attr:`errors`.
+
+    :type table: :class:`~google.cloud.bigquery.table.Table`
+    :param table: The table to insert rows into. Its schema must be set.
+
+    :type max_rows: int
+    :param max_rows: (Optional) The maximum number of rows in a request.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) The maximum size of the rows of a request.
+                      Defaults to (a little under) the 10 MB limit.
+
+    :type max_latency: float
+    :param max_latency: (Optional) The longest time, in seconds, a row is
+                        buffered before its batch is sent.
+
+    :type max_queued_rows: int
+    :param max_queued_rows: (Optional) The maximum number of buffered rows:
+                            :meth:`write` blocks while the buffer is full.
+                            Defaults to ``10 * max_rows``.
+
+    :type max_retries: int
+    :param max_retries: (Optional) How many times a row may be sent again.
+
+    :type skip_invalid_rows: bool
+    :param skip_invalid_rows: (Optional) skip rows w/ invalid data?
+
+    :type ignore_unknown_values: bool
+    :param ignore_unknown_values: (Optional) ignore columns beyond schema?
+
+    :type template_suffix: str
+    :param template_suffix: (Optional) treat the table as a template table
+                            and provide a suffix.
+
+    :type client: :class:`~google.cloud.bigquery.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls
+                   back to the ``client`` stored on the table's dataset.
+                   Requests are sent from one background thread at a time.
+
+    :raises: ValueError if the table's schema is not set, or if
+             ``max_retries`` is negative.
+    """
+
+    def __init__(self, table, max_rows=500,
+                 max_bytes=MAX_REQUEST_BYTES - _REQUEST_OVERHEAD_BYTES,
+                 max_latency=1.0, max_queued_rows=None, max_retries=3,
+                 skip_invalid_rows=None, ignore_unknown_values=None,
+                 template_suffix=None, client=None):
+        if len(table.schema) == 0:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+        if max_retries < 0:
+            raise ValueError(
+                'max_retries must not be negative: %d' % (max_retries,))
+        if max_queued_rows is None:
+            max_queued_rows = 10 * max_rows
+
+        self.table = table
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.max_latency = max_latency
+        self.max_queued_rows = max_queued_rows
+        self.max_retries = max_retries
+        self.errors = []
+        self._encoder = _RowsEncoder(table.schema)
+        self._insert_kwargs = {
+            'skip_invalid_rows': skip_invalid_rows,
+            'ignore_unknown_values': ignore_unknown_values,
+            'template_suffix': template_suffix,
+            'client': client,
+        }
+        # Buffered ``(row, info, size)`` entries, oldest first.
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._deadline = None
+        self._sending = False
+        self._flushing = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, row, row_id=None):
+        """Buffer a row to be inserted.
+
+        Blocks while the buffer holds ``max_queued_rows`` rows.
+
+        :type row: tuple or dict
+        :param row: The value of each field of the row, in schema order or
+                    keyed by field name, as for :meth:`Table.insert_data() \
+                    <google.cloud.bigquery.table.Table.insert_data>`.
+
+        :type row_id: str
+        :param row_id: (Optional) A unique ID for the row, which BigQuery
+                       uses to de-duplicate retried inserts. Defaults to a
+                       random UUID.
+
+        :raises: ValueError if the writer is closed or if the row is too
+                 large for a request.
+        """
+        if row_id is None:
+            row_id = uuid.uuid4().hex
+        row_info, = self._encoder.rows([row])
+        info = {'json': row_info, 'insertId': row_id}
+        # Each row is followed by a separator in the request.
+        size = len(_json_bytes(info)) + 1
+        if size > self.max_bytes:
+            raise ValueError('Row is too large to insert', size)
+
+        with self._condition:
+            while (not self._closed and
+                   len(self._buffer) >= self.max_queued_rows):
+                self._condition.wait()
+            if self._closed:
+                raise ValueError('Writer is closed')
+            first = not self._buffer
+            if first:
+                self._deadline = time.time() + self.max_latency
+            self._buffer.append((row, info, size))
+            self._buffer_bytes += size
+            # The background thread waits for a deadline only once the
+            # buffer has rows.
+            if first or self._batch_ready():
+                self._condition.notify_all()
+
+    def write_rows(self, rows):
+        """Buffer rows to be inserted.
+
+        :type rows: iterable of tuple or dict
+        :param rows: The rows, as for :meth:`write`.
+        """
+        for row in rows:
+            self.write(row)
+
+    def flush(self):
+        """Send every buffered row, waiting for the requests to complete."""
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                while self._buffer or self._sending:
+                    self._condition.wait()
+            finally:
+                self._flushing -= 1
+
+    def close(self):
+        """Send every buffered row and stop the background thread.
+
+        :rtype: list of dict
+        :returns: The rows which could not be inserted (see :attr:`errors`).
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        return self.errors
+
+    def _batch_ready(self):
+        """Check if the next batch should be sent now.
+
+        Must be called while holding the lock.
+
+        :rtype: bool
+        :returns: True if a batch is full, or if the buffered rows should
+                  be sent regardless.
+        """
+        if not self._buffer:
+            return False
+        return (self._closed or self._flushing > 0 or
+                len(self._buffer) >= self.max_rows or
+                self._buffer_bytes >= self.max_bytes or
+                time.time() >= self._deadline)
+
+    def _take_batch(self):
+        """Remove the next batch from the buffer.
+
+        Must be called while holding the lock.
+
+        :rtype: list of tuple
+        :returns: The oldest buffered entries, as many as fit in a request.
+        """
+        num_bytes = 0
+        count = 0
+        for _, _, size in self._buffer[:self.max_rows]:
+            if num_bytes + size > self.max_bytes:
+                break
+            num_bytes += size
+            count += 1
+        batch = self._buffer[:count]
+        del self._buffer[:count]
+        self._buffer_bytes -= num_bytes
+        if self._buffer:
+            self._deadline = time.time() + self.max_latency
+        return batch
+
+    def _run(self):
+        """Send batches until the writer is closed and its buffer empty."""
+        while True:
+            with self._condition:
+                while not self._batch_ready():
+                    if self._closed:
+                        return
+                    timeout = None
+                    if self._buffer:
+                        timeout = max(self._deadline - time.time(), 0)
+                    self._condition.wait(timeout)
+                batch = self._take_batch()
+                self._sending = True
+                # Writers blocked on a full buffer may now proceed.
+                self._condition.notify_all()
+            try:
+                self._send(batch)
+            finally:
+                with self._condition:
+                    self._sending = False
+                    self._condition.notify_all()
+
+    def _send(self, batch):
+        """Insert a batch of rows, retrying the rows which failed.
+
+        :type batch: list of tuple
+        :param batch: Buffered ``(row, info, size)`` entries.
+        """
+        delay = _RETRY_DELAY_SECONDS
+        attempt = 0
+        while True:
+            retries = []
+            for entry, errors, retryable in self._insert_batch(batch):
+                if retryable and attempt < self.max_retries:
+                    retries.append(entry)
+                else:
+                    self._add_error(entry, errors)
+            if not retries:
+                return
+            time.sleep(delay)
+            delay *= 2
+            attempt += 1
+            batch = retries
+
+    def _insert_batch(self, batch):
+        """Send one ``insertAll`` request.
+
+        :type batch: list of tuple
+        :param batch: Buffered ``(row, info, size)`` entries.
+
+        :rtype: list of tuple
+        :returns: ``(entry, errors, retryable)`` for each row which was not
+                  inserted.
+        """
+        try:
+            errors = self.table._insert_all(
+                [info for _, info, _ in batch], **self._insert_kwargs)
+        except Exception as exc:  # pylint: disable=broad-except
+            # Client errors would recur; server and connection errors may
+            # not. Either way, the background thread must keep running.
+            retryable = not isinstance(exc, ClientError)
+            error = {'reason': type(exc).__name__, 'message': str(exc)}
+            return [(entry, [error], retryable) for entry in batch]
+        return [(batch[error['index']], error['errors'],
+                 not _is_permanent(error['errors']))
+                for error in errors]
+
+    def _add_error(self, entry, errors):
+        """Record a row which could not be inserted.
+
+        :type entry: tuple
+        :param entry: The buffered ``(row, info, size)`` entry.
+
+        :type errors: list of dict
+        :param errors: The errors of the row's last attempt.
+        """
+        row, info, _ = entry
+        with self._condition:
+            self.errors.append({
+                'row': row,
+                'row_id': info['insertId'],
+                'errors': errors,
+            })
+
+
+def _is_permanent(errors):
+    """Check if retrying a row cannot fix its errors.
+
+    :type errors: list of dict
+    :param errors: The errors of a row.
+
+    :rtype: bool
+    :returns: True if any error has a permanent reason.
+    """
+    return any(error.get('reason') in _PERMANENT_REASONS for error in errors)
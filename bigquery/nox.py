@@ -32,7 +32,7 @@ def unit_tests(session, python_version):
 
     # Install all test dependencies, then install this package in-place.
     session.install('mock', 'pytest', 'pytest-cov', *LOCAL_DEPS)
-    session.install('-e', '.')
+    session.install('-e', '.[pandas,pyarrow]')
 
     # Run py.test against the unit tests.
     session.run('py.test', '--quiet',
@@ -53,6 +53,11 @@ SETUP_BASE = {
 REQUIREMENTS = [
     'google-cloud-core >= 0.24.0, < 0.25dev',
 ]
+EXTRAS_REQUIRE = {
+    ':python_version<"3.2"': ['futures >= 3.0.0'],
+    'pandas': ['pandas >= 0.17.1'],
+    'pyarrow': ['pyarrow >= 0.9.0'],
+}
 
 setup(
     name='google-cloud-bigquery',
@@ -65,5 +70,6 @@ setup(
     ],
     packages=find_packages(exclude=('tests*',)),
     install_requires=REQUIREMENTS,
+    extras_require=EXTRAS_REQUIRE,
     **SETUP_BASE
 )
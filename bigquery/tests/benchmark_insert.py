@@ -0,0 +1,137 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare encoding ``insertAll`` request bodies cell by cell and by column.
+
+Usage::
+
+    $ python tests/benchmark_insert.py [NUM_ROWS ...]
+
+For each number of rows, builds synthetic rows of a schema with a mix of
+scalar types, then reports the time to encode them as the JSON body of an
+``insertAll`` request: the way :meth:`Table.insert_data() \
+<google.cloud.bigquery.table.Table.insert_data>` used to, looking up the
+conversion of each cell and leaving the serialization to ``api_request``,
+then with :class:`google.cloud.bigquery._helpers._RowsEncoder`, from
+tuples, dicts, a dict of columns and, if :mod:`pandas` is installed, a
+DataFrame.
+"""
+
+import datetime
+import json
+import sys
+import timeit
+
+import six
+
+from google.cloud._helpers import UTC
+from google.cloud._helpers import _microseconds_from_datetime
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery.schema import SchemaField
+
+
+REPEAT = 5
+
+SCHEMA = [
+    SchemaField('id', 'INTEGER', mode='REQUIRED'),
+    SchemaField('name', 'STRING'),
+    SchemaField('score', 'FLOAT'),
+    SchemaField('active', 'BOOLEAN'),
+    SchemaField('created', 'TIMESTAMP'),
+    SchemaField('day', 'DATE'),
+]
+
+START = datetime.datetime(2017, 1, 1, tzinfo=UTC)
+
+
+def _timestamp_to_json_row_before(value):
+    """The TIMESTAMP conversion used before the encoder."""
+    if isinstance(value, datetime.datetime):
+        value = _microseconds_from_datetime(value) * 1e-6
+    return value
+
+
+_SCALAR_VALUE_TO_JSON_ROW_BEFORE = dict(
+    _helpers._SCALAR_VALUE_TO_JSON_ROW,
+    TIMESTAMP=_timestamp_to_json_row_before)
+
+
+def make_rows(num_rows):
+    """Build rows of native values, with one null in ten values."""
+    rows = []
+    for index in six.moves.range(num_rows):
+        def nullable(value):
+            return None if index % 10 == 9 else value
+
+        rows.append((
+            index,
+            nullable('name-%d' % (index,)),
+            nullable(index / 7.0),
+            nullable(bool(index % 2)),
+            nullable(START + datetime.timedelta(seconds=index)),
+            nullable(datetime.date(2017, index % 12 + 1, index % 28 + 1)),
+        ))
+    return rows
+
+
+def encode_cell_by_cell(rows):
+    """Encode rows the way ``insert_data`` used to."""
+    rows_info = []
+    for row in rows:
+        row_info = {}
+        for field, value in zip(SCHEMA, row):
+            converter = _SCALAR_VALUE_TO_JSON_ROW_BEFORE.get(field.field_type)
+            if converter is not None:
+                value = converter(value)
+            row_info[field.name] = value
+        rows_info.append({'json': row_info})
+    return json.dumps({'rows': rows_info}).encode('utf-8')
+
+
+def main(sizes):
+    encoder = _helpers._RowsEncoder(SCHEMA)
+
+    def encode(rows):
+        return _helpers._json_bytes(
+            {'rows': [{'json': row} for row in encoder.rows(rows)]})
+
+    print('%8s  %-22s %10s %12s' % ('rows', 'encoder', 'ms', 'rows/s'))
+    for num_rows in sizes:
+        rows = make_rows(num_rows)
+        names = [field.name for field in SCHEMA]
+        inputs = [
+            ('cell by cell', encode_cell_by_cell, rows),
+            ('_RowsEncoder, tuples', encode, rows),
+            ('_RowsEncoder, dicts', encode,
+             [dict(zip(names, row)) for row in rows]),
+            ('_RowsEncoder, columns', encode,
+             dict(zip(names, (list(column) for column in zip(*rows))))),
+        ]
+        if _helpers.pandas is not None:
+            inputs.append(('_RowsEncoder, frame', encode,
+                           _helpers.pandas.DataFrame.from_records(
+                               rows, columns=names)))
+
+        expected = json.loads(encode_cell_by_cell(rows).decode('utf-8'))
+        for name, func, value in inputs:
+            body = json.loads(func(value).decode('utf-8'))
+            assert body == expected, name
+            seconds = min(timeit.repeat(
+                lambda: func(value), number=1, repeat=REPEAT))
+            print('%8d  %-22s %10.1f %12.0f' % (
+                num_rows, name, seconds * 1000, num_rows / seconds))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000])
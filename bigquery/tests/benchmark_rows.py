@@ -0,0 +1,102 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare decoding pages of rows one row at a time and column by column.
+
+Usage::
+
+    $ python tests/benchmark_rows.py [NUM_ROWS ...]
+
+For each page size, builds a synthetic ``tabledata.list`` page with a mix
+of nullable scalar, repeated and record fields, then reports the time to
+decode it with :func:`google.cloud.bigquery._helpers._row_from_json` (one
+row at a time), with :class:`google.cloud.bigquery._helpers._RowsDecoder`
+and, if :mod:`numpy` / :mod:`pandas` / :mod:`pyarrow` are installed,
+straight to arrays, to a DataFrame and to an Arrow record batch.
+"""
+
+import sys
+import timeit
+
+import six
+
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery.schema import SchemaField
+
+
+REPEAT = 5
+
+SCHEMA = [
+    SchemaField('id', 'INTEGER', mode='REQUIRED'),
+    SchemaField('name', 'STRING'),
+    SchemaField('score', 'FLOAT'),
+    SchemaField('active', 'BOOLEAN'),
+    SchemaField('created', 'TIMESTAMP'),
+    SchemaField('day', 'DATE'),
+    SchemaField('tags', 'STRING', mode='REPEATED'),
+    SchemaField('location', 'RECORD', fields=[
+        SchemaField('lat', 'FLOAT'),
+        SchemaField('lng', 'FLOAT'),
+    ]),
+]
+
+
+def make_rows(num_rows):
+    """Build the JSON rows of a page, with one null in ten values."""
+    rows = []
+    for index in six.moves.range(num_rows):
+        def nullable(value):
+            return None if index % 10 == 9 else value
+
+        rows.append({'f': [
+            {'v': str(index)},
+            {'v': nullable('name-%d' % (index,))},
+            {'v': nullable('%r' % (index / 7.0,))},
+            {'v': nullable('true' if index % 2 else 'false')},
+            {'v': nullable('%0.6E' % (1.4e9 + index,))},
+            {'v': nullable('2017-%02d-%02d' % (index % 12 + 1,
+                                               index % 28 + 1))},
+            {'v': [{'v': 'tag-%d' % (tag,)} for tag in range(index % 3)]},
+            {'v': nullable({'f': [{'v': '51.5'}, {'v': '-0.12'}]})},
+        ]})
+    return rows
+
+
+def main(sizes):
+    decoder = _helpers._RowsDecoder(SCHEMA)
+    candidates = [
+        ('_row_from_json', lambda rows: [
+            _helpers._row_from_json(row, SCHEMA) for row in rows]),
+        ('_RowsDecoder.rows', decoder.rows),
+    ]
+    if _helpers.numpy is not None:
+        candidates.append(('_RowsDecoder.to_numpy', decoder.to_numpy))
+    if _helpers.pandas is not None:
+        candidates.append(('_RowsDecoder.to_dataframe', decoder.to_dataframe))
+    if _helpers.pyarrow is not None:
+        candidates.append(('_RowsDecoder.to_arrow', decoder.to_arrow))
+
+    print('%8s  %-26s %10s %12s' % ('rows', 'decoder', 'ms', 'rows/s'))
+    for num_rows in sizes:
+        rows = make_rows(num_rows)
+        assert decoder.rows(rows) == candidates[0][1](rows)
+        for name, decode in candidates:
+            seconds = min(timeit.repeat(
+                lambda: decode(rows), number=1, repeat=REPEAT))
+            print('%8d  %-26s %10.1f %12.0f' % (
+                num_rows, name, seconds * 1000, num_rows / seconds))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000])
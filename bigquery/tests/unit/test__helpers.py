@@ -14,6 +14,21 @@
 
 import unittest
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 
 class Test_not_null(unittest.TestCase):
 
@@ -501,6 +516,287 @@ class Test_rows_from_json(unittest.TestCase):
         self.assertEqual(coerced, expected)
 
 
+class Test_RowsDecoder(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery._helpers import _RowsDecoder
+
+        return _RowsDecoder
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_rows(*values):
+        return [{'f': [{'v': value} for value in row]} for row in values]
+
+    def _scalar_schema(self, mode):
+        return [
+            _Field(mode, 'int', 'INTEGER'),
+            _Field(mode, 'float', 'FLOAT'),
+            _Field(mode, 'bool', 'BOOLEAN'),
+            _Field(mode, 'str', 'STRING'),
+            _Field(mode, 'bytes', 'BYTES'),
+            _Field(mode, 'ts', 'TIMESTAMP'),
+            _Field(mode, 'dt', 'DATETIME'),
+            _Field(mode, 'date', 'DATE'),
+            _Field(mode, 'time', 'TIME'),
+        ]
+
+    def _scalar_rows(self):
+        return self._make_rows(
+            ['1', '1.5', 'true', 'a', 'YWJj', '1.0',
+             '2017-01-02T03:04:05', '2017-01-02', '03:04:05'],
+            [None] * 9,
+            ['-2', '-0.25', 'False', 'b', 'ZGVm', '1497652320.25',
+             '2016-12-31T23:59:59', '2016-12-31', '23:59:59'],
+        )
+
+    def test_rows_matches_row_from_json(self):
+        from google.cloud.bigquery._helpers import _row_from_json
+
+        schema = self._scalar_schema('NULLABLE')
+        rows = self._scalar_rows()
+        decoder = self._make_one(schema)
+        self.assertIs(decoder.schema, schema)
+        decoded = decoder.rows(rows)
+        self.assertEqual(decoded, [_row_from_json(row, schema)
+                                   for row in rows])
+        self.assertEqual(decoded[1], (None,) * 9)
+        self.assertEqual(decoded[2][:5], (-2, -0.25, False, 'b', b'def'))
+
+    def test_rows_w_required_and_repeated(self):
+        schema = [
+            _Field('REQUIRED', 'count', 'INT64'),
+            _Field('REPEATED', 'tags', 'STRING'),
+            _Field('REPEATED', 'scores', 'FLOAT64'),
+        ]
+        rows = self._make_rows(
+            ['1', [{'v': 'a'}, {'v': 'b'}], []],
+            ['2', [], [{'v': '0.5'}]],
+            ['3', [{'v': 'c'}], [{'v': '1'}, {'v': '2'}]],
+        )
+        decoder = self._make_one(schema)
+        self.assertEqual(decoder.rows(rows), [
+            (1, ['a', 'b'], []),
+            (2, [], [0.5]),
+            (3, ['c'], [1.0, 2.0]),
+        ])
+
+    def test_rows_w_nullable_record(self):
+        schema = [
+            _Field('NULLABLE', 'point', 'RECORD', fields=[
+                _Field('REQUIRED', 'x', 'INTEGER'),
+                _Field('NULLABLE', 'y', 'INTEGER'),
+            ]),
+        ]
+        rows = self._make_rows(
+            [{'f': [{'v': '1'}, {'v': '2'}]}],
+            [None],
+            [{'f': [{'v': '3'}, {'v': None}]}],
+        )
+        self.assertEqual(self._make_one(schema).rows(rows), [
+            ({'x': 1, 'y': 2},),
+            (None,),
+            ({'x': 3, 'y': None},),
+        ])
+
+    def test_columns(self):
+        schema = [_Field('REQUIRED', 'a', 'INTEGER'),
+                  _Field('NULLABLE', 'b', 'BOOL')]
+        rows = self._make_rows(['1', 't'], ['2', None])
+        self.assertEqual(self._make_one(schema).columns(rows),
+                         [[1, 2], [True, None]])
+
+    def test_empty(self):
+        decoder = self._make_one(self._scalar_schema('NULLABLE'))
+        self.assertEqual(decoder.rows([]), [])
+        self.assertEqual(decoder.columns([]), [[]] * 9)
+
+    @unittest.skipIf(numpy is None, 'Requires `numpy`')
+    def test_to_numpy(self):
+        schema = self._scalar_schema('NULLABLE') + [
+            _Field('REQUIRED', 'count', 'INTEGER'),
+            _Field('REQUIRED', 'flag', 'BOOLEAN'),
+            _Field('REPEATED', 'tags', 'STRING'),
+        ]
+        rows = self._scalar_rows()
+        for row, extra in zip(rows, (['1', 't', []],
+                                     ['2', 'f', [{'v': 'a'}]],
+                                     ['3', 'f', []])):
+            row['f'].extend({'v': value} for value in extra)
+
+        arrays = self._make_one(schema).to_numpy(rows)
+
+        self.assertEqual(list(arrays), [field.name for field in schema])
+        self.assertEqual(arrays['int'].dtype, numpy.dtype('float64'))
+        self.assertEqual(arrays['int'][0], 1.0)
+        self.assertTrue(numpy.isnan(arrays['int'][1]))
+        self.assertEqual(arrays['count'].dtype, numpy.dtype('int64'))
+        self.assertEqual(arrays['count'].tolist(), [1, 2, 3])
+        self.assertEqual(arrays['float'][2], -0.25)
+        self.assertEqual(arrays['flag'].dtype, numpy.dtype('bool'))
+        self.assertEqual(arrays['flag'].tolist(), [True, False, False])
+        self.assertEqual(arrays['bool'].dtype, numpy.dtype('object'))
+        self.assertEqual(arrays['bool'].tolist(), [True, None, False])
+        self.assertEqual(arrays['bytes'].tolist(), [b'abc', None, b'def'])
+        self.assertEqual(arrays['ts'][2],
+                         numpy.datetime64('2017-06-16T22:32:00.250'))
+        self.assertTrue(numpy.isnat(arrays['ts'][1]))
+        self.assertEqual(arrays['dt'][0],
+                         numpy.datetime64('2017-01-02T03:04:05'))
+        self.assertEqual(arrays['date'].dtype, numpy.dtype('datetime64[D]'))
+        self.assertEqual(arrays['tags'].tolist(), [[], ['a'], []])
+
+    @unittest.skipIf(numpy is None, 'Requires `numpy`')
+    def test_to_numpy_empty(self):
+        arrays = self._make_one([_Field('NULLABLE', 'a', 'INTEGER')]).to_numpy(
+            [])
+        self.assertEqual(len(arrays['a']), 0)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe(self):
+        schema = [_Field('REQUIRED', 'name', 'STRING'),
+                  _Field('NULLABLE', 'ts', 'TIMESTAMP')]
+        rows = self._make_rows(['a', '0.5'], ['b', None])
+
+        frame = self._make_one(schema).to_dataframe(rows)
+
+        self.assertEqual(list(frame.columns), ['name', 'ts'])
+        self.assertEqual(frame['name'].tolist(), ['a', 'b'])
+        self.assertEqual(frame['ts'][0],
+                         pandas.Timestamp('1970-01-01T00:00:00.5Z'))
+        self.assertTrue(pandas.isnull(frame['ts'][1]))
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow(self):
+        import datetime
+        from google.cloud._helpers import UTC
+
+        schema = self._scalar_schema('NULLABLE') + [
+            _Field('REQUIRED', 'count', 'INTEGER'),
+            _Field('REPEATED', 'tags', 'STRING'),
+            _Field('NULLABLE', 'point', 'RECORD', fields=[
+                _Field('REQUIRED', 'x', 'INTEGER'),
+                _Field('REPEATED', 'ys', 'FLOAT'),
+            ]),
+        ]
+        rows = self._scalar_rows()
+        for row, extra in zip(rows, (
+                ['9007199254740993', [], {'f': [{'v': '1'}, {'v': []}]}],
+                ['2', [{'v': 'a'}], None],
+                ['3', [], {'f': [{'v': '2'}, {'v': [{'v': '0.5'}]}]}])):
+            row['f'].extend({'v': value} for value in extra)
+        decoder = self._make_one(schema)
+
+        batch = decoder.to_arrow(rows)
+
+        self.assertTrue(batch.schema.equals(decoder.arrow_schema()))
+        self.assertEqual(
+            [str(field.type) for field in batch.schema],
+            ['int64', 'double', 'bool', 'string', 'binary',
+             'timestamp[us, tz=UTC]', 'timestamp[us]', 'date32[day]',
+             'time64[us]', 'int64', 'list<item: string>',
+             'struct<x: int64, ys: list<item: double>>'])
+        values = batch.to_pydict()
+        self.assertEqual(values['int'], [1, None, -2])
+        self.assertEqual(values['count'],
+                         [9007199254740993, 2, 3])
+        self.assertEqual(values['bool'], [True, None, False])
+        self.assertEqual(values['bytes'], [b'abc', None, b'def'])
+        self.assertEqual(values['ts'][0].replace(tzinfo=UTC),
+                         datetime.datetime(1970, 1, 1, 0, 0, 1, tzinfo=UTC))
+        self.assertIsNone(values['ts'][1])
+        self.assertEqual(values['date'], [datetime.date(2017, 1, 2), None,
+                                          datetime.date(2016, 12, 31)])
+        self.assertEqual(values['time'][2], datetime.time(23, 59, 59))
+        self.assertEqual(values['tags'], [[], ['a'], []])
+        self.assertEqual(values['point'], [{'x': 1, 'ys': []}, None,
+                                           {'x': 2, 'ys': [0.5]}])
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow_empty(self):
+        decoder = self._make_one(self._scalar_schema('NULLABLE'))
+        self.assertEqual(decoder.to_arrow([]).num_rows, 0)
+
+
+class Test_numpy_from_pages(unittest.TestCase):
+
+    def _call_fut(self, pages):
+        from google.cloud.bigquery._helpers import _numpy_from_pages
+
+        return _numpy_from_pages(pages)
+
+    @unittest.skipIf(numpy is None, 'Requires `numpy`')
+    def test_concatenates_pages(self):
+        from google.cloud.bigquery._helpers import _RowsDecoder
+
+        decoder = _RowsDecoder([_Field('NULLABLE', 'count', 'INTEGER'),
+                                _Field('NULLABLE', 'name', 'STRING')])
+        make_rows = Test_RowsDecoder._make_rows
+        pages = [
+            (decoder, make_rows(['1', 'a'], ['2', 'b'])),
+            (decoder, make_rows([None, 'c'])),
+        ]
+
+        found, arrays = self._call_fut(iter(pages))
+
+        self.assertIs(found, decoder)
+        self.assertEqual(list(arrays), ['count', 'name'])
+        self.assertEqual(arrays['count'].dtype, numpy.dtype('float64'))
+        self.assertEqual(arrays['count'][:2].tolist(), [1.0, 2.0])
+        self.assertTrue(numpy.isnan(arrays['count'][2]))
+        self.assertEqual(arrays['name'].tolist(), ['a', 'b', 'c'])
+
+
+class Test_dataframe_from_pages(unittest.TestCase):
+
+    def _call_fut(self, pages):
+        from google.cloud.bigquery._helpers import _dataframe_from_pages
+
+        return _dataframe_from_pages(pages)
+
+    def test_wo_pandas(self):
+        import mock
+
+        pages = iter([(None, [])])
+        with mock.patch('google.cloud.bigquery._helpers.pandas', new=None):
+            with self.assertRaises(ValueError):
+                self._call_fut(pages)
+        self.assertEqual(list(pages), [(None, [])])
+
+
+class Test_arrow_from_pages(unittest.TestCase):
+
+    def _call_fut(self, pages):
+        from google.cloud.bigquery._helpers import _arrow_from_pages
+
+        return _arrow_from_pages(pages)
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_one_chunk_per_page(self):
+        from google.cloud.bigquery._helpers import _RowsDecoder
+
+        decoder = _RowsDecoder([_Field('NULLABLE', 'count', 'INTEGER')])
+        make_rows = Test_RowsDecoder._make_rows
+        pages = [(decoder, make_rows(['1'], ['2'])),
+                 (decoder, make_rows([None]))]
+
+        table = self._call_fut(pages)
+
+        column = table.column(0)
+        self.assertEqual(column.num_chunks, 2)
+        self.assertEqual(table.to_pydict(), {'count': [1, 2, None]})
+
+    def test_wo_pyarrow(self):
+        import mock
+
+        with mock.patch('google.cloud.bigquery._helpers.pyarrow', new=None):
+            with self.assertRaises(ValueError):
+                self._call_fut([])
+
+
 class Test_int_to_json(unittest.TestCase):
 
     def _call_fut(self, value):
@@ -626,6 +922,20 @@ class Test_timestamp_to_json_row(unittest.TestCase):
         self.assertEqual(
             self._call_fut(when), _microseconds_from_datetime(when) / 1e6)
 
+    def test_w_datetime_w_timezone(self):
+        import datetime
+        from google.cloud._helpers import _microseconds_from_datetime
+
+        class _Offset(datetime.tzinfo):
+
+            def utcoffset(self, _):
+                return datetime.timedelta(hours=-7, minutes=-30)
+
+        when = datetime.datetime(1969, 12, 20, 15, 58, 27, 339328,
+                                 tzinfo=_Offset())
+        self.assertEqual(
+            self._call_fut(when), _microseconds_from_datetime(when) * 1e-6)
+
 
 class Test_datetime_to_json(unittest.TestCase):
 
@@ -682,6 +992,152 @@ class Test_time_to_json(unittest.TestCase):
         self.assertEqual(self._call_fut(when), '12:13:41')
 
 
+class Test_json_bytes(unittest.TestCase):
+
+    def _call_fut(self, value):
+        from google.cloud.bigquery._helpers import _json_bytes
+
+        return _json_bytes(value)
+
+    def test_compact(self):
+        self.assertEqual(
+            self._call_fut({'rows': [{'json': {'a': u'\xe9', 'b': 1.5}}]}),
+            b'{"rows":[{"json":{"a":"\\u00e9","b":1.5}}]}')
+
+
+class Test_RowsEncoder(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery._helpers import _RowsEncoder
+
+        return _RowsEncoder
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _schema():
+        return [
+            _Field('REQUIRED', 'name', 'STRING'),
+            _Field('NULLABLE', 'age', 'INTEGER'),
+            _Field('NULLABLE', 'joined', 'TIMESTAMP'),
+        ]
+
+    def _expected(self):
+        return [
+            {'name': 'Phred', 'age': '32', 'joined': 1.5},
+            {'name': 'Bharney', 'age': None, 'joined': None},
+        ]
+
+    def test_rows_matches_scalar_converters(self):
+        import datetime
+        from google.cloud._helpers import UTC
+        from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_ROW
+
+        types = ['INTEGER', 'FLOAT', 'BOOLEAN', 'STRING', 'BYTES',
+                 'TIMESTAMP', 'DATETIME', 'DATE', 'TIME']
+        schema = [_Field('NULLABLE', field_type.lower(), field_type)
+                  for field_type in types]
+        when = datetime.datetime(2017, 1, 2, 3, 4, 5, 678901)
+        rows = [
+            (1, 1.5, True, 'a', b'abc', when.replace(tzinfo=UTC), when,
+             when.date(), when.time()),
+            (None,) * 9,
+            ('2', '2.5', 'false', u'\xe9', 'YWJj', when, '2017-01-02T03:04',
+             '2017-01-02', '03:04:05'),
+        ]
+        expected = [
+            dict((field.name, _SCALAR_VALUE_TO_JSON_ROW.get(
+                field.field_type, lambda value: value)(value))
+                for field, value in zip(schema, row))
+            for row in rows]
+
+        self.assertEqual(self._make_one(schema).rows(rows), expected)
+
+    def test_rows_w_tuples(self):
+        rows = [('Phred', 32, 1.5), ('Bharney', None, None)]
+        self.assertEqual(
+            self._make_one(self._schema()).rows(rows), self._expected())
+
+    def test_rows_w_short_tuples(self):
+        rows = [('Phred', 32, 1.5), ('Bharney',)]
+        self.assertEqual(
+            self._make_one(self._schema()).rows(rows), self._expected())
+
+    def test_rows_w_dicts(self):
+        rows = iter([
+            {'name': 'Phred', 'age': 32, 'joined': 1.5, 'other': 1},
+            {'name': 'Bharney'},
+        ])
+        self.assertEqual(
+            self._make_one(self._schema()).rows(rows), self._expected())
+
+    def test_rows_w_columns(self):
+        columns = {'name': ['Phred', 'Bharney'], 'age': (32, None)}
+        expected = self._expected()
+        expected[0]['joined'] = None
+        self.assertEqual(
+            self._make_one(self._schema()).rows(columns), expected)
+
+    def test_rows_w_columns_of_different_lengths(self):
+        columns = {'name': ['Phred', 'Bharney'], 'age': [32]}
+        with self.assertRaises(ValueError):
+            self._make_one(self._schema()).rows(columns)
+
+    def test_rows_empty(self):
+        encoder = self._make_one(self._schema())
+        self.assertEqual(encoder.rows([]), [])
+        self.assertEqual(encoder.rows({}), [])
+        self.assertEqual(encoder.columns([]), [[], [], []])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_rows_w_dataframe(self):
+        import datetime
+
+        frame = pandas.DataFrame({
+            'name': ['Phred', 'Bharney'],
+            'age': [32, None],
+            'joined': [datetime.datetime(1970, 1, 1, 0, 0, 1, 500000),
+                       None],
+        })
+        rows = self._make_one(self._schema()).rows(frame)
+        self.assertEqual(rows, self._expected())
+        self.assertIsInstance(rows[0]['joined'], float)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_rows_w_dataframe_w_dates(self):
+        schema = [_Field('NULLABLE', 'day', 'DATE')]
+        frame = pandas.DataFrame({
+            'day': pandas.to_datetime(['2017-01-02', None]),
+        })
+        self.assertEqual(frame['day'].dtype.kind, 'M')
+        rows = self._make_one(schema).rows(frame)
+        self.assertEqual(rows, [{'day': '2017-01-02'}, {'day': None}])
+
+    def test_rows_w_repeated_and_records(self):
+        schema = [
+            _Field('REPEATED', 'tags', 'STRING'),
+            _Field('REPEATED', 'scores', 'INTEGER'),
+            _Field('NULLABLE', 'phone', 'RECORD', fields=[
+                _Field('REQUIRED', 'number', 'STRING'),
+                _Field('REPEATED', 'rank', 'INTEGER'),
+            ]),
+        ]
+        rows = [
+            (['a', 'b'], [1, 2], ('555-1212', [1])),
+            ([], None, {'number': '555-1213', 'rank': None, 'other': 1}),
+            (None, [], None),
+        ]
+        self.assertEqual(self._make_one(schema).rows(rows), [
+            {'tags': ['a', 'b'], 'scores': ['1', '2'],
+             'phone': {'number': '555-1212', 'rank': ['1']}},
+            {'tags': [], 'scores': None,
+             'phone': {'number': '555-1213', 'rank': None, 'other': 1}},
+            {'tags': None, 'scores': [], 'phone': None},
+        ])
+
+
 class Test_ConfigurationProperty(unittest.TestCase):
 
     @staticmethod
@@ -14,6 +14,16 @@
 
 import unittest
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 
 class TestQueryResults(unittest.TestCase):
     PROJECT = 'project'
@@ -692,6 +702,95 @@ class TestQueryResults(unittest.TestCase):
                           'startIndex': START,
                           'timeoutMs': TIMEOUT})
 
+    def _make_pages(self):
+        FIRST = self._makeResource(complete=True)
+        SECOND = self._makeResource(complete=True)
+        del SECOND['pageToken']
+        SECOND['rows'] = SECOND['rows'][:1]
+        return FIRST, SECOND
+
+    def test_to_dataframe_query_not_yet_run(self):
+        client = _Client(project=self.PROJECT, connection=_Connection())
+        query = self._make_one(self.QUERY, client)
+        self.assertRaises(ValueError, query.to_dataframe)
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe(self):
+        PATH = 'projects/%s/queries/%s' % (self.PROJECT, self.JOB_NAME)
+        FIRST, SECOND = self._make_pages()
+        conn = _Connection(FIRST, SECOND)
+        client = _Client(project=self.PROJECT, connection=conn)
+        query = self._make_one(self.QUERY, client)
+        query._set_properties(self._makeResource(complete=False))
+
+        frame = query.to_dataframe(start_index=2, timeout_ms=100)
+
+        self.assertEqual(list(frame.columns), ['full_name', 'age'])
+        self.assertEqual(frame['full_name'].tolist(), [
+            'Phred Phlyntstone', 'Bharney Rhubble', 'Wylma Phlyntstone',
+            'Bhettye Rhubble', 'Phred Phlyntstone'])
+        self.assertEqual(frame['age'].tolist(), [32, 33, 29, 27, 32])
+        self.assertTrue(query.complete)
+
+        self.assertEqual(len(conn._requested), 2)
+        for req in conn._requested:
+            self.assertEqual(req['method'], 'GET')
+            self.assertEqual(req['path'], '/%s' % PATH)
+        self.assertEqual(conn._requested[0]['query_params'],
+                         {'startIndex': 2, 'timeoutMs': 100})
+        self.assertEqual(conn._requested[1]['query_params'],
+                         {'startIndex': 2, 'timeoutMs': 100,
+                          'pageToken': self.TOKEN})
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_w_schema_from_first_page(self):
+        FIRST, SECOND = self._make_pages()
+        conn = _Connection(FIRST, SECOND)
+        client = _Client(project=self.PROJECT, connection=conn)
+        query = self._make_one(self.QUERY, client)
+        query._set_properties({
+            'jobReference': FIRST['jobReference'],
+            'jobComplete': False,
+        })
+        self.assertIsNone(query.schema)
+
+        frame = query.to_dataframe()
+
+        self.assertEqual(list(frame.columns), ['full_name', 'age'])
+        self.assertEqual(len(frame), 5)
+        self.assertEqual([field.name for field in query.schema],
+                         ['full_name', 'age'])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe_not_complete(self):
+        RESOURCE = self._makeResource(complete=False)
+        conn = _Connection(RESOURCE)
+        client = _Client(project=self.PROJECT, connection=conn)
+        query = self._make_one(self.QUERY, client)
+        query._set_properties(RESOURCE)
+
+        with self.assertRaises(ValueError):
+            query.to_dataframe(timeout_ms=100)
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_to_arrow_w_alternate_client(self):
+        FIRST, SECOND = self._make_pages()
+        conn1 = _Connection()
+        client1 = _Client(project=self.PROJECT, connection=conn1)
+        conn2 = _Connection(FIRST, SECOND)
+        client2 = _Client(project=self.PROJECT, connection=conn2)
+        query = self._make_one(self.QUERY, client1)
+        query._set_properties(self._makeResource(complete=False))
+
+        table = query.to_arrow(max_results=10, client=client2)
+
+        self.assertEqual(table.num_rows, 5)
+        self.assertEqual(table.column_names, ['full_name', 'age'])
+        self.assertEqual(str(table.schema.field('age').type), 'int64')
+        self.assertEqual(len(conn1._requested), 0)
+        self.assertEqual(conn2._requested[1]['query_params'],
+                         {'maxResults': 6, 'pageToken': self.TOKEN})
+
 
 class _Client(object):
 
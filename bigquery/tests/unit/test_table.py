@@ -14,6 +14,16 @@
 
 import unittest
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 
 class _SchemaBase(object):
 
@@ -1136,6 +1146,35 @@ class TestTable(unittest.TestCase, _SchemaBase):
         self.assertEqual(req['method'], 'GET')
         self.assertEqual(req['path'], '/%s' % PATH)
 
+    def test_fetch_data_w_stream_items(self):
+        import json
+        from google.cloud.bigquery.table import SchemaField
+
+        DATA = {
+            'totalRows': '2',
+            'rows': [
+                {'f': [{'v': 'Phred Phlyntstone'}, {'v': '32'}]},
+                {'f': [{'v': 'Bharney Rhubble'}, {'v': None}]},
+            ]
+        }
+        conn = _Connection(json.dumps(DATA))
+        client = _Client(project=self.PROJECT, connection=conn)
+        dataset = _Dataset(client)
+        full_name = SchemaField('full_name', 'STRING', mode='REQUIRED')
+        age = SchemaField('age', 'INTEGER', mode='NULLABLE')
+        table = self._make_one(self.TABLE_NAME, dataset=dataset,
+                               schema=[full_name, age])
+
+        iterator = table.fetch_data()
+        iterator.stream_items = True
+        rows = list(iterator)
+
+        self.assertEqual(rows, [('Phred Phlyntstone', 32),
+                                ('Bharney Rhubble', None)])
+        self.assertEqual(iterator.total_rows, 2)
+        req, = conn._requested
+        self.assertFalse(req['expect_json'])
+
     def test_fetch_data_w_alternate_client(self):
         import six
         from google.cloud.bigquery.table import SchemaField
@@ -1323,6 +1362,242 @@ class TestTable(unittest.TestCase, _SchemaBase):
         self.assertEqual(req['method'], 'GET')
         self.assertEqual(req['path'], '/%s' % PATH)
 
+    def _make_data_pages(self):
+        FIRST = {
+            'totalRows': '3',
+            'pageToken': 'TOKEN',
+            'rows': [
+                {'f': [{'v': 'Phred Phlyntstone'}, {'v': '32'},
+                       {'v': [{'v': 'red'}]}]},
+                {'f': [{'v': 'Bharney Rhubble'}, {'v': None},
+                       {'v': []}]},
+            ]
+        }
+        SECOND = {
+            'totalRows': '3',
+            'rows': [
+                {'f': [{'v': 'Wylma Phlyntstone'}, {'v': '29'},
+                       {'v': [{'v': 'blue'}, {'v': 'green'}]}]},
+            ]
+        }
+        return FIRST, SECOND
+
+    def _make_data_table(self, conn):
+        from google.cloud.bigquery.table import SchemaField
+
+        client = _Client(project=self.PROJECT, connection=conn)
+        dataset = _Dataset(client)
+        full_name = SchemaField('full_name', 'STRING', mode='REQUIRED')
+        age = SchemaField('age', 'INTEGER', mode='NULLABLE')
+        colors = SchemaField('colors', 'STRING', mode='REPEATED')
+        return self._make_one(self.TABLE_NAME, dataset=dataset,
+                              schema=[full_name, age, colors])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_fetch_data_to_dataframe(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        conn = _Connection(*self._make_data_pages())
+        table = self._make_data_table(conn)
+
+        iterator = table.fetch_data()
+        self.assertIsInstance(iterator, RowIterator)
+        frame = iterator.to_dataframe()
+
+        self.assertEqual(list(frame.columns), ['full_name', 'age', 'colors'])
+        self.assertEqual(frame['full_name'].tolist(), [
+            'Phred Phlyntstone', 'Bharney Rhubble', 'Wylma Phlyntstone'])
+        self.assertEqual(frame['age'][0], 32)
+        self.assertTrue(pandas.isnull(frame['age'][1]))
+        self.assertEqual(frame['colors'].tolist(),
+                         [['red'], [], ['blue', 'green']])
+        self.assertEqual(iterator.prefetch, 1)
+        self.assertEqual(iterator.total_rows, 3)
+        self.assertEqual(len(conn._requested), 2)
+        self.assertEqual(conn._requested[1]['query_params'],
+                         {'pageToken': 'TOKEN'})
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_fetch_data_to_dataframe_empty(self):
+        conn = _Connection({'totalRows': '0'})
+        table = self._make_data_table(conn)
+
+        iterator = table.fetch_data()
+        frame = iterator.to_dataframe()
+
+        self.assertEqual(list(frame.columns), ['full_name', 'age', 'colors'])
+        self.assertEqual(len(frame), 0)
+        self.assertEqual(iterator.total_rows, 0)
+        self.assertEqual(len(conn._requested), 1)
+
+    @unittest.skipIf(pyarrow is None, 'Requires `pyarrow`')
+    def test_fetch_data_to_arrow(self):
+        FIRST, _ = self._make_data_pages()
+        del FIRST['pageToken']
+        conn = _Connection(FIRST)
+        table = self._make_data_table(conn)
+
+        iterator = table.fetch_data()
+        iterator.prefetch = 2
+        arrow_table = iterator.to_arrow()
+
+        self.assertEqual(iterator.prefetch, 2)
+        self.assertEqual(arrow_table.num_rows, 2)
+        self.assertEqual(arrow_table.to_pydict(), {
+            'full_name': ['Phred Phlyntstone', 'Bharney Rhubble'],
+            'age': [32, None],
+            'colors': [['red'], []],
+        })
+
+    def test_fetch_data_to_dataframe_wo_pandas(self):
+        import mock
+
+        conn = _Connection(*self._make_data_pages())
+        table = self._make_data_table(conn)
+        iterator = table.fetch_data()
+
+        with mock.patch('google.cloud.bigquery._helpers.pandas', new=None):
+            with self.assertRaises(ValueError):
+                iterator.to_dataframe()
+        self.assertEqual(conn._requested, [])
+
+    @staticmethod
+    def _make_shard_page(*ages):
+        return {'rows': [
+            {'f': [{'v': 'Person %d' % (age,)}, {'v': str(age)}]}
+            for age in ages]}
+
+    def test_fetch_data_parallel_wo_schema(self):
+        from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
+
+        client = _Client(project=self.PROJECT)
+        dataset = _Dataset(client)
+        table = self._make_one(self.TABLE_NAME, dataset=dataset)
+        table._properties['numRows'] = '5'
+
+        with self.assertRaises(ValueError) as exc:
+            table.fetch_data_parallel()
+
+        self.assertEqual(exc.exception.args, (_TABLE_HAS_NO_SCHEMA,))
+
+    def test_fetch_data_parallel_w_reload(self):
+        from google.cloud._http import PooledHttp
+
+        PATH = 'projects/%s/datasets/%s/tables/%s' % (
+            self.PROJECT, self.DS_NAME, self.TABLE_NAME)
+        RESOURCE = self._makeResource()
+        RESOURCE['numRows'] = '5'
+        conn = _Connection(
+            RESOURCE,
+            self._make_shard_page(0, 1),
+            self._make_shard_page(2, 3),
+            self._make_shard_page(4))
+        client = _Client(project=self.PROJECT, connection=conn)
+        client._http = PooledHttp(object, size=1)
+        dataset = _Dataset(client)
+        table = self._make_one(self.TABLE_NAME, dataset=dataset)
+
+        rows = list(table.fetch_data_parallel(max_workers=1, shard_size=2))
+
+        self.assertEqual(rows, [('Person %d' % (age,), age)
+                                for age in range(5)])
+        reload_req = conn._requested[0]
+        self.assertEqual(reload_req['path'], '/%s' % PATH)
+        shard_reqs = conn._requested[1:]
+        self.assertEqual(len(shard_reqs), 3)
+        for req in shard_reqs:
+            self.assertEqual(req['method'], 'GET')
+            self.assertEqual(req['path'], '/%s/data' % PATH)
+        self.assertEqual(
+            [req['query_params'] for req in shard_reqs],
+            [{'startIndex': 0, 'maxResults': 2},
+             {'startIndex': 2, 'maxResults': 2},
+             {'startIndex': 4, 'maxResults': 1}])
+
+    def test_fetch_data_parallel_default_shards(self):
+        import mock
+        from google.cloud._http import PooledHttp
+        from google.cloud.bigquery.table import SchemaField
+
+        client = _Client(project=self.PROJECT)
+        client._http = PooledHttp(object, size=2)
+        dataset = _Dataset(client)
+        full_name = SchemaField('full_name', 'STRING', mode='REQUIRED')
+        table = self._make_one(self.TABLE_NAME, dataset=dataset,
+                               schema=[full_name])
+        table._properties['numRows'] = '100000'
+
+        patch = mock.patch('google.cloud.bigquery.table._fetch_shards')
+        with patch as fetch_shards:
+            result = table.fetch_data_parallel(ordered=False)
+
+        self.assertIs(result, fetch_shards.return_value)
+        _, shards, max_workers, ordered = fetch_shards.call_args[0]
+        self.assertEqual(shards, [(0, 12500), (12500, 12500),
+                                  (25000, 12500), (37500, 12500),
+                                  (50000, 12500), (62500, 12500),
+                                  (75000, 12500), (87500, 12500)])
+        self.assertEqual(max_workers, 2)
+        self.assertFalse(ordered)
+
+    def test_fetch_data_parallel_wo_pooled_http(self):
+        import mock
+        from google.cloud._http import DEFAULT_POOL_SIZE
+        from google.cloud._http import PooledHttp
+        from google.cloud.bigquery.table import SchemaField
+
+        PATH = '/bigquery/v2/projects/%s/datasets/%s/tables/%s/data' % (
+            self.PROJECT, self.DS_NAME, self.TABLE_NAME)
+        conn = _Connection()
+        client = _Client(project=self.PROJECT, connection=conn)
+        client._http = object()
+        client._credentials = object()
+        dataset = _Dataset(client)
+        full_name = SchemaField('full_name', 'STRING', mode='REQUIRED')
+        age = SchemaField('age', 'INTEGER', mode='REQUIRED')
+        table = self._make_one(self.TABLE_NAME, dataset=dataset,
+                               schema=[full_name, age])
+        table._properties['numRows'] = '25'
+        shard_https = []
+
+        def http_factory():
+            http = _ShardHTTP(self._make_shard_page)
+            shard_https.append(http)
+            return http
+
+        def from_credentials(credentials, size):
+            return PooledHttp(http_factory, size=size)
+
+        with mock.patch.object(PooledHttp, 'from_credentials',
+                               side_effect=from_credentials) as pooled:
+            rows = list(table.fetch_data_parallel(shard_size=5))
+
+        pooled.assert_called_once_with(
+            client._credentials, size=DEFAULT_POOL_SIZE)
+        self.assertEqual(rows, [('Person %d' % (age,), age)
+                                for age in range(25)])
+        self.assertEqual(conn._requested, [])
+        uris = sorted(uri for http in shard_https for uri in http._requested)
+        self.assertEqual(len(uris), 5)
+        for uri in uris:
+            self.assertIn(PATH, uri)
+
+    def test_fetch_data_parallel_empty_table(self):
+        from google.cloud._http import PooledHttp
+        from google.cloud.bigquery.table import SchemaField
+
+        conn = _Connection()
+        client = _Client(project=self.PROJECT, connection=conn)
+        client._http = PooledHttp(object, size=4)
+        dataset = _Dataset(client)
+        full_name = SchemaField('full_name', 'STRING', mode='REQUIRED')
+        table = self._make_one(self.TABLE_NAME, dataset=dataset,
+                               schema=[full_name])
+        table._properties['numRows'] = '0'
+
+        self.assertEqual(list(table.fetch_data_parallel(max_workers=4)), [])
+        self.assertEqual(conn._requested, [])
+
     def test_insert_data_wo_schema(self):
         from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
 
@@ -1341,7 +1616,47 @@ class TestTable(unittest.TestCase, _SchemaBase):
 
         self.assertEqual(exc.exception.args, (_TABLE_HAS_NO_SCHEMA,))
 
+    def test_streaming_writer(self):
+        import json
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.writer import StreamingWriter
+
+        conn = _Connection({})
+        client = _Client(project=self.PROJECT, connection=conn)
+        dataset = _Dataset(client)
+        full_name = SchemaField('full_name', 'STRING', mode='REQUIRED')
+        age = SchemaField('age', 'INTEGER', mode='REQUIRED')
+        table = self._make_one(self.TABLE_NAME, dataset=dataset,
+                               schema=[full_name, age])
+
+        with table.streaming_writer(max_rows=10) as writer:
+            self.assertIsInstance(writer, StreamingWriter)
+            writer.write(('Phred Phlyntstone', 32), row_id='phred')
+
+        self.assertEqual(writer.errors, [])
+        self.assertEqual(len(conn._requested), 1)
+        req = conn._requested[0]
+        self.assertEqual(req['method'], 'POST')
+        self.assertEqual(req['path'], table.path + '/insertAll')
+        self.assertEqual(json.loads(req['data'].decode('ascii')), {'rows': [{
+            'json': {'full_name': 'Phred Phlyntstone', 'age': '32'},
+            'insertId': 'phred',
+        }]})
+
+    def test_streaming_writer_wo_schema(self):
+        from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
+
+        client = _Client(project=self.PROJECT)
+        dataset = _Dataset(client)
+        table = self._make_one(self.TABLE_NAME, dataset=dataset)
+
+        with self.assertRaises(ValueError) as exc:
+            table.streaming_writer()
+
+        self.assertEqual(exc.exception.args, (_TABLE_HAS_NO_SCHEMA,))
+
     def test_insert_data_w_bound_client(self):
+        import json
         import datetime
         from google.cloud._helpers import UTC
         from google.cloud._helpers import _datetime_to_rfc3339
@@ -1387,9 +1702,58 @@ class TestTable(unittest.TestCase, _SchemaBase):
         req = conn._requested[0]
         self.assertEqual(req['method'], 'POST')
         self.assertEqual(req['path'], '/%s' % PATH)
-        self.assertEqual(req['data'], SENT)
+        self.assertEqual(req['content_type'], 'application/json')
+        self.assertEqual(json.loads(req['data'].decode('ascii')), SENT)
+
+    def test_insert_data_w_columns(self):
+        import json
+        from google.cloud.bigquery.table import SchemaField
+
+        conn = _Connection({})
+        client = _Client(project=self.PROJECT, connection=conn)
+        dataset = _Dataset(client)
+        full_name = SchemaField('full_name', 'STRING', mode='REQUIRED')
+        age = SchemaField('age', 'INTEGER', mode='NULLABLE')
+        table = self._make_one(self.TABLE_NAME, dataset=dataset,
+                               schema=[full_name, age])
+        COLUMNS = {
+            'full_name': ['Phred Phlyntstone', 'Bharney Rhubble'],
+            'age': [32, None],
+        }
+        SENT = {
+            'rows': [
+                {'insertId': 'a',
+                 'json': {'full_name': 'Phred Phlyntstone', 'age': '32'}},
+                {'insertId': 'b',
+                 'json': {'full_name': 'Bharney Rhubble', 'age': None}},
+            ],
+        }
+
+        errors = table.insert_data(COLUMNS, row_ids=['a', 'b'])
+
+        self.assertEqual(errors, [])
+        req, = conn._requested
+        self.assertEqual(json.loads(req['data'].decode('ascii')), SENT)
+
+    def test_insert_data_w_wrong_number_of_row_ids(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        conn = _Connection({})
+        client = _Client(project=self.PROJECT, connection=conn)
+        dataset = _Dataset(client)
+        full_name = SchemaField('full_name', 'STRING', mode='REQUIRED')
+        table = self._make_one(self.TABLE_NAME, dataset=dataset,
+                               schema=[full_name])
+        ROWS = [('Phred Phlyntstone',), ('Bharney Rhubble',)]
+
+        for row_ids in (['a'], ['a', 'b', 'c']):
+            with self.assertRaises(ValueError):
+                table.insert_data(ROWS, row_ids=row_ids)
+
+        self.assertEqual(conn._requested, [])
 
     def test_insert_data_w_alternate_client(self):
+        import json
         from google.cloud.bigquery.table import SchemaField
 
         PATH = 'projects/%s/datasets/%s/tables/%s/insertAll' % (
@@ -1456,9 +1820,10 @@ class TestTable(unittest.TestCase, _SchemaBase):
         req = conn2._requested[0]
         self.assertEqual(req['method'], 'POST')
         self.assertEqual(req['path'], '/%s' % PATH)
-        self.assertEqual(req['data'], SENT)
+        self.assertEqual(json.loads(req['data'].decode('ascii')), SENT)
 
     def test_insert_data_w_repeated_fields(self):
+        import json
         from google.cloud.bigquery.table import SchemaField
 
         PATH = 'projects/%s/datasets/%s/tables/%s/insertAll' % (
@@ -1479,7 +1844,8 @@ class TestTable(unittest.TestCase, _SchemaBase):
 
         def _row_data(row):
             return {'color': row[0],
-                    'struct': row[1]}
+                    'struct': [{'index': ['1', '2'],
+                                'score': [3.1415, 1.414]}]}
 
         SENT = {
             'rows': [{'json': _row_data(row)} for row in ROWS],
@@ -1492,9 +1858,10 @@ class TestTable(unittest.TestCase, _SchemaBase):
         req = conn._requested[0]
         self.assertEqual(req['method'], 'POST')
         self.assertEqual(req['path'], '/%s' % PATH)
-        self.assertEqual(req['data'], SENT)
+        self.assertEqual(json.loads(req['data'].decode('ascii')), SENT)
 
     def test_insert_data_w_record_schema(self):
+        import json
         from google.cloud.bigquery.table import SchemaField
 
         PATH = 'projects/%s/datasets/%s/tables/%s/insertAll' % (
@@ -1521,8 +1888,11 @@ class TestTable(unittest.TestCase, _SchemaBase):
         ]
 
         def _row_data(row):
+            phone = row[1]
+            if phone is not None:
+                phone = dict(phone, rank=str(phone['rank']))
             return {'full_name': row[0],
-                    'phone': row[1]}
+                    'phone': phone}
 
         SENT = {
             'rows': [{'json': _row_data(row)} for row in ROWS],
@@ -1535,7 +1905,7 @@ class TestTable(unittest.TestCase, _SchemaBase):
         req = conn._requested[0]
         self.assertEqual(req['method'], 'POST')
         self.assertEqual(req['path'], '/%s' % PATH)
-        self.assertEqual(req['data'], SENT)
+        self.assertEqual(json.loads(req['data'].decode('ascii')), SENT)
 
     def test_upload_from_file_text_mode_file_failure(self):
 
@@ -1828,6 +2198,203 @@ class TestTable(unittest.TestCase, _SchemaBase):
         self.assertEqual(req['body'], BODY)
     # pylint: enable=too-many-statements
 
+    def _load_table(self, *fields):
+        from google.cloud.bigquery.table import SchemaField
+
+        conn = _Connection()
+        conn.http = _ResumableHTTP()
+        client = _Client(project=self.PROJECT, connection=conn)
+        client._job = object()
+        dataset = _Dataset(client)
+        if not fields:
+            fields = (SchemaField('full_name', 'STRING', mode='REQUIRED'),
+                      SchemaField('age', 'INTEGER'))
+        table = self._make_one(self.TABLE_NAME, dataset=dataset,
+                               schema=list(fields))
+        return table, conn.http._requested
+
+    def test_load_from_iterable(self):
+        import json
+        from six.moves.urllib.parse import parse_qsl
+        from six.moves.urllib.parse import urlsplit
+
+        table, requested = self._load_table()
+        rows = iter([('Phred Phlyntstone', 32), ('Bharney Rhubble', None)])
+
+        job = table.load_from_iterable(
+            rows, create_disposition='CREATE_IF_NEEDED',
+            ignore_unknown_values=True, max_bad_records=1,
+            write_disposition='WRITE_APPEND')
+
+        self.assertIs(job, table._dataset._client._job)
+        self.assertEqual(len(requested), 2)
+        req = requested[0]
+        self.assertEqual(req['method'], 'POST')
+        _, _, path, qs, _ = urlsplit(req['uri'])
+        self.assertEqual(path, '/projects/%s/jobs' % (self.PROJECT,))
+        self.assertEqual(dict(parse_qsl(qs)), {'uploadType': 'resumable'})
+        load_config = json.loads(req['body'])['configuration']['load']
+        self.assertEqual(load_config['sourceFormat'],
+                         'NEWLINE_DELIMITED_JSON')
+        self.assertEqual(load_config['createDisposition'], 'CREATE_IF_NEEDED')
+        self.assertEqual(load_config['ignoreUnknownValues'], True)
+        self.assertEqual(load_config['maxBadRecords'], 1)
+        self.assertEqual(load_config['writeDisposition'], 'WRITE_APPEND')
+        self.assertEqual(len(load_config['schema']['fields']), 2)
+        self.assertNotIn('allowQuotedNewlines', load_config)
+
+        body = (b'{"full_name":"Phred Phlyntstone","age":"32"}\n'
+                b'{"full_name":"Bharney Rhubble","age":null}\n')
+        req = requested[1]
+        self.assertEqual(req['method'], 'PUT')
+        self.assertEqual(req['uri'], _ResumableHTTP.UPLOAD_URL)
+        self.assertEqual(req['headers']['Content-Type'],
+                         'application/octet-stream')
+        self.assertEqual(req['headers']['Content-Range'],
+                         'bytes 0-%d/%d' % (len(body) - 1, len(body)))
+        self.assertEqual(req['body'], body)
+
+    def test_load_from_iterable_csv_gzip_in_chunks(self):
+        import json
+        import mock
+        import zlib
+
+        table, requested = self._load_table()
+        rows = [(u'Phred \xe9, "Jr."\n', index) for index in range(50)]
+
+        with mock.patch('google.cloud.bigquery.table._LOAD_BATCH_ROWS', 7):
+            with mock.patch('google.cloud.bigquery.table._LOAD_CHUNKSIZE',
+                            64):
+                table.load_from_iterable(
+                    rows, source_format='CSV', compression='GZIP')
+
+        load_config = json.loads(requested[0]['body'])['configuration'][
+            'load']
+        self.assertEqual(load_config['sourceFormat'], 'CSV')
+        self.assertEqual(load_config['allowQuotedNewlines'], True)
+        chunks = requested[1:]
+        self.assertGreater(len(chunks), 2)
+        for chunk in chunks[:-1]:
+            self.assertEqual(len(chunk['body']), 64)
+            self.assertTrue(chunk['headers']['Content-Range'].endswith('/*'))
+        body = b''.join(chunk['body'] for chunk in chunks)
+        self.assertTrue(chunks[-1]['headers']['Content-Range'].endswith(
+            '/%d' % (len(body),)))
+        expected = b''.join(
+            b'"Phred \xc3\xa9, ""Jr.""\n",' + str(index).encode('ascii') +
+            b'\n' for index in range(50))
+        self.assertEqual(zlib.decompress(body, 16 + zlib.MAX_WBITS),
+                         expected)
+
+    def test_load_from_iterable_w_adaptive_chunksize(self):
+        import itertools
+        import mock
+
+        table, requested = self._load_table()
+        rows = [(u'Phred Phlyntstone', index) for index in range(50)]
+        # Each chunk takes a second to send, half the target time.
+        timer = mock.patch('google.cloud.streaming.transfer._timer',
+                           side_effect=itertools.count())
+        multiple = mock.patch(
+            'google.cloud.streaming.transfer._ADAPTIVE_CHUNK_MULTIPLE', 64)
+
+        with timer, multiple:
+            with mock.patch('google.cloud.bigquery.table._LOAD_CHUNKSIZE',
+                            64):
+                table.load_from_iterable(
+                    rows, source_format='CSV', adaptive_chunksize=True)
+
+        chunks = requested[1:]
+        self.assertEqual([len(chunk['body']) for chunk in chunks[:-1]],
+                         [64, 128, 256, 512][:len(chunks) - 1])
+        self.assertGreater(len(chunks), 3)
+        body = b''.join(chunk['body'] for chunk in chunks)
+        self.assertEqual(body, b''.join(
+            b'Phred Phlyntstone,' + str(index).encode('ascii') + b'\n'
+            for index in range(50)))
+
+    def test_upload_from_file_w_adaptive_chunksize(self):
+        import io
+        import mock
+        from google.cloud.streaming.transfer import Upload
+
+        class _UploadConfig(object):
+            accept = ['*/*']
+            max_size = None
+            resumable_multipart = True
+            resumable_path = u'/upload/bigquery/v2/projects/{project}/jobs'
+            simple_multipart = True
+            simple_path = u''  # force resumable
+
+        table, requested = self._load_table()
+        data = b'Phred Phlyntstone,32\n'
+
+        with mock.patch('google.cloud.bigquery.table._UploadConfig',
+                        new=_UploadConfig):
+            with mock.patch('google.cloud.bigquery.table.Upload',
+                            wraps=Upload) as upload:
+                table.upload_from_file(
+                    io.BytesIO(data), 'CSV', size=len(data),
+                    adaptive_chunksize=True)
+
+        self.assertIs(upload.call_args[1]['adaptive_chunksize'], True)
+        self.assertEqual(requested[-1]['body'], data)
+
+    def test_load_from_iterable_empty(self):
+        table, requested = self._load_table()
+
+        table.load_from_iterable([])
+
+        self.assertEqual(len(requested), 2)
+        self.assertEqual(requested[1]['body'], b'')
+        self.assertEqual(requested[1]['headers']['Content-Range'],
+                         'bytes */0')
+
+    def test_load_from_iterable_wo_schema(self):
+        from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
+
+        client = _Client(project=self.PROJECT)
+        table = self._make_one(self.TABLE_NAME, dataset=_Dataset(client))
+
+        with self.assertRaises(ValueError) as exc:
+            table.load_from_iterable([('Phred Phlyntstone', 32)])
+
+        self.assertEqual(exc.exception.args, (_TABLE_HAS_NO_SCHEMA,))
+
+    def test_load_from_iterable_w_invalid_options(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        table, requested = self._load_table()
+        with self.assertRaises(ValueError):
+            table.load_from_iterable([], source_format='AVRO')
+        with self.assertRaises(ValueError):
+            table.load_from_iterable([], compression='ZIP')
+
+        table, requested = self._load_table(
+            SchemaField('color', 'STRING', mode='REPEATED'))
+        with self.assertRaises(ValueError):
+            table.load_from_iterable([], source_format='CSV')
+        self.assertEqual(requested, [])
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_load_from_dataframe(self):
+        import mock
+
+        table, requested = self._load_table()
+        frame = pandas.DataFrame({
+            'age': [32, None, 29],
+            'full_name': ['Phred Phlyntstone', 'Bharney Rhubble',
+                          'Wylma Phlyntstone'],
+        })
+
+        with mock.patch('google.cloud.bigquery.table._LOAD_BATCH_ROWS', 2):
+            table.load_from_dataframe(frame)
+
+        self.assertEqual(requested[1]['body'], (
+            b'{"full_name":"Phred Phlyntstone","age":"32"}\n'
+            b'{"full_name":"Bharney Rhubble","age":null}\n'
+            b'{"full_name":"Wylma Phlyntstone","age":"29"}\n'))
+
 
 class Test_parse_schema_resource(unittest.TestCase, _SchemaBase):
 
@@ -1942,6 +2509,68 @@ class Test_build_schema_resource(unittest.TestCase, _SchemaBase):
                                       'mode': 'REQUIRED'}]})
 
 
+class Test__fetch_shards(unittest.TestCase):
+
+    def _call_fut(self, fetch_shard, shards, max_workers, ordered):
+        from google.cloud.bigquery.table import _fetch_shards
+
+        return _fetch_shards(fetch_shard, shards, max_workers, ordered)
+
+    @staticmethod
+    def _fetch_w_first_blocked(first_released):
+        def fetch_shard(start, count):
+            if start == 0:
+                first_released.wait(5)
+            return list(range(start, start + count))
+
+        return fetch_shard
+
+    def test_ordered(self):
+        import threading
+
+        first_released = threading.Event()
+        first_released.set()
+        rows = self._call_fut(self._fetch_w_first_blocked(first_released),
+                              [(0, 2), (2, 2), (4, 1)], 3, True)
+        self.assertEqual(list(rows), [0, 1, 2, 3, 4])
+
+    def test_unordered(self):
+        import threading
+
+        first_released = threading.Event()
+        rows = self._call_fut(self._fetch_w_first_blocked(first_released),
+                              [(0, 2), (2, 2), (4, 1)], 3, False)
+        # The later shards are yielded while the first is still fetched.
+        found = [next(rows) for _ in range(3)]
+        first_released.set()
+        self.assertEqual(sorted(found), [2, 3, 4])
+        self.assertEqual(list(rows), [0, 1])
+
+    def test_bounds_pending_shards(self):
+        started = []
+
+        def fetch_shard(start, count):
+            started.append(start)
+            return [start]
+
+        rows = self._call_fut(fetch_shard, [(start, 1)
+                                            for start in range(10)], 1, True)
+        self.assertEqual(next(rows), 0)
+        self.assertLessEqual(len(started), 2)
+        self.assertEqual(list(rows), list(range(1, 10)))
+
+    def test_error(self):
+        def fetch_shard(start, count):
+            if start == 1:
+                raise ValueError(start)
+            return [start]
+
+        rows = self._call_fut(fetch_shard, [(0, 1), (1, 1), (2, 1)], 1, True)
+        self.assertEqual(next(rows), 0)
+        with self.assertRaises(ValueError):
+            list(rows)
+
+
 class _Client(object):
 
     _query_results = ()
@@ -2007,6 +2636,58 @@ class _HTTP(_Responder):
                              body=body, **kw)
 
 
+class _ShardHTTP(object):
+    """Answer each ``tabledata.list`` request with the rows it asks for."""
+
+    connections = {}
+
+    def __init__(self, make_page):
+        self._make_page = make_page
+        self._requested = []
+
+    def request(self, uri, method, headers, body, **kw):
+        import json
+        from httplib2 import Response
+        from six.moves.urllib.parse import parse_qsl
+        from six.moves.urllib.parse import urlsplit
+
+        self._requested.append(uri)
+        query = dict(parse_qsl(urlsplit(uri).query))
+        start = int(query['startIndex'])
+        count = int(query['maxResults'])
+        payload = self._make_page(*range(start, start + count))
+        response = Response(
+            {'status': '200', 'content-type': 'application/json'})
+        return response, json.dumps(payload).encode('utf-8')
+
+
+class _ResumableHTTP(object):
+    """Accept a resumable upload of unknown size, chunk by chunk."""
+
+    UPLOAD_URL = 'https://example.com/upload/test'
+    connections = {}  # For google-apitools debugging.
+
+    def __init__(self):
+        self._requested = []
+        self._received = 0
+
+    def request(self, uri, method, headers, body, **kw):
+        from six.moves.http_client import OK
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+
+        if hasattr(body, 'read'):
+            body = body.read()
+        self._requested.append({
+            'uri': uri, 'method': method, 'headers': headers, 'body': body})
+        if method == 'POST':
+            return {'status': OK, 'location': self.UPLOAD_URL}, b''
+        self._received += len(body)
+        if headers['Content-Range'].endswith('/*'):
+            return ({'status': RESUME_INCOMPLETE,
+                     'range': 'bytes=0-%d' % (self._received - 1,)}, b'')
+        return {'status': OK}, b'{}'
+
+
 class _Connection(_Responder):
 
     API_BASE_URL = 'http://example.com'
@@ -2053,3 +2734,109 @@ def _email_chunk_parser():
 
         parser = Parser()
         return parser.parsestr
+
+
+class Test__batches(unittest.TestCase):
+
+    def _call_fut(self, rows, size):
+        from google.cloud.bigquery.table import _batches
+
+        return _batches(rows, size)
+
+    def test_lazy(self):
+        rows = iter(range(5))
+        batches = self._call_fut(rows, 2)
+        self.assertEqual(next(batches), [0, 1])
+        self.assertEqual(next(rows), 2)
+        self.assertEqual(list(batches), [[3, 4]])
+
+    def test_empty(self):
+        self.assertEqual(list(self._call_fut([], 2)), [])
+
+
+class Test__csv_bytes(unittest.TestCase):
+
+    def _call_fut(self, rows):
+        from google.cloud.bigquery.table import _csv_bytes
+
+        return _csv_bytes(rows)
+
+    def test_values(self):
+        rows = [(u'\xe9', '32', None, 1.5), ('a,b', 'c"d', 'e\nf', '')]
+        self.assertEqual(
+            self._call_fut(rows),
+            b'\xc3\xa9,32,,1.5\n"a,b","c""d","e\nf",\n')
+
+
+class Test__gzip_chunks(unittest.TestCase):
+
+    def _call_fut(self, chunks):
+        from google.cloud.bigquery.table import _gzip_chunks
+
+        return _gzip_chunks(chunks)
+
+    def test_round_trip(self):
+        import zlib
+
+        chunks = [b'abc' * 1000, b'', b'def']
+        compressed = b''.join(self._call_fut(iter(chunks)))
+        self.assertLess(len(compressed), 100)
+        self.assertEqual(zlib.decompress(compressed, 16 + zlib.MAX_WBITS),
+                         b''.join(chunks))
+
+
+class Test_ChunkStream(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.table import _ChunkStream
+
+        return _ChunkStream
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_read(self):
+        chunks = iter([b'abc', b'', b'defg', b'h'])
+        stream = self._make_one(chunks)
+        self.assertFalse(stream.closed)
+        self.assertFalse(stream.seekable())
+        self.assertEqual(stream.read(2), b'ab')
+        self.assertEqual(stream.tell(), 2)
+        # Reads only as many chunks as it needs.
+        self.assertEqual(stream.read(4), b'cdef')
+        self.assertEqual(next(chunks), b'h')
+        self.assertEqual(stream.read(4), b'g')
+        self.assertEqual(stream.read(4), b'')
+        self.assertEqual(stream.tell(), 7)
+
+    def test_read_all(self):
+        stream = self._make_one([b'abc', b'def'])
+        self.assertEqual(stream.read(1), b'a')
+        self.assertEqual(stream.read(), b'bcdef')
+        self.assertEqual(stream.read(), b'')
+
+    def test_seek_within_last_read(self):
+        stream = self._make_one([b'abc', b'def'])
+        stream.read(2)
+        stream.read(3)
+        stream.seek(3)
+        self.assertEqual(stream.tell(), 3)
+        stream.seek(3)
+        self.assertEqual(stream.read(2), b'de')
+        stream.seek(5)
+        self.assertEqual(stream.read(), b'f')
+
+    def test_seek_outside_last_read(self):
+        import os
+
+        stream = self._make_one([b'abcdef'])
+        stream.read(2)
+        stream.read(2)
+        with self.assertRaises(ValueError):
+            stream.seek(1)
+        with self.assertRaises(ValueError):
+            stream.seek(5)
+        with self.assertRaises(ValueError):
+            stream.seek(0, os.SEEK_END)
+        self.assertEqual(stream.read(), b'ef')
@@ -0,0 +1,285 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+def _make_table(*insert_results):
+    from google.cloud.bigquery.schema import SchemaField
+
+    table = mock.Mock(spec=['schema', '_insert_all'])
+    table.schema = [
+        SchemaField('name', 'STRING', mode='REQUIRED'),
+        SchemaField('age', 'INTEGER'),
+    ]
+    table._insert_all.side_effect = list(insert_results) or None
+    table._insert_all.return_value = []
+    return table
+
+
+def _info(name, age, row_id):
+    return {'json': {'name': name, 'age': str(age)}, 'insertId': row_id}
+
+
+class TestStreamingWriter(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.writer import StreamingWriter
+
+        return StreamingWriter
+
+    def _make_one(self, *args, **kw):
+        writer = self._get_target_class()(*args, **kw)
+        self.addCleanup(writer.close)
+        return writer
+
+    def _sent(self, table):
+        return [call[0][0] for call in table._insert_all.call_args_list]
+
+    def test_ctor_defaults(self):
+        table = _make_table()
+        writer = self._make_one(table, max_latency=60)
+        self.assertIs(writer.table, table)
+        self.assertEqual(writer.max_rows, 500)
+        self.assertEqual(writer.max_bytes, 10 * 1024 * 1024 - 4096)
+        self.assertEqual(writer.max_queued_rows, 5000)
+        self.assertEqual(writer.max_retries, 3)
+        self.assertEqual(writer.errors, [])
+        self.assertTrue(writer._thread.daemon)
+        self.assertTrue(writer._thread.is_alive())
+
+    def test_ctor_wo_schema(self):
+        from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
+
+        table = _make_table()
+        table.schema = []
+        with self.assertRaises(ValueError) as exc:
+            self._get_target_class()(table)
+        self.assertEqual(exc.exception.args, (_TABLE_HAS_NO_SCHEMA,))
+
+    def test_ctor_w_negative_max_retries(self):
+        with self.assertRaises(ValueError):
+            self._get_target_class()(_make_table(), max_retries=-1)
+
+    def test_write_and_close(self):
+        client = object()
+        table = _make_table()
+        writer = self._make_one(
+            table, max_latency=60, skip_invalid_rows=True,
+            ignore_unknown_values=False, template_suffix='_suffix',
+            client=client)
+        writer.write(('Phred', 32), row_id='a')
+        writer.write(('Bharney', 33), row_id='b')
+
+        self.assertEqual(writer.close(), [])
+        self.assertFalse(writer._thread.is_alive())
+        table._insert_all.assert_called_once_with(
+            [_info('Phred', 32, 'a'), _info('Bharney', 33, 'b')],
+            skip_invalid_rows=True, ignore_unknown_values=False,
+            template_suffix='_suffix', client=client)
+
+    def test_write_dict(self):
+        table = _make_table()
+        with self._make_one(table, max_latency=60) as writer:
+            writer.write({'name': 'Phred', 'age': 32}, row_id='a')
+
+        self.assertEqual(self._sent(table), [[_info('Phred', 32, 'a')]])
+
+    def test_write_default_row_id(self):
+        table = _make_table()
+        with self._make_one(table, max_latency=60) as writer:
+            writer.write_rows([('Phred', 32), ('Bharney', 33)])
+
+        rows, = self._sent(table)
+        row_ids = [row['insertId'] for row in rows]
+        self.assertEqual(len(row_ids[0]), 32)
+        self.assertNotEqual(row_ids[0], row_ids[1])
+
+    def test_write_after_close(self):
+        writer = self._make_one(_make_table())
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write(('Phred', 32))
+
+    def test_write_row_too_large(self):
+        table = _make_table()
+        writer = self._make_one(table, max_bytes=50)
+        with self.assertRaises(ValueError):
+            writer.write(('Phred' * 10, 32))
+        writer.close()
+        table._insert_all.assert_not_called()
+
+    def test_batches_by_max_rows(self):
+        table = _make_table()
+        with self._make_one(table, max_rows=2, max_latency=60) as writer:
+            for index in range(5):
+                writer.write(('Phred', index), row_id=str(index))
+
+        self.assertEqual(self._sent(table), [
+            [_info('Phred', 0, '0'), _info('Phred', 1, '1')],
+            [_info('Phred', 2, '2'), _info('Phred', 3, '3')],
+            [_info('Phred', 4, '4')],
+        ])
+
+    def test_batches_by_max_bytes(self):
+        from google.cloud.bigquery._helpers import _json_bytes
+
+        table = _make_table()
+        size = len(_json_bytes(_info('Phred', 0, '0'))) + 1
+        with self._make_one(
+                table, max_bytes=2 * size + 1, max_latency=60) as writer:
+            for index in range(5):
+                writer.write(('Phred', index), row_id=str(index))
+
+        self.assertEqual([len(rows) for rows in self._sent(table)],
+                         [2, 2, 1])
+
+    def test_sends_after_max_latency(self):
+        import threading
+
+        sent = threading.Event()
+        table = _make_table()
+        table._insert_all.side_effect = lambda *args, **kw: sent.set() or []
+        writer = self._make_one(table, max_latency=0.01)
+        writer.write(('Phred', 32), row_id='a')
+
+        self.assertTrue(sent.wait(5))
+        table._insert_all.assert_called_once_with(
+            [_info('Phred', 32, 'a')], skip_invalid_rows=None,
+            ignore_unknown_values=None, template_suffix=None, client=None)
+
+    def test_flush(self):
+        table = _make_table()
+        writer = self._make_one(table, max_latency=60)
+        writer.write(('Phred', 32), row_id='a')
+
+        writer.flush()
+
+        self.assertEqual(self._sent(table), [[_info('Phred', 32, 'a')]])
+        self.assertTrue(writer._thread.is_alive())
+        writer.write(('Bharney', 33), row_id='b')
+        writer.flush()
+        self.assertEqual(len(self._sent(table)), 2)
+
+    def test_write_blocks_while_buffer_full(self):
+        import threading
+
+        release = threading.Event()
+        table = _make_table()
+        table._insert_all.side_effect = lambda *args, **kw: (
+            release.wait() and [])
+        writer = self._make_one(
+            table, max_rows=1, max_queued_rows=1, max_latency=60)
+        writer.write(('Phred', 0), row_id='0')
+        # The first row is being sent; the second fills the buffer.
+        writer.write(('Phred', 1), row_id='1')
+        blocked = threading.Thread(
+            target=writer.write, args=(('Phred', 2), '2'))
+        blocked.start()
+        blocked.join(0.05)
+        self.assertTrue(blocked.is_alive())
+
+        release.set()
+        blocked.join()
+        writer.close()
+        self.assertEqual([rows[0]['insertId'] for rows in self._sent(table)],
+                         ['0', '1', '2'])
+
+    @mock.patch('time.sleep')
+    def test_retries_failed_rows(self, sleep):
+        table = _make_table(
+            [{'index': 1, 'errors': [{'reason': 'backendError'}]}],
+            [])
+        with self._make_one(table, max_latency=60) as writer:
+            writer.write(('Phred', 32), row_id='a')
+            writer.write(('Bharney', 33), row_id='b')
+
+        self.assertEqual(writer.errors, [])
+        self.assertEqual(self._sent(table), [
+            [_info('Phred', 32, 'a'), _info('Bharney', 33, 'b')],
+            [_info('Bharney', 33, 'b')],
+        ])
+        sleep.assert_called_once_with(1.0)
+
+    @mock.patch('time.sleep')
+    def test_does_not_retry_invalid_rows(self, sleep):
+        errors = [{'reason': 'invalid', 'message': 'no such field'}]
+        table = _make_table([{'index': 0, 'errors': errors}])
+        with self._make_one(table, max_latency=60) as writer:
+            writer.write(('Phred', 32), row_id='a')
+
+        self.assertEqual(writer.errors, [
+            {'row': ('Phred', 32), 'row_id': 'a', 'errors': errors},
+        ])
+        self.assertEqual(table._insert_all.call_count, 1)
+        sleep.assert_not_called()
+
+    @mock.patch('time.sleep')
+    def test_gives_up_after_max_retries(self, sleep):
+        errors = [{'reason': 'timeout'}]
+        table = _make_table(*([[{'index': 0, 'errors': errors}]] * 3))
+        with self._make_one(table, max_latency=60, max_retries=2) as writer:
+            writer.write(('Phred', 32), row_id='a')
+
+        self.assertEqual(writer.errors, [
+            {'row': ('Phred', 32), 'row_id': 'a', 'errors': errors},
+        ])
+        self.assertEqual(table._insert_all.call_count, 3)
+        self.assertEqual(sleep.call_args_list,
+                         [mock.call(1.0), mock.call(2.0)])
+
+    @mock.patch('time.sleep')
+    def test_retries_server_error(self, sleep):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        table = _make_table(ServiceUnavailable('try again'), [])
+        with self._make_one(table, max_latency=60) as writer:
+            writer.write(('Phred', 32), row_id='a')
+
+        self.assertEqual(writer.errors, [])
+        self.assertEqual(self._sent(table), [[_info('Phred', 32, 'a')]] * 2)
+
+    @mock.patch('time.sleep')
+    def test_does_not_retry_client_error(self, sleep):
+        from google.cloud.exceptions import BadRequest
+
+        table = _make_table(BadRequest('bad'))
+        with self._make_one(table, max_latency=60) as writer:
+            writer.write(('Phred', 32), row_id='a')
+            writer.write(('Bharney', 33), row_id='b')
+
+        self.assertEqual([error['row_id'] for error in writer.errors],
+                         ['a', 'b'])
+        self.assertEqual(writer.errors[0]['errors'][0]['reason'],
+                         'BadRequest')
+        self.assertEqual(table._insert_all.call_count, 1)
+        sleep.assert_not_called()
+
+
+class Test__is_permanent(unittest.TestCase):
+
+    def _call_fut(self, errors):
+        from google.cloud.bigquery.writer import _is_permanent
+
+        return _is_permanent(errors)
+
+    def test_permanent(self):
+        self.assertTrue(self._call_fut(
+            [{'reason': 'stopped'}, {'reason': 'invalid'}]))
+
+    def test_transient(self):
+        self.assertFalse(self._call_fut([{'reason': 'stopped'}, {}]))
@@ -16,11 +16,16 @@
 
 import json
 import platform
+import threading
 from pkg_resources import get_distribution
 
+import google.auth.credentials
+import google_auth_httplib2
 import six
 from six.moves.urllib.parse import urlencode
+from six.moves.urllib.parse import urlsplit
 
+from google.cloud import instrumentation
 from google.cloud.exceptions import make_exception
 
 
@@ -35,6 +40,9 @@ CLIENT_INFO_HEADER = 'X-Goog-API-Client'
 CLIENT_INFO_TEMPLATE = (
     'gl-python/' + platform.python_version() + ' gccl/{}')
 
+DEFAULT_POOL_SIZE = 10
+"""The default maximum number of HTTP objects held by a :class:`PooledHttp`."""
+
 
 class Connection(object):
     """A generic connection to Google Cloud Platform.
@@ -72,6 +80,15 @@ class Connection(object):
         """
         return self._client._http
 
+    @property
+    def http_async(self):
+        """A getter for the asynchronous HTTP transport used with the API.
+
+        :rtype: :class:`~google.cloud._http_async.AuthorizedSession`
+        :returns: An object whose ``request`` method is a coroutine.
+        """
+        return self._client._http_async
+
 
 class JSONConnection(Connection):
     """A connection to a Google JSON-based API.
@@ -219,8 +236,21 @@ class JSONConnection(Connection):
                 and ``content`` (a string).
         :returns: The HTTP response object and the content of the response.
         """
-        return self.http.request(uri=url, method=method, headers=headers,
-                                 body=data)
+        hooks = instrumentation._HOOKS
+        if not hooks:
+            return self.http.request(uri=url, method=method, headers=headers,
+                                     body=data)
+
+        started = instrumentation._before_request(hooks, method, url)
+        response = content = None
+        try:
+            response, content = self.http.request(
+                uri=url, method=method, headers=headers, body=data)
+            return response, content
+        finally:
+            status = None if response is None else response.status
+            instrumentation._after_request(
+                hooks, started, method, url, status, data, content)
 
     def api_request(self, method, path, query_params=None,
                     data=None, content_type=None, headers=None,
@@ -312,3 +342,291 @@ class JSONConnection(Connection):
             return json.loads(content)
 
         return content
+
+    def api_request_async(self, method, path, query_params=None,
+                          data=None, content_type=None, headers=None,
+                          api_base_url=None, api_version=None,
+                          expect_json=True):
+        """Make a request to the API without blocking the event loop.
+
+        Asyncio counterpart of :meth:`api_request`, which takes the same
+        parameters (other than ``_target_object``, since batches are not
+        supported). Requires Python 3.5+ and :mod:`aiohttp`::
+
+            >>> payload = await connection.api_request_async(
+            ...     method='GET', path='/b/bucket-name')
+
+        :type method: str
+        :param method: The HTTP method name (ie, ``GET``, ``POST``, etc).
+
+        :type path: str
+        :param path: The path to the resource (ie, ``'/b/bucket-name'``).
+
+        :type query_params: dict or list
+        :param query_params: A dictionary of keys and values (or list of
+                             key-value pairs) to insert into the query
+                             string of the URL.
+
+        :type data: str
+        :param data: The data to send as the body of the request.
+
+        :type content_type: str
+        :param content_type: The proper MIME type of the data provided.
+
+        :type headers: dict
+        :param headers: extra HTTP headers to be sent with the request.
+
+        :type api_base_url: str
+        :param api_base_url: The base URL for the API endpoint.
+
+        :type api_version: str
+        :param api_version: The version of the API to call.
+
+        :type expect_json: bool
+        :param expect_json: If True, this method will try to parse the
+                            response as JSON and raise an exception if
+                            that cannot be done.  Default is True.
+
+        :rtype: coroutine
+        :returns: A coroutine resolving to the API response payload, as
+                  :meth:`api_request` would return it.
+        """
+        from google.cloud import _http_async
+
+        return _http_async.api_request(
+            self, method, path, query_params=query_params, data=data,
+            content_type=content_type, headers=headers,
+            api_base_url=api_base_url, api_version=api_version,
+            expect_json=expect_json)
+
+
+def _connection_key(uri):
+    """Compute the key ``httplib2`` uses to cache a connection for a URI.
+
+    :type uri: str
+    :param uri: The URI being requested.
+
+    :rtype: str
+    :returns: The lower-cased ``scheme:authority`` of ``uri``.
+    """
+    parts = urlsplit(uri)
+    return (parts.scheme + ':' + parts.netloc).lower()
+
+
+def _cached_connections(http):
+    """Get the connection cache of an ``httplib2.Http``-like object.
+
+    Unwraps an :class:`~google_auth_httplib2.AuthorizedHttp` if needed.
+
+    :type http: :class:`~httplib2.Http`
+    :param http: The HTTP object to inspect.
+
+    :rtype: dict
+    :returns: The (possibly empty) mapping of connection keys to
+              open connections.
+    """
+    http = getattr(http, 'http', http)
+    return getattr(http, 'connections', None) or {}
+
+
+class PooledHttp(object):
+    """Thread-safe pool of HTTP objects sharing a single ``request`` method.
+
+    A single :class:`httplib2.Http` is not safe to share between threads.
+    This wraps up to ``size`` of them (created lazily by ``http_factory``)
+    and lends one to each concurrent call to :meth:`request`. Since every
+    ``httplib2.Http`` caches one keep-alive connection per host, reusing
+    pooled objects avoids repeating the TCP / TLS handshake on each call.
+
+    An instance can be passed as the ``_http`` argument of any
+    :class:`~google.cloud.client.Client`, so that every
+    :class:`JSONConnection` bound to that client uses the pool:
+
+    .. code-block:: python
+
+       from google.cloud._http import PooledHttp
+
+       http = PooledHttp.from_credentials(credentials, size=16)
+       client = storage.Client(credentials=credentials, _http=http)
+
+    :type http_factory: callable
+    :param http_factory: Callable with no arguments returning a new object
+                         with the same ``request()`` interface as
+                         :meth:`httplib2.Http.request`.
+
+    :type size: int
+    :param size: (Optional) The maximum number of HTTP objects (and hence
+                 concurrent requests) in the pool. Defaults to
+                 :data:`DEFAULT_POOL_SIZE`.
+
+    :raises: :class:`ValueError` if ``size`` is less than 1.
+    """
+
+    def __init__(self, http_factory, size=DEFAULT_POOL_SIZE):
+        if size < 1:
+            raise ValueError('Pool size must be at least 1.', size)
+        self._http_factory = http_factory
+        self._size = size
+        self._condition = threading.Condition()
+        self._idle = []
+        self._num_created = 0
+        self._host_stats = {}
+
+    @classmethod
+    def from_credentials(cls, credentials, size=DEFAULT_POOL_SIZE,
+                         scopes=None):
+        """Create a pool of HTTP objects authorized with ``credentials``.
+
+        :type credentials: :class:`~google.auth.credentials.Credentials`
+        :param credentials: The OAuth2 Credentials used to authorize
+                            each pooled HTTP object.
+
+        :type size: int
+        :param size: (Optional) The maximum number of HTTP objects in the
+                     pool.
+
+        :type scopes: tuple
+        :param scopes: (Optional) Scopes applied to ``credentials`` if they
+                       require them, e.g. the ``SCOPE`` of a client class.
+
+        :rtype: :class:`PooledHttp`
+        :returns: The newly created pool.
+        """
+        credentials = google.auth.credentials.with_scopes_if_required(
+            credentials, scopes)
+
+        def http_factory():
+            """Create a new authorized HTTP object."""
+            return google_auth_httplib2.AuthorizedHttp(credentials)
+
+        return cls(http_factory, size=size)
+
+    @property
+    def size(self):
+        """The maximum number of HTTP objects in the pool.
+
+        :rtype: int
+        :returns: The pool size.
+        """
+        return self._size
+
+    @property
+    def stats(self):
+        """Usage statistics for the pool.
+
+        :rtype: dict
+        :returns: A snapshot with the number of HTTP objects ``created``,
+                  currently ``idle`` and ``in_use``, and a ``hosts`` mapping
+                  of ``scheme:authority`` to the number of ``requests`` sent
+                  to that host and how many of them ``reused`` an already
+                  open keep-alive connection.
+        """
+        with self._condition:
+            idle = len(self._idle)
+            return {
+                'created': self._num_created,
+                'idle': idle,
+                'in_use': self._num_created - idle,
+                'hosts': {
+                    key: dict(value)
+                    for key, value in six.iteritems(self._host_stats)
+                },
+            }
+
+    def _acquire(self):
+        """Check out an HTTP object, blocking while the pool is exhausted.
+
+        :rtype: :class:`~httplib2.Http`
+        :returns: An HTTP object reserved for the caller.
+        """
+        with self._condition:
+            while not self._idle and self._num_created >= self._size:
+                self._condition.wait()
+            if self._idle:
+                # LIFO order keeps the most recently used (and therefore
+                # most likely still open) connections busy.
+                return self._idle.pop()
+            self._num_created += 1
+
+        try:
+            return self._http_factory()
+        except Exception:
+            with self._condition:
+                self._num_created -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, http, conn_key, reused):
+        """Return an HTTP object to the pool and record the request.
+
+        :type http: :class:`~httplib2.Http`
+        :param http: An HTTP object previously returned by :meth:`_acquire`.
+
+        :type conn_key: str
+        :param conn_key: The ``scheme:authority`` of the request made.
+
+        :type reused: bool
+        :param reused: Whether the request was sent over a connection
+                       that was already open.
+        """
+        with self._condition:
+            host_stats = self._host_stats.setdefault(
+                conn_key, {'requests': 0, 'reused': 0})
+            host_stats['requests'] += 1
+            if reused:
+                host_stats['reused'] += 1
+            self._idle.append(http)
+            self._condition.notify()
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        """Make an HTTP request using an HTTP object from the pool.
+
+        :type uri: str
+        :param uri: The URI to be requested.
+
+        :type method: str
+        :param method: (Optional) The HTTP method to use for the request.
+
+        :type body: str
+        :param body: (Optional) Payload / body in HTTP request.
+
+        :type headers: dict
+        :param headers: (Optional) HTTP headers for the request.
+
+        :type kwargs: dict
+        :param kwargs: Remaining keyword arguments passed through to the
+                       pooled object's ``request()``, e.g. ``redirections``
+                       or ``connection_type``.
+
+        :rtype: tuple
+        :returns: The ``(response, content)`` pair returned by the pooled
+                  HTTP object.
+        """
+        conn_key = _connection_key(uri)
+        http = self._acquire()
+        reused = conn_key in _cached_connections(http)
+        try:
+            return http.request(uri, method=method, body=body,
+                                headers=headers, **kwargs)
+        finally:
+            self._release(http, conn_key, reused)
+
+
+def _max_concurrent_requests(client, default=1):
+    """Determine how many requests may be sent at once with a client.
+
+    :type client: :class:`~google.cloud.client.Client`
+    :param client: The client sending the requests.
+
+    :type default: int
+    :param default: (Optional) The number returned if the client's ``_http``
+                    is not a :class:`PooledHttp`.
+
+    :rtype: int
+    :returns: The size of the client's HTTP pool if it uses a (thread-safe)
+              :class:`PooledHttp`, otherwise ``default``.
+    """
+    http = client._http
+    if isinstance(http, PooledHttp):
+        return http.size
+    return default
@@ -0,0 +1,241 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio transport for JSON APIs.
+
+Requires Python 3.5+ and :mod:`aiohttp` (installed with the ``async``
+extra). This module is only imported lazily, by
+:meth:`~google.cloud._http.JSONConnection.api_request_async` and by the
+asynchronous iteration of :class:`~google.cloud.iterator.HTTPIterator`::
+
+    >>> bucket = client.get_bucket('my-bucket')
+    >>> async for blob in bucket.list_blobs():
+    ...     print(blob.name)
+
+Requests share one :class:`aiohttp.ClientSession` per client, so many can
+be in flight at once without a thread per request. Close the session once
+done with the client::
+
+    >>> await client._http_async.close()
+"""
+
+import asyncio
+import json
+
+import aiohttp
+import google_auth_httplib2
+import httplib2
+import six
+
+from google.cloud import instrumentation
+from google.cloud.exceptions import make_exception
+
+
+class AuthorizedSession(object):
+    """Asynchronous HTTP transport which authorizes its requests.
+
+    Mirrors the ``request`` signature of :class:`httplib2.Http`, except that
+    :meth:`request` is a coroutine.
+
+    :type credentials: :class:`google.auth.credentials.Credentials`
+    :param credentials: (Optional) The credentials to authorize requests
+                        with. If :data:`None`, requests are sent as-is.
+
+    :type session: :class:`aiohttp.ClientSession`
+    :param session: (Optional) The session used to send requests. If not
+                    passed, one is created on first use and closed by
+                    :meth:`close`.
+    """
+
+    def __init__(self, credentials=None, session=None):
+        self.credentials = credentials
+        self._session = session
+        self._owns_session = session is None
+        self._refresh_lock = None
+
+    async def _authorize(self, headers):
+        """Add the credentials' authorization to request headers.
+
+        Expired credentials are refreshed on the loop's default executor,
+        since refreshing them blocks on a synchronous HTTP request.
+
+        :type headers: dict
+        :param headers: The request headers, modified in place.
+        """
+        if self.credentials is None:
+            return
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if not self.credentials.valid:
+                request = google_auth_httplib2.Request(httplib2.Http())
+                loop = asyncio.get_event_loop()
+                await loop.run_in_executor(
+                    None, self.credentials.refresh, request)
+        self.credentials.apply(headers)
+
+    async def request(self, uri, method='GET', body=None, headers=None):
+        """Send an authorized HTTP request.
+
+        :type uri: str
+        :param uri: The URL to send the request to.
+
+        :type method: str
+        :param method: The HTTP method to use in the request.
+
+        :type body: bytes
+        :param body: (Optional) The body of the request.
+
+        :type headers: dict
+        :param headers: (Optional) The request headers.
+
+        :rtype: tuple
+        :returns: The :class:`httplib2.Response` and the content (as
+                  :class:`bytes`) of the response.
+        """
+        headers = dict(headers or {})
+        await self._authorize(headers)
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        async with self._session.request(
+                method, uri, data=body, headers=headers) as response:
+            content = await response.read()
+            info = dict(response.headers)
+            info['status'] = response.status
+        return httplib2.Response(info), content
+
+    async def close(self):
+        """Close the underlying session, if it was created here."""
+        session, self._session = self._session, None
+        if session is not None and self._owns_session:
+            await session.close()
+
+
+async def api_request(connection, method, path, query_params=None,
+                      data=None, content_type=None, headers=None,
+                      api_base_url=None, api_version=None,
+                      expect_json=True):
+    """Make a request to the API over an asynchronous HTTP transport.
+
+    Implements :meth:`~google.cloud._http.JSONConnection.api_request_async`;
+    see :meth:`~google.cloud._http.JSONConnection.api_request` for the
+    parameters.
+
+    :type connection: :class:`~google.cloud._http.JSONConnection`
+    :param connection: The connection whose API is requested.
+
+    :raises: Exception if the response code is not 200 OK.
+    :rtype: dict or str
+    :returns: The API response payload, either as a raw string or
+              a dictionary if the response is valid JSON.
+    """
+    url = connection.build_api_url(path=path, query_params=query_params,
+                                   api_base_url=api_base_url,
+                                   api_version=api_version)
+
+    # Making the executive decision that any dictionary
+    # data will be sent properly as JSON.
+    if data and isinstance(data, dict):
+        data = json.dumps(data)
+        content_type = 'application/json'
+    if isinstance(data, six.text_type):
+        data = data.encode('utf-8')
+
+    headers = dict(headers or {})
+    headers.update(connection._EXTRA_HEADERS)
+    headers['Accept-Encoding'] = 'gzip'
+    if content_type:
+        headers['Content-Type'] = content_type
+    headers['User-Agent'] = connection.USER_AGENT
+
+    hooks = instrumentation._HOOKS
+    if hooks:
+        started = instrumentation._before_request(hooks, method, url)
+    response = content = None
+    try:
+        response, content = await connection.http_async.request(
+            uri=url, method=method, headers=headers, body=data)
+    finally:
+        if hooks:
+            status = None if response is None else response.status
+            instrumentation._after_request(
+                hooks, started, method, url, status, data, content)
+
+    if not 200 <= response.status < 300:
+        raise make_exception(response, content,
+                             error_info=method + ' ' + url)
+
+    if content and expect_json:
+        content_type = response.get('content-type', '')
+        if not content_type.startswith('application/json'):
+            raise TypeError('Expected JSON, got %s' % content_type)
+        return json.loads(content.decode('utf-8'))
+
+    return content
+
+
+class _AsyncPageIterator(object):
+    """Asynchronous iterator of the pages of an HTTP iterator.
+
+    :type iterator: :class:`~google.cloud.iterator.HTTPIterator`
+    :param iterator: The iterator whose pages are fetched.
+
+    :type increment: bool
+    :param increment: Flag indicating if the total number of results
+                      should be incremented on each page.
+    """
+
+    def __init__(self, iterator, increment):
+        self._iterator = iterator
+        self._increment = increment
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        iterator = self._iterator
+        if not iterator._has_next_page():
+            raise StopAsyncIteration
+        response = await iterator._get_next_page_response_async()
+        page = iterator._page_from_response(response)
+        iterator.page_number += 1
+        if self._increment:
+            iterator.num_results += page.num_items
+        return page
+
+
+class _AsyncItemIterator(object):
+    """Asynchronous iterator of the items of an HTTP iterator.
+
+    :type iterator: :class:`~google.cloud.iterator.HTTPIterator`
+    :param iterator: The iterator whose items are fetched.
+    """
+
+    def __init__(self, iterator):
+        self._iterator = iterator
+        self._pages = _AsyncPageIterator(iterator, increment=False)
+        self._page = iter(())
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            try:
+                item = six.next(self._page)
+            except StopIteration:
+                self._page = await self._pages.__anext__()
+            else:
+                self._iterator.num_results += 1
+                return item
@@ -97,6 +97,10 @@ class Client(_ClientFactoryMixin):
     A custom ``_http`` object will also need to be able to add a bearer token
     to API requests and handle token refresh on 401 errors.
 
+    A single :class:`httplib2.Http` object is not thread-safe. To share a
+    client between threads, pass a :class:`~google.cloud._http.PooledHttp`
+    as ``_http``.
+
     :type credentials: :class:`~google.auth.credentials.Credentials`
     :param credentials: (Optional) The OAuth2 Credentials to use for this
                         client. If not passed (and if no ``_http`` object is
@@ -129,6 +133,7 @@ class Client(_ClientFactoryMixin):
         self._credentials = google.auth.credentials.with_scopes_if_required(
             credentials, self.SCOPE)
         self._http_internal = _http
+        self._http_async_internal = None
 
     def __getstate__(self):
         """Explicitly state that clients are not pickleable."""
@@ -149,6 +154,21 @@ class Client(_ClientFactoryMixin):
                 self._credentials)
         return self._http_internal
 
+    @property
+    def _http_async(self):
+        """Getter for object used for asynchronous HTTP transport.
+
+        Requires Python 3.5+ and :mod:`aiohttp`.
+
+        :rtype: :class:`~google.cloud._http_async.AuthorizedSession`
+        :returns: An asynchronous HTTP object.
+        """
+        if self._http_async_internal is None:
+            from google.cloud._http_async import AuthorizedSession
+
+            self._http_async_internal = AuthorizedSession(self._credentials)
+        return self._http_async_internal
+
 
 class _ClientProjectMixin(object):
     """Mixin to allow setting the project on the client.
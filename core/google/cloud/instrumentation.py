@@ -0,0 +1,367 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Instrumentation hooks for HTTP requests made to Google Cloud APIs.
+
+Requests sent by :meth:`~google.cloud._http.JSONConnection.api_request`
+(and hence batches), by
+:func:`~google.cloud.streaming.http_wrapper.make_api_request` and by
+:meth:`~google.cloud._http.JSONConnection.api_request_async` are reported
+to every registered :class:`RequestHook`::
+
+    >>> from google.cloud import instrumentation
+    >>> class PrintHook(instrumentation.RequestHook):
+    ...     def after_request(self, record):
+    ...         print(record.method, record.path, record.latency)
+    ...
+    >>> instrumentation.add_hook(PrintHook())
+
+:class:`RequestHistograms` aggregates latencies and sizes into
+histograms, which can be exported with
+:class:`google.cloud.monitoring.RequestMetricsExporter`.
+
+When no hook is registered, requests are not timed at all.
+"""
+
+import collections
+import math
+import threading
+import timeit
+
+from six.moves.urllib.parse import urlsplit
+
+from google.cloud._helpers import _NOW
+
+
+_HOOKS = ()
+"""The registered hooks.
+
+Replaced (never mutated) so that requests can read it without a lock.
+"""
+
+_HOOKS_LOCK = threading.Lock()
+
+_timer = timeit.default_timer
+
+
+def add_hook(hook):
+    """Register a hook to be called around each request.
+
+    :type hook: :class:`RequestHook`
+    :param hook: The hook to register.
+    """
+    global _HOOKS
+    with _HOOKS_LOCK:
+        _HOOKS = _HOOKS + (hook,)
+
+
+def remove_hook(hook):
+    """Unregister a hook added with :func:`add_hook`.
+
+    :type hook: :class:`RequestHook`
+    :param hook: The hook to unregister.
+
+    :raises ValueError: If ``hook`` is not registered.
+    """
+    global _HOOKS
+    with _HOOKS_LOCK:
+        hooks = list(_HOOKS)
+        hooks.remove(hook)
+        _HOOKS = tuple(hooks)
+
+
+class RequestRecord(collections.namedtuple(
+        'RequestRecord', 'method url status latency bytes_sent '
+                         'bytes_received retries')):
+    """A completed request, as passed to :meth:`RequestHook.after_request`.
+
+    :type method: str
+    :param method: The HTTP method of the request.
+
+    :type url: str
+    :param url: The URL requested.
+
+    :type status: int
+    :param status: The HTTP status of the (last) response, or :data:`None`
+                   if no response was received.
+
+    :type latency: float
+    :param latency: The seconds spent on the request, including retries.
+
+    :type bytes_sent: int
+    :param bytes_sent: The size of the (last) request body.
+
+    :type bytes_received: int
+    :param bytes_received: The size of the (last) response body.
+
+    :type retries: int
+    :param retries: The number of times the request was retried.
+    """
+    __slots__ = ()
+
+    @property
+    def path(self):
+        """The path of the URL requested.
+
+        :rtype: str
+        :returns: The path, without the host or query string.
+        """
+        return urlsplit(self.url).path
+
+
+class RequestHook(object):
+    """Base class for hooks called around requests.
+
+    Hooks are called on the thread making the request, so must be
+    thread-safe and should be quick.
+    """
+
+    def before_request(self, method, url):
+        """Called before a request is sent.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :type url: str
+        :param url: The URL to request.
+        """
+
+    def after_request(self, record):
+        """Called once a request completes, or fails without a response.
+
+        :type record: :class:`RequestRecord`
+        :param record: The completed request.
+        """
+
+
+def _before_request(hooks, method, url):
+    """Call each hook before a request is sent.
+
+    :type hooks: tuple
+    :param hooks: The registered hooks.
+
+    :type method: str
+    :param method: The HTTP method of the request.
+
+    :type url: str
+    :param url: The URL to request.
+
+    :rtype: float
+    :returns: The current time, to pass to :func:`_after_request`.
+    """
+    for hook in hooks:
+        hook.before_request(method, url)
+    return _timer()
+
+
+def _after_request(hooks, started, method, url, status, body, content,
+                   retries=0):
+    """Call each hook once a request completes.
+
+    :type hooks: tuple
+    :param hooks: The registered hooks.
+
+    :type started: float
+    :param started: The value returned by :func:`_before_request`.
+
+    :type method: str
+    :param method: The HTTP method of the request.
+
+    :type url: str
+    :param url: The URL requested.
+
+    :type status: int
+    :param status: The HTTP status of the response, or :data:`None`.
+
+    :type body: bytes
+    :param body: The request body, if any.
+
+    :type content: bytes
+    :param content: The response body, if any.
+
+    :type retries: int
+    :param retries: The number of times the request was retried.
+    """
+    record = RequestRecord(
+        method=method, url=url, status=status,
+        latency=_timer() - started,
+        bytes_sent=len(body) if body else 0,
+        bytes_received=len(content) if content else 0,
+        retries=retries)
+    for hook in hooks:
+        hook.after_request(record)
+
+
+class Histogram(object):
+    """Thread-safe distribution of values, in exponentially sized buckets.
+
+    Matches the ``exponentialBuckets`` option of Stackdriver Monitoring
+    distributions: besides an underflow bucket for values below ``scale``
+    and an overflow bucket, finite bucket ``i`` (from 1) counts values in
+    ``[scale * growth_factor ** (i - 1), scale * growth_factor ** i)``.
+
+    :type num_finite_buckets: int
+    :param num_finite_buckets: The number of finite buckets.
+
+    :type growth_factor: float
+    :param growth_factor: The ratio between bounds of consecutive buckets.
+
+    :type scale: float
+    :param scale: The lower bound of the first finite bucket.
+    """
+
+    def __init__(self, num_finite_buckets, growth_factor, scale):
+        self.num_finite_buckets = num_finite_buckets
+        self.growth_factor = growth_factor
+        self.scale = scale
+        self.bucket_counts = [0] * (num_finite_buckets + 2)
+        self.count = 0
+        self.mean = 0.0
+        self.sum_of_squared_deviation = 0.0
+        self._log_growth_factor = math.log(growth_factor)
+        self._lock = threading.Lock()
+
+    def _bucket(self, value):
+        """Find the bucket holding a value.
+
+        :type value: float
+        :param value: The value.
+
+        :rtype: int
+        :returns: The index of the bucket in :attr:`bucket_counts`.
+        """
+        if value < self.scale:
+            return 0
+        index = int(math.log(float(value) / self.scale) /
+                    self._log_growth_factor) + 1
+        return min(index, self.num_finite_buckets + 1)
+
+    def record(self, value):
+        """Add a value to the distribution.
+
+        :type value: float
+        :param value: The value.
+        """
+        bucket = self._bucket(value)
+        with self._lock:
+            self.bucket_counts[bucket] += 1
+            self.count += 1
+            # Welford's algorithm, numerically stable.
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self.sum_of_squared_deviation += delta * (value - self.mean)
+
+    def to_distribution(self):
+        """Build the Monitoring API representation of the distribution.
+
+        :rtype: dict
+        :returns: A ``Distribution`` resource, for use as a point value.
+        """
+        with self._lock:
+            return {
+                'count': str(self.count),
+                'mean': self.mean,
+                'sumOfSquaredDeviation': self.sum_of_squared_deviation,
+                'bucketOptions': {
+                    'exponentialBuckets': {
+                        'numFiniteBuckets': self.num_finite_buckets,
+                        'growthFactor': self.growth_factor,
+                        'scale': self.scale,
+                    },
+                },
+                'bucketCounts': [str(count) for count in self.bucket_counts],
+            }
+
+
+def _latency_histogram():
+    """Histogram for latencies in seconds, from 1 ms to about 17 minutes.
+
+    :rtype: :class:`Histogram`
+    :returns: An empty histogram.
+    """
+    return Histogram(num_finite_buckets=20, growth_factor=2.0, scale=0.001)
+
+
+def _size_histogram():
+    """Histogram for sizes in bytes, from 1 byte to 4 GiB.
+
+    :rtype: :class:`Histogram`
+    :returns: An empty histogram.
+    """
+    return Histogram(num_finite_buckets=16, growth_factor=4.0, scale=1.0)
+
+
+class RequestHistograms(RequestHook):
+    """Hook aggregating requests into histograms.
+
+    Keeps a :class:`Histogram` of each of ``latency`` (in seconds),
+    ``bytes_sent``, ``bytes_received`` and ``retries`` for each
+    combination of HTTP method and status.
+
+    :type histograms: dict
+    :param histograms: Maps ``(name, method, status)`` to the
+                       :class:`Histogram` for that metric, where ``name``
+                       is one of :attr:`METRICS`.
+    """
+
+    METRICS = {
+        'latency': _latency_histogram,
+        'bytes_sent': _size_histogram,
+        'bytes_received': _size_histogram,
+        'retries': lambda: Histogram(
+            num_finite_buckets=4, growth_factor=2.0, scale=1.0),
+    }
+    """Maps each recorded field to a factory for its histograms."""
+
+    def __init__(self):
+        self.histograms = {}
+        # The time (in UTC) the first request was recorded.
+        self.start_time = None
+        self._lock = threading.Lock()
+
+    def _histogram(self, name, method, status):
+        """Get (or create) the histogram for a metric.
+
+        :type name: str
+        :param name: The field of :class:`RequestRecord` recorded.
+
+        :type method: str
+        :param method: The HTTP method.
+
+        :type status: int
+        :param status: The HTTP status, or :data:`None`.
+
+        :rtype: :class:`Histogram`
+        :returns: The histogram.
+        """
+        key = (name, method, status)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.get(key)
+                if histogram is None:
+                    histogram = self.histograms[key] = self.METRICS[name]()
+        return histogram
+
+    def after_request(self, record):
+        """Record a completed request in the histograms.
+
+        :type record: :class:`RequestRecord`
+        :param record: The completed request.
+        """
+        if self.start_time is None:
+            self.start_time = _NOW()
+        for name in self.METRICS:
+            self._histogram(name, record.method, record.status).record(
+                getattr(record, name))
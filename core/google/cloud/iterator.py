@@ -83,15 +83,88 @@ To consume an entire page::
         <MyItemClass at 0x7fd64a098ed0>,
         <MyItemClass at 0x7fd64a098e90>,
     ]
+
+To keep requesting pages on a background thread while the current page
+is being processed, set ``prefetch`` (on any iterator, before it is
+started) to the number of pages which may be fetched ahead::
+
+    >>> iterator = Iterator(...)
+    >>> iterator.prefetch = 2
+    >>> for my_item in iterator:
+    ...     process(my_item)
+
+While prefetching, ``page_number``, ``num_results`` and
+``next_page_token`` describe the pages fetched so far, which may be ahead
+of those consumed.
+
+On Python 3.5+ (with :mod:`aiohttp` installed), an :class:`HTTPIterator`
+can also be consumed without blocking the event loop::
+
+    >>> async for my_item in HTTPIterator(...):
+    ...     print(my_item.name)
+
+or page by page, via ``async for page in iterator.pages_async``.
+
+Pages of an :class:`HTTPIterator` can hold tens of megabytes of JSON. To
+decode each item only as it is consumed (rather than decoding the whole
+page up front), set ``stream_items`` before the iterator is started::
+
+    >>> iterator = HTTPIterator(...)
+    >>> iterator.stream_items = True
+    >>> for my_item in iterator:
+    ...     process(my_item)
+
+The raw page is still held in memory, but at most one decoded item is.
 """
 
 
+from array import array
+import json
+import re
+import sys
+import threading
+
 import six
+from six.moves import queue
 
 
 DEFAULT_ITEMS_KEY = 'items'
 """The dictionary key used to retrieve items from each response."""
 
+_PREFETCH_POLL_SECONDS = 0.1
+"""How often a blocked prefetching thread checks if it should stop."""
+
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_JSON_DECODER = json.JSONDecoder()
+_JSON_STRING_PATTERN = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_JSON_STRING = re.compile(_JSON_STRING_PATTERN)
+_JSON_LITERAL = re.compile(r'[^ \t\n\r,\]}]+')
+# Everything up to the next bracket, skipping over (escaped) strings.
+_JSON_NOT_BRACKETS_PATTERN = r'[^"\[\]{}]*(?:%s[^"\[\]{}]*)*' % (
+    _JSON_STRING_PATTERN,)
+_JSON_NOT_BRACKETS = re.compile(_JSON_NOT_BRACKETS_PATTERN)
+_JSON_NESTING_MATCHED = 4
+"""How deeply nested containers can be for the pattern to match them."""
+
+
+def _json_container_pattern(depth):
+    """Build a pattern matching a JSON array or object, without decoding.
+
+    :type depth: int
+    :param depth: How many levels of containers it may hold.
+
+    :rtype: str
+    :returns: The pattern.
+    """
+    inner = _JSON_NOT_BRACKETS_PATTERN
+    for _ in six.moves.range(depth):
+        inner = r'[^"\[\]{}]*(?:(?:%s|\[%s\]|\{%s\})[^"\[\]{}]*)*' % (
+            _JSON_STRING_PATTERN, inner, inner)
+    return r'\[%s\]|\{%s\}' % (inner, inner)
+
+
+_JSON_CONTAINER = re.compile(_json_container_pattern(_JSON_NESTING_MATCHED))
+
 
 # pylint: disable=unused-argument
 def _do_nothing_page_start(iterator, page, response):
@@ -187,14 +260,20 @@ class Iterator(object):
 
     :type max_results: int
     :param max_results: (Optional) The maximum number of results to fetch.
+
+    :type prefetch: int
+    :param prefetch: (Optional) The maximum number of pages to fetch ahead
+                     of the consumer, on a background thread. Defaults to 0,
+                     i.e. each page is fetched only once it is needed.
     """
 
     def __init__(self, client, item_to_value,
-                 page_token=None, max_results=None):
+                 page_token=None, max_results=None, prefetch=0):
         self._started = False
         self.client = client
         self._item_to_value = item_to_value
         self.max_results = max_results
+        self.prefetch = prefetch
         # The attributes below will change over the life of the iterator.
         self.page_number = 0
         self.next_page_token = page_token
@@ -215,9 +294,12 @@ class Iterator(object):
 
     def _items_iter(self):
         """Iterator for each item returned."""
-        for page in self._page_iter(increment=False):
+        # When prefetching, results are counted as each page is fetched.
+        count_items = self.prefetch <= 0
+        for page in self._page_iter(increment=not count_items):
             for item in page:
-                self.num_results += 1
+                if count_items:
+                    self.num_results += 1
                 yield item
 
     def __iter__(self):
@@ -244,6 +326,11 @@ class Iterator(object):
 
         Yields :class:`Page` instances.
         """
+        if self.prefetch > 0:
+            for page in self._prefetch_page_iter(increment):
+                yield page
+            return
+
         page = self._next_page()
         while page is not None:
             self.page_number += 1
@@ -252,6 +339,67 @@ class Iterator(object):
             yield page
             page = self._next_page()
 
+    def _prefetch_page_iter(self, increment):
+        """Generator of pages fetched ahead on a background thread.
+
+        Helper for :meth:`_page_iter`. At most :attr:`prefetch` pages are
+        queued; the thread stops once the generator is closed.
+
+        :type increment: bool
+        :param increment: Flag indicating if the total number of results
+                          should be incremented on each page.
+
+        Yields :class:`Page` instances.
+        """
+        pages = queue.Queue(maxsize=self.prefetch)
+        stopped = threading.Event()
+        worker = threading.Thread(
+            target=self._fetch_pages, args=(pages, stopped, increment))
+        worker.daemon = True
+        worker.start()
+        try:
+            while True:
+                page, exc_info = pages.get()
+                if exc_info is not None:
+                    six.reraise(*exc_info)
+                if page is None:
+                    return
+                yield page
+        finally:
+            stopped.set()
+
+    def _fetch_pages(self, pages, stopped, increment):
+        """Fetch every page into a queue, for :meth:`_prefetch_page_iter`.
+
+        Puts ``(page, None)`` for each page, then ``(None, None)`` when
+        there are no pages left or ``(None, exc_info)`` if fetching a page
+        fails.
+
+        :type pages: :class:`~six.moves.queue.Queue`
+        :param pages: The queue of fetched pages.
+
+        :type stopped: :class:`threading.Event`
+        :param stopped: Set when no more pages are wanted.
+
+        :type increment: bool
+        :param increment: Flag indicating if the total number of results
+                          should be incremented on each page.
+        """
+        try:
+            page = self._next_page()
+            while page is not None:
+                self.page_number += 1
+                if increment:
+                    self.num_results += page.num_items
+                if not _put_unless_stopped(pages, (page, None), stopped):
+                    return
+                page = self._next_page()
+        except Exception:  # pylint: disable=broad-except
+            # Re-raised by the consumer.
+            _put_unless_stopped(pages, (None, sys.exc_info()), stopped)
+        else:
+            _put_unless_stopped(pages, (None, None), stopped)
+
     @staticmethod
     def _next_page():
         """Get the next page in the iterator.
@@ -300,6 +448,18 @@ class HTTPIterator(Iterator):
                        the :class:`Page` that was started and the dictionary
                        containing the page response.
 
+    :type prefetch: int
+    :param prefetch: (Optional) The maximum number of pages to fetch ahead
+                     of the consumer, on a background thread.
+
+    :type stream_items: bool
+    :param stream_items: (Optional) If True, the items in each page are
+                         decoded one at a time, as they are consumed,
+                         rather than when the page is received. The text
+                         of the page is still held until it is consumed:
+                         this only avoids holding all of its decoded
+                         items at once. Defaults to False.
+
     .. autoattribute:: pages
     """
 
@@ -312,11 +472,13 @@ class HTTPIterator(Iterator):
     def __init__(self, client, path, item_to_value,
                  items_key=DEFAULT_ITEMS_KEY,
                  page_token=None, max_results=None, extra_params=None,
-                 page_start=_do_nothing_page_start):
+                 page_start=_do_nothing_page_start, prefetch=0,
+                 stream_items=False):
         super(HTTPIterator, self).__init__(
             client, item_to_value, page_token=page_token,
-            max_results=max_results)
+            max_results=max_results, prefetch=prefetch)
         self.path = path
+        self.stream_items = stream_items
         self._items_key = items_key
         self.extra_params = extra_params
         self._page_start = page_start
@@ -345,14 +507,27 @@ class HTTPIterator(Iterator):
         """
         if self._has_next_page():
             response = self._get_next_page_response()
-            items = response.get(self._items_key, ())
-            page = Page(self, items, self._item_to_value)
-            self._page_start(self, page, response)
-            self.next_page_token = response.get(self._NEXT_TOKEN)
-            return page
+            return self._page_from_response(response)
         else:
             return None
 
+    def _page_from_response(self, response):
+        """Create a page from the response for the next page.
+
+        Also records the token for the page after it.
+
+        :type response: dict
+        :param response: The parsed JSON response of a page's contents.
+
+        :rtype: :class:`Page`
+        :returns: The page holding the items in ``response``.
+        """
+        items = response.get(self._items_key, ())
+        page = Page(self, items, self._item_to_value)
+        self._page_start(self, page, response)
+        self.next_page_token = response.get(self._NEXT_TOKEN)
+        return page
+
     def _has_next_page(self):
         """Determines whether or not there are more pages with results.
 
@@ -385,23 +560,87 @@ class HTTPIterator(Iterator):
     def _get_next_page_response(self):
         """Requests the next page from the path provided.
 
+        If :attr:`stream_items` is set, the items in the response are
+        only decoded as they are iterated.
+
         :rtype: dict
         :returns: The parsed JSON response of the next page's contents.
         """
         params = self._get_query_params()
         if self._HTTP_METHOD == 'GET':
+            kwargs = {'query_params': params}
+        elif self._HTTP_METHOD == 'POST':
+            kwargs = {'data': params}
+        else:
+            raise ValueError('Unexpected HTTP method', self._HTTP_METHOD)
+
+        if not self.stream_items:
             return self.client._connection.api_request(
+                method=self._HTTP_METHOD, path=self.path, **kwargs)
+
+        content = self.client._connection.api_request(
+            method=self._HTTP_METHOD, path=self.path, expect_json=False,
+            **kwargs)
+        return _parse_page(content, self._items_key)
+
+    def _get_next_page_response_async(self):
+        """Requests the next page without blocking the event loop.
+
+        :rtype: coroutine
+        :returns: A coroutine resolving to the parsed JSON response of the
+                  next page's contents.
+        """
+        params = self._get_query_params()
+        if self._HTTP_METHOD == 'GET':
+            return self.client._connection.api_request_async(
                 method=self._HTTP_METHOD,
                 path=self.path,
                 query_params=params)
         elif self._HTTP_METHOD == 'POST':
-            return self.client._connection.api_request(
+            return self.client._connection.api_request_async(
                 method=self._HTTP_METHOD,
                 path=self.path,
                 data=params)
         else:
             raise ValueError('Unexpected HTTP method', self._HTTP_METHOD)
 
+    @property
+    def pages_async(self):
+        """Asynchronous iterator of pages in the response.
+
+        Pages are fetched with
+        :meth:`~google.cloud._http.JSONConnection.api_request_async`, so
+        this requires Python 3.5+ and :mod:`aiohttp`. The ``prefetch``
+        setting does not apply.
+
+        :rtype: asynchronous iterator
+        :returns: An iterator to use with ``async for``, yielding
+                  :class:`Page` instances.
+        :raises ValueError: If the iterator has already been started.
+        """
+        from google.cloud._http_async import _AsyncPageIterator
+
+        if self._started:
+            raise ValueError('Iterator has already started', self)
+        self._started = True
+        return _AsyncPageIterator(self, increment=True)
+
+    def __aiter__(self):
+        """Asynchronous iterator for each item returned.
+
+        Allows ``async for item in iterator``; see :attr:`pages_async`.
+
+        :rtype: asynchronous iterator
+        :returns: An iterator of items from the API.
+        :raises ValueError: If the iterator has already been started.
+        """
+        from google.cloud._http_async import _AsyncItemIterator
+
+        if self._started:
+            raise ValueError('Iterator has already started', self)
+        self._started = True
+        return _AsyncItemIterator(self)
+
 
 class GAXIterator(Iterator):
     """A generic class for iterating through Cloud gRPC APIs list responses.
@@ -422,13 +661,18 @@ class GAXIterator(Iterator):
     :type max_results: int
     :param max_results: (Optional) The maximum number of results to fetch.
 
+    :type prefetch: int
+    :param prefetch: (Optional) The maximum number of pages to fetch ahead
+                     of the consumer, on a background thread.
+
     .. autoattribute:: pages
     """
 
-    def __init__(self, client, page_iter, item_to_value, max_results=None):
+    def __init__(self, client, page_iter, item_to_value, max_results=None,
+                 prefetch=0):
         super(GAXIterator, self).__init__(
             client, item_to_value, page_token=page_iter.page_token,
-            max_results=max_results)
+            max_results=max_results, prefetch=prefetch)
         self._gax_page_iter = page_iter
 
     def _next_page(self):
@@ -448,3 +692,221 @@ class GAXIterator(Iterator):
             return page
         except StopIteration:
             return None
+
+
+def _put_unless_stopped(pages, value, stopped):
+    """Put a value in a bounded queue, waiting until there is room.
+
+    :type pages: :class:`~six.moves.queue.Queue`
+    :param pages: The queue.
+
+    :type value: object
+    :param value: The value to put.
+
+    :type stopped: :class:`threading.Event`
+    :param stopped: Stop waiting (without putting the value) once set.
+
+    :rtype: bool
+    :returns: Whether the value was put in the queue.
+    """
+    while not stopped.is_set():
+        try:
+            pages.put(value, timeout=_PREFETCH_POLL_SECONDS)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+class _JSONItems(object):
+    """Items of a JSON array, decoded only as they are iterated.
+
+    Each item is decoded once, when it is reached; the text of the whole
+    document is held until then.
+
+    :type text: str
+    :param text: The JSON document holding the array.
+
+    :type offsets: :class:`array.array`
+    :param offsets: The offset in ``text`` at which each item starts.
+    """
+
+    def __init__(self, text, offsets):
+        self._text = text
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __iter__(self):
+        for offset in self._offsets:
+            item, _ = _JSON_DECODER.raw_decode(self._text, offset)
+            yield item
+
+
+def _skip_json_whitespace(text, index):
+    """Find the first non-whitespace character in a JSON document.
+
+    :type text: str
+    :param text: The JSON document.
+
+    :type index: int
+    :param index: The offset to start from.
+
+    :rtype: int
+    :returns: The offset of the first non-whitespace character at or
+              after ``index``.
+    """
+    return _JSON_WHITESPACE.match(text, index).end()
+
+
+def _expect_json_delimiter(text, index, delimiters):
+    """Check for one of the given delimiters in a JSON document.
+
+    :type text: str
+    :param text: The JSON document.
+
+    :type index: int
+    :param index: The offset of the delimiter, possibly preceded by
+                  whitespace.
+
+    :type delimiters: str
+    :param delimiters: The allowed delimiter characters.
+
+    :rtype: tuple
+    :returns: The delimiter found and the offset of the first
+              non-whitespace character after it.
+    :raises ValueError: If none of ``delimiters`` is found.
+    """
+    index = _skip_json_whitespace(text, index)
+    delimiter = text[index:index + 1]
+    if not delimiter or delimiter not in delimiters:
+        raise ValueError(
+            'Expected one of %r at offset %d' % (delimiters, index))
+    return delimiter, _skip_json_whitespace(text, index + 1)
+
+
+def _skip_json_brackets(text, index):
+    """Find where a JSON array or object ends, counting brackets.
+
+    Helper for :func:`_skip_json_value`, for containers nested too deeply
+    for :data:`_JSON_CONTAINER` to match.
+
+    :type text: str
+    :param text: The JSON document.
+
+    :type index: int
+    :param index: The offset of the opening bracket.
+
+    :rtype: int
+    :returns: The offset just after the closing bracket.
+    :raises ValueError: If the container is not terminated.
+    """
+    start = index
+    depth = 0
+    while True:
+        char = text[index:index + 1]
+        if char in ('[', '{'):
+            depth += 1
+        elif char in (']', '}'):
+            depth -= 1
+        else:
+            raise ValueError(
+                'Unterminated JSON value at offset %d' % (start,))
+        index += 1
+        if depth == 0:
+            return index
+        index = _JSON_NOT_BRACKETS.match(text, index).end()
+
+
+def _skip_json_value(text, index):
+    """Find where a JSON value ends, without decoding it.
+
+    Only the brackets outside of strings are looked at, so a malformed
+    value is not detected until it is decoded.
+
+    :type text: str
+    :param text: The JSON document.
+
+    :type index: int
+    :param index: The offset of the first character of the value.
+
+    :rtype: int
+    :returns: The offset just after the value.
+    :raises ValueError: If the value is not terminated.
+    """
+    char = text[index:index + 1]
+    if char in ('[', '{'):
+        match = _JSON_CONTAINER.match(text, index)
+        if match is None:
+            return _skip_json_brackets(text, index)
+    elif char == '"':
+        match = _JSON_STRING.match(text, index)
+    else:
+        match = _JSON_LITERAL.match(text, index)
+    if match is None:
+        raise ValueError('Unterminated JSON value at offset %d' % (index,))
+    return match.end()
+
+
+def _scan_json_array(text, index):
+    """Find where each item of a JSON array starts.
+
+    The items are skipped over rather than decoded, so that each is only
+    decoded (once) when iterated, and at most one decoded item is held in
+    memory.
+
+    :type text: str
+    :param text: The JSON document.
+
+    :type index: int
+    :param index: The offset of the ``[`` starting the array.
+
+    :rtype: tuple
+    :returns: The :class:`_JSONItems` in the array and the offset just
+              after the array.
+    """
+    offsets = array('l')
+    delimiter, index = _expect_json_delimiter(text, index, '[')
+    if text[index:index + 1] == ']':
+        return _JSONItems(text, offsets), index + 1
+    while delimiter != ']':
+        offsets.append(index)
+        index = _skip_json_value(text, index)
+        delimiter, index = _expect_json_delimiter(text, index, ',]')
+    return _JSONItems(text, offsets), index
+
+
+def _parse_page(content, items_key):
+    """Parse the JSON response for a page, deferring decoding its items.
+
+    :type content: bytes or str
+    :param content: The JSON response, an object.
+
+    :type items_key: str
+    :param items_key: The key holding the items in the response.
+
+    :rtype: dict
+    :returns: The parsed response, except that the value for ``items_key``
+              (if present) is a sized iterable of items which are decoded
+              as they are iterated.
+    :raises ValueError: If ``content`` is not a JSON object.
+    """
+    if isinstance(content, six.binary_type):
+        content = content.decode('utf-8')
+    response = {}
+    if not content:
+        return response
+
+    delimiter, index = _expect_json_delimiter(content, 0, '{')
+    if content[index:index + 1] == '}':
+        delimiter = '}'
+    while delimiter != '}':
+        key, index = _JSON_DECODER.raw_decode(content, index)
+        _, index = _expect_json_delimiter(content, index, ':')
+        if key == items_key and content[index:index + 1] == '[':
+            response[key], index = _scan_json_array(content, index)
+        else:
+            response[key], index = _JSON_DECODER.raw_decode(content, index)
+        delimiter, index = _expect_json_delimiter(content, index, ',}')
+    return response
@@ -29,6 +29,7 @@ import six
 from six.moves import http_client
 from six.moves.urllib import parse
 
+from google.cloud import instrumentation
 from google.cloud.streaming.exceptions import BadStatusCodeError
 from google.cloud.streaming.exceptions import RequestError
 from google.cloud.streaming.exceptions import RetryAfterError
@@ -377,20 +378,38 @@ def make_api_request(http, http_request, retries=7,
     :raises: :exc:`google.cloud.streaming.exceptions.RequestError` if no
              response could be parsed.
     """
+    hooks = instrumentation._HOOKS
+    if hooks:
+        started = instrumentation._before_request(
+            hooks, http_request.http_method, http_request.url)
+    response = error = None
     retry = 0
-    while True:
-        try:
-            return _make_api_request_no_retry(http, http_request,
-                                              redirections=redirections)
-        except _RETRYABLE_EXCEPTIONS as exc:
-            retry += 1
-            if retry >= retries:
-                raise
-            retry_after = getattr(exc, 'retry_after', None)
-            if retry_after is None:
-                retry_after = calculate_wait_for_retry(retry)
-
-            _reset_http_connections(http)
-            logging.debug('Retrying request to url %s after exception %s',
-                          http_request.url, type(exc).__name__)
-            time.sleep(retry_after)
+    try:
+        while True:
+            try:
+                response = _make_api_request_no_retry(
+                    http, http_request, redirections=redirections)
+                return response
+            except _RETRYABLE_EXCEPTIONS as exc:
+                error = exc
+                if retry + 1 >= retries:
+                    raise
+                retry += 1
+                retry_after = getattr(exc, 'retry_after', None)
+                if retry_after is None:
+                    retry_after = calculate_wait_for_retry(retry)
+
+                _reset_http_connections(http)
+                logging.debug(
+                    'Retrying request to url %s after exception %s',
+                    http_request.url, type(exc).__name__)
+                time.sleep(retry_after)
+    finally:
+        if hooks:
+            if response is not None:
+                status, content = response.status_code, response.content
+            else:
+                status, content = getattr(error, 'status_code', None), None
+            instrumentation._after_request(
+                hooks, started, http_request.http_method, http_request.url,
+                status, http_request.body, content, retries=retry)
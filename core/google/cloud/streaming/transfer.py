@@ -19,7 +19,10 @@ import email.generator as email_generator
 import email.mime.multipart as mime_multipart
 import email.mime.nonmultipart as mime_nonmultipart
 import mimetypes
+import mmap
 import os
+import stat
+import timeit
 
 import httplib2
 import six
@@ -45,6 +48,89 @@ RESUMABLE_UPLOAD = 'resumable'
 
 _DEFAULT_CHUNKSIZE = 1 << 20
 
+_ADAPTIVE_CHUNK_MULTIPLE = 256 << 10
+"""Granularity of adaptive chunk sizes, unless the server specifies one."""
+
+_MAX_ADAPTIVE_CHUNKSIZE = 64 << 20
+"""Largest chunk sent by an upload with adaptive chunk sizes."""
+
+_TARGET_CHUNK_SECONDS = 2.0
+"""Time each chunk should take to send, with adaptive chunk sizes.
+
+Long enough that the fixed cost of each request is small in comparison.
+"""
+
+_timer = timeit.default_timer
+
+
+class _AdaptiveChunkSize(object):
+    """Choose the size of each chunk of an upload from measured throughput.
+
+    Each chunk is sized to take about ``target_seconds`` to send at the
+    throughput measured for the previous one, changing by at most a factor
+    of two at a time. After an error, the size drops to the minimum so
+    that resending a chunk costs as little as possible; it then grows
+    again with each chunk sent successfully.
+
+    :type chunksize: int
+    :param chunksize: The size of the first chunk (rounded to a multiple
+                      of ``multiple``).
+
+    :type multiple: int
+    :param multiple: Every chunk size is a (non-zero) multiple of this.
+
+    :type maximum: int
+    :param maximum: (Optional) The largest chunk size.
+
+    :type target_seconds: float
+    :param target_seconds: (Optional) The time each chunk should take.
+    """
+
+    def __init__(self, chunksize, multiple, maximum=_MAX_ADAPTIVE_CHUNKSIZE,
+                 target_seconds=_TARGET_CHUNK_SECONDS):
+        self.multiple = multiple
+        self.maximum = max(maximum // multiple, 1) * multiple
+        self.target_seconds = target_seconds
+        self.chunksize = self._round(chunksize)
+
+    def _round(self, chunksize):
+        """Round a chunk size down to an allowed one.
+
+        :type chunksize: int
+        :param chunksize: The chunk size to round.
+
+        :rtype: int
+        :returns: The largest allowed chunk size not above ``chunksize``
+                  (or the smallest allowed one).
+        """
+        chunksize = chunksize // self.multiple * self.multiple
+        return min(max(chunksize, self.multiple), self.maximum)
+
+    def record_success(self, num_bytes, seconds):
+        """Adjust the chunk size after a chunk was sent.
+
+        Short (final) chunks are ignored, since the fixed cost of their
+        request dominates their throughput.
+
+        :type num_bytes: int
+        :param num_bytes: The size of the chunk sent.
+
+        :type seconds: float
+        :param seconds: The time taken to send it.
+        """
+        if num_bytes < self.chunksize:
+            return
+        if seconds > 0:
+            desired = num_bytes / float(seconds) * self.target_seconds
+        else:
+            desired = self.chunksize * 2
+        desired = min(max(desired, self.chunksize // 2), self.chunksize * 2)
+        self.chunksize = self._round(int(desired))
+
+    def record_error(self):
+        """Drop to the smallest chunk size after a failed chunk."""
+        self.chunksize = self.multiple
+
 
 class _Transfer(object):
     """Generic bits common to Uploads and Downloads.
@@ -645,6 +731,21 @@ class Upload(_Transfer):
     :param auto_transfer: should this instance automatically begin transfering
                           data when initialized
 
+    :type memory_map: bool
+    :param memory_map: (Optional) if the stream is backed by a regular file
+                       and positioned at its start, map the file into memory
+                       and send chunks as ``memoryview`` slices of the map
+                       rather than copying them out of the stream.  The map
+                       is closed once the upload completes.
+
+    :type adaptive_chunksize: bool
+    :param adaptive_chunksize: (Optional) if True, ``chunksize`` is only the
+                               size of the first chunk of a resumable
+                               upload; later ones grow or shrink with the
+                               measured throughput, and shrink to the
+                               minimum after an error (so an upload resumed
+                               with :meth:`stream_file` resends little).
+
     :type kwds: dict
     :param kwds:  keyword arguments:  all except ``total_size`` are passed
                   through to :meth:`_Transfer.__init__()`.
@@ -653,12 +754,19 @@ class Upload(_Transfer):
         'auto_transfer', 'mime_type', 'total_size', 'url'))
 
     def __init__(self, stream, mime_type, total_size=None, http=None,
-                 close_stream=False, auto_transfer=True,
-                 **kwds):
+                 close_stream=False, auto_transfer=True, memory_map=False,
+                 adaptive_chunksize=False, **kwds):
         super(Upload, self).__init__(
             stream, close_stream=close_stream, auto_transfer=auto_transfer,
             http=http, **kwds)
         self._final_response = None
+        self._memory_map = None
+        if memory_map and getattr(stream, 'tell', lambda: None)() == 0:
+            # Chunk offsets are stream positions, which are only offsets
+            # into the map when the upload starts at the start of the file.
+            self._memory_map = _memory_map(stream)
+        self._adaptive_chunksize = adaptive_chunksize
+        self._chunk_sizer = None
         self._server_chunk_granularity = None
         self._complete = False
         self._mime_type = mime_type
@@ -682,7 +790,9 @@ class Upload(_Transfer):
 
         :type kwds: dict
         :param kwds:  keyword arguments:  passed
-                      through to :meth:`_Transfer.__init__()`.
+                      through to :meth:`_Transfer.__init__()`.  Unless
+                      ``memory_map=False`` is passed, the file is mapped
+                      into memory and uploaded without per-chunk copies.
 
         :rtype: :class:`Upload`
         :returns: The upload initiated from the file passed.
@@ -694,6 +804,7 @@ class Upload(_Transfer):
                 raise ValueError(
                     'Could not guess mime type for %s' % path)
         size = os.stat(path).st_size
+        kwds.setdefault('memory_map', True)
         return cls(open(path, 'rb'), mime_type, total_size=size,
                    close_stream=True, auto_transfer=auto_transfer, **kwds)
 
@@ -959,6 +1070,7 @@ class Upload(_Transfer):
         if refresh_response.status_code in (http_client.OK,
                                             http_client.CREATED):
             self._complete = True
+            self._close_memory_map()
             self._progress = self.total_size
             self.stream.seek(self.progress)
             # If we're finished, the refresh response will contain the metadata
@@ -1087,6 +1199,12 @@ class Upload(_Transfer):
         # final_response is set if we resumed an already-completed upload.
         response = self._final_response
         send_func = self._send_chunk if use_chunks else self._send_media_body
+        if use_chunks and self._adaptive_chunksize:
+            if self._chunk_sizer is None:
+                self._chunk_sizer = _AdaptiveChunkSize(
+                    self.chunksize,
+                    self._server_chunk_granularity or _ADAPTIVE_CHUNK_MULTIPLE)
+            self.chunksize = self._chunk_sizer.chunksize
         if use_chunks:
             self._validate_chunksize(self.chunksize)
         self._ensure_initialized()
@@ -1094,6 +1212,7 @@ class Upload(_Transfer):
             response = send_func(self.stream.tell())
             if response.status_code in (http_client.OK, http_client.CREATED):
                 self._complete = True
+                self._close_memory_map()
                 break
             self._progress = self._last_byte(response.info['range'])
             if self.progress + 1 != self.stream.tell():
@@ -1144,6 +1263,49 @@ class Upload(_Transfer):
                 self.stream.seek(last_byte)
         return response
 
+    def _close_memory_map(self):
+        """Release the memory map of the stream, if any.
+
+        Called once the upload completes, and when the upload is deleted.
+        If a request body still refers to the map, closing it is left to
+        the garbage collector.
+        """
+        mapped, self._memory_map = self._memory_map, None
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+
+    def __del__(self):
+        self._close_memory_map()
+        super(Upload, self).__del__()
+
+    def _body_slice(self, start, end):
+        """Build the request body for a range of the stream.
+
+        Helper for :meth:`_send_media_body` & :meth:`_send_chunk`.
+
+        When the stream is memory-mapped, the body is a ``memoryview`` over
+        the map (no bytes are copied) and the stream is advanced past the
+        range, as reading a :class:`StreamSlice` would do.
+
+        :type start: int
+        :param start: start byte of the range; the current stream position.
+
+        :type end: int
+        :param end: end byte (exclusive) of the range.
+
+        :rtype: :class:`memoryview` or
+                :class:`~google.cloud.streaming.stream_slice.StreamSlice`
+        :returns: the body for the range.
+        """
+        mapped = self._memory_map
+        if mapped is not None and end <= len(mapped):
+            self.stream.seek(end)
+            return memoryview(mapped)[start:end]
+        return StreamSlice(self.stream, end - start)
+
     def _send_media_body(self, start):
         """Send the entire stream in a single request.
 
@@ -1159,7 +1321,7 @@ class Upload(_Transfer):
         if self.total_size is None:
             raise TransferInvalidError(
                 'Total size must be known for SendMediaBody')
-        body_stream = StreamSlice(self.stream, self.total_size - start)
+        body_stream = self._body_slice(start, self.total_size)
 
         request = Request(url=self.url, http_method='PUT', body=body_stream)
         request.headers['Content-Type'] = self.mime_type
@@ -1202,7 +1364,7 @@ class Upload(_Transfer):
             body_stream = body_stream.read(self.chunksize)
         else:
             end = min(start + self.chunksize, self.total_size)
-            body_stream = StreamSlice(self.stream, end - start)
+            body_stream = self._body_slice(start, end)
         request = Request(url=self.url, http_method='PUT', body=body_stream)
         request.headers['Content-Type'] = self.mime_type
         if no_log_body:
@@ -1220,4 +1382,46 @@ class Upload(_Transfer):
 
         request.headers['Content-Range'] = range_string
 
-        return self._send_media_request(request, end)
+        sizer = self._chunk_sizer
+        if sizer is None:
+            return self._send_media_request(request, end)
+
+        started = _timer()
+        try:
+            response = self._send_media_request(request, end)
+        except Exception:
+            sizer.record_error()
+            self.chunksize = sizer.chunksize
+            raise
+        if self.stream.tell() != end:
+            # The server kept only part of the chunk.
+            sizer.record_error()
+        else:
+            sizer.record_success(end - start, _timer() - started)
+        self.chunksize = sizer.chunksize
+        return response
+
+
+def _memory_map(stream):
+    """Map the regular file backing a stream into memory, read-only.
+
+    :type stream: file-like object
+    :param stream: the stream to be uploaded.
+
+    :rtype: :class:`mmap.mmap` or ``NoneType``
+    :returns: the mapped file, or ``None`` if the stream is not backed by a
+              non-empty regular file which can be mapped.
+    """
+    try:
+        fileno = stream.fileno()
+        # Make sure buffered writes are visible through the map.
+        getattr(stream, 'flush', lambda: None)()
+        file_stat = os.fstat(fileno)
+    except (AttributeError, EnvironmentError, ValueError):
+        return None
+    if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+        return None
+    try:
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (EnvironmentError, ValueError):
+        return None
@@ -30,12 +30,19 @@ def unit_tests(session, python_version):
     # Install all test dependencies, then install this package in-place.
     session.install('mock', 'pytest', 'pytest-cov',
                     'grpcio >= 1.0.2')
+    if python_version in ('3.5', '3.6'):
+        session.install('aiohttp')
+        coveragerc = '.coveragerc'
+    else:
+        # The asyncio transport cannot be imported before Python 3.5.
+        coveragerc = '.coveragerc-py2'
     session.install('-e', '.')
 
     # Run py.test against the unit tests.
     session.run('py.test', '--quiet',
         '--cov=google.cloud', '--cov=tests.unit', '--cov-append',
-        '--cov-config=.coveragerc', '--cov-report=', '--cov-fail-under=97',
+        '--cov-config=' + coveragerc, '--cov-report=',
+        '--cov-fail-under=97',
         'tests/unit',
     )
 
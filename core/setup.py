@@ -59,6 +59,10 @@ REQUIREMENTS = [
     'six',
 ]
 
+EXTRAS_REQUIRE = {
+    'async:python_version>="3.5"': ['aiohttp >= 3.0.0'],
+}
+
 setup(
     name='google-cloud-core',
     version='0.24.1',
@@ -70,5 +74,6 @@ setup(
     ],
     packages=find_packages(exclude=('tests*',)),
     install_requires=REQUIREMENTS,
+    extras_require=EXTRAS_REQUIRE,
     **SETUP_BASE
 )
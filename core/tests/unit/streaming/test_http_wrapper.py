@@ -118,6 +118,13 @@ class Test_Request(unittest.TestCase):
         self.assertIs(request.body, body)
         self.assertEqual(request.loggable_body, '<media body>')
 
+    def test_body_setter_w_memoryview(self):
+        request = self._make_one()
+        request.body = body = memoryview(b'abcdef')[1:4]
+        self.assertEqual(request.headers, {'content-length': '3'})
+        self.assertIs(request.body, body)
+        self.assertEqual(request.loggable_body, '<media body>')
+
 
 class Test_Response(unittest.TestCase):
 
@@ -457,6 +464,63 @@ class Test_make_api_request(unittest.TestCase):
             self.assertEqual(attempt, ((HTTP, REQUEST), expected_kw))
         self.assertEqual(_checked, [])  # not called by '_wo_exception'
 
+    def test_w_hook(self):
+        import mock
+        from google.cloud import instrumentation
+        from google.cloud.streaming.exceptions import BadStatusCodeError
+        from google.cloud.streaming import http_wrapper as MUT
+        from google.cloud._testing import _Monkey
+
+        HTTP = object()
+        REQUEST = _Request(http_method='PUT', body=b'BODY')
+        RESPONSE = _Response(201)
+        RESPONSE.content = b'CONTENT'
+        _counter = [None] * 2
+
+        def _wo_exception(*args, **kw):
+            if _counter:
+                _counter.pop()
+                raise BadStatusCodeError({'status': '503'}, '', REQUEST.url)
+            return RESPONSE
+
+        hook = mock.Mock(spec=['before_request', 'after_request'])
+        with _Monkey(MUT, calculate_wait_for_retry=lambda *ignored: 0,
+                     _make_api_request_no_retry=_wo_exception):
+            with mock.patch.object(instrumentation, '_HOOKS', (hook,)):
+                self._call_fut(HTTP, REQUEST)
+
+        hook.before_request.assert_called_once_with('PUT', REQUEST.url)
+        record, = hook.after_request.call_args[0]
+        self.assertEqual(record.method, 'PUT')
+        self.assertEqual(record.status, 201)
+        self.assertEqual(record.bytes_sent, 4)
+        self.assertEqual(record.bytes_received, 7)
+        self.assertEqual(record.retries, 2)
+
+    def test_w_hook_gt_max_retries(self):
+        import mock
+        from google.cloud import instrumentation
+        from google.cloud.streaming.exceptions import BadStatusCodeError
+        from google.cloud.streaming import http_wrapper as MUT
+        from google.cloud._testing import _Monkey
+
+        REQUEST = _Request()
+
+        def _wo_exception(*args, **kw):
+            raise BadStatusCodeError({'status': '503'}, '', REQUEST.url)
+
+        hook = mock.Mock(spec=['before_request', 'after_request'])
+        with _Monkey(MUT, calculate_wait_for_retry=lambda *ignored: 0,
+                     _make_api_request_no_retry=_wo_exception):
+            with mock.patch.object(instrumentation, '_HOOKS', (hook,)):
+                with self.assertRaises(BadStatusCodeError):
+                    self._call_fut(object(), REQUEST, retries=3)
+
+        record, = hook.after_request.call_args[0]
+        self.assertEqual(record.status, 503)
+        self.assertEqual(record.bytes_received, 0)
+        self.assertEqual(record.retries, 2)
+
 
 class _Dummy(object):
     def __init__(self, **kw):
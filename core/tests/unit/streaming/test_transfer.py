@@ -831,6 +831,61 @@ class Test_Download(unittest.TestCase):
         self.assertEqual(download.total_size, LEN)
 
 
+class Test__AdaptiveChunkSize(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.streaming.transfer import _AdaptiveChunkSize
+
+        return _AdaptiveChunkSize
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        from google.cloud.streaming.transfer import _MAX_ADAPTIVE_CHUNKSIZE
+        from google.cloud.streaming.transfer import _TARGET_CHUNK_SECONDS
+
+        sizer = self._make_one(1000, 256)
+        self.assertEqual(sizer.chunksize, 768)
+        self.assertEqual(sizer.multiple, 256)
+        self.assertEqual(sizer.maximum, _MAX_ADAPTIVE_CHUNKSIZE)
+        self.assertEqual(sizer.target_seconds, _TARGET_CHUNK_SECONDS)
+
+    def test_ctor_rounds_to_bounds(self):
+        self.assertEqual(self._make_one(10, 256).chunksize, 256)
+        sizer = self._make_one(10000, 256, maximum=1000)
+        self.assertEqual(sizer.maximum, 768)
+        self.assertEqual(sizer.chunksize, 768)
+
+    def test_record_success_grows_at_most_twofold(self):
+        sizer = self._make_one(1024, 256, maximum=3000, target_seconds=1.0)
+        sizer.record_success(1024, 0.001)
+        self.assertEqual(sizer.chunksize, 2048)
+        sizer.record_success(2048, 0.0)
+        self.assertEqual(sizer.chunksize, 2816)  # The maximum.
+
+    def test_record_success_to_target(self):
+        sizer = self._make_one(1024, 256, target_seconds=1.0)
+        sizer.record_success(1024, 0.8)
+        self.assertEqual(sizer.chunksize, 1280)
+
+    def test_record_success_shrinks_at_most_twofold(self):
+        sizer = self._make_one(4096, 256, target_seconds=1.0)
+        sizer.record_success(4096, 100.0)
+        self.assertEqual(sizer.chunksize, 2048)
+
+    def test_record_success_ignores_short_chunk(self):
+        sizer = self._make_one(4096, 256, target_seconds=1.0)
+        sizer.record_success(10, 100.0)
+        self.assertEqual(sizer.chunksize, 4096)
+
+    def test_record_error(self):
+        sizer = self._make_one(4096, 256)
+        sizer.record_error()
+        self.assertEqual(sizer.chunksize, 256)
+
+
 class Test_Upload(unittest.TestCase):
     URL = "http://example.com/api"
     MIME_TYPE = 'application/octet-stream'
@@ -925,6 +980,36 @@ class Test_Upload(unittest.TestCase):
             self.assertEqual(upload.chunksize, CHUNK_SIZE)
             upload._stream.close()
 
+    def test_from_file_maps_file(self):
+        import os
+        from google.cloud._testing import _tempdir
+
+        klass = self._get_target_class()
+        CONTENT = b'EXISTING FILE TO BE MAPPED'
+        with _tempdir() as tempdir:
+            filename = os.path.join(tempdir, 'file.txt')
+            with open(filename, 'wb') as fileobj:
+                fileobj.write(CONTENT)
+            upload = klass.from_file(filename, auto_transfer=False)
+            self.assertEqual(upload._memory_map[:], CONTENT)
+            upload._memory_map.close()
+            upload._stream.close()
+
+    def test_from_file_wo_memory_map(self):
+        import os
+        from google.cloud._testing import _tempdir
+
+        klass = self._get_target_class()
+        CONTENT = b'EXISTING FILE NOT TO BE MAPPED'
+        with _tempdir() as tempdir:
+            filename = os.path.join(tempdir, 'file.txt')
+            with open(filename, 'wb') as fileobj:
+                fileobj.write(CONTENT)
+            upload = klass.from_file(
+                filename, auto_transfer=False, memory_map=False)
+            self.assertIsNone(upload._memory_map)
+            upload._stream.close()
+
     def test_from_stream_wo_mimetype(self):
         klass = self._get_target_class()
         stream = _Stream()
@@ -1200,6 +1285,7 @@ class Test_Upload(unittest.TestCase):
             upload.refresh_upload_state()
 
     def test_refresh_upload_state_w_OK(self):
+        import mock
         from six.moves import http_client
         from google.cloud._testing import _Monkey
         from google.cloud.streaming import transfer as MUT
@@ -1213,6 +1299,7 @@ class Test_Upload(unittest.TestCase):
         upload = self._make_one(stream, total_size=LEN)
         upload.strategy = RESUMABLE_UPLOAD
         upload._initialize(http, _Request.URL)
+        upload._memory_map = mapped = mock.Mock(spec=['close'])
         info = {'content-range': RESP_RANGE}
         response = _makeResponse(http_client.OK, info, CONTENT)
         requester = _MakeRequest(response)
@@ -1226,6 +1313,8 @@ class Test_Upload(unittest.TestCase):
         self.assertEqual(upload.progress, LEN)
         self.assertEqual(stream.tell(), LEN)
         self.assertIs(upload._final_response, response)
+        mapped.close.assert_called_once_with()
+        self.assertIsNone(upload._memory_map)
 
     def test_refresh_upload_state_w_CREATED(self):
         from six.moves import http_client
@@ -1657,6 +1746,108 @@ class Test_Upload(unittest.TestCase):
                           'Content-Type': self.MIME_TYPE})
         self.assertEqual(request.body, CONTENT[:6])
 
+    def test_stream_file_w_adaptive_chunksize(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
+
+        CONTENT = b'ABCDEFGHIJKLMN'
+        http = object()
+        stream = _Stream(CONTENT)
+        upload = self._make_one(stream, chunksize=2, adaptive_chunksize=True)
+        upload.strategy = RESUMABLE_UPLOAD
+        upload._server_chunk_granularity = 2
+        upload._initialize(http, self.UPLOAD_URL)
+
+        requester = _MakeRequest(
+            _makeResponse(RESUME_INCOMPLETE, {'range': 'bytes=0-1'}),
+            _makeResponse(RESUME_INCOMPLETE, {'range': 'bytes=0-5'}),
+            _makeResponse(http_client.OK))
+        times = [0.0, 0.1, 1.0, 1.1, 2.0, 2.1]
+
+        def timer():
+            return times.pop(0)
+
+        with _Monkey(MUT, Request=_Request, make_api_request=requester,
+                     _timer=timer):
+            upload.stream_file()
+
+        self.assertTrue(upload.complete)
+        bodies = [request.body for request, _, _ in requester._requested]
+        self.assertEqual(bodies, [CONTENT[:2], CONTENT[2:6], CONTENT[6:]])
+        self.assertEqual(upload.chunksize, 16)
+
+    def test_stream_file_w_adaptive_chunksize_resumed(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
+
+        CONTENT = b'ABCDEFGHIJKLMN'
+        http = object()
+        stream = _Stream(CONTENT)
+        upload = self._make_one(stream, chunksize=2, adaptive_chunksize=True)
+        upload.strategy = RESUMABLE_UPLOAD
+        upload._initialize(http, self.UPLOAD_URL)
+        # Learned by an earlier, interrupted call.
+        upload._chunk_sizer = MUT._AdaptiveChunkSize(8, 2)
+
+        requester = _MakeRequest(
+            _makeResponse(RESUME_INCOMPLETE, {'range': 'bytes=0-7'}),
+            _makeResponse(http_client.OK))
+        times = [0.0, 1.0, 2.0, 3.0]
+
+        with _Monkey(MUT, Request=_Request, make_api_request=requester,
+                     _timer=lambda: times.pop(0)):
+            upload.stream_file()
+
+        self.assertTrue(upload.complete)
+        bodies = [request.body for request, _, _ in requester._requested]
+        self.assertEqual(bodies, [CONTENT[:8], CONTENT[8:]])
+
+    def test__send_chunk_w_adaptive_chunksize_error(self):
+        from google.cloud.streaming.transfer import _AdaptiveChunkSize
+
+        CONTENT = b'ABCDEFGHIJ'
+        http = object()
+        stream = _Stream(CONTENT)
+        upload = self._make_one(stream, total_size=len(CONTENT), chunksize=4)
+        upload._initialize(http, self.UPLOAD_URL)
+        upload._chunk_sizer = _AdaptiveChunkSize(4, 2)
+
+        def send_media_request(request, end):
+            raise ValueError('failed')
+
+        upload._send_media_request = send_media_request
+
+        with self.assertRaises(ValueError):
+            upload._send_chunk(0)
+
+        self.assertEqual(upload.chunksize, 2)
+
+    def test__send_chunk_w_adaptive_chunksize_partial(self):
+        from google.cloud.streaming.transfer import _AdaptiveChunkSize
+
+        CONTENT = b'ABCDEFGHIJ'
+        http = object()
+        stream = _Stream(CONTENT)
+        upload = self._make_one(stream, total_size=len(CONTENT), chunksize=4)
+        upload._initialize(http, self.UPLOAD_URL)
+        upload._chunk_sizer = _AdaptiveChunkSize(4, 2)
+        response = object()
+
+        def send_media_request(request, end):
+            stream.seek(2)  # The server kept two bytes.
+            return response
+
+        upload._send_media_request = send_media_request
+
+        self.assertIs(upload._send_chunk(0), response)
+        self.assertEqual(upload.chunksize, 2)
+
     def test__send_media_request_wo_error(self):
         from google.cloud._testing import _Monkey
         from google.cloud.streaming import transfer as MUT
@@ -1771,6 +1962,35 @@ class Test_Upload(unittest.TestCase):
                           'Content-Range': 'bytes 0-%d/%d' % (SIZE - 1, SIZE)})
         self.assertEqual(end, SIZE)
 
+    def test__send_media_body_w_memory_map(self):
+        CONTENT = b'ABCDEFGHIJ'
+        SIZE = len(CONTENT)
+        START = 3
+        http = object()
+        stream = _mapped_stream(self, CONTENT)
+        upload = self._make_one(stream, total_size=SIZE, memory_map=True)
+        upload._initialize(http, self.UPLOAD_URL)
+        stream.seek(START)
+        response = object()
+        streamer = _MediaStreamer(response)
+        upload._send_media_request = streamer
+
+        found = upload._send_media_body(START)
+
+        self.assertIs(found, response)
+        request, end = streamer._called_with
+        body = request.body
+        self.assertIsInstance(body, memoryview)
+        self.assertEqual(body.tobytes(), CONTENT[START:])
+        self.assertEqual(request.loggable_body, '<media body>')
+        self.assertEqual(
+            request.headers,
+            {'content-length': '%d' % (SIZE - START,),  # speling!
+             'Content-Type': self.MIME_TYPE,
+             'Content-Range': 'bytes %d-%d/%d' % (START, SIZE - 1, SIZE)})
+        self.assertEqual(end, SIZE)
+        self.assertEqual(stream.tell(), SIZE)
+
     def test__send_media_body_start_eq_total_size(self):
         from google.cloud.streaming.stream_slice import StreamSlice
 
@@ -1921,6 +2141,207 @@ class Test_Upload(unittest.TestCase):
                           'Content-Range': 'bytes */%d' % (SIZE,)})
         self.assertEqual(end, SIZE)
 
+    def test__send_chunk_w_memory_map(self):
+        CONTENT = b'ABCDEFGHIJ'
+        SIZE = len(CONTENT)
+        CHUNK_SIZE = 4
+        http = object()
+        stream = _mapped_stream(self, CONTENT)
+        upload = self._make_one(stream, total_size=SIZE, chunksize=CHUNK_SIZE,
+                                memory_map=True)
+        upload._initialize(http, self.UPLOAD_URL)
+        response = object()
+        streamer = _MediaStreamer(response)
+        upload._send_media_request = streamer
+
+        found = upload._send_chunk(0)
+
+        self.assertIs(found, response)
+        request, end = streamer._called_with
+        body = request.body
+        self.assertIsInstance(body, memoryview)
+        self.assertEqual(body.tobytes(), CONTENT[:CHUNK_SIZE])
+        self.assertEqual(
+            request.headers,
+            {'content-length': '%d' % CHUNK_SIZE,  # speling!
+             'Content-Type': self.MIME_TYPE,
+             'Content-Range': 'bytes 0-%d/%d' % (CHUNK_SIZE - 1, SIZE)})
+        self.assertEqual(end, CHUNK_SIZE)
+        self.assertEqual(stream.tell(), CHUNK_SIZE)
+
+    def test__send_chunk_w_memory_map_file_shrunk(self):
+        from google.cloud.streaming.stream_slice import StreamSlice
+
+        CONTENT = b'ABCDEFGHIJ'
+        SIZE = len(CONTENT) + 5
+        http = object()
+        stream = _mapped_stream(self, CONTENT)
+        upload = self._make_one(stream, total_size=SIZE, memory_map=True)
+        upload._initialize(http, self.UPLOAD_URL)
+        streamer = _MediaStreamer(object())
+        upload._send_media_request = streamer
+
+        upload._send_chunk(0)
+
+        request, end = streamer._called_with
+        self.assertIsInstance(request.body, StreamSlice)
+        self.assertEqual(end, SIZE)
+
+    def test_ctor_w_memory_map_stream_not_at_start(self):
+        from google.cloud.streaming.stream_slice import StreamSlice
+
+        CONTENT = b'HEADER\nrow1\nrow2\n'
+        SIZE = len(CONTENT)
+        START = len(b'HEADER\n')
+        http = object()
+        stream = _mapped_stream(self, CONTENT)
+        stream.seek(START)
+        upload = self._make_one(stream, total_size=SIZE, memory_map=True)
+        self.assertIsNone(upload._memory_map)
+        upload._initialize(http, self.UPLOAD_URL)
+        streamer = _MediaStreamer(object())
+        upload._send_media_request = streamer
+
+        upload._send_media_body(START)
+
+        request, end = streamer._called_with
+        self.assertIsInstance(request.body, StreamSlice)
+        self.assertEqual(request.body.read(), b'row1\nrow2\n')
+        self.assertEqual(end, SIZE)
+
+    def test_ctor_w_memory_map_stream_wo_tell(self):
+        stream = _FilenoStream(_mapped_stream(self, b'ABC'))
+        upload = self._make_one(stream, total_size=3, memory_map=True)
+        self.assertIsNone(upload._memory_map)
+
+    def test_stream_file_w_memory_map_closes_map(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
+
+        CONTENT = b'ABCDEFGHIJ'
+        http = object()
+        stream = _mapped_stream(self, CONTENT)
+        upload = self._make_one(stream, total_size=len(CONTENT),
+                                chunksize=1024, memory_map=True)
+        upload.strategy = RESUMABLE_UPLOAD
+        upload._initialize(http, self.UPLOAD_URL)
+        self.assertIsNotNone(upload._memory_map)
+        response = _makeResponse(http_client.OK, {'content-length': '0'})
+        requester = _MakeRequest(response)
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester):
+            self.assertIs(upload.stream_file(), response)
+
+        self.assertTrue(upload.complete)
+        self.assertIsNone(upload._memory_map)
+        request = requester._requested[0][0]
+        self.assertEqual(bytes(request.body), CONTENT)
+
+    def test__close_memory_map(self):
+        import mock
+
+        upload = self._make_one(_Stream())
+        upload._memory_map = mapped = mock.Mock(spec=['close'])
+
+        upload._close_memory_map()
+        upload._close_memory_map()
+
+        mapped.close.assert_called_once_with()
+        self.assertIsNone(upload._memory_map)
+
+    def test__close_memory_map_w_exported_buffer(self):
+        import mock
+
+        upload = self._make_one(_Stream())
+        upload._memory_map = mapped = mock.Mock(spec=['close'])
+        mapped.close.side_effect = BufferError('exports exist')
+
+        upload._close_memory_map()
+
+        self.assertIsNone(upload._memory_map)
+
+    def test___del___closes_memory_map(self):
+        import mock
+
+        stream = _Stream()
+        upload = self._make_one(stream, close_stream=True)
+        upload._memory_map = mapped = mock.Mock(spec=['close'])
+
+        upload.__del__()
+
+        mapped.close.assert_called_once_with()
+        self.assertTrue(stream._closed)
+
+
+class Test__memory_map(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(stream):
+        from google.cloud.streaming.transfer import _memory_map
+
+        return _memory_map(stream)
+
+    def test_wo_fileno(self):
+        self.assertIsNone(self._call_fut(_Stream(b'ABC')))
+
+    def test_w_unsupported_fileno(self):
+        import io
+
+        self.assertIsNone(self._call_fut(io.BytesIO(b'ABC')))
+
+    def test_w_empty_file(self):
+        stream = _mapped_stream(self, b'')
+        self.assertIsNone(self._call_fut(stream))
+
+    def test_w_regular_file(self):
+        CONTENT = b'ABCDEFGHIJ'
+        stream = _mapped_stream(self, CONTENT)
+        mapped = self._call_fut(stream)
+        self.addCleanup(mapped.close)
+        self.assertEqual(len(mapped), len(CONTENT))
+        self.assertEqual(mapped[2:5], CONTENT[2:5])
+
+    def test_w_mmap_failure(self):
+        import mock
+
+        stream = _mapped_stream(self, b'ABCDEFGHIJ')
+        patch = mock.patch('mmap.mmap', side_effect=OSError('no mapping'))
+        with patch:
+            self.assertIsNone(self._call_fut(stream))
+
+    def test_w_unflushed_writes(self):
+        import tempfile
+
+        CONTENT = b'ABCDEFGHIJ'
+        stream = tempfile.TemporaryFile()
+        self.addCleanup(stream.close)
+        stream.write(CONTENT)
+        mapped = self._call_fut(stream)
+        self.addCleanup(mapped.close)
+        self.assertEqual(mapped[:], CONTENT)
+
+    def test_wo_flush(self):
+        CONTENT = b'ABCDEFGHIJ'
+        stream = _FilenoStream(_mapped_stream(self, CONTENT))
+        mapped = self._call_fut(stream)
+        self.addCleanup(mapped.close)
+        self.assertEqual(mapped[:], CONTENT)
+
+
+def _mapped_stream(test_case, content):
+    import tempfile
+
+    stream = tempfile.TemporaryFile()
+    test_case.addCleanup(stream.close)
+    stream.write(content)
+    stream.flush()
+    stream.seek(0)
+    return stream
+
 
 def _email_chunk_parser():
     import six
@@ -1977,6 +2398,16 @@ class _Stream(object):
         self._closed = True
 
 
+class _FilenoStream(object):
+    """Exposes only ``fileno`` of a wrapped file."""
+
+    def __init__(self, wrapped):
+        self._wrapped = wrapped
+
+    def fileno(self):
+        return self._wrapped.fileno()
+
+
 class _StreamWithSeekableMethod(_Stream):
 
     def __init__(self, to_read=b'', seekable=True):
@@ -43,6 +43,11 @@ class TestConnection(unittest.TestCase):
         conn = self._make_one(client)
         self.assertIs(conn.http, client._http)
 
+    def test_http_async_property(self):
+        client = mock.Mock(spec=['_http_async'])
+        conn = self._make_one(client)
+        self.assertIs(conn.http_async, client._http_async)
+
     def test_user_agent_format(self):
         from pkg_resources import get_distribution
 
@@ -221,6 +226,46 @@ class TestJSONConnection(unittest.TestCase):
         self.assertEqual(conn.api_request('GET', '/', expect_json=False),
                          b'CONTENT')
 
+    def test_api_request_w_hook(self):
+        from google.cloud import instrumentation
+
+        http = _Http(
+            {'status': '200', 'content-type': 'application/json'},
+            b'{"a": 1}',
+        )
+        client = mock.Mock(_http=http, spec=['_http'])
+        conn = self._make_mock_one(client)
+        hook = mock.Mock(spec=['before_request', 'after_request'])
+        with mock.patch.object(instrumentation, '_HOOKS', (hook,)):
+            conn.api_request('POST', '/foo', data='DATA')
+
+        url = 'http://mock/mock/vMOCK/foo'
+        hook.before_request.assert_called_once_with('POST', url)
+        record, = hook.after_request.call_args[0]
+        self.assertEqual(record.method, 'POST')
+        self.assertEqual(record.path, '/mock/vMOCK/foo')
+        self.assertEqual(record.status, 200)
+        self.assertGreaterEqual(record.latency, 0)
+        self.assertEqual(record.bytes_sent, 4)
+        self.assertEqual(record.bytes_received, 8)
+        self.assertEqual(record.retries, 0)
+
+    def test_api_request_w_hook_and_failure(self):
+        from google.cloud import instrumentation
+
+        http = mock.Mock(spec=['request'])
+        http.request.side_effect = ValueError('no response')
+        client = mock.Mock(_http=http, spec=['_http'])
+        conn = self._make_mock_one(client)
+        hook = mock.Mock(spec=['before_request', 'after_request'])
+        with mock.patch.object(instrumentation, '_HOOKS', (hook,)):
+            with self.assertRaises(ValueError):
+                conn.api_request('GET', '/foo')
+
+        record, = hook.after_request.call_args[0]
+        self.assertIsNone(record.status)
+        self.assertEqual(record.bytes_received, 0)
+
     def test_api_request_w_query_params(self):
         from six.moves.urllib.parse import parse_qsl
         from six.moves.urllib.parse import urlsplit
@@ -418,3 +463,209 @@ class _Http(object):
     def request(self, **kw):
         self._called_with = kw
         return self._response, self._content
+
+
+class Test__connection_key(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(uri):
+        from google.cloud._http import _connection_key
+
+        return _connection_key(uri)
+
+    def test_it(self):
+        self.assertEqual(
+            self._call_fut('HTTPS://Example.COM:443/path?q=1'),
+            'https:example.com:443')
+
+
+class TestPooledHttp(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud._http import PooledHttp
+
+        return PooledHttp
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_constructor_defaults(self):
+        from google.cloud._http import DEFAULT_POOL_SIZE
+
+        factory = object()
+        pool = self._make_one(factory)
+        self.assertIs(pool._http_factory, factory)
+        self.assertEqual(pool.size, DEFAULT_POOL_SIZE)
+        self.assertEqual(
+            pool.stats, {'created': 0, 'idle': 0, 'in_use': 0, 'hosts': {}})
+
+    def test_constructor_bad_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(object(), size=0)
+
+    def test_from_credentials(self):
+        import google.auth.credentials
+        import google_auth_httplib2
+
+        credentials = mock.Mock(spec=google.auth.credentials.Credentials)
+        pool = self._get_target_class().from_credentials(
+            credentials, size=3)
+        self.assertEqual(pool.size, 3)
+        http = pool._http_factory()
+        self.assertIsInstance(http, google_auth_httplib2.AuthorizedHttp)
+        self.assertIs(http.credentials, credentials)
+
+    def test_from_credentials_with_scopes(self):
+        import google.auth.credentials
+
+        credentials = mock.Mock(spec=google.auth.credentials.Scoped)
+        credentials.requires_scopes = True
+        scopes = ('https://www.googleapis.com/auth/cloud-platform',)
+        pool = self._get_target_class().from_credentials(
+            credentials, scopes=scopes)
+        http = pool._http_factory()
+        self.assertEqual(credentials.with_scopes.call_count, 1)
+        self.assertEqual(credentials.with_scopes.call_args[0], (scopes,))
+        self.assertIs(http.credentials, credentials.with_scopes.return_value)
+
+    def test_request_reuses_http_and_tracks_connections(self):
+        created = []
+
+        def factory():
+            http = _PoolHttp()
+            created.append(http)
+            return http
+
+        pool = self._make_one(factory, size=2)
+        uri = 'https://www.googleapis.com/storage/v1/b'
+        result1 = pool.request(uri, method='POST', body='{}',
+                               headers={'a': 'b'}, redirections=1)
+        result2 = pool.request(uri)
+
+        self.assertEqual(len(created), 1)
+        http = created[0]
+        self.assertEqual(result1, (http._response, http._content))
+        self.assertEqual(result2, (http._response, http._content))
+        self.assertEqual(http._requested, [
+            (uri, {'method': 'POST', 'body': '{}', 'headers': {'a': 'b'},
+                   'redirections': 1}),
+            (uri, {'method': 'GET', 'body': None, 'headers': None}),
+        ])
+        self.assertEqual(pool.stats, {
+            'created': 1,
+            'idle': 1,
+            'in_use': 0,
+            'hosts': {
+                'https:www.googleapis.com': {'requests': 2, 'reused': 1},
+            },
+        })
+
+    def test_request_unwraps_authorized_http(self):
+        inner = _PoolHttp()
+        inner.connections['https:example.com'] = object()
+        outer = mock.Mock(spec=['http', 'request'], http=inner)
+        outer.request.return_value = (None, b'')
+        pool = self._make_one(lambda: outer)
+
+        pool.request('https://example.com/')
+
+        self.assertEqual(
+            pool.stats['hosts'],
+            {'https:example.com': {'requests': 1, 'reused': 1}})
+
+    def test_request_failure_returns_http_to_pool(self):
+        http = mock.Mock(spec=['request'])
+        http.request.side_effect = RuntimeError('boom')
+        pool = self._make_one(lambda: http, size=1)
+
+        with self.assertRaises(RuntimeError):
+            pool.request('https://example.com/')
+
+        self.assertEqual(pool._idle, [http])
+        self.assertEqual(
+            pool.stats['hosts'],
+            {'https:example.com': {'requests': 1, 'reused': 0}})
+
+    def test_factory_failure_releases_slot(self):
+        factory = mock.Mock(side_effect=[RuntimeError('boom'), _PoolHttp()])
+        pool = self._make_one(factory, size=1)
+
+        with self.assertRaises(RuntimeError):
+            pool.request('https://example.com/')
+        self.assertEqual(pool.stats['created'], 0)
+
+        pool.request('https://example.com/')
+        self.assertEqual(pool.stats['created'], 1)
+
+    def test_request_blocks_until_released(self):
+        import threading
+
+        started = threading.Event()
+        proceed = threading.Event()
+
+        class _BlockingHttp(_PoolHttp):
+
+            def request(self, uri, **kw):
+                started.set()
+                proceed.wait()
+                return super(_BlockingHttp, self).request(uri, **kw)
+
+        pool = self._make_one(_BlockingHttp, size=1)
+        first = threading.Thread(
+            target=pool.request, args=('https://example.com/',))
+        first.start()
+        started.wait()
+
+        second = threading.Thread(
+            target=pool.request, args=('https://example.com/',))
+        second.start()
+        second.join(0.05)
+        self.assertTrue(second.is_alive())
+        self.assertEqual(pool.stats['in_use'], 1)
+
+        proceed.set()
+        first.join()
+        second.join()
+        self.assertEqual(pool.stats['created'], 1)
+        self.assertEqual(
+            pool.stats['hosts']['https:example.com']['requests'], 2)
+
+
+class Test__max_concurrent_requests(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args, **kw):
+        from google.cloud._http import _max_concurrent_requests
+
+        return _max_concurrent_requests(*args, **kw)
+
+    def test_w_pooled_http(self):
+        from google.cloud._http import PooledHttp
+
+        client = mock.Mock(_http=PooledHttp(object, size=7), spec=['_http'])
+        self.assertEqual(self._call_fut(client), 7)
+        self.assertEqual(self._call_fut(client, default=3), 7)
+
+    def test_wo_pooled_http(self):
+        client = mock.Mock(_http=object(), spec=['_http'])
+        self.assertEqual(self._call_fut(client), 1)
+        self.assertEqual(self._call_fut(client, default=3), 3)
+
+
+class _PoolHttp(object):
+
+    def __init__(self):
+        from httplib2 import Response
+
+        self._response = Response({'status': '200'})
+        self._content = b'{}'
+        self._requested = []
+        self.connections = {}
+
+    def request(self, uri, **kw):
+        from google.cloud._http import _connection_key
+
+        self._requested.append((uri, kw))
+        self.connections[_connection_key(uri)] = object()
+        return self._response, self._content
@@ -0,0 +1,365 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+import mock
+
+try:
+    import aiohttp
+except ImportError:  # pragma: NO COVER
+    aiohttp = None
+
+_SKIP_REASON = 'Requires aiohttp'
+_SKIP = aiohttp is None
+
+
+class _AsyncTestCase(unittest.TestCase):
+    """Runs each test on a fresh event loop, next to a local stub server.
+
+    The server answers each request with the next of ``self.responses``,
+    as ``(status, headers, body)``, and records it in ``self.requests``.
+    """
+
+    def setUp(self):
+        import asyncio
+
+        self.loop = asyncio.new_event_loop()
+        self.requests = []
+        self.responses = []
+        self.sessions = []
+        self.runner = None
+
+    def tearDown(self):
+        for session in self.sessions:
+            self._run(session.close())
+        if self.runner is not None:
+            self._run(self.runner.cleanup())
+        self.loop.close()
+
+    def _run(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def _collect(self, async_iter):
+        results = []
+        while True:
+            try:
+                results.append(self._run(async_iter.__anext__()))
+            except StopAsyncIteration:
+                return results
+
+    def _start_server(self):
+        from aiohttp import web
+
+        async def handler(request):
+            body = await request.read()
+            self.requests.append((request, body))
+            status, headers, body = self.responses.pop(0)
+            return web.Response(status=status, headers=headers, body=body)
+
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', handler)
+        self.runner = web.AppRunner(app)
+        self._run(self.runner.setup())
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        self._run(site.start())
+        port = site._server.sockets[0].getsockname()[1]
+        return 'http://127.0.0.1:%d' % (port,)
+
+    def _json_response(self, payload, status=200):
+        headers = {'Content-Type': 'application/json'}
+        self.responses.append(
+            (status, headers, json.dumps(payload).encode('utf-8')))
+
+    def _make_connection(self, credentials=None):
+        from google.cloud._http import JSONConnection
+        from google.cloud._http_async import AuthorizedSession
+
+        base_url = self._start_server()
+
+        class StubConnection(JSONConnection):
+            API_URL_TEMPLATE = '{api_base_url}/stub/{api_version}{path}'
+            API_BASE_URL = base_url
+            API_VERSION = 'v1'
+            _EXTRA_HEADERS = {'X-Extra': 'extra'}
+
+        http_async = AuthorizedSession(credentials)
+        self.sessions.append(http_async)
+        client = mock.Mock(_http_async=http_async, spec=['_http_async'])
+        client._connection = StubConnection(client)
+        return client._connection
+
+
+@unittest.skipIf(_SKIP, _SKIP_REASON)
+class TestAuthorizedSession(_AsyncTestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud._http_async import AuthorizedSession
+
+        return AuthorizedSession
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _request(self, session, **kw):
+        base_url = self._start_server()
+        self.responses.append((200, {'X-Foo': 'bar'}, b'CONTENT'))
+        try:
+            return self._run(session.request(base_url + '/path', **kw))
+        finally:
+            self._run(session.close())
+
+    def test_request_wo_credentials(self):
+        session = self._make_one()
+        response, content = self._request(
+            session, method='PUT', body=b'BODY', headers={'X-Baz': 'qux'})
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response['x-foo'], 'bar')
+        self.assertEqual(content, b'CONTENT')
+        (request, body), = self.requests
+        self.assertEqual(request.method, 'PUT')
+        self.assertEqual(request.path, '/path')
+        self.assertEqual(request.headers['X-Baz'], 'qux')
+        self.assertNotIn('Authorization', request.headers)
+        self.assertEqual(body, b'BODY')
+
+    def test_request_w_valid_credentials(self):
+        credentials = mock.Mock(valid=True, spec=['valid', 'apply'])
+        credentials.apply.side_effect = (
+            lambda headers: headers.update(Authorization='Bearer TOKEN'))
+        session = self._make_one(credentials)
+        self._request(session)
+
+        (request, _), = self.requests
+        self.assertEqual(request.headers['Authorization'], 'Bearer TOKEN')
+
+    def test_request_twice_w_valid_credentials(self):
+        credentials = mock.Mock(valid=True, spec=['valid', 'apply'])
+        session = self._make_one(credentials)
+        base_url = self._start_server()
+        self.responses.extend([(200, {}, b'ONE'), (200, {}, b'TWO')])
+        self.sessions.append(session)
+
+        _, first = self._run(session.request(base_url + '/one'))
+        lock = session._refresh_lock
+        _, second = self._run(session.request(base_url + '/two'))
+
+        self.assertEqual((first, second), (b'ONE', b'TWO'))
+        self.assertIsNotNone(lock)
+        self.assertIs(session._refresh_lock, lock)
+        self.assertEqual(credentials.apply.call_count, 2)
+
+    def test_request_w_expired_credentials(self):
+        import google_auth_httplib2
+
+        credentials = mock.Mock(
+            valid=False, spec=['valid', 'apply', 'refresh'])
+        session = self._make_one(credentials)
+        self._request(session)
+
+        credentials.refresh.assert_called_once_with(mock.ANY)
+        request, = credentials.refresh.call_args[0]
+        self.assertIsInstance(request, google_auth_httplib2.Request)
+        credentials.apply.assert_called_once_with(mock.ANY)
+
+    def test_close_w_session(self):
+        session = mock.Mock(spec=['close'])
+        http_async = self._make_one(session=session)
+        self._run(http_async.close())
+        session.close.assert_not_called()
+        self.assertIsNone(http_async._session)
+
+    def test_close_wo_session(self):
+        http_async = self._make_one()
+        self._run(http_async.close())
+        self.assertIsNone(http_async._session)
+
+
+@unittest.skipIf(_SKIP, _SKIP_REASON)
+class Test_api_request(_AsyncTestCase):
+
+    def test_get(self):
+        connection = self._make_connection()
+        self._json_response({'foo': 'bar'})
+        result = self._run(connection.api_request_async(
+            'GET', '/b/name', query_params={'a': 'b'},
+            headers={'X-Baz': 'qux'}))
+
+        self.assertEqual(result, {'foo': 'bar'})
+        (request, body), = self.requests
+        self.assertEqual(request.method, 'GET')
+        self.assertEqual(request.path, '/stub/v1/b/name')
+        self.assertEqual(dict(request.query), {'a': 'b'})
+        self.assertEqual(request.headers['X-Baz'], 'qux')
+        self.assertEqual(request.headers['X-Extra'], 'extra')
+        self.assertEqual(request.headers['User-Agent'],
+                         connection.USER_AGENT)
+        self.assertEqual(body, b'')
+
+    def test_post_w_dict_data(self):
+        connection = self._make_connection()
+        self._json_response({})
+        self._run(connection.api_request_async(
+            'POST', '/b', data={'name': u'\N{SNOWMAN}'}))
+
+        (request, body), = self.requests
+        self.assertEqual(request.headers['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(body.decode('utf-8')),
+                         {'name': u'\N{SNOWMAN}'})
+
+    def test_post_w_text_data(self):
+        connection = self._make_connection()
+        self._json_response({})
+        self._run(connection.api_request_async(
+            'POST', '/b', data=u'\N{SNOWMAN}', content_type='text/plain'))
+
+        (request, body), = self.requests
+        self.assertEqual(request.headers['Content-Type'], 'text/plain')
+        self.assertEqual(body, u'\N{SNOWMAN}'.encode('utf-8'))
+
+    def test_error(self):
+        from google.cloud.exceptions import NotFound
+
+        connection = self._make_connection()
+        self._json_response({'error': {'message': 'missing'}}, status=404)
+        with self.assertRaises(NotFound) as exc_info:
+            self._run(connection.api_request_async('GET', '/b/name'))
+
+        self.assertIn('missing', str(exc_info.exception))
+        self.assertIn('GET ', str(exc_info.exception))
+
+    def test_non_json_response(self):
+        connection = self._make_connection()
+        self.responses.append((200, {'Content-Type': 'text/plain'}, b'X'))
+        with self.assertRaises(TypeError):
+            self._run(connection.api_request_async('GET', '/b/name'))
+
+    def test_w_hook(self):
+        from google.cloud import instrumentation
+
+        connection = self._make_connection()
+        self._json_response({'a': 1})
+        hook = mock.Mock(spec=['before_request', 'after_request'])
+        with mock.patch.object(instrumentation, '_HOOKS', (hook,)):
+            self._run(connection.api_request_async(
+                'POST', '/b', data=b'DATA', content_type='text/plain'))
+
+        record, = hook.after_request.call_args[0]
+        self.assertEqual(record.method, 'POST')
+        self.assertEqual(record.path, '/stub/v1/b')
+        self.assertEqual(record.status, 200)
+        self.assertEqual(record.bytes_sent, 4)
+        self.assertEqual(record.bytes_received, 8)
+
+    def test_wo_expect_json(self):
+        connection = self._make_connection()
+        self.responses.append((200, {'Content-Type': 'text/plain'}, b'X'))
+        result = self._run(connection.api_request_async(
+            'GET', '/b/name', expect_json=False))
+        self.assertEqual(result, b'X')
+
+
+@unittest.skipIf(_SKIP, _SKIP_REASON)
+class TestHTTPIteratorAsync(_AsyncTestCase):
+
+    def _make_iterator(self, **kw):
+        from google.cloud.iterator import HTTPIterator
+
+        connection = self._make_connection()
+        return HTTPIterator(
+            connection._client, '/items', lambda iterator, item: item['n'],
+            **kw)
+
+    def _add_pages(self):
+        self._json_response(
+            {'items': [{'n': 1}, {'n': 2}], 'nextPageToken': 'token'})
+        self._json_response({'items': [{'n': 3}]})
+
+    def test_items(self):
+        iterator = self._make_iterator()
+        self._add_pages()
+        self.assertEqual(self._collect(iterator.__aiter__()), [1, 2, 3])
+
+        self.assertEqual(iterator.page_number, 2)
+        self.assertEqual(iterator.num_results, 3)
+        first, second = self.requests
+        self.assertEqual(dict(first[0].query), {})
+        self.assertEqual(dict(second[0].query), {'pageToken': 'token'})
+
+    def test_items_w_max_results(self):
+        iterator = self._make_iterator(max_results=2)
+        self._json_response(
+            {'items': [{'n': 1}, {'n': 2}], 'nextPageToken': 'token'})
+        self.assertEqual(self._collect(iterator.__aiter__()), [1, 2])
+
+        (request, _), = self.requests
+        self.assertEqual(dict(request.query), {'maxResults': '2'})
+
+    def test_pages(self):
+        iterator = self._make_iterator()
+        self._add_pages()
+        pages = self._collect(iterator.pages_async)
+
+        self.assertEqual([list(page) for page in pages], [[1, 2], [3]])
+        self.assertEqual(iterator.page_number, 2)
+        self.assertEqual(iterator.num_results, 3)
+        self.assertIsNone(iterator.next_page_token)
+
+    def test_pages_async_for(self):
+        iterator = self._make_iterator()
+        self._add_pages()
+
+        async def collect():
+            pages = []
+            async for page in iterator.pages_async:
+                pages.append(list(page))
+            return pages
+
+        self.assertEqual(self._run(collect()), [[1, 2], [3]])
+
+    def test_items_aiter(self):
+        items = self._make_iterator().__aiter__()
+        self.assertIs(items.__aiter__(), items)
+
+    def test_started(self):
+        iterator = self._make_iterator()
+        iterator.__aiter__()
+        with self.assertRaises(ValueError):
+            iterator.__aiter__()
+        with self.assertRaises(ValueError):
+            iterator.pages_async
+        with self.assertRaises(ValueError):
+            iter(iterator)
+
+
+@unittest.skipIf(_SKIP, _SKIP_REASON)
+class TestClient(unittest.TestCase):
+
+    def test__http_async(self):
+        from google.cloud._http_async import AuthorizedSession
+        from google.cloud.client import Client
+
+        credentials = mock.Mock(spec=['valid', 'apply'])
+        with mock.patch('google.auth.credentials.with_scopes_if_required',
+                        side_effect=lambda credentials, scopes: credentials):
+            client = Client(_http=object())
+        client._credentials = credentials
+        http_async = client._http_async
+
+        self.assertIsInstance(http_async, AuthorizedSession)
+        self.assertIs(http_async.credentials, credentials)
+        self.assertIs(client._http_async, http_async)
@@ -0,0 +1,182 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class Test_add_hook(unittest.TestCase):
+
+    def test_add_and_remove(self):
+        from google.cloud import instrumentation
+
+        hook1, hook2 = object(), object()
+        with mock.patch.object(instrumentation, '_HOOKS', ()):
+            instrumentation.add_hook(hook1)
+            instrumentation.add_hook(hook2)
+            self.assertEqual(instrumentation._HOOKS, (hook1, hook2))
+            instrumentation.remove_hook(hook1)
+            self.assertEqual(instrumentation._HOOKS, (hook2,))
+            with self.assertRaises(ValueError):
+                instrumentation.remove_hook(hook1)
+
+
+class TestRequestRecord(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.instrumentation import RequestRecord
+
+        return RequestRecord
+
+    def test_path(self):
+        record = self._get_target_class()(
+            method='GET', url='https://example.com/b/name?a=b', status=200,
+            latency=0.5, bytes_sent=0, bytes_received=10, retries=0)
+        self.assertEqual(record.path, '/b/name')
+
+
+class TestRequestHook(unittest.TestCase):
+
+    def test_defaults_do_nothing(self):
+        from google.cloud.instrumentation import RequestHook
+
+        hook = RequestHook()
+        self.assertIsNone(hook.before_request('GET', 'http://example.com'))
+        self.assertIsNone(hook.after_request(object()))
+
+
+class Test__before_and_after_request(unittest.TestCase):
+
+    def test_it(self):
+        from google.cloud import instrumentation
+
+        hook = mock.Mock(spec=['before_request', 'after_request'])
+        timer = mock.Mock(side_effect=[10.0, 12.5])
+        with mock.patch.object(instrumentation, '_timer', new=timer):
+            started = instrumentation._before_request(
+                (hook,), 'POST', 'http://example.com/')
+            instrumentation._after_request(
+                (hook,), started, 'POST', 'http://example.com/', 404,
+                b'BODY', None, retries=1)
+
+        hook.before_request.assert_called_once_with(
+            'POST', 'http://example.com/')
+        record, = hook.after_request.call_args[0]
+        self.assertEqual(record, instrumentation.RequestRecord(
+            method='POST', url='http://example.com/', status=404,
+            latency=2.5, bytes_sent=4, bytes_received=0, retries=1))
+
+
+class TestHistogram(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.instrumentation import Histogram
+
+        return Histogram
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_record(self):
+        histogram = self._make_one(3, 2.0, 1.0)
+        for value in (0.5, 1.0, 1.5, 2.0, 3.0, 7.9, 8.0, 1000.0):
+            histogram.record(value)
+
+        self.assertEqual(histogram.bucket_counts, [1, 2, 2, 1, 2])
+        self.assertEqual(histogram.count, 8)
+        self.assertAlmostEqual(histogram.mean, 1023.9 / 8)
+        values = (0.5, 1.0, 1.5, 2.0, 3.0, 7.9, 8.0, 1000.0)
+        expected = sum((value - 1023.9 / 8) ** 2 for value in values)
+        self.assertAlmostEqual(histogram.sum_of_squared_deviation, expected)
+
+    def test_to_distribution(self):
+        histogram = self._make_one(2, 4.0, 0.5)
+        histogram.record(1.0)
+        histogram.record(3.0)
+        self.assertEqual(histogram.to_distribution(), {
+            'count': '2',
+            'mean': 2.0,
+            'sumOfSquaredDeviation': 2.0,
+            'bucketOptions': {
+                'exponentialBuckets': {
+                    'numFiniteBuckets': 2,
+                    'growthFactor': 4.0,
+                    'scale': 0.5,
+                },
+            },
+            'bucketCounts': ['0', '1', '1', '0'],
+        })
+
+
+class TestRequestHistograms(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.instrumentation import RequestHistograms
+
+        return RequestHistograms
+
+    def _make_one(self):
+        return self._get_target_class()()
+
+    def test_after_request(self):
+        import datetime
+        from google.cloud import instrumentation
+        from google.cloud.instrumentation import RequestRecord
+
+        now = datetime.datetime(2017, 1, 2, 3, 4, 5)
+        histograms = self._make_one()
+        self.assertIsNone(histograms.start_time)
+        with mock.patch.object(instrumentation, '_NOW', return_value=now):
+            for status in (200, 200, None):
+                histograms.after_request(RequestRecord(
+                    method='GET', url='http://example.com/', status=status,
+                    latency=0.25, bytes_sent=0, bytes_received=100,
+                    retries=1))
+
+        self.assertEqual(histograms.start_time, now)
+        self.assertEqual(sorted(histograms.histograms, key=repr), [
+            ('bytes_received', 'GET', 200),
+            ('bytes_received', 'GET', None),
+            ('bytes_sent', 'GET', 200),
+            ('bytes_sent', 'GET', None),
+            ('latency', 'GET', 200),
+            ('latency', 'GET', None),
+            ('retries', 'GET', 200),
+            ('retries', 'GET', None),
+        ])
+        latency = histograms.histograms['latency', 'GET', 200]
+        self.assertEqual(latency.count, 2)
+        self.assertEqual(latency.mean, 0.25)
+        retries = histograms.histograms['retries', 'GET', None]
+        self.assertEqual(retries.bucket_counts, [0, 1, 0, 0, 0, 0])
+
+    def test__histogram_created_by_other_thread(self):
+        import contextlib
+
+        histograms = self._make_one()
+        key = ('latency', 'GET', 200)
+        existing = object()
+
+        @contextlib.contextmanager
+        def racing_lock():
+            # Another thread created it while this one waited for the lock.
+            histograms.histograms[key] = existing
+            yield
+
+        histograms._lock = racing_lock()
+        self.assertIs(histograms._histogram(*key), existing)
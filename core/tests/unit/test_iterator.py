@@ -116,6 +116,7 @@ class TestIterator(unittest.TestCase):
         self.assertIs(iterator.client, client)
         self.assertIs(iterator._item_to_value, item_to_value)
         self.assertEqual(iterator.max_results, max_results)
+        self.assertEqual(iterator.prefetch, 0)
         # Changing attributes.
         self.assertEqual(iterator.page_number, 0)
         self.assertEqual(iterator.next_page_token, token)
@@ -200,6 +201,92 @@ class TestIterator(unittest.TestCase):
         # Make sure our page_iter() was called correctly.
         self.assertEqual(incremented, [False])
 
+    def _make_prefetching(self, pages, prefetch=2):
+        import itertools
+        import mock
+
+        iterator = self._make_one(None, None, prefetch=prefetch)
+        iterator._next_page = mock.Mock(
+            side_effect=itertools.chain(pages, [None]), spec=[])
+        return iterator
+
+    def test__items_iter_w_prefetch(self):
+        from google.cloud.iterator import Page
+
+        parent = object()
+        page1 = Page(parent, (17, 100), self._do_nothing)
+        page2 = Page(parent, (211,), self._do_nothing)
+        iterator = self._make_prefetching([page1, page2])
+
+        items = list(iterator)
+
+        self.assertEqual(
+            items, [(parent, 17), (parent, 100), (parent, 211)])
+        self.assertEqual(iterator.page_number, 2)
+        self.assertEqual(iterator.num_results, 3)
+        self.assertEqual(iterator._next_page.call_count, 3)
+
+    def test_pages_w_prefetch(self):
+        from google.cloud.iterator import Page
+
+        parent = object()
+        page1 = Page(parent, (17, 100), self._do_nothing)
+        page2 = Page(parent, (211,), self._do_nothing)
+        iterator = self._make_prefetching([page1, page2], prefetch=1)
+
+        self.assertEqual(list(iterator.pages), [page1, page2])
+        self.assertEqual(iterator.page_number, 2)
+        self.assertEqual(iterator.num_results, 3)
+
+    def test__page_iter_w_prefetch_wo_increment(self):
+        from google.cloud.iterator import Page
+
+        page = Page(object(), (17, 100), self._do_nothing)
+        iterator = self._make_prefetching([page])
+
+        self.assertEqual(list(iterator._page_iter(increment=False)), [page])
+        self.assertEqual(iterator.page_number, 1)
+        self.assertEqual(iterator.num_results, 0)
+
+    def test_pages_w_prefetch_error(self):
+        import six
+        from google.cloud.iterator import Page
+
+        page1 = Page(object(), (17,), self._do_nothing)
+        iterator = self._make_prefetching([page1, ValueError('boom')])
+
+        pages = iterator.pages
+        self.assertIs(six.next(pages), page1)
+        with self.assertRaises(ValueError):
+            six.next(pages)
+
+    def test_pages_w_prefetch_closed_early(self):
+        import itertools
+        import threading
+        import mock
+        import six
+        from google.cloud.iterator import Page
+
+        workers = []
+
+        class _Thread(threading.Thread):
+
+            def start(self):
+                workers.append(self)
+                super(_Thread, self).start()
+
+        page = Page(object(), (17,), self._do_nothing)
+        iterator = self._make_prefetching(itertools.repeat(page), prefetch=1)
+
+        pages = iterator.pages
+        with mock.patch('google.cloud.iterator.threading.Thread', new=_Thread):
+            self.assertIs(six.next(pages), page)
+        pages.close()
+
+        worker, = workers
+        worker.join(timeout=5)
+        self.assertFalse(worker.is_alive())
+
     def test___iter__(self):
         iterator = self._make_one(None, None)
         self.assertFalse(iterator._started)
@@ -337,6 +424,25 @@ class TestHTTPIterator(unittest.TestCase):
         self.assertEqual(kw['path'], path)
         self.assertEqual(kw['query_params'], {})
 
+    def test_iterate_w_prefetch_w_max_results(self):
+        path = '/foo'
+        connection = _Connection(
+            {'items': [{'name': 'a'}, {'name': 'b'}], 'nextPageToken': 'tok'},
+            {'items': [{'name': 'c'}]})
+        client = _Client(connection)
+        iterator = self._make_one(
+            client, path=path, item_to_value=lambda _, item: item['name'],
+            max_results=3, prefetch=2)
+
+        self.assertEqual(list(iterator), ['a', 'b', 'c'])
+
+        kw1, kw2 = connection._requested
+        self.assertEqual(kw1['query_params'], {'maxResults': 3})
+        self.assertEqual(kw2['query_params'],
+                         {'maxResults': 1, 'pageToken': 'tok'})
+        self.assertEqual(iterator.num_results, 3)
+        self.assertIsNone(iterator.next_page_token)
+
     def test__has_next_page_new(self):
         connection = _Connection()
         client = _Client(connection)
@@ -469,6 +575,75 @@ class TestHTTPIterator(unittest.TestCase):
         with self.assertRaises(ValueError):
             iterator._get_next_page_response()
 
+    def test__get_next_page_response_w_stream_items(self):
+        path = '/foo'
+        content = b'{"items": [{"name": "a"}, {"name": "b"}], "x": 1}'
+        connection = _Connection(content)
+        client = _Client(connection)
+        iterator = self._make_one(client, path, None, stream_items=True)
+        response = iterator._get_next_page_response()
+
+        self.assertEqual(response['x'], 1)
+        self.assertEqual(len(response['items']), 2)
+        self.assertEqual(list(response['items']),
+                         [{'name': 'a'}, {'name': 'b'}])
+        kw, = connection._requested
+        self.assertEqual(kw, {
+            'method': 'GET',
+            'path': path,
+            'query_params': {},
+            'expect_json': False,
+        })
+
+    def test_iterate_w_stream_items(self):
+        path = '/foo'
+        connection = _Connection(
+            b'{"nextPageToken": "token", "items": [{"n": 1}, {"n": 2}]}',
+            b'{"items": [{"n": 3}]}')
+        client = _Client(connection)
+        iterator = self._make_one(
+            client, path, lambda iterator, item: item['n'],
+            stream_items=True)
+        iterator._HTTP_METHOD = 'POST'
+
+        self.assertEqual(list(iterator), [1, 2, 3])
+        self.assertEqual(iterator.num_results, 3)
+        first, second = connection._requested
+        self.assertEqual(first['data'], {})
+        self.assertEqual(second['data'], {'pageToken': 'token'})
+
+    def test__get_next_page_response_async(self):
+        path = '/foo'
+        returned = object()
+        connection = _Connection(returned)
+        client = _Client(connection)
+        iterator = self._make_one(client, path, None, max_results=10)
+        self.assertIs(iterator._get_next_page_response_async(), returned)
+        kw, = connection._requested_async
+        self.assertEqual(kw, {
+            'method': 'GET',
+            'path': path,
+            'query_params': {'maxResults': 10},
+        })
+
+    def test__get_next_page_response_async_with_post(self):
+        path = '/foo'
+        returned = object()
+        connection = _Connection(returned)
+        client = _Client(connection)
+        iterator = self._make_one(client, path, None)
+        iterator._HTTP_METHOD = 'POST'
+        self.assertIs(iterator._get_next_page_response_async(), returned)
+        kw, = connection._requested_async
+        self.assertEqual(kw, {'method': 'POST', 'path': path, 'data': {}})
+
+    def test__get_next_page_response_async_bad_http_method(self):
+        client = _Client(None)
+        iterator = self._make_one(client, '/foo', None)
+        iterator._HTTP_METHOD = 'NOT-A-VERB'
+        with self.assertRaises(ValueError):
+            iterator._get_next_page_response_async()
+
 
 class TestGAXIterator(unittest.TestCase):
 
@@ -581,17 +756,169 @@ class TestGAXIterator(unittest.TestCase):
             six.next(items_iter)
 
 
+class Test__parse_page(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(content, items_key='items'):
+        from google.cloud.iterator import _parse_page
+
+        return _parse_page(content, items_key)
+
+    def test_w_items(self):
+        content = (
+            u' {"kind" : "list", "items": [ {"a": [1, {"b": "]"}]} ,\n'
+            u'"\u2603", null, 2.5 ],  "nextPageToken": "tok" } ')
+        response = self._call_fut(content)
+        self.assertEqual(response['kind'], 'list')
+        self.assertEqual(response['nextPageToken'], 'tok')
+        items = response['items']
+        self.assertEqual(len(items), 4)
+        self.assertEqual(
+            list(items), [{'a': [1, {'b': ']'}]}, u'\u2603', None, 2.5])
+        # Items are decoded again on each pass.
+        self.assertEqual(len(list(items)), 4)
+
+    def test_w_bytes(self):
+        content = u'{"items": ["\u2603"]}'.encode('utf-8')
+        response = self._call_fut(content)
+        self.assertEqual(list(response['items']), [u'\u2603'])
+
+    def test_w_empty_items(self):
+        response = self._call_fut('{"items": [ ]}')
+        self.assertEqual(len(response['items']), 0)
+        self.assertEqual(list(response['items']), [])
+
+    def test_w_other_items_key(self):
+        response = self._call_fut('{"items": [1], "rows": [2]}', 'rows')
+        self.assertEqual(response['items'], [1])
+        self.assertEqual(list(response['rows']), [2])
+
+    def test_w_non_array_items(self):
+        response = self._call_fut('{"items": {"a": 1}}')
+        self.assertEqual(response['items'], {'a': 1})
+
+    def test_w_empty_object(self):
+        self.assertEqual(self._call_fut(' { } '), {})
+
+    def test_w_empty_content(self):
+        self.assertEqual(self._call_fut(b''), {})
+
+    def test_w_non_object(self):
+        with self.assertRaises(ValueError):
+            self._call_fut('[1, 2]')
+
+    def test_w_truncated_array(self):
+        with self.assertRaises(ValueError):
+            self._call_fut('{"items": [1, 2')
+
+    def test_w_missing_colon(self):
+        with self.assertRaises(ValueError):
+            self._call_fut('{"items" [1]}')
+
+    def test_decodes_each_item_once(self):
+        import json
+        import mock
+
+        decoder = json.JSONDecoder()
+        patch = mock.patch('google.cloud.iterator._JSON_DECODER',
+                           mock.Mock(wraps=decoder))
+        with patch as patched:
+            response = self._call_fut('{"items": [{"a": [1]}, {"b": "]"}]}')
+            # Only the key is decoded while scanning the page.
+            self.assertEqual(patched.raw_decode.call_count, 1)
+            self.assertEqual(
+                list(response['items']), [{'a': [1]}, {'b': ']'}])
+            self.assertEqual(patched.raw_decode.call_count, 3)
+
+
+class Test__skip_json_value(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(text, index=0):
+        from google.cloud.iterator import _skip_json_value
+
+        return _skip_json_value(text, index)
+
+    def test_nested(self):
+        import json
+
+        text = u'{"a": [1, {"b": "]}\\\\"}], "c\\"": "["}, 2'
+        end = self._call_fut(text)
+        self.assertEqual(end, text.index(', 2'))
+        self.assertEqual(json.loads(text[:end]),
+                         {'a': [1, {'b': ']}\\'}], 'c"': '['})
+
+    def test_array(self):
+        self.assertEqual(self._call_fut(u'x[[], [1]]]', 1), 10)
+
+    def test_deeply_nested(self):
+        from google.cloud.iterator import _JSON_CONTAINER
+
+        text = u'[[[[[[{"a": "]"}]]]]]], 1'
+        self.assertIsNone(_JSON_CONTAINER.match(text))
+        self.assertEqual(self._call_fut(text), len(text) - 3)
+
+    def test_string(self):
+        self.assertEqual(self._call_fut(u'"a\\"b",'), 6)
+
+    def test_literals(self):
+        self.assertEqual(self._call_fut(u'-2.5e3, 1'), 6)
+        self.assertEqual(self._call_fut(u'null]'), 4)
+        self.assertEqual(self._call_fut(u'true}'), 4)
+
+    def test_unterminated(self):
+        for text in (u'{"a": [1]', u'["]"', u'"abc', u''):
+            with self.assertRaises(ValueError):
+                self._call_fut(text)
+
+
+class Test__put_unless_stopped(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(pages, value, stopped):
+        from google.cloud.iterator import _put_unless_stopped
+
+        return _put_unless_stopped(pages, value, stopped)
+
+    def test_w_room(self):
+        import threading
+        from six.moves import queue
+
+        pages = queue.Queue(maxsize=1)
+        self.assertTrue(self._call_fut(pages, 'page', threading.Event()))
+        self.assertEqual(pages.get_nowait(), 'page')
+
+    def test_full_then_stopped(self):
+        import threading
+        from six.moves import queue
+
+        pages = queue.Queue(maxsize=1)
+        pages.put('page1')
+        stopped = threading.Event()
+        timer = threading.Timer(0.2, stopped.set)
+        timer.start()
+        self.assertFalse(self._call_fut(pages, 'page2', stopped))
+        timer.join()
+        self.assertEqual(pages.qsize(), 1)
+
+
 class _Connection(object):
 
     def __init__(self, *responses):
         self._responses = responses
         self._requested = []
+        self._requested_async = []
 
     def api_request(self, **kw):
         self._requested.append(kw)
         response, self._responses = self._responses[0], self._responses[1:]
         return response
 
+    def api_request_async(self, **kw):
+        self._requested_async.append(kw)
+        response, self._responses = self._responses[0], self._responses[1:]
+        return response
+
 
 class _Client(object):
 
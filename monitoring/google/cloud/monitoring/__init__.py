@@ -19,6 +19,7 @@ from pkg_resources import get_distribution
 __version__ = get_distribution('google-cloud-monitoring').version
 
 from google.cloud.monitoring.client import Client
+from google.cloud.monitoring.exporter import RequestMetricsExporter
 from google.cloud.monitoring.group import Group
 from google.cloud.monitoring.label import LabelDescriptor
 from google.cloud.monitoring.label import LabelValueType
@@ -40,6 +41,7 @@ __all__ = (
     'LabelDescriptor', 'LabelValueType',
     'Metric', 'MetricDescriptor', 'MetricKind', 'ValueType',
     'Aligner', 'Query', 'Reducer',
+    'RequestMetricsExporter',
     'Resource', 'ResourceDescriptor',
     'Point', 'TimeSeries',
     'SCOPE',
@@ -0,0 +1,139 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Export request instrumentation to Stackdriver Monitoring.
+
+Aggregate the requests made by any client with a
+:class:`~google.cloud.instrumentation.RequestHistograms` hook, then
+periodically write the histograms as time series::
+
+    >>> from google.cloud import instrumentation
+    >>> from google.cloud import monitoring
+    >>> histograms = instrumentation.RequestHistograms()
+    >>> instrumentation.add_hook(histograms)
+    >>> exporter = monitoring.RequestMetricsExporter(
+    ...     monitoring.Client(), histograms)
+    >>> exporter.create_metric_descriptors()  # Only needed once.
+    >>> exporter.export()
+"""
+
+from google.cloud._helpers import _NOW
+from google.cloud.monitoring.label import LabelDescriptor
+from google.cloud.monitoring.metric import MetricKind
+from google.cloud.monitoring.metric import ValueType
+
+
+DEFAULT_METRIC_PREFIX = 'custom.googleapis.com/google-cloud-python/request/'
+"""The prefix of the metric types written by default."""
+
+_MAX_TIME_SERIES_PER_WRITE = 200
+"""The most time series the API accepts in one write."""
+
+_METRIC_UNITS = {
+    'latency': 's',
+    'bytes_sent': 'By',
+    'bytes_received': 'By',
+    'retries': '1',
+}
+
+_METRIC_LABELS = (
+    LabelDescriptor('method', description='The HTTP method.'),
+    LabelDescriptor('status', description='The HTTP status code.'),
+)
+
+
+class RequestMetricsExporter(object):
+    """Writes request histograms as cumulative distribution time series.
+
+    :type client: :class:`~google.cloud.monitoring.client.Client`
+    :param client: The client used to write time series.
+
+    :type histograms: :class:`~google.cloud.instrumentation.RequestHistograms`
+    :param histograms: The histograms to export.
+
+    :type resource: :class:`~google.cloud.monitoring.resource.Resource`
+    :param resource: (Optional) The monitored resource the time series are
+                     written for. Defaults to the ``global`` resource.
+
+    :type metric_prefix: str
+    :param metric_prefix: (Optional) The prefix of the metric types, which
+                          end with the name of the recorded field (e.g.
+                          ``latency``). Defaults to
+                          :data:`DEFAULT_METRIC_PREFIX`.
+    """
+
+    def __init__(self, client, histograms, resource=None,
+                 metric_prefix=DEFAULT_METRIC_PREFIX):
+        if resource is None:
+            resource = client.resource('global', {})
+        self.client = client
+        self.histograms = histograms
+        self.resource = resource
+        self.metric_prefix = metric_prefix
+
+    def metric_descriptors(self):
+        """Describe the metrics written by :meth:`export`.
+
+        :rtype:
+            list of :class:`~google.cloud.monitoring.metric.MetricDescriptor`
+        :returns: A descriptor for each metric.
+        """
+        return [
+            self.client.metric_descriptor(
+                self.metric_prefix + name,
+                metric_kind=MetricKind.CUMULATIVE,
+                value_type=ValueType.DISTRIBUTION,
+                labels=_METRIC_LABELS,
+                unit=_METRIC_UNITS.get(name, ''),
+                description='Distribution of the %s of API requests.' % (
+                    name.replace('_', ' '),))
+            for name in sorted(self.histograms.METRICS)
+        ]
+
+    def create_metric_descriptors(self):
+        """Create the descriptors of the metrics written by :meth:`export`."""
+        for descriptor in self.metric_descriptors():
+            descriptor.create()
+
+    def export(self, end_time=None):
+        """Write a point for each histogram to the API.
+
+        :type end_time: :class:`~datetime.datetime`
+        :param end_time: (Optional) The end time of the points. Defaults to
+                         the current time.
+        """
+        start_time = self.histograms.start_time
+        if start_time is None:
+            return  # Nothing recorded yet.
+        if end_time is None:
+            end_time = _NOW()
+
+        timeseries_list = []
+        # Copied first, since requests may add histograms meanwhile.
+        histograms = list(self.histograms.histograms.items())
+        for key, histogram in sorted(histograms,
+                                     key=lambda item: repr(item[0])):
+            name, method, status = key
+            metric = self.client.metric(self.metric_prefix + name, {
+                'method': method,
+                'status': 'none' if status is None else str(status),
+            })
+            timeseries_list.append(self.client.time_series(
+                metric, self.resource, histogram.to_distribution(),
+                end_time=end_time, start_time=start_time))
+
+        for start in range(0, len(timeseries_list),
+                           _MAX_TIME_SERIES_PER_WRITE):
+            self.client.write_time_series(
+                timeseries_list[start:start + _MAX_TIME_SERIES_PER_WRITE])
@@ -0,0 +1,158 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+PROJECT = 'my-project'
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+def _make_client():
+    from google.cloud.monitoring.client import Client
+
+    client = Client(project=PROJECT, credentials=_make_credentials())
+    client._connection = mock.Mock(spec=['api_request'])
+    client._connection.api_request.return_value = {}
+    return client
+
+
+def _make_histograms(*statuses):
+    import datetime
+    from google.cloud.instrumentation import RequestHistograms
+    from google.cloud.instrumentation import RequestRecord
+
+    histograms = RequestHistograms()
+    for status in statuses:
+        histograms.after_request(RequestRecord(
+            method='GET', url='http://example.com/', status=status,
+            latency=0.01, bytes_sent=0, bytes_received=10, retries=0))
+    histograms.start_time = datetime.datetime(2017, 1, 2, 3, 4, 5)
+    return histograms
+
+
+class TestRequestMetricsExporter(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.monitoring.exporter import RequestMetricsExporter
+
+        return RequestMetricsExporter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_constructor_defaults(self):
+        from google.cloud.monitoring.exporter import DEFAULT_METRIC_PREFIX
+        from google.cloud.monitoring.resource import Resource
+
+        client = _make_client()
+        histograms = _make_histograms()
+        exporter = self._make_one(client, histograms)
+        self.assertIs(exporter.client, client)
+        self.assertIs(exporter.histograms, histograms)
+        self.assertEqual(exporter.resource, Resource('global', {}))
+        self.assertEqual(exporter.metric_prefix, DEFAULT_METRIC_PREFIX)
+
+    def test_metric_descriptors(self):
+        from google.cloud.monitoring.metric import MetricKind
+        from google.cloud.monitoring.metric import ValueType
+
+        exporter = self._make_one(
+            _make_client(), _make_histograms(), metric_prefix='custom/')
+        descriptors = exporter.metric_descriptors()
+
+        self.assertEqual(
+            [descriptor.type for descriptor in descriptors],
+            ['custom/bytes_received', 'custom/bytes_sent', 'custom/latency',
+             'custom/retries'])
+        for descriptor in descriptors:
+            self.assertEqual(descriptor.metric_kind, MetricKind.CUMULATIVE)
+            self.assertEqual(descriptor.value_type, ValueType.DISTRIBUTION)
+            self.assertEqual([label.key for label in descriptor.labels],
+                             ['method', 'status'])
+        self.assertEqual(descriptors[2].unit, 's')
+
+    def test_create_metric_descriptors(self):
+        client = _make_client()
+        client._connection.api_request.side_effect = (
+            lambda **kw: dict(kw['data'], name='NAME'))
+        exporter = self._make_one(client, _make_histograms())
+        exporter.create_metric_descriptors()
+
+        requested = client._connection.api_request.call_args_list
+        self.assertEqual(len(requested), 4)
+        for call in requested:
+            self.assertEqual(call[1]['method'], 'POST')
+            self.assertEqual(call[1]['path'],
+                             '/projects/%s/metricDescriptors/' % (PROJECT,))
+
+    def test_export_wo_requests(self):
+        import datetime
+
+        client = _make_client()
+        histograms = _make_histograms()
+        histograms.start_time = None
+        exporter = self._make_one(client, histograms)
+        exporter.export(end_time=datetime.datetime(2017, 1, 2, 3, 5, 0))
+        client._connection.api_request.assert_not_called()
+
+    def test_export(self):
+        import datetime
+
+        client = _make_client()
+        exporter = self._make_one(
+            client, _make_histograms(200, None), metric_prefix='custom/')
+        exporter.export(end_time=datetime.datetime(2017, 1, 2, 3, 5, 0))
+
+        kw = client._connection.api_request.call_args[1]
+        self.assertEqual(kw['method'], 'POST')
+        self.assertEqual(kw['path'], '/projects/%s/timeSeries/' % (PROJECT,))
+        timeseries = kw['data']['timeSeries']
+        self.assertEqual(len(timeseries), 8)
+        first = timeseries[0]
+        self.assertEqual(first['metric'], {
+            'type': 'custom/bytes_received',
+            'labels': {'method': 'GET', 'status': '200'},
+        })
+        self.assertEqual(first['resource'], {'type': 'global', 'labels': {}})
+        point, = first['points']
+        self.assertEqual(point['interval'], {
+            'startTime': '2017-01-02T03:04:05.000000Z',
+            'endTime': '2017-01-02T03:05:00.000000Z',
+        })
+        distribution = point['value']['distributionValue']
+        self.assertEqual(distribution['count'], '1')
+        self.assertEqual(distribution['mean'], 10.0)
+        self.assertEqual(timeseries[1]['metric']['labels']['status'], 'none')
+
+    def test_export_in_chunks(self):
+        from google.cloud.monitoring import exporter as MUT
+
+        client = _make_client()
+        exporter = self._make_one(client, _make_histograms(200, 404, 500))
+        with mock.patch.object(MUT, '_MAX_TIME_SERIES_PER_WRITE', new=5):
+            exporter.export()
+
+        requested = client._connection.api_request.call_args_list
+        self.assertEqual(
+            [len(call[1]['data']['timeSeries']) for call in requested],
+            [5, 5, 2])
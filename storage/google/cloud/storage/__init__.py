@@ -37,7 +37,13 @@ __version__ = get_distribution('google-cloud-storage').version
 from google.cloud.storage.batch import Batch
 from google.cloud.storage.blob import Blob
 from google.cloud.storage.bucket import Bucket
+from google.cloud.storage.cache import DownloadCache
+from google.cloud.storage.cache import MetadataCache
 from google.cloud.storage.client import Client
+from google.cloud.storage.signing import SignedUrlGenerator
+from google.cloud.storage.transfer_manager import copy_many
 
 
-__all__ = ['__version__', 'Batch', 'Blob', 'Bucket', 'Client']
+__all__ = ['__version__', 'Batch', 'Blob', 'Bucket', 'Client',
+           'DownloadCache', 'MetadataCache', 'SignedUrlGenerator',
+           'copy_many']
@@ -19,6 +19,24 @@ These are *not* part of the API.
 
 import base64
 from hashlib import md5
+import os
+import struct
+
+import six
+
+from google.cloud._helpers import _bytes_to_unicode
+
+try:
+    import crcmod.predefined
+    # Only use ``crcmod`` when its C extension is available; its pure
+    # Python implementation is slower than ``_Crc32c``.
+    from crcmod import _crcfunext  # noqa - C extension check
+except ImportError:  # pragma: NO COVER
+    crcmod = None
+
+
+_CRC32C_POLYNOMIAL = 0x82F63B78
+"""Reversed Castagnoli polynomial used by Cloud Storage's CRC32C checksum."""
 
 
 def _validate_name(name):
@@ -40,6 +58,66 @@ def _validate_name(name):
     return name
 
 
+def _metadata_cache(client):
+    """Get the metadata cache to use for a client's lookups.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client making the lookup.
+
+    :rtype: :class:`~google.cloud.storage.cache.MetadataCache`
+    :returns: The client's cache, or :data:`None` if it has none or is
+              batching requests (since batched responses are deferred).
+    """
+    cache = getattr(client, 'metadata_cache', None)
+    if cache is None or client.current_batch is not None:
+        return None
+    return cache
+
+
+def _invalidate_metadata(client, path):
+    """Drop a bucket or blob from a client's metadata cache, if any.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client which modified the bucket or blob.
+
+    :type path: str
+    :param path: The API path of the bucket or blob.
+    """
+    cache = getattr(client, 'metadata_cache', None)
+    if cache is not None:
+        cache.invalidate(path)
+
+
+def _filename_below(directory, blob_name):
+    """Get the path of the file for a blob name below a directory.
+
+    The blob named ``a/b.txt`` maps to the file ``a/b.txt`` below the
+    directory.
+
+    :type directory: str
+    :param directory: The path of the directory.
+
+    :type blob_name: str
+    :param blob_name: The name of the blob.
+
+    :rtype: str
+    :returns: The path of the file.
+    :raises: :class:`ValueError` if a segment of the name is empty, ``.``,
+             ``..`` or contains a path separator or drive, i.e. if the file
+             might not be below ``directory``.
+    """
+    segments = blob_name.split('/')
+    separators = [sep for sep in (os.sep, os.altsep) if sep]
+    for segment in segments:
+        if (segment in ('', os.curdir, os.pardir) or
+                os.path.splitdrive(segment)[0] or
+                any(sep in segment for sep in separators)):
+            raise ValueError(
+                'Blob name %r does not map to a file below %r' % (
+                    blob_name, directory))
+    return os.path.join(os.path.abspath(directory), *segments)
+
+
 class _PropertyMixin(object):
     """Abstract mixin for cloud storage classes with associated propertties.
 
@@ -91,6 +169,13 @@ class _PropertyMixin(object):
                        ``client`` stored on the current object.
         """
         client = self._require_client(client)
+        cache = _metadata_cache(client)
+        if cache is not None:
+            cached = cache.get(self.path)
+            if cached is not None:
+                self._set_properties(cached)
+                return
+
         # Pass only '?projection=noAcl' here because 'acl' and related
         # are handled via custom endpoints.
         query_params = {'projection': 'noAcl'}
@@ -98,6 +183,8 @@ class _PropertyMixin(object):
             method='GET', path=self.path, query_params=query_params,
             _target_object=self)
         self._set_properties(api_response)
+        if cache is not None:
+            cache.put(self.path, api_response)
 
     def _patch_property(self, name, value):
         """Update field of this object's properties.
@@ -197,3 +284,259 @@ def _base64_md5hash(buffer_object):
     _write_buffer_to_hash(buffer_object, hash_obj)
     digest_bytes = hash_obj.digest()
     return base64.b64encode(digest_bytes)
+
+
+def _make_crc32c_table():
+    """Build the byte-wise lookup table for the CRC32C polynomial.
+
+    :rtype: tuple
+    :returns: 256 integers, the CRC of each possible byte value.
+    """
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ _CRC32C_POLYNOMIAL
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC32C_TABLE = _make_crc32c_table()
+
+
+class _Crc32c(object):
+    """Pure-Python, table-driven CRC32C hash.
+
+    Implements the subset of the :mod:`hashlib` interface used by
+    :func:`_write_buffer_to_hash`. Used when the C extension for
+    ``crcmod`` is not installed.
+    """
+
+    def __init__(self):
+        self._crc = 0
+
+    def update(self, data):
+        """Update the checksum with more bytes.
+
+        :type data: bytes
+        :param data: The bytes to add to the checksum.
+        """
+        table = _CRC32C_TABLE
+        crc = self._crc ^ 0xFFFFFFFF
+        for byte in six.iterbytes(data):
+            crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+        self._crc = crc ^ 0xFFFFFFFF
+
+    def digest(self):
+        """Get the current checksum.
+
+        :rtype: bytes
+        :returns: The checksum as 4 big-endian bytes.
+        """
+        return struct.pack('>I', self._crc)
+
+
+def _crc32c():
+    """Create a new CRC32C hash object.
+
+    Uses ``crcmod`` if its C extension is installed, otherwise falls back
+    to the (much slower) pure-Python :class:`_Crc32c`.
+
+    :rtype: object
+    :returns: A hash object which implements ``update`` and ``digest``.
+    """
+    if crcmod is not None:
+        return crcmod.predefined.Crc('crc-32c')
+    return _Crc32c()
+
+
+def _base64_crc32c(buffer_object):
+    """Get CRC32C checksum of bytes (as base64).
+
+    :type buffer_object: bytes buffer
+    :param buffer_object: Buffer containing bytes used to compute a CRC32C
+                          checksum (as base64).
+
+    :rtype: bytes
+    :returns: A base64 encoded CRC32C checksum, as used by Cloud Storage.
+    """
+    hash_obj = _crc32c()
+    _write_buffer_to_hash(buffer_object, hash_obj)
+    digest_bytes = hash_obj.digest()
+    return base64.b64encode(digest_bytes)
+
+
+class _Checksums(object):
+    """Incrementally compute the MD5 hash and CRC32C checksum of some bytes.
+
+    The CRC32C checksum is only computed when ``crcmod`` can compute it
+    quickly, unless ``crc32c`` is set.
+
+    :type crc32c: bool
+    :param crc32c: (Optional) Compute the CRC32C checksum even if only the
+                   pure-Python implementation is available.
+    """
+
+    def __init__(self, crc32c=False):
+        self._md5 = md5()
+        self._crc32c = None
+        if crc32c or crcmod is not None:
+            self._crc32c = _crc32c()
+
+    def update(self, data):
+        """Update the checksums with more bytes.
+
+        :type data: bytes
+        :param data: The bytes to add to the checksums.
+        """
+        self._md5.update(data)
+        if self._crc32c is not None:
+            self._crc32c.update(data)
+
+    def find_mismatch(self, md5_hash=None, crc32c=None):
+        """Compare the checksums with the values reported by the server.
+
+        The MD5 hash is compared if it is known, otherwise the CRC32C
+        checksum (if it was computed).
+
+        :type md5_hash: str
+        :param md5_hash: (Optional) The expected base64-encoded MD5 hash.
+
+        :type crc32c: str
+        :param crc32c: (Optional) The expected base64-encoded CRC32C checksum.
+
+        :rtype: tuple
+        :returns: ``(name, actual, expected)`` for a checksum which does not
+                  match, or :data:`None` if there is nothing to compare or
+                  the checksum matches.
+        """
+        if md5_hash is not None:
+            name, expected, hash_obj = 'MD5 hash', md5_hash, self._md5
+        elif crc32c is not None and self._crc32c is not None:
+            name, expected, hash_obj = 'CRC32C', crc32c, self._crc32c
+        else:
+            return None
+
+        actual = _bytes_to_unicode(base64.b64encode(hash_obj.digest()))
+        if actual == expected:
+            return None
+        return name, actual, expected
+
+
+class _ChecksumReader(object):
+    """Wrap a stream open for reading, checksumming the bytes read from it.
+
+    Bytes which are read again after seeking backwards (e.g. to retry
+    part of an upload) are only added to the checksums once.
+
+    :type stream: IO[bytes]
+    :param stream: The stream to read from.
+
+    :type checksums: :class:`_Checksums`
+    :param checksums: The checksums to update.
+    """
+
+    def __init__(self, stream, checksums):
+        self._stream = stream
+        self._checksums = checksums
+        try:
+            self._start = stream.tell()
+        except (AttributeError, EnvironmentError, ValueError):
+            self._start = 0
+        self._position = 0
+        self._checksummed = 0
+        # Set if part of the stream was never read, so the checksums are
+        # not of the whole upload.
+        self.skipped = False
+
+    def read(self, size=-1):
+        """Read bytes from the stream.
+
+        :type size: int
+        :param size: (Optional) The maximum number of bytes to read.
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        data = self._stream.read(size)
+        start = self._position
+        self._position += len(data)
+        if start > self._checksummed:
+            self.skipped = True
+        elif self._position > self._checksummed:
+            self._checksums.update(data[self._checksummed - start:])
+            self._checksummed = self._position
+        return data
+
+    def tell(self):
+        """Get the position of the stream.
+
+        :rtype: int
+        :returns: The position of the stream.
+        """
+        return self._stream.tell()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Change the position of the stream.
+
+        :type offset: int
+        :param offset: The offset to seek to, relative to ``whence``.
+
+        :type whence: int
+        :param whence: (Optional) One of the ``os.SEEK_*`` constants.
+
+        :rtype: int
+        :returns: The new position of the stream.
+        """
+        self._stream.seek(offset, whence)
+        position = self._stream.tell()
+        self._position = position - self._start
+        return position
+
+
+class _ChecksumWriter(object):
+    """Wrap a file open for writing, checksumming the bytes written to it.
+
+    :type file_obj: IO[bytes]
+    :param file_obj: The file to write to.
+
+    :type checksums: :class:`_Checksums`
+    :param checksums: The checksums to update.
+    """
+
+    def __init__(self, file_obj, checksums):
+        self._file_obj = file_obj
+        self._checksums = checksums
+
+    def write(self, data):
+        """Write bytes to the file.
+
+        :type data: bytes
+        :param data: The bytes to write.
+
+        :rtype: int
+        :returns: The result of the wrapped file's ``write``.
+        """
+        self._checksums.update(data)
+        return self._file_obj.write(data)
+
+
+def _parse_hash_header(value):
+    """Parse the checksums from an ``X-Goog-Hash`` response header.
+
+    :type value: str
+    :param value: The header value, e.g. ``crc32c=n03x6A==,md5=Ojk9...==``.
+
+    :rtype: dict
+    :returns: Mapping of checksum name (``crc32c`` or ``md5``) to its
+              base64-encoded value.
+    """
+    result = {}
+    for item in value.split(','):
+        name, _, checksum = item.strip().partition('=')
+        if checksum:
+            result[name] = checksum
+    return result
@@ -14,6 +14,8 @@
 
 """Create / interact with Google Cloud Storage connections."""
 
+from six.moves.urllib.parse import urlsplit
+
 from google.cloud import _http
 
 from google.cloud.storage import __version__
@@ -41,3 +43,35 @@ class Connection(_http.JSONConnection):
     _EXTRA_HEADERS = {
         _http.CLIENT_INFO_HEADER: _CLIENT_INFO,
     }
+
+    def _make_request(self, method, url, data=None, content_type=None,
+                      headers=None, target_object=None):
+        """A low level method to send a request to the API.
+
+        Drops the buckets and blobs modified by the request from the
+        client's metadata cache, if any, both before and after the request
+        so that concurrent lookups cannot cache their old metadata.
+        (A :class:`~google.cloud.storage.batch.Batch` only queues the
+        request here, and drops them again once the batch is sent.)
+
+        See :meth:`google.cloud._http.JSONConnection._make_request` for
+        the parameters.
+
+        :rtype: tuple of ``response`` (a dictionary of sorts)
+                and ``content`` (a string).
+        :returns: The HTTP response object and the content of the response.
+        """
+        cache = getattr(self._client, 'metadata_cache', None)
+        if cache is None or method == 'GET':
+            return super(Connection, self)._make_request(
+                method, url, data=data, content_type=content_type,
+                headers=headers, target_object=target_object)
+
+        path = urlsplit(url).path
+        cache.invalidate_request(path)
+        try:
+            return super(Connection, self)._make_request(
+                method, url, data=data, content_type=content_type,
+                headers=headers, target_object=target_object)
+        finally:
+            cache.invalidate_request(path)
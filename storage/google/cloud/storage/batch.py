@@ -18,14 +18,20 @@ See: https://cloud.google.com/storage/docs/json_api/v1/how-tos/batch
 from email.encoders import encode_noop
 from email.generator import Generator
 from email.mime.application import MIMEApplication
+from email.message import Message
 from email.mime.multipart import MIMEMultipart
-from email.parser import Parser
+import collections
+import concurrent.futures
 import io
+import itertools
 import json
+import re
 
 import httplib2
 import six
+from six.moves.urllib.parse import urlsplit
 
+from google.cloud._http import PooledHttp
 from google.cloud.exceptions import make_exception
 from google.cloud.storage._http import Connection
 
@@ -202,24 +208,35 @@ class Batch(Connection):
         _, body = payload.split('\n\n', 1)
         return dict(multi._headers), body
 
-    def _finish_futures(self, responses):
-        """Apply all the batch responses to the futures created.
+    def _finish_futures(self, responses, raise_exception=True):
+        """Apply the batch responses to the futures created.
 
-        :type responses: list of (headers, payload) tuples.
-        :param responses: List of headers and payloads from each response in
-                          the batch.
+        Each future is resolved as soon as its response is produced, so
+        ``responses`` may be a generator parsing them incrementally.
 
-        :raises: :class:`ValueError` if no requests have been deferred.
+        :type responses: iterable of (headers, payload) tuples.
+        :param responses: Headers and payloads from each response in the
+                          batch.
+
+        :type raise_exception: bool
+        :param raise_exception: (Optional) If false, do not raise an
+                                exception for failed requests.
+
+        :rtype: list of tuples
+        :returns: one ``(headers, payload)`` tuple per deferred request.
+        :raises: :class:`ValueError` if the number of responses differs
+                 from the number of deferred requests.
         """
         # If a bad status occurs, we track it, but don't raise an exception
         # until all futures have been populated.
         exception_args = None
+        finished = []
 
-        if len(self._target_objects) != len(responses):
-            raise ValueError('Expected a response for every request.')
-
-        for target_object, sub_response in zip(self._target_objects,
-                                               responses):
+        for sub_response in responses:
+            if len(finished) == len(self._target_objects):
+                raise ValueError('Expected a response for every request.')
+            target_object = self._target_objects[len(finished)]
+            finished.append(sub_response)
             resp_headers, sub_payload = sub_response
             if not 200 <= resp_headers.status < 300:
                 exception_args = exception_args or (resp_headers,
@@ -227,12 +244,21 @@ class Batch(Connection):
             elif target_object is not None:
                 target_object._properties = sub_payload
 
-        if exception_args is not None:
+        if len(finished) != len(self._target_objects):
+            raise ValueError('Expected a response for every request.')
+
+        if exception_args is not None and raise_exception:
             raise make_exception(*exception_args)
+        return finished
 
-    def finish(self):
+    def finish(self, raise_exception=True):
         """Submit a single `multipart/mixed` request with deferred requests.
 
+        :type raise_exception: bool
+        :param raise_exception: (Optional) If false, do not raise an
+                                exception if any deferred request failed;
+                                check the status in each response instead.
+
         :rtype: list of tuples
         :returns: one ``(headers, payload)`` tuple per deferred request.
         """
@@ -243,11 +269,27 @@ class Batch(Connection):
         # Use the private ``_base_connection`` rather than the property
         # ``_connection``, since the property may be this
         # current batch.
-        response, content = self._client._base_connection._make_request(
-            'POST', url, data=body, headers=headers)
-        responses = list(_unpack_batch_response(response, content))
-        self._finish_futures(responses)
-        return responses
+        try:
+            response, content = self._client._base_connection._make_request(
+                'POST', url, data=body, headers=headers)
+            return self._finish_futures(
+                _unpack_batch_response(response, content),
+                raise_exception=raise_exception)
+        finally:
+            self._invalidate_metadata()
+
+    def _invalidate_metadata(self):
+        """Drop what the deferred requests modify from the metadata cache.
+
+        Called once the batch has been sent: queueing a request (in
+        :meth:`_make_request`) does not modify anything yet.
+        """
+        cache = getattr(self._client, 'metadata_cache', None)
+        if cache is None:
+            return
+        for method, url, _, _ in self._requests:
+            if method != 'GET':
+                cache.invalidate_request(urlsplit(url).path)
 
     def current(self):
         """Return the topmost batch, or None."""
@@ -265,30 +307,139 @@ class Batch(Connection):
             self._client._pop_batch()
 
 
-def _generate_faux_mime_message(parser, response, content):
-    """Convert response, content -> (multipart) email.message.
+class _MultipartParser(object):
+    """Incrementally split a ``multipart/mixed`` body into its parts.
+
+    Data is fed in pieces of any size, and each part is returned as soon as
+    the delimiter ending it has been seen, so only the part being read is
+    buffered.
 
-    Helper for _unpack_batch_response.
+    :type boundary: bytes
+    :param boundary: The boundary from the ``Content-Type`` header.
     """
-    # We coerce to bytes to get consistent concat across
-    # Py2 and Py3. Percent formatting is insufficient since
-    # it includes the b in Py3.
-    if not isinstance(content, six.binary_type):
-        content = content.encode('utf-8')
-    content_type = response['content-type']
-    if not isinstance(content_type, six.binary_type):
-        content_type = content_type.encode('utf-8')
-    faux_message = b''.join([
-        b'Content-Type: ',
-        content_type,
-        b'\nMIME-Version: 1.0\n\n',
-        content,
-    ])
 
-    if six.PY2:
-        return parser.parsestr(faux_message)
-    else:  # pragma: NO COVER  Python3
-        return parser.parsestr(faux_message.decode('utf-8'))
+    def __init__(self, boundary):
+        self._delimiter = b'--' + boundary
+        self._buffer = bytearray()
+        self._in_preamble = True
+        self.done = False
+
+    def feed(self, data):
+        """Parse more of the body.
+
+        :type data: bytes
+        :param data: The next piece of the body.
+
+        :rtype: list of bytes
+        :returns: The parts completed by ``data``, without the line break
+                  preceding their closing delimiter.
+        """
+        buffer_ = self._buffer
+        buffer_.extend(data)
+        parts = []
+        while not self.done:
+            if self._in_preamble:
+                index = buffer_.find(self._delimiter)
+                if index == -1:
+                    # Keep enough to find a delimiter split across pieces.
+                    del buffer_[:-len(self._delimiter)]
+                    break
+                del buffer_[:index + len(self._delimiter)]
+                self._in_preamble = False
+
+            # The buffer starts right after a delimiter.
+            if len(buffer_) < 2:
+                break
+            if buffer_[:2] == b'--':
+                self.done = True
+                break
+            line_end = buffer_.find(b'\n')
+            if line_end == -1:
+                break
+            end = buffer_.find(b'\n' + self._delimiter, line_end)
+            if end == -1:
+                break
+            part = bytes(buffer_[line_end + 1:end])
+            if part.endswith(b'\r'):
+                part = part[:-1]
+            parts.append(part)
+            del buffer_[:end + 1 + len(self._delimiter)]
+        return parts
+
+
+_BLANK_LINE_RE = re.compile(b'\r?\n\r?\n')
+
+
+def _split_message(message):
+    """Split a message into its header block and body.
+
+    :type message: bytes
+    :param message: The headers, a blank line and the body.
+
+    :rtype: tuple
+    :returns: The header block and the body, which is empty if there is no
+              blank line.
+    """
+    if message.startswith(b'\n') or message.startswith(b'\r\n'):
+        return b'', message.split(b'\n', 1)[1]
+    match = _BLANK_LINE_RE.search(message)
+    if match is None:
+        return message, b''
+    return message[:match.start()], message[match.end():]
+
+
+def _parse_headers(header_block):
+    """Parse a block of ``Name: value`` header lines.
+
+    :type header_block: bytes
+    :param header_block: The header lines.
+
+    :rtype: dict
+    :returns: The header values (as native strings) keyed by name.
+    """
+    headers = {}
+    name = None
+    for line in header_block.split(b'\n'):
+        line = line.rstrip(b'\r')
+        if not line.strip():
+            continue
+        if line[:1] in (b' ', b'\t') and name is not None:
+            # Folded continuation of the previous header.
+            headers[name] += ' ' + line.strip().decode('latin-1')
+            continue
+        name, _, value = line.partition(b':')
+        name = name.strip().decode('latin-1')
+        headers[name] = value.strip().decode('latin-1')
+    return headers
+
+
+def _parse_part(part):
+    """Convert one part of a batch response -> (headers, payload).
+
+    :type part: bytes
+    :param part: An ``application/http`` part: its MIME headers, then the
+                 status line, headers and body of the sub-response.
+
+    :rtype: tuple
+    :returns: The :class:`httplib2.Response` headers (with the status) and
+              the payload, decoded from JSON if it has that content type.
+    """
+    _, http_response = _split_message(part)
+    status_line, _, rest = http_response.partition(b'\n')
+    status = status_line.split(None, 2)[1].decode('ascii')
+    header_block, payload = _split_message(rest)
+    msg_headers = _parse_headers(header_block)
+    msg_headers['status'] = status
+    headers = httplib2.Response(msg_headers)
+    if six.PY3:  # pragma: NO COVER  Python3
+        payload = payload.decode('utf-8')
+    if headers.get('content-type', '').startswith('application/json'):
+        payload = json.loads(payload)
+    return headers, payload
+
+
+_PARSE_CHUNK_SIZE = 64 * 1024
+"""The size of the pieces of a batch response parsed at a time."""
 
 
 def _unpack_batch_response(response, content):
@@ -297,27 +448,129 @@ def _unpack_batch_response(response, content):
     Creates a generator of tuples of emulating the responses to
     :meth:`httplib2.Http.request` (a pair of headers and payload).
 
+    The multi-part content is parsed incrementally, so each tuple is
+    produced as soon as its part has been read.
+
     :type response: :class:`httplib2.Response`
     :param response: HTTP response / headers from a request.
 
     :type content: str
     :param content: Response payload with a batch response.
-    """
-    parser = Parser()
-    message = _generate_faux_mime_message(parser, response, content)
 
-    if not isinstance(message._payload, list):
+    :raises: :class:`ValueError` if the response is not multi-part, or
+             ends before its closing delimiter.
+    """
+    content_type = response['content-type']
+    if isinstance(content_type, six.binary_type):
+        content_type = content_type.decode('utf-8')
+    header = Message()
+    header['Content-Type'] = content_type
+    boundary = header.get_boundary()
+    if header.get_content_maintype() != 'multipart' or not boundary:
         raise ValueError('Bad response:  not multi-part')
 
-    for subrequest in message._payload:
-        status_line, rest = subrequest._payload.split('\n', 1)
-        _, status, _ = status_line.split(' ', 2)
-        sub_message = parser.parsestr(rest)
-        payload = sub_message._payload
-        ctype = sub_message['Content-Type']
-        msg_headers = dict(sub_message._headers)
-        msg_headers['status'] = status
-        headers = httplib2.Response(msg_headers)
-        if ctype and ctype.startswith('application/json'):
-            payload = json.loads(payload)
-        yield headers, payload
+    if not isinstance(content, six.binary_type):
+        content = content.encode('utf-8')
+    parser = _MultipartParser(boundary.encode('utf-8'))
+    for start in six.moves.range(0, len(content), _PARSE_CHUNK_SIZE):
+        parts = parser.feed(content[start:start + _PARSE_CHUNK_SIZE])
+        for part in parts:
+            yield _parse_part(part)
+    if not parser.done:
+        raise ValueError('Bad response:  incomplete multi-part')
+
+
+def _check_max_workers(client, max_workers):
+    """Check that a client may send requests from several threads at once.
+
+    :type client: :class:`google.cloud.storage.client.Client`
+    :param client: The client sending the requests.
+
+    :type max_workers: int
+    :param max_workers: The number of threads sending requests.
+
+    :raises: :exc:`ValueError` if ``max_workers`` is more than 1 but the
+             client's ``_http`` is not a (thread-safe)
+             :class:`~google.cloud._http.PooledHttp`.
+    """
+    if max_workers > 1 and not isinstance(client._http, PooledHttp):
+        raise ValueError(
+            'Sending requests from %d threads at once needs a client whose '
+            '_http is a PooledHttp.' % (max_workers,))
+
+
+def _send_batch(client, requests):
+    """Send requests in a single batch.
+
+    :type client: :class:`google.cloud.storage.client.Client`
+    :param client: The client used to send the batch.
+
+    :type requests: list
+    :param requests: ``(method, path, data, query_params)`` tuples, at most
+                     :attr:`Batch._MAX_BATCH_SIZE` of them.
+
+    :rtype: list
+    :returns: For each request, the response payload if it succeeded,
+              otherwise the exception for its error response.
+    """
+    batch = Batch(client)
+    for method, path, data, query_params in requests:
+        batch.api_request(method=method, path=path, data=data,
+                          query_params=query_params)
+    responses = batch.finish(raise_exception=False)
+
+    results = []
+    for request, (headers, payload) in zip(requests, responses):
+        if 200 <= headers.status < 300:
+            results.append(payload)
+        else:
+            method, path = request[:2]
+            results.append(make_exception(
+                headers, payload, error_info=method + ' ' + path))
+    return results
+
+
+def _send_batches(client, requests, max_workers):
+    """Send any number of requests, split up into concurrent batches.
+
+    ``requests`` is consumed lazily, so only the batches being sent are
+    held in memory.
+
+    :type client: :class:`google.cloud.storage.client.Client`
+    :param client: The client used to send the batches.
+
+    :type requests: iterable
+    :param requests: ``(method, path, data, query_params)`` tuples.
+
+    :type max_workers: int
+    :param max_workers: The maximum number of batches sent at once.
+
+    :rtype: list
+    :returns: For each request (in order), the response payload if it
+              succeeded, otherwise the exception for its error response.
+
+    :raises: :exc:`ValueError` if ``max_workers`` is more than 1 but the
+             client's ``_http`` is not a
+             :class:`~google.cloud._http.PooledHttp`.
+    """
+    _check_max_workers(client, max_workers)
+    requests = iter(requests)
+    chunks = iter(
+        lambda: list(itertools.islice(requests, Batch._MAX_BATCH_SIZE)), [])
+
+    results = []
+    if max_workers <= 1:
+        for chunk in chunks:
+            results.extend(_send_batch(client, chunk))
+        return results
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_send_batch, client, chunk))
+            # Keep every worker busy without reading ahead too far.
+            if len(pending) >= 2 * max_workers:
+                results.extend(pending.popleft().result())
+        while pending:
+            results.extend(pending.popleft().result())
+    return results
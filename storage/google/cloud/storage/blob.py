@@ -26,15 +26,21 @@
 """
 
 import base64
+import concurrent.futures
 import copy
 import hashlib
 from io import BytesIO
+import json
 import mimetypes
 import os
+import threading
 import time
+import uuid
 import warnings
 
 import httplib2
+import requests
+import six
 from six.moves.urllib.parse import quote
 
 import google.auth.transport.requests
@@ -51,9 +57,18 @@ from google.cloud.credentials import generate_signed_url
 from google.cloud.exceptions import NotFound
 from google.cloud.exceptions import make_exception
 from google.cloud.iam import Policy
+from google.cloud.storage._helpers import _base64_crc32c
+from google.cloud.storage._helpers import _base64_md5hash
+from google.cloud.storage._helpers import _ChecksumReader
+from google.cloud.storage._helpers import _Checksums
+from google.cloud.storage._helpers import _ChecksumWriter
+from google.cloud.storage._helpers import _invalidate_metadata
+from google.cloud.storage._helpers import _metadata_cache
+from google.cloud.storage._helpers import _parse_hash_header
 from google.cloud.storage._helpers import _PropertyMixin
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage.acl import ObjectACL
+from google.cloud.storage.cache import _TeeWriter
 
 
 _API_ACCESS_ENDPOINT = 'https://storage.googleapis.com'
@@ -90,6 +105,22 @@ _NUM_RETRIES_MESSAGE = (
 _READ_LESS_THAN_SIZE = (
     'Size {:d} was specified but the file-like object only had '
     '{:d} bytes remaining.')
+_CHECKSUM_MISMATCH = (
+    'Checksum mismatch while {} {}: the {} computed locally is {!r} but '
+    'the server has {!r}.')
+_HASH_HEADER = 'x-goog-hash'
+_STORED_ENCODING_HEADER = 'x-goog-stored-content-encoding'
+_COMPOSITE_STATE_SUFFIX = '.gcs-upload-state'
+"""Suffix of the file recording the progress of a composite upload."""
+_COMPONENT_NAME_TEMPLATE = u'{}.__component-{}-{:d}__'
+"""Name of a temporary object holding part of a composite upload."""
+_MAX_COMPOSE_SOURCES = 32
+"""Maximum number of source objects in a single compose request."""
+_SLICE_RETRYABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+"""Errors after which a single slice of a sliced download is resumed."""
 
 
 class Blob(_PropertyMixin):
@@ -121,6 +152,15 @@ class Blob(_PropertyMixin):
     _CHUNK_SIZE_MULTIPLE = 256 * 1024
     """Number (256 KB, in bytes) that must divide the chunk size."""
 
+    _SLICE_CHUNK_SIZE = 40 * _CHUNK_SIZE_MULTIPLE
+    """Default chunk size (10 MB) for each slice of a sliced download.
+
+    Also used for each component of a composite upload.
+    """
+
+    _MAX_SLICE_RETRIES = 3
+    """Number of times a slice of a sliced download is resumed on error."""
+
     _STORAGE_CLASSES = (
         'NEARLINE',
         'MULTI_REGIONAL',
@@ -330,6 +370,19 @@ class Blob(_PropertyMixin):
         :returns: True if the blob exists in Cloud Storage.
         """
         client = self._require_client(client)
+        cache = _metadata_cache(client)
+        if cache is not None:
+            if cache.get(self.path) is not None:
+                return True
+            try:
+                # Fetch all the metadata, so the cache can be filled.
+                response = client._connection.api_request(
+                    method='GET', path=self.path, _target_object=None)
+            except NotFound:
+                return False
+            cache.put(self.path, response)
+            return True
+
         try:
             # We only need the status code (200 or not) so we seek to
             # minimize the returned payload.
@@ -416,17 +469,60 @@ class Blob(_PropertyMixin):
 
         :type headers: dict
         :param headers: Optional headers to be sent with the request(s).
+
+        :raises: :exc:`ValueError` if the data received does not match the
+                 checksum reported by the server.
         """
+        # Composite objects only have a CRC32C checksum, so compute it even
+        # without a fast implementation.
+        checksums = _Checksums(
+            crc32c=self.md5_hash is None and self.crc32c is not None)
+        writer = _ChecksumWriter(file_obj, checksums)
         if self.chunk_size is None:
             download = Download(download_url, headers=headers)
             response = download.consume(transport)
-            file_obj.write(response.content)
+            writer.write(response.content)
         else:
             download = ChunkedDownload(
-                download_url, self.chunk_size, file_obj, headers=headers)
+                download_url, self.chunk_size, writer, headers=headers)
 
             while not download.finished:
-                download.consume_next_chunk(transport)
+                response = download.consume_next_chunk(transport)
+
+        # Objects stored gzipped may be decompressed in transit, so the data
+        # received does not match the stored checksums.
+        if response.headers.get(_STORED_ENCODING_HEADER) == 'gzip':
+            return
+        server_hashes = _parse_hash_header(
+            response.headers.get(_HASH_HEADER, ''))
+        self._check_checksums(
+            checksums, server_hashes.get('md5'), server_hashes.get('crc32c'),
+            'downloading')
+
+    def _check_checksums(self, checksums, md5_hash, crc32c, action):
+        """Compare checksums computed locally with those from the server.
+
+        :type checksums: :class:`~google.cloud.storage._helpers._Checksums`
+        :param checksums: The checksums of the data sent or received.
+
+        :type md5_hash: str
+        :param md5_hash: The base64-encoded MD5 hash reported by the server
+                         (or :data:`None`).
+
+        :type crc32c: str
+        :param crc32c: The base64-encoded CRC32C checksum reported by the
+                       server (or :data:`None`).
+
+        :type action: str
+        :param action: What was being done, for the error message.
+
+        :raises: :exc:`ValueError` if a checksum does not match.
+        """
+        mismatch = checksums.find_mismatch(md5_hash=md5_hash, crc32c=crc32c)
+        if mismatch is not None:
+            name, actual, expected = mismatch
+            raise ValueError(_CHECKSUM_MISMATCH.format(
+                action, self.name, name, actual, expected))
 
     def download_to_file(self, file_obj, client=None):
         """Download the contents of this blob into a file-like object.
@@ -450,6 +546,17 @@ class Blob(_PropertyMixin):
         `google-resumable-media`_. For example, this library allows
         downloading **parts** of a blob rather than the whole thing.
 
+        The data is checksummed as it is written and compared with the MD5
+        hash (or, for composite objects, the CRC32C checksum) sent by the
+        server. Objects stored with ``gzip`` content encoding are not
+        checked, since they may be decompressed in transit.
+
+        If the client has a
+        :class:`~google.cloud.storage.cache.DownloadCache`, the data is read
+        from it (without any network request, if :attr:`generation` is
+        known) when this generation of the blob was downloaded before, and
+        added to it otherwise.
+
         :type file_obj: file
         :param file_obj: A file handle to which to write the blob's data.
 
@@ -458,20 +565,198 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
-        :raises: :class:`google.cloud.exceptions.NotFound`
+        :raises: :class:`google.cloud.exceptions.NotFound`, or
+                 :exc:`ValueError` if the data received does not match the
+                 checksum sent by the server.
+        """
+        cache = self._download_cache(client)
+        if cache is not None and cache.read_into(self, file_obj):
+            return
+        transport = self._make_transport(client)
+        if cache is None:
+            self._download_with_transport(transport, file_obj)
+        else:
+            with cache.adding(self) as cache_file:
+                self._download_with_transport(
+                    transport, _TeeWriter(file_obj, cache_file))
+
+    def _download_cache(self, client):
+        """Get the client's download cache, if this blob may use it.
+
+        Blobs encrypted with a customer-supplied key are not cached, nor are
+        those larger than the cache, nor those stored with ``gzip``
+        content encoding (which are downloaded decompressed, so never match
+        their size). The cache is keyed by generation, so
+        this makes an API request to load the blob's metadata if
+        :attr:`generation` is not yet known.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :rtype: :class:`~google.cloud.storage.cache.DownloadCache`
+        :returns: The cache, or :data:`None` if not to be used.
+        """
+        client = self._require_client(client)
+        cache = getattr(client, 'download_cache', None)
+        if cache is None or self._encryption_key is not None:
+            return None
+        if self.generation is None:
+            self.reload(client=client)
+        if self.size is not None and self.size > cache.max_bytes:
+            return None
+        if self.content_encoding == 'gzip':
+            return None
+        return cache
+
+    def _download_with_transport(self, transport, file_obj):
+        """Download the contents of this blob using an existing transport.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport (with credentials) that will
+                          make authenticated requests.
+
+        :type file_obj: file
+        :param file_obj: A file handle to which to write the blob's data.
+
+        :raises: :class:`google.cloud.exceptions.NotFound`, or
+                 :exc:`ValueError` if the data received does not match the
+                 checksum sent by the server.
         """
+        download_url = self._get_download_url()
+        headers = _get_encryption_headers(self._encryption_key)
+        try:
+            self._do_download(transport, file_obj, download_url, headers)
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc, download_url)
+
+    def _download_slice(self, transport, download_url, headers, filename,
+                        start, end):
+        """Download a byte range of this blob into part of a named file.
+
+        The range is written at the same offset in the file. If the
+        connection fails part way through, the slice is resumed from the
+        last chunk received, up to :attr:`_MAX_SLICE_RETRIES` times.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport (with credentials) that will
+                          make authenticated requests.
+
+        :type download_url: str
+        :param download_url: The URL where the media can be accessed.
+
+        :type headers: dict
+        :param headers: Headers to be sent with the request(s).
+
+        :type filename: str
+        :param filename: The name of an existing file to write into.
+
+        :type start: int
+        :param start: The first byte of the slice.
+
+        :type end: int
+        :param end: The last byte of the slice (inclusive).
+        """
+        chunk_size = self.chunk_size or self._SLICE_CHUNK_SIZE
+        num_retries = 0
+        with open(filename, 'r+b') as file_obj:
+            while True:
+                file_obj.seek(start)
+                download = ChunkedDownload(
+                    download_url, chunk_size, file_obj, start=start,
+                    end=end, headers=dict(headers))
+                try:
+                    while not download.finished:
+                        download.consume_next_chunk(transport)
+                    return
+                except _SLICE_RETRYABLE_ERRORS:
+                    if num_retries >= self._MAX_SLICE_RETRIES:
+                        raise
+                    num_retries += 1
+                    start += download.bytes_downloaded
+
+    def _do_sliced_download(self, filename, client, parallelism):
+        """Download this blob into a named file using concurrent slices.
+
+        The file is truncated to the size of the blob and then each
+        slice is written in place.
+
+        :type filename: str
+        :param filename: A filename to be passed to ``open``.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type parallelism: int
+        :param parallelism: The maximum number of slices downloaded
+                            at once.
+        """
+        if self.size is None:
+            self.reload(client=client)
+
         download_url = self._get_download_url()
         headers = _get_encryption_headers(self._encryption_key)
         transport = self._make_transport(client)
 
+        with open(filename, 'wb') as file_obj:
+            file_obj.truncate(self.size)
+
+        slices = _slice_ranges(
+            self.size, parallelism, self._CHUNK_SIZE_MULTIPLE)
         try:
-            self._do_download(transport, file_obj, download_url, headers)
+            _call_concurrently(
+                self._download_slice, parallelism,
+                [(transport, download_url, headers, filename, start, end)
+                 for start, end in slices])
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc, download_url)
 
-    def download_to_filename(self, filename, client=None):
+        self._verify_download_checksum(filename)
+
+    def _verify_download_checksum(self, filename):
+        """Compare a downloaded file against this blob's checksum.
+
+        Uses :attr:`md5_hash` if set, otherwise :attr:`crc32c` (composite
+        objects have no MD5 hash). Does nothing if neither is set.
+
+        :type filename: str
+        :param filename: The name of the file holding the downloaded data.
+
+        :raises: :exc:`ValueError` if the checksum does not match.
+        """
+        if self.md5_hash is not None:
+            name, expected, checksum_func = (
+                'MD5 hash', self.md5_hash, _base64_md5hash)
+        elif self.crc32c is not None:
+            name, expected, checksum_func = (
+                'CRC32C', self.crc32c, _base64_crc32c)
+        else:
+            return
+
+        with open(filename, 'rb') as file_obj:
+            actual = _bytes_to_unicode(checksum_func(file_obj))
+
+        if actual != expected:
+            raise ValueError(_CHECKSUM_MISMATCH.format(
+                'downloading', self.name, name, actual, expected))
+
+    def download_to_filename(self, filename, client=None, parallelism=None):
         """Download the contents of this blob into a named file.
 
+        If ``parallelism`` is greater than 1, the blob is split into that
+        many byte ranges which are downloaded concurrently and written in
+        place, and the file is then checked against the blob's MD5 hash
+        (or CRC32C checksum). This makes an additional API request to load
+        the blob's metadata if :attr:`size` is not yet known.
+
+        If the client has a
+        :class:`~google.cloud.storage.cache.DownloadCache`, the file is
+        copied from it when this generation of the blob was downloaded
+        before, and added to it otherwise.
+
         :type filename: str
         :param filename: A filename to be passed to ``open``.
 
@@ -480,15 +765,88 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
-        :raises: :class:`google.cloud.exceptions.NotFound`
+        :type parallelism: int
+        :param parallelism: (Optional) The number of slices to download
+                            concurrently.
+
+        :raises: :class:`google.cloud.exceptions.NotFound`, or
+                 :exc:`ValueError` if a sliced download does not match the
+                 blob's checksum.
         """
-        with open(filename, 'wb') as file_obj:
-            self.download_to_file(file_obj, client=client)
+        if parallelism is not None and parallelism > 1:
+            cache = self._download_cache(client)
+            hit = False
+            if cache is not None:
+                with open(filename, 'wb') as file_obj:
+                    hit = cache.read_into(self, file_obj)
+            if not hit:
+                self._do_sliced_download(filename, client, parallelism)
+                if cache is not None:
+                    cache.add_file(self, filename)
+        else:
+            with open(filename, 'wb') as file_obj:
+                self.download_to_file(file_obj, client=client)
 
         updated = self.updated
         if updated is not None:
             mtime = time.mktime(updated.timetuple())
-            os.utime(file_obj.name, (mtime, mtime))
+            os.utime(filename, (mtime, mtime))
+
+    def open(self, mode='rb', chunk_size=None, content_type=None,
+             client=None):
+        """Open this blob as a file-like object, for reading or writing.
+
+        In ``'rb'`` mode, returns a seekable
+        :class:`~google.cloud.storage.fileio.BlobReader`, which reads the
+        blob with ranged requests as needed, e.g. to read the footer of a
+        large file without downloading all of it:
+
+        .. code-block:: python
+
+           with blob.open('rb') as file_obj:
+               file_obj.seek(-8, os.SEEK_END)
+               footer = file_obj.read(8)
+
+        In ``'wb'`` mode, returns a
+        :class:`~google.cloud.storage.fileio.BlobWriter`, which uploads the
+        data written in chunks, through a resumable upload session, and
+        finishes the blob when closed.
+
+        :type mode: str
+        :param mode: (Optional) ``'rb'`` (the default) or ``'wb'``.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) The size of the blocks read, or of the
+                           chunks uploaded (a multiple of 256 KB).
+
+        :type content_type: str
+        :param content_type: (Optional) Type of content uploaded, in
+                             ``'wb'`` mode.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :rtype: :class:`~google.cloud.storage.fileio.BlobReader` or
+                :class:`~google.cloud.storage.fileio.BlobWriter`
+        :returns: The file-like object.
+
+        :raises: :exc:`ValueError` if ``mode`` is not supported.
+        """
+        # Imported here since ``fileio`` depends on this module.
+        from google.cloud.storage import fileio
+
+        if mode == 'rb':
+            if chunk_size is None:
+                chunk_size = fileio.DEFAULT_BLOCK_SIZE
+            return fileio.BlobReader(
+                self, client=client, block_size=chunk_size)
+        elif mode == 'wb':
+            return fileio.BlobWriter(
+                self, content_type=content_type, client=client,
+                chunk_size=chunk_size)
+        raise ValueError('Unsupported mode: %r' % (mode,))
 
     def download_as_string(self, client=None):
         """Download the contents of this blob as a string.
@@ -649,8 +1007,11 @@ class Blob(_PropertyMixin):
             upload._retry_strategy = resumable_media.RetryStrategy(
                 max_retries=num_retries)
 
-        response = upload.transmit(
-            transport, data, object_metadata, content_type)
+        try:
+            response = upload.transmit(
+                transport, data, object_metadata, content_type)
+        finally:
+            _invalidate_metadata(self._require_client(client), self.path)
 
         return response
 
@@ -766,8 +1127,11 @@ class Blob(_PropertyMixin):
         upload, transport = self._initiate_resumable_upload(
             client, stream, content_type, size, num_retries)
 
-        while not upload.finished:
-            response = upload.transmit_next_chunk(transport)
+        try:
+            while not upload.finished:
+                response = upload.transmit_next_chunk(transport)
+        finally:
+            _invalidate_metadata(self._require_client(client), self.path)
 
         return response
 
@@ -850,6 +1214,11 @@ class Blob(_PropertyMixin):
         For more fine-grained over the upload process, check out
         `google-resumable-media`_.
 
+        The data is checksummed as it is read and compared with the MD5
+        hash returned by the server for the new object. If they differ a
+        :exc:`ValueError` is raised; the (corrupt) object is left in place
+        and the blob's properties are updated to describe it.
+
         :type file_obj: file
         :param file_obj: A file handle open for reading.
 
@@ -874,7 +1243,9 @@ class Blob(_PropertyMixin):
                        to the ``client`` stored on the blob's bucket.
 
         :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
-                 if the upload response returns an error status.
+                 if the upload response returns an error status, or
+                 :exc:`ValueError` if the data sent does not match the
+                 checksum reported by the server.
 
         .. _object versioning: https://cloud.google.com/storage/\
                                docs/object-versioning
@@ -884,16 +1255,174 @@ class Blob(_PropertyMixin):
             warnings.warn(_NUM_RETRIES_MESSAGE, DeprecationWarning)
 
         _maybe_rewind(file_obj, rewind=rewind)
+        checksums = _Checksums()
+        reader = _ChecksumReader(file_obj, checksums)
         try:
             created_json = self._do_upload(
-                client, file_obj, content_type, size, num_retries)
+                client, reader, content_type, size, num_retries)
             self._set_properties(created_json)
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
-    def upload_from_filename(self, filename, content_type=None, client=None):
+        if not reader.skipped:
+            self._check_checksums(
+                checksums, created_json.get('md5Hash'),
+                created_json.get('crc32c'), 'uploading')
+
+    def _upload_component(self, component, filename, start, end,
+                          content_type, client):
+        """Upload a byte range of a named file into a temporary blob.
+
+        :type component: :class:`Blob`
+        :param component: The temporary blob to upload into.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type start: int
+        :param start: The first byte of the range.
+
+        :type end: int
+        :param end: The last byte of the range (inclusive).
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+        """
+        size = end - start + 1
+        with open(filename, 'rb') as file_obj:
+            component.upload_from_file(
+                _FileSlice(file_obj, start, size), size=size,
+                content_type=content_type, client=client)
+
+    def _compose_components(self, components, content_type, client):
+        """Compose temporary blobs into this one.
+
+        If there are more than ``_MAX_COMPOSE_SOURCES`` components, they
+        are first composed (in groups) into intermediate temporary blobs.
+
+        :type components: list of :class:`Blob`
+        :param components: The blobs to compose, in order.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :rtype: list of :class:`Blob`
+        :returns: The intermediate blobs created, which should be deleted.
+        """
+        intermediates = []
+        while len(components) > _MAX_COMPOSE_SOURCES:
+            next_components = []
+            for start in six.moves.range(
+                    0, len(components), _MAX_COMPOSE_SOURCES):
+                group = components[start:start + _MAX_COMPOSE_SOURCES]
+                if len(group) == 1:
+                    next_components.append(group[0])
+                    continue
+                intermediate = Blob(group[0].name + u'-composed',
+                                    bucket=self.bucket)
+                intermediate.content_type = content_type
+                intermediate.compose(group, client=client)
+                intermediates.append(intermediate)
+                next_components.append(intermediate)
+            components = next_components
+
+        self.content_type = content_type
+        self.compose(components, client=client)
+        return intermediates
+
+    def _do_composite_upload(self, filename, content_type, client,
+                             parallelism):
+        """Upload a named file as concurrently uploaded, composed parts.
+
+        Progress is recorded in a state file next to ``filename`` (with
+        the suffix ``.gcs-upload-state``) so that an interrupted upload of
+        an unchanged file only uploads the missing parts when retried.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type parallelism: int
+        :param parallelism: The number of parts to upload concurrently.
+
+        :raises: :exc:`ValueError` if the blob has a customer-supplied
+                 encryption key.
+        """
+        if self._encryption_key is not None:
+            raise ValueError(
+                'Composite uploads do not support customer-supplied '
+                'encryption keys.')
+
+        state_filename = filename + _COMPOSITE_STATE_SUFFIX
+        file_stat = os.stat(filename)
+        ranges = _slice_ranges(
+            file_stat.st_size, parallelism, self._CHUNK_SIZE_MULTIPLE)
+        state = {
+            'bucket': self.bucket.name,
+            'name': self.name,
+            'size': file_stat.st_size,
+            'mtime': file_stat.st_mtime,
+            'ranges': ranges,
+        }
+        state = _load_upload_state(state_filename, state)
+
+        chunk_size = self.chunk_size or self._SLICE_CHUNK_SIZE
+        components = [
+            Blob(_COMPONENT_NAME_TEMPLATE.format(
+                self.name, state['upload_id'], index),
+                 bucket=self.bucket, chunk_size=chunk_size)
+            for index in six.moves.range(len(ranges))
+        ]
+        state_lock = threading.Lock()
+
+        def upload_component(index):
+            """Upload one component and record that it is done."""
+            start, end = ranges[index]
+            self._upload_component(
+                components[index], filename, start, end, content_type, client)
+            with state_lock:
+                state['uploaded'].append(index)
+                _save_upload_state(state_filename, state)
+
+        _call_concurrently(
+            upload_component, parallelism,
+            [(index,) for index in six.moves.range(len(ranges))
+             if index not in state['uploaded']])
+
+        intermediates = self._compose_components(
+            components, content_type, client)
+        self.bucket.delete_blobs(
+            components + intermediates, on_error=lambda blob: None,
+            client=client)
+        os.remove(state_filename)
+
+    def upload_from_filename(self, filename, content_type=None, client=None,
+                             parallelism=None):
         """Upload this blob's contents from the content of a named file.
 
+        If ``parallelism`` is greater than 1, the file is split into that
+        many parts which are uploaded concurrently as temporary objects,
+        then composed into this blob and deleted. (Parts are multiples of
+        256 KB, so a file no larger than that is uploaded as usual.) If
+        this is interrupted, calling this method again with the same
+        (unchanged) file will only upload the missing parts. Note that
+        composite objects have a :attr:`crc32c` checksum but no
+        :attr:`md5_hash`.
+
         The content type of the upload will be determined in order
         of precedence:
 
@@ -922,9 +1451,19 @@ class Blob(_PropertyMixin):
         :type client: :class:`~google.cloud.storage.client.Client`
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
+
+        :type parallelism: int
+        :param parallelism: (Optional) The number of parts to upload
+                            concurrently in a composite upload.
         """
         content_type = self._get_content_type(content_type, filename=filename)
 
+        if (parallelism is not None and parallelism > 1 and
+                os.path.getsize(filename) > self._CHUNK_SIZE_MULTIPLE):
+            self._do_composite_upload(
+                filename, content_type, client, parallelism)
+            return
+
         with open(filename, 'rb') as file_obj:
             total_bytes = os.fstat(file_obj.fileno()).st_size
             self.upload_from_file(
@@ -1577,6 +2116,172 @@ def _quote(value):
     return quote(value, safe='')
 
 
+def _slice_ranges(total_bytes, num_slices, multiple):
+    """Split a byte count into contiguous ranges.
+
+    :type total_bytes: int
+    :param total_bytes: The number of bytes to split.
+
+    :type num_slices: int
+    :param num_slices: The maximum number of ranges.
+
+    :type multiple: int
+    :param multiple: Every range but the last will have a size which is
+                     a (non-zero) multiple of this.
+
+    :rtype: list
+    :returns: Pairs of ``(start, end)`` byte offsets, where ``end`` is
+              inclusive.
+    """
+    slice_size = -(-total_bytes // num_slices)  # Ceiling division.
+    slice_size = max(-(-slice_size // multiple), 1) * multiple
+    return [
+        (start, min(start + slice_size, total_bytes) - 1)
+        for start in six.moves.range(0, total_bytes, slice_size)
+    ]
+
+
+def _call_concurrently(func, max_workers, args_list):
+    """Call a function concurrently for each set of arguments.
+
+    Waits for every call to complete. If a call fails, the calls which
+    have not yet started are cancelled and the first error is raised.
+
+    :type func: callable
+    :param func: The function to call.
+
+    :type max_workers: int
+    :param max_workers: The maximum number of concurrent calls.
+
+    :type args_list: list of tuple
+    :param args_list: The positional arguments for each call.
+
+    :rtype: list
+    :returns: The results of each call, in the order of ``args_list``.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        pending = [executor.submit(func, *args) for args in args_list]
+        try:
+            return [future.result() for future in pending]
+        except Exception:
+            for future in pending:
+                future.cancel()
+            raise
+
+
+def _load_upload_state(state_filename, expected):
+    """Load the state of a composite upload, if it can be resumed.
+
+    :type state_filename: str
+    :param state_filename: The path of the state file.
+
+    :type expected: dict
+    :param expected: Properties of the upload (target, file size and mtime,
+                     part ranges) which must match the saved state for it
+                     to be resumed.
+
+    :rtype: dict
+    :returns: The saved state, or ``expected`` with a new ``upload_id``
+              and no ``uploaded`` parts if there is nothing to resume.
+    """
+    try:
+        with open(state_filename, 'r') as file_obj:
+            state = json.load(file_obj)
+    except (IOError, OSError, ValueError):
+        state = {}
+
+    # JSON round-trips tuples as lists.
+    saved = {key: state.get(key) for key in expected}
+    saved['ranges'] = [tuple(pair) for pair in saved['ranges'] or ()]
+    if saved != expected:
+        state = dict(expected)
+        state['upload_id'] = uuid.uuid4().hex
+        state['uploaded'] = []
+    return state
+
+
+def _save_upload_state(state_filename, state):
+    """Save the state of a composite upload.
+
+    :type state_filename: str
+    :param state_filename: The path of the state file.
+
+    :type state: dict
+    :param state: The state to save.
+    """
+    with open(state_filename, 'w') as file_obj:
+        json.dump(state, file_obj)
+
+
+class _FileSlice(object):
+    """Seekable, read-only view of a byte range of a file.
+
+    Positions are relative to the start of the range, so that it can be
+    used as the stream of a (resumable) upload.
+
+    :type file_obj: file
+    :param file_obj: A seekable file handle open for reading.
+
+    :type start: int
+    :param start: The offset in ``file_obj`` of the first byte of the range.
+
+    :type size: int
+    :param size: The number of bytes in the range.
+    """
+
+    def __init__(self, file_obj, start, size):
+        self._file_obj = file_obj
+        self._start = start
+        self._size = size
+        self._position = 0
+
+    def tell(self):
+        """Get the current position in the range.
+
+        :rtype: int
+        :returns: The current position.
+        """
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Change the current position in the range.
+
+        :type offset: int
+        :param offset: The position, relative to ``whence``.
+
+        :type whence: int
+        :param whence: One of ``os.SEEK_SET``, ``os.SEEK_CUR`` or
+                       ``os.SEEK_END``.
+
+        :rtype: int
+        :returns: The new position.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._size
+        self._position = min(max(offset, 0), self._size)
+        return self._position
+
+    def read(self, size=-1):
+        """Read bytes from the range.
+
+        :type size: int
+        :param size: (Optional) The maximum number of bytes to read. If
+                     negative or not passed, reads to the end of the range.
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        remaining = self._size - self._position
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        self._file_obj.seek(self._start + self._position)
+        data = self._file_obj.read(size)
+        self._position += len(data)
+        return data
+
+
 def _maybe_rewind(stream, rewind=False):
     """Rewind the stream if desired.
 
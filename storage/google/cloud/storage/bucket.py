@@ -15,27 +15,41 @@
 """Create / interact with Google Cloud Storage buckets."""
 
 import base64
+import concurrent.futures
 import copy
 import datetime
+import io
 import json
+import os
 
 import google.auth.credentials
+import google.auth.transport.requests
+import requests
 import six
 
 from google.cloud._helpers import _datetime_to_rfc3339
 from google.cloud._helpers import _NOW
 from google.cloud._helpers import _rfc3339_to_datetime
+from google.cloud._http import _max_concurrent_requests
 from google.cloud.exceptions import NotFound
 from google.cloud.iam import Policy
 from google.cloud.iterator import HTTPIterator
+from google.cloud.storage._helpers import _filename_below
+from google.cloud.storage._helpers import _metadata_cache
 from google.cloud.storage._helpers import _PropertyMixin
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._helpers import _validate_name
 from google.cloud.storage.acl import BucketACL
 from google.cloud.storage.acl import DefaultObjectACL
+from google.cloud.storage.acl import ObjectACL
+from google.cloud.storage.batch import _send_batches
 from google.cloud.storage.blob import Blob
 
 
+_DEFAULT_DOWNLOAD_WORKERS = 16
+"""Default number of blobs downloaded at once by ``download_many``."""
+
+
 def _blobs_page_start(iterator, page, response):
     """Grab prefixes after a :class:`~google.cloud.iterator.Page` started.
 
@@ -52,6 +66,62 @@ def _blobs_page_start(iterator, page, response):
     iterator.prefixes.update(page.prefixes)
 
 
+def _make_pooled_transport(credentials, pool_size):
+    """Make an authenticated transport keeping many connections open.
+
+    :type credentials: :class:`google.auth.credentials.Credentials`
+    :param credentials: The credentials used to authorize requests.
+
+    :type pool_size: int
+    :param pool_size: The number of connections kept open for re-use, which
+                      should be at least the number of threads using the
+                      transport.
+
+    :rtype: :class:`~google.auth.transport.requests.AuthorizedSession`
+    :returns: The transport.
+    """
+    transport = google.auth.transport.requests.AuthorizedSession(credentials)
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=1, pool_maxsize=pool_size)
+    transport.mount('https://', adapter)
+    return transport
+
+
+def _download_to_directory(blob, transport, directory):
+    """Download a blob to the file with its name below a directory.
+
+    The file is removed if the download fails.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to download.
+
+    :type transport:
+        :class:`~google.auth.transport.requests.AuthorizedSession`
+    :param transport: The transport (with credentials) that will make
+                      authenticated requests.
+
+    :type directory: str
+    :param directory: The path of the directory.
+
+    :raises: :class:`ValueError` if the blob's name does not map to a file
+             below ``directory`` (e.g. it has a ``..`` segment).
+    """
+    filename = _filename_below(directory, blob.name)
+    dirname = os.path.dirname(filename)
+    try:
+        os.makedirs(dirname)
+    except OSError:
+        if not os.path.isdir(dirname):
+            raise
+    with open(filename, 'wb') as file_obj:
+        try:
+            blob._download_with_transport(transport, file_obj)
+        except Exception:
+            file_obj.close()
+            os.remove(filename)
+            raise
+
+
 def _item_to_blob(iterator, item):
     """Convert a JSON blob to the native object.
 
@@ -72,6 +142,9 @@ def _item_to_blob(iterator, item):
     name = item.get('name')
     blob = Blob(name, bucket=iterator.bucket)
     blob._set_properties(item)
+    cache = _metadata_cache(iterator.client)
+    if cache is not None:
+        cache.refresh(blob.path, item)
     return blob
 
 
@@ -250,11 +323,20 @@ class Bucket(_PropertyMixin):
         """
         client = self._require_client(client)
         blob = Blob(bucket=self, name=blob_name)
+        cache = _metadata_cache(client)
+        if cache is not None:
+            cached = cache.get(blob.path)
+            if cached is not None:
+                blob._set_properties(cached)
+                return blob
+
         try:
             response = client._connection.api_request(
                 method='GET', path=blob.path, _target_object=blob)
             # NOTE: We assume response.get('name') matches `blob_name`.
             blob._set_properties(response)
+            if cache is not None:
+                cache.put(blob.path, response)
             # NOTE: This will not fail immediately in a batch. However, when
             #       Batch.finish() is called, the resulting `NotFound` will be
             #       raised.
@@ -347,7 +429,8 @@ class Bucket(_PropertyMixin):
         If ``force=True`` and the bucket contains more than 256 objects / blobs
         this will cowardly refuse to delete the objects (or the bucket). This
         is to prevent accidental bucket deletion and to prevent extremely long
-        runtime of this method.
+        runtime of this method. Larger buckets can be emptied first with
+        :meth:`bulk_delete`.
 
         :type force: bool
         :param force: If True, empties the bucket's objects then deletes it.
@@ -523,6 +606,322 @@ class Bucket(_PropertyMixin):
         blob.delete(client=client)
         return new_blob
 
+    def _send_bulk_requests(self, requests, client, max_workers):
+        """Send requests for many blobs in concurrent batches.
+
+        :type requests: iterable
+        :param requests: ``(method, path, data, query_params)`` tuples.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: The maximum number of batches sent at once, or
+                            :data:`None` to decide based on the client's
+                            HTTP object.
+
+        :rtype: list
+        :returns: For each request, the response payload if it succeeded,
+                  otherwise the exception for its error response.
+
+        :raises: :exc:`ValueError` if ``max_workers`` is more than 1 but the
+                 client's ``_http`` is not a
+                 :class:`~google.cloud._http.PooledHttp`.
+        """
+        client = self._require_client(client)
+        if max_workers is None:
+            max_workers = _max_concurrent_requests(client)
+        return _send_batches(client, requests, max_workers)
+
+    def bulk_delete(self, blobs, client=None, max_workers=None):
+        """Delete many blobs from the current bucket using batch requests.
+
+        Unlike :meth:`delete_blobs`, the deletes are grouped into batches
+        of up to :attr:`~google.cloud.storage.batch.Batch._MAX_BATCH_SIZE`
+        requests, several of which are sent at once, and a failure to
+        delete one blob does not stop the others from being deleted.
+
+        ``blobs`` is consumed lazily, so every blob in a large bucket can be
+        deleted with:
+
+        .. code-block:: python
+
+           results = bucket.bulk_delete(bucket.list_blobs())
+
+        Batches are only sent concurrently if the client's ``_http`` is a
+        (thread-safe) :class:`~google.cloud._http.PooledHttp`; passing
+        ``max_workers`` greater than 1 with any other client raises
+        :exc:`ValueError`.
+
+        :type blobs: iterable
+        :param blobs: :class:`~google.cloud.storage.blob.Blob`-s or blob
+                      names to delete.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of batches sent at
+                            once. Defaults to the size of the client's
+                            ``PooledHttp``, or 1 if it does not use one.
+
+        :rtype: list
+        :returns: For each blob (in order), :data:`None` if it was deleted,
+                  otherwise the exception for the failed request (e.g.
+                  :class:`~google.cloud.exceptions.NotFound`).
+
+        :raises: :exc:`ValueError` if ``max_workers`` is more than 1 but the
+                 client's ``_http`` is not a
+                 :class:`~google.cloud._http.PooledHttp`.
+        """
+        def requests():
+            for blob in blobs:
+                blob_name = blob
+                if not isinstance(blob_name, six.string_types):
+                    blob_name = blob.name
+                path = Blob.path_helper(self.path, blob_name)
+                yield 'DELETE', path, None, None
+
+        results = self._send_bulk_requests(requests(), client, max_workers)
+        return [result if isinstance(result, Exception) else None
+                for result in results]
+
+    def bulk_copy(self, blobs, destination_bucket, new_names=None,
+                  client=None, max_workers=None):
+        """Copy many blobs to a bucket using batch requests.
+
+        See :meth:`bulk_delete` for how the requests are sent.
+
+        :type blobs: list
+        :param blobs: The :class:`~google.cloud.storage.blob.Blob`-s to
+                      copy.
+
+        :type destination_bucket: :class:`google.cloud.storage.bucket.Bucket`
+        :param destination_bucket: The bucket into which the blobs should be
+                                   copied.
+
+        :type new_names: list
+        :param new_names: (Optional) The new name for each blob. Defaults to
+                          the blobs' current names.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of batches sent at
+                            once.
+
+        :rtype: list
+        :returns: For each blob (in order), the new
+                  :class:`~google.cloud.storage.blob.Blob` if it was copied,
+                  otherwise the exception for the failed request.
+        :raises: :exc:`ValueError` if ``new_names`` and ``blobs`` differ
+                 in length.
+        """
+        blobs = list(blobs)
+        if new_names is None:
+            new_names = [blob.name for blob in blobs]
+        elif len(new_names) != len(blobs):
+            raise ValueError('Expected a new name for every blob.')
+        new_blobs = [Blob(bucket=destination_bucket, name=new_name)
+                     for new_name in new_names]
+
+        requests = [
+            ('POST', blob.path + '/copyTo' + new_blob.path, None, None)
+            for blob, new_blob in zip(blobs, new_blobs)]
+        results = self._send_bulk_requests(requests, client, max_workers)
+
+        for index, result in enumerate(results):
+            if not isinstance(result, Exception):
+                new_blobs[index]._set_properties(result)
+                results[index] = new_blobs[index]
+        return results
+
+    def bulk_update_acl(self, blobs, predefined=None, client=None,
+                        max_workers=None):
+        """Save the ACLs of many blobs using batch requests.
+
+        Each blob's current :attr:`~google.cloud.storage.blob.Blob.acl` is
+        saved (it is reloaded first, one blob at a time, if it has not been
+        loaded), unless ``predefined`` is passed.
+
+        See :meth:`bulk_delete` for how the requests are sent.
+
+        :type blobs: list
+        :param blobs: The :class:`~google.cloud.storage.blob.Blob`-s to
+                      update.
+
+        :type predefined: str
+        :param predefined: (Optional) An identifier for a predefined ACL to
+                           apply to every blob instead. Must be one of the
+                           keys in
+                           :attr:`~google.cloud.storage.acl.ACL.PREDEFINED_JSON_ACLS`
+                           or
+                           :attr:`~google.cloud.storage.acl.ACL.PREDEFINED_XML_ACLS`.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of batches sent at
+                            once.
+
+        :rtype: list
+        :returns: For each blob (in order), the blob (with its ACL updated)
+                  if the request succeeded, otherwise the exception for the
+                  failed request.
+        :raises: :exc:`ValueError` if ``predefined`` is not a valid
+                 predefined ACL.
+        """
+        blobs = list(blobs)
+        query_params = {'projection': 'full'}
+        if predefined is not None:
+            predefined = ObjectACL.PREDEFINED_XML_ACLS.get(
+                predefined, predefined)
+            if predefined not in ObjectACL.PREDEFINED_JSON_ACLS:
+                raise ValueError(
+                    'Invalid predefined ACL: %s' % (predefined,))
+            query_params['predefinedAcl'] = predefined
+
+        def requests():
+            for blob in blobs:
+                acl = [] if predefined is not None else list(blob.acl)
+                yield 'PATCH', blob.path, {'acl': acl}, query_params
+
+        results = self._send_bulk_requests(requests(), client, max_workers)
+
+        for index, result in enumerate(results):
+            if not isinstance(result, Exception):
+                acl = blobs[index].acl
+                acl.entities.clear()
+                for entry in result.get('acl', ()):
+                    acl.add_entity(acl.entity_from_dict(entry))
+                acl.loaded = True
+                results[index] = blobs[index]
+        return results
+
+    def download_many(self, blobs, destination, client=None,
+                      max_workers=_DEFAULT_DOWNLOAD_WORKERS):
+        """Download many (small) blobs concurrently.
+
+        Each blob is downloaded in a single request, using a pool of
+        ``max_workers`` threads sharing that many persistent connections,
+        so the latency of each request is mostly overlapped with others.
+        This suits many small blobs; large ones are better downloaded with
+        :meth:`~google.cloud.storage.blob.Blob.download_to_filename`.
+
+        If ``destination`` is a directory, the blob named ``a/b.txt`` is
+        written to the file ``a/b.txt`` below it (creating ``a`` if
+        needed); a blob whose name does not map to a file below the
+        directory (e.g. ``../b.txt`` or ``a//b.txt``) fails with
+        :class:`ValueError`. Otherwise ``destination`` is called with each
+        blob and its data as it is downloaded, e.g. to feed a queue:
+
+        .. code-block:: python
+
+           def received(blob, data):
+               examples.put((blob.name, data))
+
+           bucket.download_many(bucket.list_blobs(prefix='train/'), received)
+
+        Note that the callback is called from the pool's threads.
+
+        Failing to download a blob does not stop the others from being
+        downloaded.
+
+        :type blobs: iterable
+        :param blobs: :class:`~google.cloud.storage.blob.Blob`-s or blob
+                      names to download.
+
+        :type destination: str or callable
+        :param destination: The path of a directory, or a callable taking
+                            a :class:`~google.cloud.storage.blob.Blob` and
+                            its contents (as bytes).
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of blobs downloaded
+                            at once. Defaults to 16.
+
+        :rtype: list
+        :returns: For each blob (in order), :data:`None` if it was
+                  downloaded, otherwise the exception raised (e.g.
+                  :class:`~google.cloud.exceptions.NotFound`) when
+                  downloading it or by ``destination``.
+        """
+        client = self._require_client(client)
+        blobs = [
+            self.blob(blob) if isinstance(blob, six.string_types) else blob
+            for blob in blobs]
+        transport = _make_pooled_transport(client._credentials, max_workers)
+
+        def download(blob):
+            """Download one blob, returning any error."""
+            try:
+                if callable(destination):
+                    buffer_ = io.BytesIO()
+                    blob._download_with_transport(transport, buffer_)
+                    destination(blob, buffer_.getvalue())
+                else:
+                    _download_to_directory(blob, transport, destination)
+            except Exception as exc:
+                return exc
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(download, blobs))
+
+    def bulk_patch(self, blobs, client=None, max_workers=None):
+        """Send the changed properties of many blobs using batch requests.
+
+        Like :meth:`~google.cloud.storage.blob.Blob.patch`, for each blob.
+        See :meth:`bulk_delete` for how the requests are sent.
+
+        :type blobs: list
+        :param blobs: The :class:`~google.cloud.storage.blob.Blob`-s to
+                      update.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The maximum number of batches sent at
+                            once.
+
+        :rtype: list
+        :returns: For each blob (in order), the blob (with its properties
+                  updated from the response) if the request succeeded,
+                  otherwise the exception for the failed request.
+        """
+        blobs = list(blobs)
+        # Pass '?projection=full' here because 'PATCH' documented not
+        # to work properly w/ 'noAcl'.
+        requests = [
+            ('PATCH', blob.path,
+             {key: blob._properties[key] for key in blob._changes},
+             {'projection': 'full'})
+            for blob in blobs]
+        results = self._send_bulk_requests(requests, client, max_workers)
+
+        for index, result in enumerate(results):
+            if not isinstance(result, Exception):
+                blobs[index]._set_properties(result)
+                results[index] = blobs[index]
+        return results
+
     @property
     def cors(self):
         """Retrieve or set CORS policies configured for this bucket.
@@ -886,7 +1285,8 @@ class Bucket(_PropertyMixin):
 
         If ``recursive=True`` and the bucket contains more than 256
         objects / blobs this will cowardly refuse to make the objects public.
-        This is to prevent extremely long runtime of this method.
+        This is to prevent extremely long runtime of this method. Use
+        :meth:`bulk_update_acl` to update the ACLs of more objects.
 
         :type recursive: bool
         :param recursive: If True, this will make all blobs inside the bucket
@@ -0,0 +1,539 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side caches of bucket and blob metadata, and of blob contents.
+
+Pass a :class:`MetadataCache` to :class:`~google.cloud.storage.client.Client`
+so that repeated lookups of the same buckets and blobs are answered
+locally::
+
+    >>> from google.cloud import storage
+    >>> cache = storage.MetadataCache(max_size=1000, ttl=30)
+    >>> client = storage.Client(metadata_cache=cache)
+    >>> bucket = client.get_bucket('my-bucket')
+    >>> blob = bucket.get_blob('hot-object')  # Fetched.
+    >>> blob = bucket.get_blob('hot-object')  # From the cache.
+    >>> cache.hits, cache.misses
+    (1, 2)
+
+:meth:`Bucket.get_blob <google.cloud.storage.bucket.Bucket.get_blob>`,
+:meth:`Blob.exists <google.cloud.storage.blob.Blob.exists>` and the
+``reload`` method of buckets and blobs use the cache. Entries expire after
+``ttl`` seconds, and are dropped whenever the client modifies the bucket or
+blob (or its ACL), so the client always sees its own writes. Changes made
+by others can go unnoticed for up to ``ttl`` seconds, unless a newer
+generation or metageneration of the object is seen in a listing first.
+
+Lookups within a :class:`~google.cloud.storage.batch.Batch` bypass the
+cache.
+
+Pass a :class:`DownloadCache` to keep the contents of downloaded blobs on
+local disk, shared by the processes using the same directory::
+
+    >>> cache = storage.DownloadCache('/var/cache/gcs', max_bytes=10 ** 10)
+    >>> client = storage.Client(download_cache=cache)
+    >>> blob = client.bucket('my-bucket').get_blob('model.bin')
+    >>> blob.download_to_filename('model.bin')  # Downloaded.
+    >>> blob.download_to_filename('model.bin')  # Copied from the cache.
+    >>> cache.hits, cache.misses
+    (1, 1)
+"""
+
+import collections
+import contextlib
+import copy
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: NO COVER  Windows
+    fcntl = None
+    import msvcrt
+
+
+_RESOURCE_PATH = re.compile(r'/b/([^/?]+)(?:/o/([^/?]+))?')
+"""Matches the bucket and blob paths in a request path."""
+
+
+def _version(properties):
+    """Get the version of a bucket or blob from its properties.
+
+    :type properties: dict
+    :param properties: The API representation of a bucket or blob.
+
+    :rtype: tuple
+    :returns: The generation and metageneration, as integers.
+    """
+    return (int(properties.get('generation', 0)),
+            int(properties.get('metageneration', 0)))
+
+
+class MetadataCache(object):
+    """Least-recently-used cache of bucket and blob metadata, with a TTL.
+
+    Entries are keyed by the API path of the bucket or blob.
+
+    :type max_size: int
+    :param max_size: (Optional) The most entries to keep. Defaults to 1024.
+
+    :type ttl: float
+    :param ttl: (Optional) The seconds for which an entry is used. Defaults
+                to 60.
+    """
+
+    def __init__(self, max_size=1024, ttl=60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, path):
+        """Look up the properties of a bucket or blob.
+
+        :type path: str
+        :param path: The API path of the bucket or blob.
+
+        :rtype: dict
+        :returns: A copy of the cached properties, or :data:`None` if they
+                  are not cached (or have expired).
+        """
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            if entry is None or entry[0] <= time.time():
+                self.misses += 1
+                return None
+            self._entries[path] = entry  # Now most recently used.
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, path, properties):
+        """Cache the properties of a bucket or blob.
+
+        Properties older (by generation, then metageneration) than those
+        already cached are ignored.
+
+        :type path: str
+        :param path: The API path of the bucket or blob.
+
+        :type properties: dict
+        :param properties: The API representation of the bucket or blob.
+        """
+        properties = copy.deepcopy(properties)
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            if entry is not None and _version(entry[1]) > _version(
+                    properties):
+                self._entries[path] = entry
+                return
+            self._entries[path] = (time.time() + self.ttl, properties)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def refresh(self, path, properties):
+        """Update a cached entry if it is for another version of the object.
+
+        Unlike :meth:`put`, does nothing unless ``path`` is cached. Used with
+        properties seen in passing, e.g. in a listing.
+
+        :type path: str
+        :param path: The API path of the bucket or blob.
+
+        :type properties: dict
+        :param properties: The API representation of the bucket or blob.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or _version(entry[1]) >= _version(properties):
+                return
+            del self._entries[path]
+            self._entries[path] = (
+                time.time() + self.ttl, copy.deepcopy(properties))
+
+    def invalidate(self, path):
+        """Drop the cached properties of a bucket or blob.
+
+        :type path: str
+        :param path: The API path of the bucket or blob.
+        """
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def invalidate_request(self, path):
+        """Drop the entries for the buckets and blobs a request modifies.
+
+        Covers requests on ACLs and requests naming a second blob (such
+        as ``copyTo`` or ``rewriteTo``).
+
+        :type path: str
+        :param path: The path of the request.
+        """
+        for bucket_name, blob_name in _RESOURCE_PATH.findall(path):
+            if blob_name:
+                self.invalidate('/b/%s/o/%s' % (bucket_name, blob_name))
+            else:
+                self.invalidate('/b/%s' % (bucket_name,))
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+_LOCK_FILENAME = '.lock'
+"""The file locked by the processes sharing a :class:`DownloadCache`."""
+
+_SIZE_FILENAME = '.size'
+"""The file recording the total size of the entries of a
+:class:`DownloadCache`."""
+
+_TEMP_PREFIX = '.tmp-'
+"""The prefix of files being downloaded into a :class:`DownloadCache`."""
+
+_EVICT_TO = 0.8
+"""The fraction of ``max_bytes`` to which a full :class:`DownloadCache` is
+trimmed, so that the next additions do not need to evict again."""
+
+_STALE_TEMP_SECONDS = 24 * 60 * 60
+"""The age after which unfinished downloads of dead processes are removed."""
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+def _file_size(path):
+    """Get the size of a file, if it exists.
+
+    :type path: str
+    :param path: The path of the file.
+
+    :rtype: int
+    :returns: The size in bytes, or 0 if there is no such file.
+    """
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+@contextlib.contextmanager
+def _file_lock(filename, shared=False):
+    """Hold a lock on a file, excluding other processes and threads.
+
+    Shared locks need ``fcntl``; elsewhere every lock is exclusive.
+
+    :type filename: str
+    :param filename: The path of the lock file, created if needed.
+
+    :type shared: bool
+    :param shared: (Optional) If True, only exclude exclusive locks.
+    """
+    with open(filename, 'a+b') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(),
+                        fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:  # pragma: NO COVER  Windows
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: NO COVER  Windows
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class _TeeWriter(object):
+    """Write data to a file and to a copy.
+
+    :type file_obj: file
+    :param file_obj: The file written.
+
+    :type copy_obj: file
+    :param copy_obj: The file receiving a copy of the data.
+    """
+
+    def __init__(self, file_obj, copy_obj):
+        self._file_obj = file_obj
+        self._copy_obj = copy_obj
+
+    def write(self, data):
+        """Write data to both files.
+
+        :type data: bytes
+        :param data: The data to write.
+        """
+        self._file_obj.write(data)
+        self._copy_obj.write(data)
+
+
+class DownloadCache(object):
+    """Least-recently-used cache of blob contents on local disk.
+
+    Entries are keyed by the bucket, name and generation of each blob, so
+    they never go stale: a new version of a blob has a new generation.
+    The processes of one host may share the cache directory. They
+    coordinate through a lock file, and an entry is only added (by an
+    atomic rename) once its download completed and matched its checksum.
+
+    The total size of the entries is recorded next to them, so adding an
+    entry does not list the directory. When the total grows beyond
+    ``max_bytes`` (or is not known), the directory is listed and the least
+    recently read or added entries are removed, down to 80% of
+    ``max_bytes``.
+
+    :type directory: str
+    :param directory: The directory holding the cache, created if needed.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) The most bytes to keep. Defaults to 1 GB.
+    """
+
+    def __init__(self, directory, max_bytes=1024 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        try:
+            os.makedirs(directory)
+        except OSError:
+            if not os.path.isdir(directory):
+                raise
+
+    def _path(self, blob):
+        """Get the path of the entry for a blob.
+
+        :type blob: :class:`~google.cloud.storage.blob.Blob`
+        :param blob: The blob, with a known generation.
+
+        :rtype: str
+        :returns: The path in the cache directory.
+        """
+        key = u'%s/%s#%d' % (blob.bucket.name, blob.name, blob.generation)
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest)
+
+    def _lock_filename(self):
+        """Get the path of the lock file.
+
+        :rtype: str
+        :returns: The path in the cache directory.
+        """
+        return os.path.join(self.directory, _LOCK_FILENAME)
+
+    def _size_filename(self):
+        """Get the path of the file recording the size of the entries.
+
+        :rtype: str
+        :returns: The path in the cache directory.
+        """
+        return os.path.join(self.directory, _SIZE_FILENAME)
+
+    def _read_total(self):
+        """Read the recorded total size of the entries.
+
+        Must be called with the lock file held.
+
+        :rtype: int
+        :returns: The size in bytes, or :data:`None` if it is not recorded.
+        """
+        try:
+            with open(self._size_filename(), 'r') as size_file:
+                return int(size_file.read())
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _write_total(self, total):
+        """Record the total size of the entries.
+
+        Must be called with the lock file held exclusively.
+
+        :type total: int
+        :param total: The size in bytes.
+        """
+        with open(self._size_filename(), 'w') as size_file:
+            size_file.write(str(total))
+
+    def _count(self, hit):
+        """Record a hit or a miss.
+
+        :type hit: bool
+        :param hit: Whether the lookup was a hit.
+
+        :rtype: bool
+        :returns: ``hit``.
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return hit
+
+    def __contains__(self, blob):
+        return os.path.exists(self._path(blob))
+
+    def read_into(self, blob, file_obj):
+        """Copy the cached contents of a blob into a file, if cached.
+
+        :type blob: :class:`~google.cloud.storage.blob.Blob`
+        :param blob: The blob, with a known generation.
+
+        :type file_obj: file
+        :param file_obj: A file handle to which to write the blob's data.
+
+        :rtype: bool
+        :returns: True if the blob was cached (a hit).
+        """
+        path = self._path(blob)
+        with _file_lock(self._lock_filename(), shared=True):
+            try:
+                cached = open(path, 'rb')
+            except (IOError, OSError):
+                return self._count(False)
+            # The modification time orders the entries for eviction.
+            os.utime(path, None)
+        # The open file stays readable if the entry is evicted meanwhile,
+        # so other processes need not wait for the copy.
+        with cached:
+            size = os.fstat(cached.fileno()).st_size
+            if blob.size is not None and size != blob.size:
+                return self._count(False)
+            shutil.copyfileobj(cached, file_obj)
+        return self._count(True)
+
+    @contextlib.contextmanager
+    def adding(self, blob):
+        """Add the contents of a blob, written to a temporary file.
+
+        The entry is only added if the block completes without error.
+
+        :type blob: :class:`~google.cloud.storage.blob.Blob`
+        :param blob: The blob, with a known generation.
+
+        :rtype: file
+        :returns: The file to write the contents to.
+        """
+        fd, temp_path = tempfile.mkstemp(
+            prefix=_TEMP_PREFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                yield temp_file
+            path = self._path(blob)
+            with _file_lock(self._lock_filename()):
+                size = os.path.getsize(temp_path)
+                replaced = _file_size(path)
+                try:
+                    _replace(temp_path, path)
+                except OSError:  # pragma: NO COVER  Python2 on Windows
+                    size = replaced  # Added by another process meanwhile.
+                total = self._read_total()
+                if total is not None:
+                    total += size - replaced
+                if total is None or total > self.max_bytes:
+                    total = self._evict()
+                self._write_total(total)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def add_file(self, blob, filename):
+        """Add the contents of a blob, downloaded to a file.
+
+        :type blob: :class:`~google.cloud.storage.blob.Blob`
+        :param blob: The blob, with a known generation.
+
+        :type filename: str
+        :param filename: The path of the file.
+        """
+        with self.adding(blob) as cache_file:
+            with open(filename, 'rb') as file_obj:
+                shutil.copyfileobj(file_obj, cache_file)
+
+    def _evict(self):
+        """List the entries, removing the least recently used if too many.
+
+        If the entries are larger than ``max_bytes``, they are trimmed to
+        80% of it. Also removes the unfinished downloads of processes which
+        died. Must be called with the lock file held.
+
+        :rtype: int
+        :returns: The total size of the remaining entries.
+        """
+        stale = time.time() - _STALE_TEMP_SECONDS
+        entries = []
+        total = 0
+        for filename in os.listdir(self.directory):
+            path = os.path.join(self.directory, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # A failed download, removed meanwhile.
+            if filename.startswith(_TEMP_PREFIX):
+                if stat.st_mtime < stale:
+                    os.remove(path)
+            elif filename not in (_LOCK_FILENAME, _SIZE_FILENAME):
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        if total > self.max_bytes:
+            target = int(self.max_bytes * _EVICT_TO)
+            entries.sort()
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                os.remove(path)
+                total -= size
+                with self._lock:
+                    self.evictions += 1
+        return total
+
+    def _entry_filenames(self):
+        """List the names of the entry files.
+
+        :rtype: list of str
+        :returns: The filenames, without the lock and temporary files.
+        """
+        return [filename for filename in os.listdir(self.directory)
+                if not filename.startswith('.')]
+
+    def size(self):
+        """Get the total size of the entries.
+
+        :rtype: int
+        :returns: The size in bytes.
+        """
+        with _file_lock(self._lock_filename(), shared=True):
+            return sum(os.path.getsize(os.path.join(self.directory, name))
+                       for name in self._entry_filenames())
+
+    def clear(self):
+        """Remove all entries."""
+        with _file_lock(self._lock_filename()):
+            for filename in self._entry_filenames():
+                os.remove(os.path.join(self.directory, filename))
+            self._write_total(0)
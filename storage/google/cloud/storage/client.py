@@ -19,6 +19,7 @@ from google.cloud._helpers import _LocalStack
 from google.cloud.client import ClientWithProject
 from google.cloud.exceptions import NotFound
 from google.cloud.iterator import HTTPIterator
+from google.cloud.storage._helpers import _metadata_cache
 from google.cloud.storage._http import Connection
 from google.cloud.storage.batch import Batch
 from google.cloud.storage.bucket import Bucket
@@ -46,6 +47,14 @@ class Client(ClientWithProject):
                   ``credentials`` for the current object.
                   This parameter should be considered private, and could
                   change in the future.
+
+    :type metadata_cache: :class:`~google.cloud.storage.cache.MetadataCache`
+    :param metadata_cache: (Optional) Cache for the metadata of buckets and
+                           blobs looked up with this client.
+
+    :type download_cache: :class:`~google.cloud.storage.cache.DownloadCache`
+    :param download_cache: (Optional) On-disk cache for the contents of blobs
+                           downloaded with this client.
     """
 
     SCOPE = ('https://www.googleapis.com/auth/devstorage.full_control',
@@ -53,12 +62,15 @@ class Client(ClientWithProject):
              'https://www.googleapis.com/auth/devstorage.read_write')
     """The scopes required for authenticating as a Cloud Storage consumer."""
 
-    def __init__(self, project=None, credentials=None, _http=None):
+    def __init__(self, project=None, credentials=None, _http=None,
+                 metadata_cache=None, download_cache=None):
         self._base_connection = None
         super(Client, self).__init__(project=project, credentials=credentials,
                                      _http=_http)
         self._connection = Connection(self)
         self._batch_stack = _LocalStack()
+        self.metadata_cache = metadata_cache
+        self.download_cache = download_cache
 
     @property
     def _connection(self):
@@ -290,4 +302,7 @@ def _item_to_bucket(iterator, item):
     name = item.get('name')
     bucket = Bucket(iterator.client, name)
     bucket._set_properties(item)
+    cache = _metadata_cache(iterator.client)
+    if cache is not None:
+        cache.refresh(bucket.path, item)
     return bucket
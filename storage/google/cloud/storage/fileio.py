@@ -0,0 +1,460 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""File-like objects reading and writing blobs.
+
+Usually created with :meth:`Blob.open <google.cloud.storage.blob.Blob.open>`::
+
+    >>> with blob.open('rb') as file_obj:
+    ...     file_obj.seek(-8, os.SEEK_END)
+    ...     footer = file_obj.read(8)
+    >>> with other_blob.open('wb') as file_obj:
+    ...     for record in records:
+    ...         file_obj.write(record)
+"""
+
+import collections
+import io
+import os
+
+from google import resumable_media
+from google.resumable_media.requests import Download
+
+from google.cloud.storage._helpers import _Checksums
+from google.cloud.storage._helpers import _invalidate_metadata
+from google.cloud.storage.blob import _get_encryption_headers
+from google.cloud.storage.blob import _raise_from_invalid_response
+
+
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+"""Default size (1 MB) of the blocks read by :class:`BlobReader`."""
+
+DEFAULT_CHUNK_SIZE = 40 * 256 * 1024
+"""Default size (10 MB) of the chunks uploaded by :class:`BlobWriter`."""
+
+_DEFAULT_CACHE_BLOCKS = 8
+"""Default number of blocks kept by :class:`BlobReader`."""
+
+_DEFAULT_READ_AHEAD = 4
+"""Default number of blocks read at once when reading sequentially."""
+
+
+class BlobReader(io.RawIOBase):
+    """A seekable, read-only file-like object over the contents of a blob.
+
+    Data is read in blocks of ``block_size`` bytes, each with a ranged
+    request, and the most recently used ``cache_blocks`` blocks are kept.
+    When reading sequentially, ``read_ahead`` blocks are requested at once.
+    Seeking elsewhere (e.g. to the footer of a large file) only reads the
+    blocks needed there.
+
+    The blob's metadata is loaded when opening if its size is not known.
+    Data is read from the generation current then, if the blob was
+    loaded from the API.
+
+    Unlike :meth:`~google.cloud.storage.blob.Blob.download_to_file`,
+    the data is not checked against the blob's checksums.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to read.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type block_size: int
+    :param block_size: (Optional) The number of bytes in each block.
+
+    :type cache_blocks: int
+    :param cache_blocks: (Optional) The number of blocks kept.
+
+    :type read_ahead: int
+    :param read_ahead: (Optional) The number of blocks requested at once
+                       when reading sequentially.
+    """
+
+    def __init__(self, blob, client=None, block_size=DEFAULT_BLOCK_SIZE,
+                 cache_blocks=_DEFAULT_CACHE_BLOCKS,
+                 read_ahead=_DEFAULT_READ_AHEAD):
+        super(BlobReader, self).__init__()
+        if blob.size is None:
+            blob.reload(client=client)
+        self.blob = blob
+        self.block_size = block_size
+        self.cache_blocks = cache_blocks
+        self.read_ahead = read_ahead
+        self._size = blob.size
+        self._download_url = blob._get_download_url()
+        self._headers = _get_encryption_headers(blob._encryption_key)
+        self._transport = blob._make_transport(client)
+        self._position = 0
+        self._blocks = collections.OrderedDict()
+        self._next_block = 0  # Reading this block continues a sequence.
+
+    def readable(self):
+        """Whether the object can be read.
+
+        :rtype: bool
+        :returns: True.
+        """
+        return True
+
+    def seekable(self):
+        """Whether the object supports random access.
+
+        :rtype: bool
+        :returns: True.
+        """
+        return True
+
+    def tell(self):
+        """Get the current position.
+
+        :rtype: int
+        :returns: The offset of the next byte read.
+        """
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Change the current position.
+
+        Does not make any request.
+
+        :type offset: int
+        :param offset: The offset, relative to ``whence``.
+
+        :type whence: int
+        :param whence: (Optional) :data:`os.SEEK_SET` (the start, the
+                       default), :data:`os.SEEK_CUR` (the current position)
+                       or :data:`os.SEEK_END` (the end).
+
+        :rtype: int
+        :returns: The new position.
+
+        :raises: :exc:`ValueError` if the new position would be negative, or
+                 ``whence`` is invalid.
+        """
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError('Invalid whence: %r' % (whence,))
+        if position < 0:
+            raise ValueError('Negative seek position %d' % (position,))
+        self._position = position
+        return position
+
+    def readinto(self, buffer_):
+        """Read bytes into a buffer.
+
+        :type buffer_: bytearray
+        :param buffer_: The (writable) buffer to fill.
+
+        :rtype: int
+        :returns: The number of bytes read, which is only less than the
+                  size of ``buffer_`` at the end of the blob.
+        """
+        view = memoryview(buffer_)
+        num_read = 0
+        while num_read < len(view) and self._position < self._size:
+            index, offset = divmod(self._position, self.block_size)
+            block = self._get_block(index)
+            count = min(len(view) - num_read, len(block) - offset)
+            view[num_read:num_read + count] = block[offset:offset + count]
+            num_read += count
+            self._position += count
+        return num_read
+
+    def _get_block(self, index):
+        """Get a block, from the cache or the API.
+
+        :type index: int
+        :param index: The index of the block.
+
+        :rtype: bytes
+        :returns: The data in the block.
+        """
+        block = self._blocks.pop(index, None)
+        if block is None:
+            count = self.read_ahead if index == self._next_block else 1
+            self._fetch_blocks(index, count)
+            block = self._blocks.pop(index)
+        self._blocks[index] = block  # Now most recently used.
+        return block
+
+    def _fetch_blocks(self, index, count):
+        """Read blocks with a single ranged request, and cache them.
+
+        :type index: int
+        :param index: The index of the first block.
+
+        :type count: int
+        :param count: The number of blocks (fewer are read at the end of
+                      the blob).
+        """
+        start = index * self.block_size
+        end = min(start + count * self.block_size, self._size)
+        download = Download(
+            self._download_url, start=start, end=end - 1,
+            headers=dict(self._headers))
+        try:
+            response = download.consume(self._transport)
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc, self._download_url)
+
+        data = response.content
+        for offset in range(0, len(data), self.block_size):
+            self._blocks[index] = data[offset:offset + self.block_size]
+            index += 1
+        self._next_block = index
+        while len(self._blocks) > max(self.cache_blocks, count):
+            self._blocks.popitem(last=False)
+
+
+class BlobWriter(io.RawIOBase):
+    """A write-only file-like object uploading the contents of a blob.
+
+    Data is uploaded in chunks of ``chunk_size`` bytes as it is written,
+    through a resumable upload session, so at most one chunk is buffered.
+    If less than one chunk is written in total, it is uploaded with a
+    single request when closing instead. The blob only exists once the
+    writer is closed; if a ``with`` block using the writer raises an
+    exception, the blob is not created.
+
+    The data written is checked against the checksums reported by the
+    server for the new blob.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to write.
+
+    :type content_type: str
+    :param content_type: (Optional) Type of content being uploaded.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The number of bytes in each chunk, a
+                       multiple of 256 KB. Defaults to the blob's
+                       ``chunk_size``, if set.
+
+    :raises: :exc:`ValueError` if ``chunk_size`` is not a multiple of
+             256 KB.
+    """
+
+    def __init__(self, blob, content_type=None, client=None,
+                 chunk_size=None):
+        super(BlobWriter, self).__init__()
+        if chunk_size is None:
+            chunk_size = blob.chunk_size or DEFAULT_CHUNK_SIZE
+        if chunk_size % blob._CHUNK_SIZE_MULTIPLE != 0:
+            raise ValueError(
+                'Chunk size must be a multiple of %d.' % (
+                    blob._CHUNK_SIZE_MULTIPLE,))
+        self.blob = blob
+        self.content_type = content_type
+        self.client = client
+        self.chunk_size = chunk_size
+        self._buffer = _ChunkBuffer()
+        self._checksums = _Checksums()
+        self._upload = None
+        self._transport = None
+
+    def writable(self):
+        """Whether the object can be written.
+
+        :rtype: bool
+        :returns: True.
+        """
+        return True
+
+    def tell(self):
+        """Get the number of bytes written.
+
+        :rtype: int
+        :returns: The number of bytes written.
+        """
+        return self._buffer.end
+
+    def write(self, data):
+        """Write bytes, uploading each chunk once it is complete.
+
+        :type data: bytes
+        :param data: The bytes to write.
+
+        :rtype: int
+        :returns: The number of bytes written (all of them).
+
+        :raises: :exc:`ValueError` if the writer is closed.
+        """
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        data = bytes(data)
+        self._buffer.write(data)
+        self._checksums.update(data)
+        while self._buffer.end - self._buffer.tell() >= self.chunk_size:
+            if self._upload is None:
+                self._upload, self._transport = (
+                    self.blob._initiate_resumable_upload(
+                        self.client, self._buffer, self.content_type, None,
+                        None, chunk_size=self.chunk_size))
+            self._transmit_next_chunk()
+        return len(data)
+
+    def _transmit_next_chunk(self):
+        """Upload the next chunk and drop it from the buffer.
+
+        :rtype: :class:`requests.Response`
+        :returns: The response to the request.
+        """
+        try:
+            response = self._upload.transmit_next_chunk(self._transport)
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+        self._buffer.discard_before(self._upload.bytes_uploaded)
+        return response
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Do not create a blob from partial data.
+            super(BlobWriter, self).close()
+
+    def close(self):
+        """Upload the remaining data and finish the blob.
+
+        The blob's properties are updated from the response.
+
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError` if the
+                 upload fails, or :exc:`ValueError` if the data uploaded
+                 does not match the checksum reported by the server.
+        """
+        if self.closed:
+            return
+        try:
+            if self._upload is None:
+                self._buffer.seek(0)
+                self.blob.upload_from_file(
+                    self._buffer, size=self._buffer.end,
+                    content_type=self.content_type, client=self.client)
+                return
+
+            try:
+                while not self._upload.finished:
+                    response = self._transmit_next_chunk()
+            finally:
+                _invalidate_metadata(
+                    self.blob._require_client(self.client), self.blob.path)
+            created_json = response.json()
+            self.blob._set_properties(created_json)
+            self.blob._check_checksums(
+                self._checksums, created_json.get('md5Hash'),
+                created_json.get('crc32c'), 'uploading')
+        finally:
+            super(BlobWriter, self).close()
+
+
+class _ChunkBuffer(object):
+    """The bytes of a stream which have been written but not uploaded.
+
+    Positions are offsets in the whole stream, as expected by a
+    :class:`~google.resumable_media.requests.ResumableUpload` reading from
+    it. Data before the position passed to :meth:`discard_before` is
+    dropped.
+    """
+
+    def __init__(self):
+        self._data = bytearray()
+        self._start = 0  # Stream offset of ``_data[0]``.
+        self._position = 0
+
+    @property
+    def end(self):
+        """The number of bytes written.
+
+        :rtype: int
+        :returns: The stream offset after the last byte written.
+        """
+        return self._start + len(self._data)
+
+    def write(self, data):
+        """Append bytes to the stream.
+
+        :type data: bytes
+        :param data: The bytes to append.
+        """
+        self._data.extend(data)
+
+    def read(self, size=-1):
+        """Read bytes from the current position.
+
+        :type size: int
+        :param size: (Optional) The most bytes to read. Defaults to all.
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        offset = self._position - self._start
+        if size is None or size < 0:
+            size = len(self._data) - offset
+        data = bytes(self._data[offset:offset + size])
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        """Get the current position.
+
+        :rtype: int
+        :returns: The current stream offset.
+        """
+        return self._position
+
+    def seek(self, position, whence=os.SEEK_SET):
+        """Change the current position.
+
+        :type position: int
+        :param position: The stream offset (or, if ``whence`` is
+                         :data:`os.SEEK_END`, the offset from the end).
+
+        :type whence: int
+        :param whence: (Optional) :data:`os.SEEK_SET` or
+                       :data:`os.SEEK_END`.
+
+        :rtype: int
+        :returns: The new position.
+
+        :raises: :exc:`ValueError` if the data at ``position`` was dropped.
+        """
+        if whence == os.SEEK_END:
+            position += self.end
+        if position < self._start:
+            raise ValueError(
+                'Cannot seek to %d; data before %d was discarded.' % (
+                    position, self._start))
+        self._position = position
+        return position
+
+    def discard_before(self, position):
+        """Drop the data before a position.
+
+        :type position: int
+        :param position: The stream offset of the first byte to keep.
+        """
+        del self._data[:position - self._start]
+        self._start = position
@@ -0,0 +1,317 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generate many signed URLs with a single service account key.
+
+:meth:`Blob.generate_signed_url() \
+<google.cloud.storage.blob.Blob.generate_signed_url>` is convenient for
+one URL at a time. To sign URLs in bulk, load the key once and sign whole
+lists of blobs::
+
+    >>> from google.cloud import storage
+    >>> generator = storage.SignedUrlGenerator.from_service_account_json(
+    ...     'key.json')
+    >>> bucket = storage.Client().bucket('my-bucket')
+    >>> urls = generator.sign_many([
+    ...     (bucket.blob('a.jpg'), 'GET', 1500000000),
+    ...     (bucket.blob('b.jpg'), 'PUT', 1500000000),
+    ... ])
+
+Signing is CPU bound, so a large list may be split across a pool of
+``processes``.
+"""
+
+import base64
+import json
+import multiprocessing
+
+import google.auth.credentials
+from google.auth import crypt
+import six
+from six.moves.urllib.parse import quote_plus
+from six.moves.urllib.parse import urlencode
+
+from google.cloud.credentials import _get_expiration_seconds
+from google.cloud.storage.blob import _API_ACCESS_ENDPOINT
+from google.cloud.storage.blob import _quote
+
+
+_worker_generator = None
+"""The generator used by each process of a :meth:`sign_many` pool."""
+
+
+def _init_worker(service_account_info, api_access_endpoint):
+    """Load the signing key once in a pool process.
+
+    :type service_account_info: dict
+    :param service_account_info: The service account key.
+
+    :type api_access_endpoint: str
+    :param api_access_endpoint: The base of the signed URLs.
+    """
+    global _worker_generator
+    _worker_generator = SignedUrlGenerator.from_service_account_info(
+        service_account_info, api_access_endpoint=api_access_endpoint)
+
+
+def _sign_in_worker(requests):
+    """Sign URLs in a pool process.
+
+    :type requests: list of tuple
+    :param requests: ``(resource, method, expiration)`` tuples.
+
+    :rtype: list of str
+    :returns: The signed URLs.
+    """
+    return [_worker_generator._sign_resource(*request)
+            for request in requests]
+
+
+class SignedUrlGenerator(object):
+    """Generate signed URLs for blobs, reusing one signer.
+
+    The URLs are the same as those of
+    :meth:`~google.cloud.storage.blob.Blob.generate_signed_url`, but the
+    private key is parsed once and the parts of the URL which only depend
+    on the key are computed once.
+
+    :type signer: :class:`google.auth.crypt.Signer`
+    :param signer: The signer holding the service account's private key.
+
+    :type signer_email: str
+    :param signer_email: The email of the service account.
+
+    :type api_access_endpoint: str
+    :param api_access_endpoint: (Optional) The base of the signed URLs.
+                                Defaults to
+                                ``https://storage.googleapis.com``.
+    """
+
+    _service_account_info = None
+
+    def __init__(self, signer, signer_email,
+                 api_access_endpoint=_API_ACCESS_ENDPOINT):
+        self.signer = signer
+        self.signer_email = signer_email
+        self.api_access_endpoint = api_access_endpoint
+        self._query_prefix = '?%s&Expires=' % (
+            urlencode({'GoogleAccessId': signer_email}),)
+
+    @classmethod
+    def from_service_account_info(cls, info, **kwargs):
+        """Create a generator from a parsed service account key.
+
+        Only generators created from the key itself can sign URLs in a
+        process pool.
+
+        :type info: dict
+        :param info: The service account key, in the JSON key file format.
+
+        :type kwargs: dict
+        :param kwargs: Remaining keyword arguments to pass to the
+                       constructor.
+
+        :rtype: :class:`SignedUrlGenerator`
+        :returns: The generator.
+        """
+        signer = crypt.RSASigner.from_service_account_info(info)
+        generator = cls(signer, info['client_email'], **kwargs)
+        generator._service_account_info = info
+        return generator
+
+    @classmethod
+    def from_service_account_json(cls, json_credentials_path, **kwargs):
+        """Create a generator from a service account JSON key file.
+
+        :type json_credentials_path: str
+        :param json_credentials_path: The path of the key file.
+
+        :type kwargs: dict
+        :param kwargs: Remaining keyword arguments to pass to the
+                       constructor.
+
+        :rtype: :class:`SignedUrlGenerator`
+        :returns: The generator.
+        """
+        with open(json_credentials_path, 'r') as file_obj:
+            info = json.load(file_obj)
+        return cls.from_service_account_info(info, **kwargs)
+
+    @classmethod
+    def from_credentials(cls, credentials, **kwargs):
+        """Create a generator using the signer of some credentials.
+
+        :type credentials: :class:`google.auth.credentials.Signing`
+        :param credentials: Credentials with a private key, such as
+                            those of a client created from a service account
+                            key file.
+
+        :type kwargs: dict
+        :param kwargs: Remaining keyword arguments to pass to the
+                       constructor.
+
+        :rtype: :class:`SignedUrlGenerator`
+        :returns: The generator.
+
+        :raises AttributeError: If the credentials cannot sign.
+        """
+        if not isinstance(credentials, google.auth.credentials.Signing):
+            raise AttributeError(
+                'Signed URLs need credentials with a private key, not %s.' %
+                (type(credentials),))
+        return cls(credentials.signer, credentials.signer_email, **kwargs)
+
+    def _sign_resource(self, resource, method, expiration,
+                       content_md5=None, content_type=None):
+        """Sign the URL of a resource.
+
+        :type resource: str
+        :param resource: The quoted path of the resource.
+
+        :type method: str
+        :param method: The HTTP verb of requests for the URL.
+
+        :type expiration: int
+        :param expiration: The expiration as seconds since the epoch.
+
+        :type content_md5: str
+        :param content_md5: (Optional) The MD5 hash of the resource.
+
+        :type content_type: str
+        :param content_type: (Optional) The content type of the resource.
+
+        :rtype: str
+        :returns: The signed URL, without optional query parameters.
+        """
+        string_to_sign = '\n'.join([
+            method,
+            content_md5 or '',
+            content_type or '',
+            str(expiration),
+            resource])
+        signature = base64.b64encode(self.signer.sign(string_to_sign))
+        return ''.join([
+            self.api_access_endpoint, resource, self._query_prefix,
+            str(expiration), '&Signature=', quote_plus(signature)])
+
+    def sign(self, blob, expiration, method='GET', content_md5=None,
+             content_type=None, response_type=None,
+             response_disposition=None, generation=None):
+        """Generate a signed URL for a blob.
+
+        :type blob: :class:`~google.cloud.storage.blob.Blob`
+        :param blob: The blob to access with the URL.
+
+        :type expiration: int, long, datetime.datetime, datetime.timedelta
+        :param expiration: When the signed URL should expire.
+
+        :type method: str
+        :param method: (Optional) The HTTP verb that will be used when
+                       requesting the URL. Defaults to ``'GET'``.
+
+        :type content_md5: str
+        :param content_md5: (Optional) The MD5 hash of the blob.
+
+        :type content_type: str
+        :param content_type: (Optional) The content type of the blob.
+
+        :type response_type: str
+        :param response_type: (Optional) Content type of responses to
+                              requests for the signed URL.
+
+        :type response_disposition: str
+        :param response_disposition: (Optional) Content disposition of
+                                     responses to requests for the signed
+                                     URL.
+
+        :type generation: str
+        :param generation: (Optional) A value that indicates which generation
+                           of the blob to fetch.
+
+        :rtype: str
+        :returns: A signed URL you can use to access the blob until
+                  expiration.
+        """
+        url = self._sign_resource(
+            _blob_resource(blob), method,
+            _get_expiration_seconds(expiration),
+            content_md5=content_md5, content_type=content_type)
+        query_params = []
+        if response_type is not None:
+            query_params.append(('response-content-type', response_type))
+        if response_disposition is not None:
+            query_params.append(
+                ('response-content-disposition', response_disposition))
+        if generation is not None:
+            query_params.append(('generation', generation))
+        if query_params:
+            url += '&' + urlencode(query_params)
+        return url
+
+    def sign_many(self, requests, processes=None):
+        """Generate signed URLs for many blobs.
+
+        :type requests: iterable
+        :param requests: ``(blob, method, expiration)`` tuples, with the
+                         arguments of :meth:`sign`.
+
+        :type processes: int
+        :param processes: (Optional) If passed, sign the URLs in a pool of
+                          this many processes, each loading the key once.
+                          Only possible for generators created from the
+                          service account key. Worthwhile for thousands of
+                          URLs.
+
+        :rtype: list of str
+        :returns: The signed URL for each request, in order.
+
+        :raises ValueError: If ``processes`` is passed but the generator
+                            was not created from a service account key.
+        """
+        requests = [
+            (_blob_resource(blob), method,
+             _get_expiration_seconds(expiration))
+            for blob, method, expiration in requests]
+        if processes is None:
+            return [self._sign_resource(*request) for request in requests]
+
+        if self._service_account_info is None:
+            raise ValueError(
+                'Signing in processes needs a generator created from the '
+                'service account key.')
+        # Send each process a few large lists rather than many tiny tasks.
+        size = max(1, -(-len(requests) // (4 * processes)))
+        chunks = [requests[start:start + size]
+                  for start in six.moves.range(0, len(requests), size)]
+        pool = multiprocessing.Pool(
+            processes, initializer=_init_worker,
+            initargs=(self._service_account_info, self.api_access_endpoint))
+        try:
+            results = pool.map(_sign_in_worker, chunks)
+        finally:
+            pool.terminate()
+        return [url for chunk in results for url in chunk]
+
+
+def _blob_resource(blob):
+    """Get the path of a blob in signed URLs.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob.
+
+    :rtype: str
+    :returns: The bucket name and quoted blob name.
+    """
+    return '/{bucket_name}/{quoted_name}'.format(
+        bucket_name=blob.bucket.name, quoted_name=_quote(blob.name))
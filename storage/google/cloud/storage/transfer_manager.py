@@ -0,0 +1,521 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Transfer many files between a local directory and a bucket.
+
+Mirror a directory into a bucket (or a bucket into a directory), only
+transferring the files which differ::
+
+    >>> from google.cloud import storage
+    >>> from google.cloud.storage import transfer_manager
+    >>> bucket = storage.Client().bucket('my-bucket')
+    >>> result = transfer_manager.sync('photos', bucket, prefix='photos/')
+    >>> result.transferred
+    ['2017/beach.jpg', '2017/sunset.jpg']
+
+or copy many blobs between buckets, server-side::
+
+    >>> destination = storage.Client().bucket('my-archive')
+    >>> results = transfer_manager.copy_many(
+    ...     [(blob, destination.blob(blob.name))
+    ...      for blob in bucket.list_blobs(prefix='photos/')],
+    ...     storage_class='COLDLINE')
+"""
+
+import collections
+import os
+import threading
+
+from google.cloud._helpers import _bytes_to_unicode
+from google.cloud._http import _max_concurrent_requests
+from google.cloud.exceptions import NotFound
+from google.cloud.storage._helpers import _base64_crc32c
+from google.cloud.storage._helpers import _base64_md5hash
+from google.cloud.storage._helpers import _filename_below
+from google.cloud.storage.blob import _call_concurrently
+from google.cloud.storage.batch import _check_max_workers
+from google.cloud.storage.blob import Blob
+from google.cloud.storage.blob import _COMPOSITE_STATE_SUFFIX
+
+
+UPLOAD = 'upload'
+"""Sync direction copying local files to the bucket."""
+
+DOWNLOAD = 'download'
+"""Sync direction copying blobs to the local directory."""
+
+DEFAULT_MAX_WORKERS = 8
+"""Default number of files transferred concurrently."""
+
+PARALLEL_THRESHOLD = 150 * 1024 * 1024
+"""Default size (150 MB) from which files are transferred in parts."""
+
+DEFAULT_PARALLELISM = 4
+"""Default number of parts of a large file transferred concurrently."""
+
+_MTIME_METADATA_KEY = 'goog-reserved-file-mtime'
+"""Blob metadata key recording the modification time of uploaded files.
+
+The same key is used by ``gsutil rsync``.
+"""
+
+_LIST_FIELDS = (
+    'items(name,size,md5Hash,crc32c,updated,metadata),nextPageToken')
+"""The blob properties needed to compare blobs with files."""
+
+
+SyncResult = collections.namedtuple('SyncResult', ['transferred', 'deleted'])
+"""The result of :func:`sync`.
+
+The relative names of the files transferred and of those deleted (when
+syncing with ``delete=True``), each sorted.
+"""
+
+
+def _list_local(local_dir):
+    """Find the files below a directory.
+
+    Skips the state files of interrupted composite uploads.
+
+    :type local_dir: str
+    :param local_dir: The path of the directory.
+
+    :rtype: dict
+    :returns: The ``os.stat`` result for each file, keyed by its path
+              relative to ``local_dir`` with ``/`` separators.
+    """
+    files = {}
+    for dirpath, _, filenames in os.walk(local_dir):
+        for filename in filenames:
+            if filename.endswith(_COMPOSITE_STATE_SUFFIX):
+                continue
+            path = os.path.join(dirpath, filename)
+            relative = os.path.relpath(path, local_dir)
+            files[relative.replace(os.sep, '/')] = os.stat(path)
+    return files
+
+
+def _list_remote(bucket, prefix, client):
+    """Find the blobs with a prefix.
+
+    Skips the placeholder blobs of "directories" (whose names end in
+    ``/``).
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket to list.
+
+    :type prefix: str
+    :param prefix: The prefix of the blob names.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.
+
+    :rtype: dict
+    :returns: Each :class:`~google.cloud.storage.blob.Blob`, keyed by its
+              name without ``prefix``.
+    """
+    blobs = {}
+    iterator = bucket.list_blobs(
+        prefix=prefix or None, fields=_LIST_FIELDS, client=client)
+    for blob in iterator:
+        relative = blob.name[len(prefix):]
+        if relative and not relative.endswith('/'):
+            blobs[relative] = blob
+    return blobs
+
+
+def _blob_mtime(blob):
+    """Get the modification time of the file a blob was uploaded from.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob.
+
+    :rtype: int
+    :returns: The modification time in seconds since the epoch, or
+              :data:`None` if it was not recorded when uploading.
+    """
+    value = (blob.metadata or {}).get(_MTIME_METADATA_KEY)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def _same_contents(filename, blob):
+    """Check whether a file has the contents of a blob.
+
+    Compares the MD5 hash or, for composite blobs which have none, the
+    CRC32C checksum.
+
+    :type filename: str
+    :param filename: The path of the file.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob.
+
+    :rtype: bool
+    :returns: True if the checksums match.
+    """
+    if blob.md5_hash is not None:
+        checksum, expected = _base64_md5hash, blob.md5_hash
+    elif blob.crc32c is not None:
+        checksum, expected = _base64_crc32c, blob.crc32c
+    else:
+        return False
+    with open(filename, 'rb') as file_obj:
+        return _bytes_to_unicode(checksum(file_obj)) == expected
+
+
+def _needs_transfer(filename, file_stat, blob):
+    """Check whether a file and a blob differ.
+
+    They differ if their sizes do. If not, they are the same if the blob
+    records the file's modification time; otherwise their checksums are
+    compared.
+
+    :type filename: str
+    :param filename: The path of the file.
+
+    :type file_stat: :class:`os.stat_result`
+    :param file_stat: The status of the file.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob.
+
+    :rtype: bool
+    :returns: True if the file and blob differ.
+    """
+    if file_stat.st_size != blob.size:
+        return True
+    if _blob_mtime(blob) == int(file_stat.st_mtime):
+        return False
+    return not _same_contents(filename, blob)
+
+
+def _upload(bucket, blob_name, filename, file_stat, client,
+            parallel_threshold, parallelism, compose_slots):
+    """Upload a file, recording its modification time.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket to upload to.
+
+    :type blob_name: str
+    :param blob_name: The name of the blob to upload.
+
+    :type filename: str
+    :param filename: The path of the file.
+
+    :type file_stat: :class:`os.stat_result`
+    :param file_stat: The status of the file.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.
+
+    :type parallel_threshold: int
+    :param parallel_threshold: The size from which the file is uploaded as
+                               composed parts.
+
+    :type parallelism: int
+    :param parallelism: The number of parts of a large file.
+
+    :type compose_slots: :class:`threading.BoundedSemaphore`
+    :param compose_slots: Held while uploading a file in parts, whose
+                          compose and delete requests are sent through the
+                          client's connection.
+    """
+    blob = bucket.blob(blob_name)
+    blob.metadata = {_MTIME_METADATA_KEY: str(int(file_stat.st_mtime))}
+    if file_stat.st_size < parallel_threshold:
+        blob.upload_from_filename(filename, client=client, parallelism=None)
+        return
+    with compose_slots:
+        blob.upload_from_filename(
+            filename, client=client, parallelism=parallelism)
+
+
+def _download(blob, filename, client, parallel_threshold, parallelism):
+    """Download a blob, creating its directory if needed.
+
+    The file's modification time is set to that recorded for the blob, if
+    any.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob.
+
+    :type filename: str
+    :param filename: The path of the file.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.
+
+    :type parallel_threshold: int
+    :param parallel_threshold: The size from which the blob is downloaded
+                               in slices.
+
+    :type parallelism: int
+    :param parallelism: The number of slices of a large blob.
+    """
+    dirname = os.path.dirname(filename)
+    try:
+        os.makedirs(dirname)
+    except OSError:
+        if not os.path.isdir(dirname):
+            raise
+    if blob.size is None or blob.size < parallel_threshold:
+        parallelism = None
+    blob.download_to_filename(
+        filename, client=client, parallelism=parallelism)
+    mtime = _blob_mtime(blob)
+    if mtime is not None:
+        os.utime(filename, (mtime, mtime))
+
+
+def sync(local_dir, bucket, prefix=u'', direction=UPLOAD, delete=False,
+         client=None, max_workers=DEFAULT_MAX_WORKERS,
+         parallel_threshold=PARALLEL_THRESHOLD,
+         parallelism=DEFAULT_PARALLELISM):
+    """Make the blobs with a prefix mirror the files below a directory.
+
+    The file at relative path ``a/b.txt`` corresponds to the blob named
+    ``prefix + 'a/b.txt'``, so ``prefix`` usually ends with ``/``. The
+    directory and the blobs are each listed once (the blobs a page of a
+    thousand at a time), then the files which are missing or differ on
+    the destination side are transferred, ``max_workers`` at a time.
+
+    A file and a blob differ if their sizes do or, if not, if the
+    modification time recorded when the file was uploaded (or the file's
+    MD5 hash, if none was recorded) does not match. Uploaded blobs record
+    the file's modification time in their metadata, and downloaded files
+    are given the recorded time, so unchanged files are not re-hashed when
+    syncing again.
+
+    Files smaller than ``parallel_threshold`` are sent in one request, or
+    as a resumable upload if larger than a few megabytes. Larger files are
+    uploaded in ``parallelism`` concurrent parts composed into the blob, or
+    downloaded in as many concurrent slices.
+
+    Each small transfer (and each part or slice of a large one) is sent
+    with a new transport, so any number of them may run at once. Composing
+    the parts of a large upload, and deleting blobs, uses the client's
+    connection, so those requests are only sent concurrently if the
+    client's ``_http`` is a (thread-safe)
+    :class:`~google.cloud._http.PooledHttp`.
+
+    :type local_dir: str
+    :param local_dir: The path of the directory.
+
+    :type bucket: :class:`~google.cloud.storage.bucket.Bucket`
+    :param bucket: The bucket holding the blobs.
+
+    :type prefix: str
+    :param prefix: (Optional) The prefix of the blob names. Defaults to the
+                   whole bucket.
+
+    :type direction: str
+    :param direction: (Optional) :data:`UPLOAD` (the default) to copy files
+                      to the bucket, or :data:`DOWNLOAD` to copy blobs to
+                      the directory.
+
+    :type delete: bool
+    :param delete: (Optional) If True, also delete the files (or blobs) at
+                   the destination which are missing at the source.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the bucket.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of files transferred
+                        concurrently. Defaults to
+                        :data:`DEFAULT_MAX_WORKERS`.
+
+    :type parallel_threshold: int
+    :param parallel_threshold: (Optional) The size from which files are
+                               transferred in parts. Defaults to
+                               :data:`PARALLEL_THRESHOLD`.
+
+    :type parallelism: int
+    :param parallelism: (Optional) The number of parts of a large file
+                        transferred concurrently. Defaults to
+                        :data:`DEFAULT_PARALLELISM`.
+
+    :rtype: :class:`SyncResult`
+    :returns: The relative names of the files transferred and deleted.
+
+    :raises: :exc:`ValueError` if ``direction`` is unknown, or (before
+             transferring anything) if the name of a blob to download
+             does not map to a file below ``local_dir``, e.g. because it
+             has a ``..`` segment. Otherwise, the first error raised by a
+             transfer or delete (after which the transfers not yet
+             started are cancelled).
+    """
+    if direction not in (UPLOAD, DOWNLOAD):
+        raise ValueError('Unknown sync direction: %r' % (direction,))
+    compose_slots = threading.BoundedSemaphore(
+        _max_concurrent_requests(bucket._require_client(client)))
+
+    local_files = _list_local(local_dir)
+    blobs = _list_remote(bucket, prefix, client)
+    if direction == UPLOAD:
+        sources, destinations = local_files, blobs
+    else:
+        sources, destinations = blobs, local_files
+    filenames = dict(
+        (relative, _filename_below(local_dir, relative))
+        for relative in set(sources) | set(local_files))
+
+    def sync_one(relative):
+        """Transfer one file if it differs, returning its name if it did."""
+        filename = filenames[relative]
+        file_stat = local_files.get(relative)
+        blob = blobs.get(relative)
+        if (file_stat is not None and blob is not None and
+                not _needs_transfer(filename, file_stat, blob)):
+            return None
+        if direction == UPLOAD:
+            _upload(bucket, prefix + relative, filename, file_stat, client,
+                    parallel_threshold, parallelism, compose_slots)
+        else:
+            _download(blob, filename, client, parallel_threshold,
+                      parallelism)
+        return relative
+
+    results = _call_concurrently(
+        sync_one, max_workers, [(relative,) for relative in sorted(sources)])
+    transferred = [relative for relative in results if relative is not None]
+
+    deleted = []
+    if delete:
+        deleted = sorted(set(destinations) - set(sources))
+        if direction == UPLOAD:
+            errors = bucket.bulk_delete(
+                [blobs[relative] for relative in deleted], client=client)
+            for error in errors:
+                if error is not None and not isinstance(error, NotFound):
+                    raise error
+        else:
+            for relative in deleted:
+                os.remove(filenames[relative])
+
+    return SyncResult(transferred, deleted)
+
+
+def _rewrite(source, destination, client, progress_callback):
+    """Rewrite a blob, calling the API until the rewrite is done.
+
+    :type source: :class:`~google.cloud.storage.blob.Blob`
+    :param source: The blob to copy.
+
+    :type destination: :class:`~google.cloud.storage.blob.Blob`
+    :param destination: The blob to copy to.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.
+
+    :type progress_callback: callable
+    :param progress_callback: (Optional) Called after each API call with
+                              ``source``, ``destination``, the bytes
+                              rewritten so far and the total bytes.
+
+    :rtype: :class:`~google.cloud.storage.blob.Blob`
+    :returns: ``destination``, with the properties of the new blob.
+    """
+    token = None
+    while True:
+        token, rewritten, total = destination.rewrite(
+            source, token=token, client=client)
+        if progress_callback is not None:
+            progress_callback(source, destination, rewritten, total)
+        if token is None:
+            return destination
+
+
+def copy_many(pairs, max_workers=None, client=None, storage_class=None,
+              progress_callback=None):
+    """Copy many blobs server-side, running several rewrites at once.
+
+    Each copy is a rewrite. When copying large blobs, especially between
+    locations or storage classes, the back-end copies part of the blob per
+    API call and returns a token to continue with, so each blob may take
+    many calls. Up to
+    ``max_workers`` of these loops run concurrently, and a failed copy
+    does not stop the others.
+
+    Concurrent requests need a thread-safe HTTP object, so blobs are only
+    copied concurrently if the client's ``_http`` is a
+    :class:`~google.cloud._http.PooledHttp` (one rewrite per connection).
+
+    :type pairs: iterable
+    :param pairs: ``(source, destination)`` pairs of
+                  :class:`~google.cloud.storage.blob.Blob`-s. Properties set
+                  on a destination blob (e.g. its metadata or
+                  :attr:`~google.cloud.storage.blob.Blob.storage_class`)
+                  are applied to the copy.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of blobs copied concurrently.
+                        Defaults to the size of the client's ``PooledHttp``,
+                        or 1 if it does not use one. More than 1 requires
+                        a ``PooledHttp``.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on each destination's bucket.
+
+    :type storage_class: str
+    :param storage_class: (Optional) The storage class of every copy, such
+                          as ``'COLDLINE'``.
+
+    :type progress_callback: callable
+    :param progress_callback: (Optional) Called after each API call with the
+                              source and destination blobs, the bytes
+                              rewritten so far and the size of the blob. It
+                              is called from several threads at once.
+
+    :rtype: list
+    :returns: For each pair (in order), the destination blob if it was
+              copied, otherwise the exception raised when copying it (e.g.
+              :class:`~google.cloud.exceptions.NotFound`, or a socket
+              error).
+
+    :raises: :exc:`ValueError` if ``storage_class`` is unknown, or if
+             ``max_workers`` is more than 1 but a client's ``_http`` is not
+             a :class:`~google.cloud._http.PooledHttp`.
+    """
+    pairs = list(pairs)
+    if storage_class is not None:
+        if storage_class not in Blob._STORAGE_CLASSES:
+            raise ValueError('Invalid storage class: %s' % (storage_class,))
+        for _, destination in pairs:
+            destination.storage_class = storage_class
+    if not pairs:
+        return []
+    clients = set(
+        destination._require_client(client) for _, destination in pairs)
+    if max_workers is None:
+        max_workers = min(
+            _max_concurrent_requests(pair_client) for pair_client in clients)
+    for pair_client in clients:
+        _check_max_workers(pair_client, max_workers)
+
+    def copy_one(source, destination):
+        """Copy one blob, returning the error if it fails."""
+        try:
+            return _rewrite(source, destination, client, progress_callback)
+        except Exception as exc:
+            return exc
+
+    return _call_concurrently(copy_one, max_workers, pairs)
@@ -56,6 +56,9 @@ REQUIREMENTS = [
     'google-resumable-media >= 0.1.1',
     'requests >= 2.0.0',
 ]
+EXTRAS_REQUIRE = {
+    ':python_version<"3.2"': ['futures >= 3.0.0'],
+}
 
 setup(
     name='google-cloud-storage',
@@ -68,5 +71,6 @@ setup(
     ],
     packages=find_packages(exclude=('tests*',)),
     install_requires=REQUIREMENTS,
+    extras_require=EXTRAS_REQUIRE,
     **SETUP_BASE
 )
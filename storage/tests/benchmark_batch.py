@@ -0,0 +1,134 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare parsing batch responses incrementally with the ``email`` package.
+
+Usage::
+
+    $ python tests/benchmark_batch.py [NUM_PARTS ...]
+
+For each batch size, builds a response with that many JSON object
+resources, then reports the time (and, on Python 3, the peak memory
+allocated) to unpack it with
+:func:`google.cloud.storage.batch._unpack_batch_response` and with the
+``email``-based parser it replaced.
+"""
+
+from email.parser import Parser
+import json
+import sys
+import timeit
+
+import httplib2
+import six
+
+from google.cloud.storage.batch import _unpack_batch_response
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: NO COVER  Python2
+    tracemalloc = None
+
+
+BOUNDARY = 'batch_DEADBEEF'
+RESPONSE = {'content-type': 'multipart/mixed; boundary=%s' % (BOUNDARY,)}
+REPEAT = 5
+
+
+def make_content(num_parts):
+    """Build a batch response with ``num_parts`` object resources."""
+    parts = []
+    for index in six.moves.range(num_parts):
+        body = json.dumps({
+            'kind': 'storage#object',
+            'name': 'logs/2017/%06d.json' % (index,),
+            'bucket': 'my-bucket',
+            'size': str(index * 1024),
+            'metadata': {'index': str(index)},
+        })
+        parts.append('\r\n'.join([
+            '--' + BOUNDARY,
+            'Content-Type: application/http',
+            'Content-ID: <response-%d>' % (index,),
+            '',
+            'HTTP/1.1 200 OK',
+            'Content-Type: application/json; charset=UTF-8',
+            'Content-Length: %d' % (len(body),),
+            '',
+            body,
+            '',
+        ]))
+    parts.append('--%s--\r\n' % (BOUNDARY,))
+    return ''.join(parts).encode('utf-8')
+
+
+def unpack_with_email(response, content):
+    """The former ``email``-based implementation, for comparison."""
+    parser = Parser()
+    faux_message = b''.join([
+        b'Content-Type: ',
+        response['content-type'].encode('utf-8'),
+        b'\nMIME-Version: 1.0\n\n',
+        content,
+    ])
+    if six.PY3:
+        faux_message = faux_message.decode('utf-8')
+    message = parser.parsestr(faux_message)
+
+    for subrequest in message._payload:
+        status_line, rest = subrequest._payload.split('\n', 1)
+        _, status, _ = status_line.split(' ', 2)
+        sub_message = parser.parsestr(rest)
+        payload = sub_message._payload
+        ctype = sub_message['Content-Type']
+        msg_headers = dict(sub_message._headers)
+        msg_headers['status'] = status
+        headers = httplib2.Response(msg_headers)
+        if ctype and ctype.startswith('application/json'):
+            payload = json.loads(payload)
+        yield headers, payload
+
+
+def measure(unpack, content):
+    """Return the best time and the peak memory to unpack ``content``."""
+    def run():
+        for _ in unpack(RESPONSE, content):
+            pass
+
+    seconds = min(timeit.repeat(run, number=1, repeat=REPEAT))
+    peak = None
+    if tracemalloc is not None:
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def main(sizes):
+    print('%8s  %-10s %10s %12s' % ('parts', 'parser', 'ms', 'peak KiB'))
+    for num_parts in sizes:
+        content = make_content(num_parts)
+        assert (list(_unpack_batch_response(RESPONSE, content)) ==
+                list(unpack_with_email(RESPONSE, content)))
+        for name, unpack in (('email', unpack_with_email),
+                             ('streaming', _unpack_batch_response)):
+            seconds, peak = measure(unpack, content)
+            peak = '-' if peak is None else '%d' % (peak // 1024,)
+            print('%8d  %-10s %10.1f %12s' % (
+                num_parts, name, seconds * 1000, peak))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10, 100, 1000])
@@ -0,0 +1,87 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare signing URLs one at a time with a ``SignedUrlGenerator``.
+
+Usage::
+
+    $ python tests/benchmark_signing.py [NUM_URLS [PROCESSES]]
+
+Signs ``NUM_URLS`` (default 200) URLs with a freshly generated key using
+:meth:`Blob.generate_signed_url() \
+<google.cloud.storage.blob.Blob.generate_signed_url>`, then with
+:meth:`SignedUrlGenerator.sign_many() \
+<google.cloud.storage.signing.SignedUrlGenerator.sign_many>`, in this
+process and in a pool of ``PROCESSES`` (default: the number of CPUs).
+"""
+
+import multiprocessing
+import sys
+import timeit
+
+from google.oauth2 import service_account
+import rsa
+
+from google.cloud.storage.bucket import Bucket
+from google.cloud.storage.signing import SignedUrlGenerator
+
+
+EXPIRATION = 1500000000
+
+
+def make_service_account_info():
+    """Generate a service account key."""
+    _, private_key = rsa.newkeys(2048)
+    return {
+        'client_email': 'benchmark@example.iam.gserviceaccount.com',
+        'private_key': private_key.save_pkcs1().decode('ascii'),
+        'token_uri': 'https://accounts.google.com/o/oauth2/token',
+    }
+
+
+def main(num_urls, processes):
+    info = make_service_account_info()
+    credentials = service_account.Credentials.from_service_account_info(info)
+    generator = SignedUrlGenerator.from_service_account_info(info)
+    bucket = Bucket(client=None, name='my-bucket')
+    blobs = [bucket.blob('logs/%06d.json' % (index,))
+             for index in range(num_urls)]
+    requests = [(blob, 'GET', EXPIRATION) for blob in blobs]
+
+    def one_at_a_time():
+        return [blob.generate_signed_url(EXPIRATION, credentials=credentials)
+                for blob in blobs]
+
+    def sign_many():
+        return generator.sign_many(requests)
+
+    def sign_many_in_processes():
+        return generator.sign_many(requests, processes=processes)
+
+    assert one_at_a_time() == sign_many() == sign_many_in_processes()
+    print('%d URLs' % (num_urls,))
+    for name, func in (
+            ('Blob.generate_signed_url', one_at_a_time),
+            ('sign_many', sign_many),
+            ('sign_many (%d processes)' % (processes,),
+             sign_many_in_processes)):
+        seconds = timeit.timeit(func, number=1)
+        print('%-28s %8.3f s %10.0f URLs/s' % (
+            name, seconds, num_urls / seconds))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+         int(sys.argv[2]) if len(sys.argv) > 2 else
+         multiprocessing.cpu_count())
@@ -62,6 +62,43 @@ class Test_PropertyMixin(unittest.TestCase):
         # Make sure changes get reset by reload.
         self.assertEqual(derived._changes, set())
 
+    def test_reload_w_metadata_cache_miss(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        connection = _Connection({'foo': 'Foo'})
+        client = _Client(connection, metadata_cache=MetadataCache())
+        derived = self._derivedClass('/path')()
+        derived.reload(client=client)
+        self.assertEqual(derived._properties, {'foo': 'Foo'})
+        self.assertEqual(len(connection._requested), 1)
+        self.assertEqual(client.metadata_cache.get('/path'), {'foo': 'Foo'})
+
+    def test_reload_w_metadata_cache_hit(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        connection = _Connection()
+        client = _Client(connection, metadata_cache=MetadataCache())
+        client.metadata_cache.put('/path', {'foo': 'Foo'})
+        derived = self._derivedClass('/path')()
+        derived._changes = object()
+        derived.reload(client=client)
+        self.assertEqual(derived._properties, {'foo': 'Foo'})
+        self.assertEqual(derived._changes, set())
+        self.assertEqual(connection._requested, [])
+        self.assertEqual(client.metadata_cache.hits, 1)
+
+    def test_reload_w_metadata_cache_in_batch(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        connection = _Connection({'foo': 'Foo'})
+        client = _Client(connection, metadata_cache=MetadataCache())
+        client.current_batch = object()
+        client.metadata_cache.put('/path', {'foo': 'Stale'})
+        derived = self._derivedClass('/path')()
+        derived.reload(client=client)
+        self.assertEqual(derived._properties, {'foo': 'Foo'})
+        self.assertEqual(len(connection._requested), 1)
+
     def test__set_properties(self):
         mixin = self._make_one()
         self.assertEqual(mixin._properties, {})
@@ -96,6 +133,54 @@ class Test_PropertyMixin(unittest.TestCase):
         self.assertEqual(derived._changes, set())
 
 
+class Test__invalidate_metadata(unittest.TestCase):
+
+    def _call_fut(self, client, path):
+        from google.cloud.storage._helpers import _invalidate_metadata
+
+        return _invalidate_metadata(client, path)
+
+    def test_wo_metadata_cache(self):
+        self._call_fut(object(), '/b/name')
+
+    def test_w_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        client = _Client(None, metadata_cache=MetadataCache())
+        client.metadata_cache.put('/b/name', {})
+        client.metadata_cache.put('/b/other', {})
+        self._call_fut(client, '/b/name')
+        self.assertIsNone(client.metadata_cache.get('/b/name'))
+        self.assertEqual(client.metadata_cache.get('/b/other'), {})
+
+
+class Test__filename_below(unittest.TestCase):
+
+    def _call_fut(self, directory, blob_name):
+        from google.cloud.storage._helpers import _filename_below
+
+        return _filename_below(directory, blob_name)
+
+    def test_nested_name(self):
+        import os
+
+        directory = os.path.abspath('dest')
+        self.assertEqual(self._call_fut('dest', 'a/b.txt'),
+                         os.path.join(directory, 'a', 'b.txt'))
+
+    def test_hostile_names(self):
+        for blob_name in ('../b.txt', 'a/../../b.txt', '/b.txt', 'a//b.txt',
+                          'a/./b.txt', 'a/', '..', ''):
+            with self.assertRaises(ValueError):
+                self._call_fut('dest', blob_name)
+
+    def test_name_w_os_separator(self):
+        import os
+
+        with self.assertRaises(ValueError):
+            self._call_fut('dest', 'a' + os.sep + '..' + os.sep + 'b.txt')
+
+
 class Test__scalar_property(unittest.TestCase):
 
     def _call_fut(self, fieldName):
@@ -176,6 +261,232 @@ class Test__base64_md5hash(unittest.TestCase):
         self.assertEqual(MD5.hash_obj._blocks, [BYTES_TO_SIGN])
 
 
+class Test__Crc32c(unittest.TestCase):
+
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage._helpers import _Crc32c
+
+        return _Crc32c()
+
+    def test_empty(self):
+        hash_obj = self._make_one()
+        self.assertEqual(hash_obj.digest(), b'\x00\x00\x00\x00')
+
+    def test_check_value(self):
+        hash_obj = self._make_one()
+        hash_obj.update(b'123456789')
+        self.assertEqual(hash_obj.digest(), b'\xe3\x06\x92\x83')
+
+    def test_incremental(self):
+        hash_obj = self._make_one()
+        hash_obj.update(b'1234')
+        hash_obj.update(b'56789')
+        self.assertEqual(hash_obj.digest(), b'\xe3\x06\x92\x83')
+
+
+class Test__crc32c(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut():
+        from google.cloud.storage._helpers import _crc32c
+
+        return _crc32c()
+
+    def test_wo_crcmod(self):
+        import mock
+        from google.cloud.storage._helpers import _Crc32c
+
+        with mock.patch('google.cloud.storage._helpers.crcmod', new=None):
+            hash_obj = self._call_fut()
+
+        self.assertIsInstance(hash_obj, _Crc32c)
+
+    def test_w_crcmod(self):
+        import mock
+
+        crcmod = mock.Mock(spec=['predefined'])
+        with mock.patch('google.cloud.storage._helpers.crcmod', new=crcmod):
+            hash_obj = self._call_fut()
+
+        self.assertIs(hash_obj, crcmod.predefined.Crc.return_value)
+        crcmod.predefined.Crc.assert_called_once_with('crc-32c')
+
+
+class Test__base64_crc32c(unittest.TestCase):
+
+    def _call_fut(self, buffer_object):
+        from google.cloud.storage._helpers import _base64_crc32c
+
+        return _base64_crc32c(buffer_object)
+
+    def test_it(self):
+        from io import BytesIO
+
+        self.assertEqual(self._call_fut(BytesIO(b'123456789')), b'4waSgw==')
+
+
+class Test__Checksums(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage._helpers import _Checksums
+
+        return _Checksums
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_wo_crcmod(self):
+        import mock
+
+        with mock.patch('google.cloud.storage._helpers.crcmod', new=None):
+            checksums = self._make_one()
+
+        self.assertIsNone(checksums._crc32c)
+
+    def test_ctor_wo_crcmod_w_crc32c(self):
+        import mock
+        from google.cloud.storage._helpers import _Crc32c
+
+        with mock.patch('google.cloud.storage._helpers.crcmod', new=None):
+            checksums = self._make_one(crc32c=True)
+
+        self.assertIsInstance(checksums._crc32c, _Crc32c)
+
+    def test_find_mismatch_md5_match(self):
+        checksums = self._make_one(crc32c=True)
+        checksums.update(b'abc')
+        checksums.update(b'def')
+        # The CRC32C checksum is ignored when the MD5 hash is known.
+        self.assertIsNone(checksums.find_mismatch(
+            md5_hash=u'6AtQFwmJUPxYqtg8jBSXjg==', crc32c=u'AAAAAA=='))
+
+    def test_find_mismatch_md5_mismatch(self):
+        checksums = self._make_one()
+        checksums.update(b'abcdef')
+        self.assertEqual(
+            checksums.find_mismatch(md5_hash=u'kBiQqOnIz21aGlQrIp/r/w=='),
+            ('MD5 hash', u'6AtQFwmJUPxYqtg8jBSXjg==',
+             u'kBiQqOnIz21aGlQrIp/r/w=='))
+
+    def test_find_mismatch_crc32c(self):
+        checksums = self._make_one(crc32c=True)
+        checksums.update(b'abcdef')
+        self.assertIsNone(checksums.find_mismatch(crc32c=u'U7zv8Q=='))
+        self.assertEqual(
+            checksums.find_mismatch(crc32c=u'AAAAAA=='),
+            ('CRC32C', u'U7zv8Q==', u'AAAAAA=='))
+
+    def test_find_mismatch_crc32c_not_computed(self):
+        checksums = self._make_one()
+        checksums._crc32c = None
+        checksums.update(b'abcdef')
+        self.assertIsNone(checksums.find_mismatch(crc32c=u'AAAAAA=='))
+
+    def test_find_mismatch_wo_expected(self):
+        checksums = self._make_one()
+        self.assertIsNone(checksums.find_mismatch())
+
+
+class Test__ChecksumReader(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage._helpers import _ChecksumReader
+
+        return _ChecksumReader
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_read_sequential(self):
+        import io
+        import mock
+
+        checksums = mock.Mock(spec=['update'])
+        reader = self._make_one(io.BytesIO(b'abcdef'), checksums)
+        self.assertEqual(reader.read(4), b'abcd')
+        self.assertEqual(reader.read(), b'ef')
+        self.assertEqual(reader.read(), b'')
+        self.assertEqual(
+            checksums.update.mock_calls,
+            [mock.call(b'abcd'), mock.call(b'ef')])
+        self.assertFalse(reader.skipped)
+
+    def test_read_after_seeking_back(self):
+        import io
+        import mock
+
+        stream = io.BytesIO(b'xxabcdef')
+        stream.seek(2)
+        checksums = mock.Mock(spec=['update'])
+        reader = self._make_one(stream, checksums)
+        reader.read(4)
+        self.assertEqual(reader.tell(), 6)
+        self.assertEqual(reader.seek(4), 4)
+        self.assertEqual(reader.read(), b'cdef')
+        self.assertEqual(
+            checksums.update.mock_calls,
+            [mock.call(b'abcd'), mock.call(b'ef')])
+        self.assertFalse(reader.skipped)
+
+    def test_read_after_seeking_forward(self):
+        import io
+        import mock
+
+        checksums = mock.Mock(spec=['update'])
+        reader = self._make_one(io.BytesIO(b'abcdef'), checksums)
+        reader.seek(2)
+        self.assertEqual(reader.read(), b'cdef')
+        checksums.update.assert_not_called()
+        self.assertTrue(reader.skipped)
+
+    def test_wo_tell(self):
+        import mock
+
+        stream = mock.Mock(spec=['read'])
+        stream.read.return_value = b'abc'
+        checksums = mock.Mock(spec=['update'])
+        reader = self._make_one(stream, checksums)
+        self.assertEqual(reader.read(), b'abc')
+        checksums.update.assert_called_once_with(b'abc')
+
+
+class Test__ChecksumWriter(unittest.TestCase):
+
+    def test_write(self):
+        import io
+        import mock
+        from google.cloud.storage._helpers import _ChecksumWriter
+
+        file_obj = io.BytesIO()
+        checksums = mock.Mock(spec=['update'])
+        writer = _ChecksumWriter(file_obj, checksums)
+        self.assertEqual(writer.write(b'abc'), 3)
+        self.assertEqual(file_obj.getvalue(), b'abc')
+        checksums.update.assert_called_once_with(b'abc')
+
+
+class Test__parse_hash_header(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(value):
+        from google.cloud.storage._helpers import _parse_hash_header
+
+        return _parse_hash_header(value)
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut(''), {})
+
+    def test_both(self):
+        value = 'crc32c=n03x6A==, md5=Ojk9c3dhfxgoKVVHYwFbHQ=='
+        self.assertEqual(self._call_fut(value), {
+            'crc32c': 'n03x6A==',
+            'md5': 'Ojk9c3dhfxgoKVVHYwFbHQ==',
+        })
+
+
 class _Connection(object):
 
     def __init__(self, *responses):
@@ -226,5 +537,8 @@ class _Base64(object):
 
 class _Client(object):
 
-    def __init__(self, connection):
+    current_batch = None
+
+    def __init__(self, connection, metadata_cache=None):
         self._connection = connection
+        self.metadata_cache = metadata_cache
@@ -58,6 +58,38 @@ class TestConnection(unittest.TestCase):
             uri=expected_uri,
         )
 
+    def test__make_request_invalidates_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        cache = MetadataCache()
+        cache.put('/b/name', {})
+        cache.put('/b/name/o/blob', {})
+        http = mock.Mock(spec=['request'])
+        http.request.return_value = (
+            mock.Mock(status=204, spec=['status']), b'')
+        client = mock.Mock(_http=http, metadata_cache=cache,
+                           spec=['_http', 'metadata_cache'])
+
+        conn = self._make_one(client)
+        conn.api_request('DELETE', '/b/name/o/blob')
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get('/b/name'), {})
+
+    def test__make_request_w_get_keeps_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        cache = MetadataCache()
+        cache.put('/b/name/o/blob', {})
+        http = mock.Mock(spec=['request'])
+        http.request.return_value = (
+            mock.Mock(status=200, spec=['status']), b'{}')
+        client = mock.Mock(_http=http, metadata_cache=cache,
+                           spec=['_http', 'metadata_cache'])
+
+        conn = self._make_one(client)
+        conn.api_request('GET', '/b/name/o/blob', expect_json=False)
+        self.assertEqual(len(cache), 1)
+
     def test_build_api_url_no_extra_query_params(self):
         conn = self._make_one(object())
         URI = '/'.join([
@@ -321,6 +321,31 @@ class TestBatch(unittest.TestCase):
 
         self._check_subrequest_no_payload(chunks[2], 'DELETE', URL)
 
+    def test_finish_invalidates_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        BASE = 'http://api.example.com/storage/v1'
+        expected = _Response()
+        expected['content-type'] = 'multipart/mixed; boundary="DEADBEEF="'
+        http = _HTTP((expected, _THREE_PART_MIME_RESPONSE))
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        client.metadata_cache = MetadataCache()
+        batch = self._make_one(client)
+        batch.API_BASE_URL = 'http://api.example.com'
+        batch._do_request('PATCH', BASE + '/b/name/o/a', {}, {'foo': 1}, None)
+        batch._do_request('DELETE', BASE + '/b/name/o/b', {}, None, None)
+        batch._do_request('GET', BASE + '/b/name/o/c', {}, None, None)
+        # Looked up while the requests were queued.
+        for name in ('a', 'b', 'c'):
+            client.metadata_cache.put('/b/name/o/' + name, {})
+
+        batch.finish()
+
+        self.assertIsNone(client.metadata_cache.get('/b/name/o/a'))
+        self.assertIsNone(client.metadata_cache.get('/b/name/o/b'))
+        self.assertEqual(client.metadata_cache.get('/b/name/o/c'), {})
+
     def test_finish_responses_mismatch(self):
         URL = 'http://api.example.com/other_api'
         expected = _Response()
@@ -333,6 +358,22 @@ class TestBatch(unittest.TestCase):
         batch._requests.append(('GET', URL, {}, None))
         self.assertRaises(ValueError, batch.finish)
 
+    def test_finish_too_few_responses(self):
+        URL = 'http://api.example.com/other_api'
+        expected = _Response()
+        expected['content-type'] = 'multipart/mixed; boundary="DEADBEEF="'
+        http = _HTTP((expected, _TWO_PART_MIME_RESPONSE_WITH_FAIL))
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client)
+        batch.API_BASE_URL = 'http://api.example.com'
+        target1 = _MockObject()
+        for _ in range(3):
+            batch._do_request('GET', URL, {}, None, target1)
+        self.assertRaises(ValueError, batch.finish)
+        # The futures are resolved as their responses are parsed.
+        self.assertEqual(target1._properties, {'foo': 1, 'bar': 2})
+
     def test_finish_nonempty_with_status_failure(self):
         from google.cloud.exceptions import NotFound
 
@@ -376,6 +417,28 @@ class TestBatch(unittest.TestCase):
         self._check_subrequest_payload(chunks[0], 'GET', URL, {})
         self._check_subrequest_payload(chunks[1], 'GET', URL, {})
 
+    def test_finish_nonempty_with_status_failure_wo_raise(self):
+        URL = 'http://api.example.com/other_api'
+        expected = _Response()
+        expected['content-type'] = 'multipart/mixed; boundary="DEADBEEF="'
+        http = _HTTP((expected, _TWO_PART_MIME_RESPONSE_WITH_FAIL))
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client)
+        batch.API_BASE_URL = 'http://api.example.com'
+        target1 = _MockObject()
+        target2 = _MockObject()
+        batch._do_request('GET', URL, {}, None, target1)
+        batch._do_request('GET', URL, {}, None, target2)
+        target2_future_before = target2._properties
+
+        responses = batch.finish(raise_exception=False)
+
+        self.assertEqual(
+            [headers.status for headers, _ in responses], [200, 404])
+        self.assertEqual(target1._properties, {'foo': 1, 'bar': 2})
+        self.assertIs(target2._properties, target2_future_before)
+
     def test_finish_nonempty_non_multipart_response(self):
         URL = 'http://api.example.com/other_api'
         expected = _Response()
@@ -502,6 +565,99 @@ class Test__unpack_batch_response(unittest.TestCase):
         CONTENT = _THREE_PART_MIME_RESPONSE.decode('utf-8')
         self._unpack_helper(RESPONSE, CONTENT)
 
+    def test_crlf_w_preamble_and_unquoted_boundary(self):
+        RESPONSE = {'content-type': 'multipart/mixed; boundary=DEADBEEF='}
+        CONTENT = b'preamble\r\n' + _THREE_PART_MIME_RESPONSE.replace(
+            b'\n', b'\r\n')
+        self._unpack_helper(RESPONSE, CONTENT)
+
+    def test_non_json_payload(self):
+        CONTENT = b"""\
+--DEADBEEF=
+Content-Type: application/http
+
+HTTP/1.1 500 Internal Server Error
+Content-Type: text/plain
+X-Folded: one
+ two
+
+Backend
+error
+
+--DEADBEEF=--
+"""
+        RESPONSE = {'content-type': 'multipart/mixed; boundary="DEADBEEF="'}
+        (headers, payload), = self._call_fut(RESPONSE, CONTENT)
+        self.assertEqual(headers.status, 500)
+        self.assertEqual(headers['x-folded'], 'one two')
+        self.assertEqual(payload, 'Backend\nerror\n')
+
+    def test_parts_produced_incrementally(self):
+        RESPONSE = {'content-type': 'multipart/mixed; boundary="DEADBEEF="'}
+        CONTENT = _THREE_PART_MIME_RESPONSE[:-len(b'--DEADBEEF=--\n')]
+        result = self._call_fut(RESPONSE, CONTENT)
+        self.assertEqual(next(result)[1], {u'foo': 1, u'bar': 2})
+        self.assertEqual(next(result)[1], {u'foo': 1, u'bar': 3})
+        with self.assertRaises(ValueError):
+            next(result)
+
+    def test_not_multipart(self):
+        RESPONSE = {'content-type': 'text/plain'}
+        with self.assertRaises(ValueError):
+            list(self._call_fut(RESPONSE, b'NOT A MIME RESPONSE'))
+
+
+class Test_MultipartParser(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(boundary):
+        from google.cloud.storage.batch import _MultipartParser
+
+        return _MultipartParser(boundary)
+
+    def test_feed_byte_by_byte(self):
+        parser = self._make_one(b'DEADBEEF=')
+        parts = []
+        for index in range(len(_TWO_PART_MIME_RESPONSE_WITH_FAIL)):
+            parts.extend(parser.feed(
+                _TWO_PART_MIME_RESPONSE_WITH_FAIL[index:index + 1]))
+        self.assertTrue(parser.done)
+        self.assertEqual(len(parts), 2)
+        self.assertTrue(parts[0].startswith(b'Content-Type: application/'))
+        self.assertTrue(parts[1].endswith(b'"Not Found"}}\n'))
+
+    def test_feed_empty_part_and_epilogue(self):
+        parser = self._make_one(b'xyz')
+        self.assertEqual(parser.feed(b'--xyz\r\n\r\n--x'), [])
+        self.assertEqual(parser.feed(b'yz\r\nabc\r\n--xyz--'), [b'', b'abc'])
+        self.assertTrue(parser.done)
+        self.assertEqual(parser.feed(b'\r\nepilogue'), [])
+
+    def test_feed_partial_delimiter_line(self):
+        parser = self._make_one(b'xyz')
+        self.assertEqual(parser.feed(b'--xyz  '), [])
+        self.assertEqual(parser.feed(b'\r\nabc\r\n--xyz--'), [b'abc'])
+        self.assertTrue(parser.done)
+
+
+class Test__split_message(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(message):
+        from google.cloud.storage.batch import _split_message
+
+        return _split_message(message)
+
+    def test_w_headers(self):
+        self.assertEqual(self._call_fut(b'A: b\r\n\r\nbody'),
+                         (b'A: b', b'body'))
+
+    def test_wo_headers(self):
+        self.assertEqual(self._call_fut(b'\r\nbody'), (b'', b'body'))
+
+    def test_wo_body(self):
+        self.assertEqual(self._call_fut(b'A: b'), (b'A: b', b''))
+
 
 _TWO_PART_MIME_RESPONSE_WITH_FAIL = b"""\
 --DEADBEEF=
@@ -559,6 +715,132 @@ Content-Length: 0
 """
 
 
+class Test__check_max_workers(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(client, max_workers):
+        from google.cloud.storage.batch import _check_max_workers
+
+        return _check_max_workers(client, max_workers)
+
+    def test_one_worker_wo_pooled_http(self):
+        client = mock.Mock(_http=object(), spec=['_http'])
+        self._call_fut(client, 1)
+
+    def test_many_workers_wo_pooled_http(self):
+        client = mock.Mock(_http=object(), spec=['_http'])
+        with self.assertRaises(ValueError):
+            self._call_fut(client, 2)
+
+    def test_many_workers_w_pooled_http(self):
+        from google.cloud._http import PooledHttp
+
+        client = mock.Mock(_http=PooledHttp(object, size=1), spec=['_http'])
+        self._call_fut(client, 8)
+
+
+class Test__send_batch(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(client, requests):
+        from google.cloud.storage.batch import _send_batch
+
+        return _send_batch(client, requests)
+
+    def test_it(self):
+        from google.cloud.exceptions import NotFound
+
+        expected = _Response()
+        expected['content-type'] = 'multipart/mixed; boundary="DEADBEEF="'
+        http = _HTTP((expected, _TWO_PART_MIME_RESPONSE_WITH_FAIL))
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        requests = [
+            ('PATCH', '/b/name/o/one', {'foo': 1}, {'projection': 'full'}),
+            ('DELETE', '/b/name/o/two', None, None),
+        ]
+
+        results = self._call_fut(client, requests)
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0], {'foo': 1, 'bar': 2})
+        self.assertIsInstance(results[1], NotFound)
+        self.assertIn('DELETE /b/name/o/two', results[1].message)
+        # Both requests were sent in a single batch.
+        self.assertEqual(len(http._requests), 1)
+        method, uri, _, body = http._requests[0]
+        self.assertEqual(method, 'POST')
+        self.assertTrue(uri.endswith('/batch'))
+        self.assertIn('PATCH ', body)
+        self.assertIn('/b/name/o/one?projection=full', body)
+        self.assertIn('DELETE ', body)
+
+
+class Test__send_batches(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(client, requests, max_workers):
+        from google.cloud.storage.batch import _send_batches
+
+        return _send_batches(client, requests, max_workers)
+
+    @staticmethod
+    def _fake_send_batch(client, requests):
+        return [path for _, path, _, _ in requests]
+
+    @staticmethod
+    def _make_client():
+        from google.cloud._http import PooledHttp
+
+        return mock.Mock(_http=PooledHttp(object, size=2), spec=['_http'])
+
+    def _send_helper(self, max_workers, num_requests=7):
+        from google.cloud.storage.batch import Batch
+
+        client = self._make_client()
+        requests = (('DELETE', 'path-%d' % (index,), None, None)
+                    for index in range(num_requests))
+        patch_size = mock.patch.object(Batch, '_MAX_BATCH_SIZE', new=2)
+        patch_send = mock.patch(
+            'google.cloud.storage.batch._send_batch',
+            side_effect=self._fake_send_batch)
+        with patch_size, patch_send as send_batch:
+            results = self._call_fut(client, requests, max_workers)
+
+        self.assertEqual(
+            results, ['path-%d' % (index,) for index in range(num_requests)])
+        self.assertEqual(
+            [len(call[0][1]) for call in send_batch.call_args_list],
+            [2, 2, 2, 1])
+        for call in send_batch.call_args_list:
+            self.assertIs(call[0][0], client)
+
+    def test_serial(self):
+        self._send_helper(1)
+
+    def test_concurrent(self):
+        self._send_helper(2)
+
+    def test_empty(self):
+        with mock.patch('google.cloud.storage.batch._send_batch') as send:
+            self.assertEqual(self._call_fut(self._make_client(), [], 4), [])
+        send.assert_not_called()
+
+    def test_concurrent_wo_pooled_http(self):
+        client = mock.Mock(_http=object(), spec=['_http'])
+        with mock.patch('google.cloud.storage.batch._send_batch') as send:
+            with self.assertRaises(ValueError):
+                self._call_fut(client, [('DELETE', 'path', None, None)], 4)
+        send.assert_not_called()
+
+    def test_w_failure(self):
+        with mock.patch('google.cloud.storage.batch._send_batch',
+                        side_effect=ValueError('Bad response')):
+            with self.assertRaises(ValueError):
+                self._call_fut(
+                    self._make_client(), [('DELETE', 'path', None, None)], 4)
+
+
 class Test__FutureDict(unittest.TestCase):
 
     def _make_one(self, *args, **kw):
@@ -313,6 +313,38 @@ class Test_Blob(unittest.TestCase):
         bucket._blobs[BLOB_NAME] = 1
         self.assertTrue(blob.exists())
 
+    def test_exists_w_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        BLOB_NAME = 'blob-name'
+        found_response = ({'status': http_client.OK}, {'name': BLOB_NAME})
+        connection = _Connection(found_response)
+        cache = MetadataCache()
+        client = _Client(connection, metadata_cache=cache)
+        bucket = _Bucket(client)
+        blob = self._make_one(BLOB_NAME, bucket=bucket)
+        self.assertTrue(blob.exists())
+        self.assertTrue(blob.exists())
+
+        self.assertEqual(len(connection._requested), 1)
+        kw = connection._requested[0]
+        self.assertEqual(kw['method'], 'GET')
+        self.assertEqual(kw['path'], '/b/name/o/%s' % (BLOB_NAME,))
+        self.assertNotIn('query_params', kw)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_exists_miss_w_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        not_found_response = ({'status': http_client.NOT_FOUND}, b'')
+        connection = _Connection(not_found_response)
+        cache = MetadataCache()
+        client = _Client(connection, metadata_cache=cache)
+        bucket = _Bucket(client)
+        blob = self._make_one('nonesuch', bucket=bucket)
+        self.assertFalse(blob.exists())
+        self.assertEqual(len(cache), 0)
+
     def test_delete(self):
         BLOB_NAME = 'blob-name'
         not_found_response = ({'status': http_client.NOT_FOUND}, b'')
@@ -463,6 +495,53 @@ class Test_Blob(unittest.TestCase):
             'GET', download_url, data=None, headers=headers)
         self.assertEqual(transport.request.mock_calls, [call, call])
 
+    def _do_download_checksum_helper(self, response_headers, chunk_size=None,
+                                     properties=None):
+        blob = self._make_one('blob-name', bucket=None, properties=properties)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = chunk_size
+
+        transport = mock.Mock(spec=['request'])
+        headers = {'content-length': '6', 'content-range': 'bytes 0-5/6'}
+        headers.update(response_headers)
+        transport.request.return_value = self._mock_requests_response(
+            http_client.OK, headers, content=b'abcdef')
+        file_obj = io.BytesIO()
+        blob._do_download(transport, file_obj, 'http://test.invalid', {})
+        return file_obj
+
+    def test__do_download_w_matching_checksums(self):
+        file_obj = self._do_download_checksum_helper({
+            'x-goog-hash': 'crc32c=U7zv8Q==,md5=6AtQFwmJUPxYqtg8jBSXjg==',
+        })
+        self.assertEqual(file_obj.getvalue(), b'abcdef')
+
+    def test__do_download_w_md5_mismatch(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._do_download_checksum_helper({
+                'x-goog-hash': 'crc32c=U7zv8Q==,md5=kBiQqOnIz21aGlQrIp/r/w==',
+            })
+
+        message = str(exc_info.exception)
+        self.assertIn('MD5 hash', message)
+        self.assertIn('6AtQFwmJUPxYqtg8jBSXjg==', message)
+
+    def test__do_download_chunked_composite_w_crc32c_mismatch(self):
+        properties = {'crc32c': 'AAAAAA==', 'componentCount': '2'}
+        with self.assertRaises(ValueError) as exc_info:
+            self._do_download_checksum_helper(
+                {'x-goog-hash': 'crc32c=AAAAAA=='}, chunk_size=6,
+                properties=properties)
+
+        self.assertIn('CRC32C', str(exc_info.exception))
+
+    def test__do_download_w_gzip_stored_content_encoding(self):
+        file_obj = self._do_download_checksum_helper({
+            'x-goog-hash': 'md5=kBiQqOnIz21aGlQrIp/r/w==',
+            'x-goog-stored-content-encoding': 'gzip',
+        })
+        self.assertEqual(file_obj.getvalue(), b'abcdef')
+
     @mock.patch('google.auth.transport.requests.AuthorizedSession')
     def test_download_to_file_with_failure(self, fake_session_factory):
         from google.cloud import exceptions
@@ -649,6 +728,44 @@ class Test_Blob(unittest.TestCase):
         self._check_session_mocks(
             client, fake_session_factory, media_link, headers=key_headers)
 
+    def test_open_read(self):
+        from google.cloud.storage.fileio import BlobReader
+
+        blob = self._make_one(u'blob-name', bucket=_Bucket())
+        blob._properties['size'] = '10'
+        blob._make_transport = mock.Mock(spec=[])
+        client = object()
+        reader = blob.open(chunk_size=4, client=client)
+        self.assertIsInstance(reader, BlobReader)
+        self.assertIs(reader.blob, blob)
+        self.assertEqual(reader.block_size, 4)
+        blob._make_transport.assert_called_once_with(client)
+
+    def test_open_read_w_default_chunk_size(self):
+        from google.cloud.storage.fileio import DEFAULT_BLOCK_SIZE
+
+        blob = self._make_one(u'blob-name', bucket=_Bucket())
+        blob._properties['size'] = '10'
+        blob._make_transport = mock.Mock(spec=[])
+        reader = blob.open()
+        self.assertEqual(reader.block_size, DEFAULT_BLOCK_SIZE)
+
+    def test_open_write(self):
+        from google.cloud.storage.fileio import BlobWriter
+
+        blob = self._make_one(u'blob-name', bucket=_Bucket())
+        client = object()
+        writer = blob.open('wb', content_type=u'text/csv', client=client)
+        self.assertIsInstance(writer, BlobWriter)
+        self.assertIs(writer.blob, blob)
+        self.assertEqual(writer.content_type, u'text/csv')
+        self.assertIs(writer.client, client)
+
+    def test_open_invalid_mode(self):
+        blob = self._make_one(u'blob-name', bucket=_Bucket())
+        with self.assertRaises(ValueError):
+            blob.open('r+')
+
     @mock.patch('google.auth.transport.requests.AuthorizedSession')
     def test_download_as_string(self, fake_session_factory):
         blob_name = 'blob-name'
@@ -669,6 +786,302 @@ class Test_Blob(unittest.TestCase):
 
         self._check_session_mocks(client, fake_session_factory, media_link)
 
+    def _make_cached_blob(self, properties, cache_dir):
+        from google.cloud.storage.cache import DownloadCache
+
+        cache = DownloadCache(cache_dir)
+        client = mock.Mock(
+            _credentials=_make_credentials(), download_cache=cache,
+            spec=['_credentials', 'download_cache'])
+        properties.setdefault('mediaLink', 'http://example.com/media/')
+        blob = self._make_one(
+            'blob-name', bucket=_Bucket(client), properties=properties)
+        # Modify the blob so there there will be 2 chunks of size 3.
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 3
+        return blob, cache
+
+    @mock.patch('google.auth.transport.requests.AuthorizedSession')
+    def test_download_as_string_w_download_cache(self, fake_session_factory):
+        import shutil
+        import tempfile
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        fake_session_factory.return_value = self._mock_download_transport()
+        blob, cache = self._make_cached_blob({'generation': '5'}, cache_dir)
+
+        self.assertEqual(blob.download_as_string(), b'abcdef')
+        self.assertEqual(blob.download_as_string(), b'abcdef')
+
+        self._check_session_mocks(
+            blob.client, fake_session_factory, blob.media_link)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.size(), 6)
+
+    @mock.patch('google.auth.transport.requests.AuthorizedSession')
+    def test_download_to_file_w_download_cache_reload(
+            self, fake_session_factory):
+        import shutil
+        import tempfile
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        fake_session_factory.return_value = self._mock_download_transport()
+        blob, cache = self._make_cached_blob({}, cache_dir)
+
+        def reload(client=None):
+            blob._properties.update({'generation': '5', 'size': '6'})
+
+        file_obj = io.BytesIO()
+        with mock.patch.object(blob, 'reload', side_effect=reload):
+            blob.download_to_file(file_obj)
+
+        self.assertEqual(file_obj.getvalue(), b'abcdef')
+        self.assertIn(blob, cache)
+
+    @mock.patch('google.auth.transport.requests.AuthorizedSession')
+    def test_download_to_file_w_download_cache_failure(
+            self, fake_session_factory):
+        import shutil
+        import tempfile
+        from google.cloud import exceptions
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = self._mock_requests_response(
+            http_client.NOT_FOUND, {}, content=b'Not found')
+        fake_session_factory.return_value = transport
+        blob, cache = self._make_cached_blob({'generation': '5'}, cache_dir)
+
+        with self.assertRaises(exceptions.NotFound):
+            blob.download_to_file(io.BytesIO())
+
+        self.assertEqual(os.listdir(cache_dir), ['.lock'])
+
+    def test__download_cache_skipped(self):
+        import shutil
+        import tempfile
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        blob, cache = self._make_cached_blob(
+            {'generation': '5', 'size': '100'}, cache_dir)
+        self.assertIs(blob._download_cache(None), cache)
+
+        cache.max_bytes = 99
+        self.assertIsNone(blob._download_cache(None))
+
+        cache.max_bytes = 100
+        blob._encryption_key = b'01234567890123456789012345678901'
+        self.assertIsNone(blob._download_cache(None))
+
+    def test__download_cache_skipped_w_gzip_encoding(self):
+        import shutil
+        import tempfile
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        blob, cache = self._make_cached_blob(
+            {'generation': '5', 'size': '100', 'contentEncoding': 'gzip'},
+            cache_dir)
+        self.assertIsNone(blob._download_cache(None))
+
+    @mock.patch('google.auth.transport.requests.AuthorizedSession')
+    def test_download_to_filename_sliced_w_download_cache(
+            self, fake_session_factory):
+        import shutil
+        import tempfile
+        from google.cloud._testing import _NamedTemporaryFile
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        payload = b'abcdefghij'
+        fake_transport = self._mock_sliced_transport(payload)
+        fake_session_factory.return_value = fake_transport
+        blob, cache = self._make_cached_blob(
+            {'generation': '5', 'size': '10'}, cache_dir)
+        blob._SLICE_CHUNK_SIZE = 2
+
+        for _ in range(2):
+            with _NamedTemporaryFile() as temp:
+                blob.download_to_filename(temp.name, parallelism=3)
+                with open(temp.name, 'rb') as file_obj:
+                    self.assertEqual(file_obj.read(), payload)
+
+        self.assertEqual(len(fake_transport.ranges), 5)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def _mock_sliced_transport(self, payload, fail_once=None):
+        import requests
+
+        fake_transport = mock.Mock(spec=['request'])
+        fake_transport.ranges = []
+        failed = []
+
+        def request(method, url, data=None, headers=None):
+            # NOTE: ``headers`` is mutated between requests, so the
+            #       range is recorded here.
+            fake_transport.ranges.append(headers['range'])
+            range_ = headers['range'][len('bytes='):]
+            start, end = [int(value) for value in range_.split('-')]
+            if start == fail_once and not failed:
+                failed.append(start)
+                raise requests.exceptions.ConnectionError('reset')
+            chunk = payload[start:end + 1]
+            response_headers = {
+                'content-length': str(len(chunk)),
+                'content-range': 'bytes %d-%d/%d' % (
+                    start, start + len(chunk) - 1, len(payload)),
+            }
+            return self._mock_requests_response(
+                http_client.PARTIAL_CONTENT, response_headers, content=chunk)
+
+        fake_transport.request.side_effect = request
+        return fake_transport
+
+    def _make_sliced_blob(self, properties):
+        client = mock.Mock(
+            _credentials=_make_credentials(), spec=['_credentials'])
+        bucket = _Bucket(client)
+        properties.setdefault('mediaLink', 'http://example.com/media/')
+        blob = self._make_one(
+            'blob-name', bucket=bucket, properties=properties)
+        # Slices and chunks of 2 bytes.
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob._SLICE_CHUNK_SIZE = 2
+        return blob
+
+    @mock.patch('google.auth.transport.requests.AuthorizedSession')
+    def test_download_to_filename_sliced(self, fake_session_factory):
+        import base64
+        import hashlib
+        from google.cloud._testing import _NamedTemporaryFile
+
+        payload = b'abcdefghij'
+        fake_transport = self._mock_sliced_transport(payload)
+        fake_session_factory.return_value = fake_transport
+        md5_hash = base64.b64encode(hashlib.md5(payload).digest())
+        blob = self._make_sliced_blob({
+            'size': '10',
+            'md5Hash': md5_hash.decode('ascii'),
+        })
+
+        with _NamedTemporaryFile() as temp:
+            blob.download_to_filename(temp.name, parallelism=3)
+            with open(temp.name, 'rb') as file_obj:
+                wrote = file_obj.read()
+
+        self.assertEqual(wrote, payload)
+        fake_session_factory.assert_called_once_with(
+            blob.client._credentials)
+        # Slices of 4 bytes, downloaded in chunks of 2 bytes.
+        self.assertEqual(sorted(fake_transport.ranges), [
+            'bytes=0-1', 'bytes=2-3', 'bytes=4-5', 'bytes=6-7', 'bytes=8-9',
+        ])
+
+    @mock.patch('google.auth.transport.requests.AuthorizedSession')
+    def test_download_to_filename_sliced_w_reload_and_crc32c(
+            self, fake_session_factory):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        payload = b'123456789'
+        fake_session_factory.return_value = self._mock_sliced_transport(
+            payload)
+        blob = self._make_sliced_blob({})
+
+        def reload(client=None):
+            blob._properties.update({'size': '9', 'crc32c': '4waSgw=='})
+
+        patch = mock.patch.object(blob, 'reload', side_effect=reload)
+        with patch as fake_reload:
+            with _NamedTemporaryFile() as temp:
+                blob.download_to_filename(temp.name, parallelism=2)
+                with open(temp.name, 'rb') as file_obj:
+                    wrote = file_obj.read()
+
+        self.assertEqual(wrote, payload)
+        fake_reload.assert_called_once_with(client=None)
+
+    @mock.patch('google.auth.transport.requests.AuthorizedSession')
+    def test_download_to_filename_sliced_retries_slice(
+            self, fake_session_factory):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        payload = b'abcdefgh'
+        fake_transport = self._mock_sliced_transport(payload, fail_once=6)
+        fake_session_factory.return_value = fake_transport
+        blob = self._make_sliced_blob({'size': '8'})
+
+        with _NamedTemporaryFile() as temp:
+            blob.download_to_filename(temp.name, parallelism=2)
+            with open(temp.name, 'rb') as file_obj:
+                wrote = file_obj.read()
+
+        self.assertEqual(wrote, payload)
+        # Only the failed chunk is requested again.
+        self.assertEqual(len(fake_transport.ranges), 5)
+        self.assertEqual(fake_transport.ranges.count('bytes=6-7'), 2)
+
+    @mock.patch('google.auth.transport.requests.AuthorizedSession')
+    def test_download_to_filename_sliced_retries_exhausted(
+            self, fake_session_factory):
+        import requests
+        from google.cloud._testing import _NamedTemporaryFile
+
+        fake_transport = mock.Mock(spec=['request'])
+        fake_transport.request.side_effect = (
+            requests.exceptions.ConnectionError('reset'))
+        fake_session_factory.return_value = fake_transport
+        blob = self._make_sliced_blob({'size': '4'})
+        blob._MAX_SLICE_RETRIES = 1
+
+        with _NamedTemporaryFile() as temp:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                blob.download_to_filename(temp.name, parallelism=2)
+
+        # Each of the two slices is tried twice.
+        self.assertEqual(fake_transport.request.call_count, 4)
+
+    @mock.patch('google.auth.transport.requests.AuthorizedSession')
+    def test_download_to_filename_sliced_w_failure(
+            self, fake_session_factory):
+        from google.cloud import exceptions
+        from google.cloud._testing import _NamedTemporaryFile
+
+        fake_transport = mock.Mock(spec=['request'])
+        fake_transport.request.return_value = self._mock_requests_response(
+            http_client.NOT_FOUND, {'content-length': '9'},
+            content=b'Not found')
+        fake_session_factory.return_value = fake_transport
+        blob = self._make_sliced_blob({'size': '4'})
+
+        with _NamedTemporaryFile() as temp:
+            with self.assertRaises(exceptions.NotFound):
+                blob.download_to_filename(temp.name, parallelism=2)
+
+    @mock.patch('google.auth.transport.requests.AuthorizedSession')
+    def test_download_to_filename_sliced_checksum_mismatch(
+            self, fake_session_factory):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        fake_session_factory.return_value = self._mock_sliced_transport(
+            b'abcd')
+        blob = self._make_sliced_blob({
+            'size': '4',
+            'md5Hash': 'kBiQqOnIz21aGlQrIp/r/w==',
+        })
+
+        with _NamedTemporaryFile() as temp:
+            with self.assertRaises(ValueError):
+                blob.download_to_filename(temp.name, parallelism=2)
+
+    def test__verify_download_checksum_wo_checksums(self):
+        blob = self._make_one(u'blob-name', bucket=None)
+        # Never opens the file.
+        blob._verify_download_checksum('/does/not/exist')
+
     def test__get_content_type_explicit(self):
         blob = self._make_one(u'blob-name', bucket=None)
 
@@ -823,6 +1236,24 @@ class Test_Blob(unittest.TestCase):
     def test__do_multipart_upload_with_retry(self, mock_get_boundary):
         self._do_multipart_success(mock_get_boundary, num_retries=8)
 
+    @mock.patch(u'google.resumable_media._upload.get_boundary',
+                return_value=b'==0==')
+    def test__do_multipart_upload_invalidates_metadata_cache(
+            self, mock_get_boundary):
+        from google.cloud.storage.cache import MetadataCache
+
+        bucket = mock.Mock(path='/b/w00t', spec=[u'path'])
+        blob = self._make_one(u'blob-name', bucket=bucket)
+        fake_transport = self._mock_transport(http_client.OK, {})
+        blob._make_transport = mock.Mock(return_value=fake_transport, spec=[])
+        cache = MetadataCache()
+        cache.put(blob.path, {'name': u'blob-name'})
+        client = mock.Mock(metadata_cache=cache, spec=['metadata_cache'])
+
+        blob._do_multipart_upload(
+            client, io.BytesIO(b'data'), u'text/plain', None, None)
+        self.assertEqual(len(cache), 0)
+
     def test__do_multipart_upload_bad_size(self):
         blob = self._make_one(u'blob-name', bucket=None)
 
@@ -1106,6 +1537,7 @@ class Test_Blob(unittest.TestCase):
 
     def _upload_from_file_helper(self, side_effect=None, **kwargs):
         from google.cloud._helpers import UTC
+        from google.cloud.storage._helpers import _ChecksumReader
 
         blob = self._make_one('blob-name', bucket=None)
 
@@ -1135,10 +1567,49 @@ class Test_Blob(unittest.TestCase):
         # Check the mock.
         num_retries = kwargs.get('num_retries')
         blob._do_upload.assert_called_once_with(
-            client, stream, content_type, len(data), num_retries)
+            client, mock.ANY, content_type, len(data), num_retries)
+        reader = blob._do_upload.call_args[0][1]
+        self.assertIsInstance(reader, _ChecksumReader)
+        self.assertIs(reader._stream, stream)
 
         return stream
 
+    def _upload_from_file_checksum_helper(self, blob, created_json,
+                                          skip=False):
+        def do_upload(client, stream, content_type, size, num_retries):
+            if skip:
+                stream.seek(4)
+            stream.read(size)
+            return created_json
+
+        blob._do_upload = mock.Mock(side_effect=do_upload, spec=[])
+        stream = io.BytesIO(b'data is here')
+        blob.upload_from_file(stream, size=12, client=mock.sentinel.client)
+
+    def test_upload_from_file_w_matching_checksum(self):
+        created_json = {
+            'md5Hash': 'm1k0Ksb18BJEhGYa0IWmtQ==',
+            'crc32c': '9m4KLg==',
+        }
+        blob = self._make_one('blob-name', bucket=None)
+        self._upload_from_file_checksum_helper(blob, created_json)
+        self.assertEqual(blob.md5_hash, created_json['md5Hash'])
+
+    def test_upload_from_file_w_checksum_mismatch(self):
+        created_json = {'md5Hash': 'kBiQqOnIz21aGlQrIp/r/w=='}
+        blob = self._make_one('blob-name', bucket=None)
+        with self.assertRaises(ValueError):
+            self._upload_from_file_checksum_helper(blob, created_json)
+
+        # The blob still describes the new object.
+        self.assertEqual(blob.md5_hash, created_json['md5Hash'])
+
+    def test_upload_from_file_w_skipped_bytes(self):
+        created_json = {'md5Hash': 'kBiQqOnIz21aGlQrIp/r/w=='}
+        blob = self._make_one('blob-name', bucket=None)
+        self._upload_from_file_checksum_helper(blob, created_json, skip=True)
+        self.assertEqual(blob.md5_hash, created_json['md5Hash'])
+
     def test_upload_from_file_success(self):
         stream = self._upload_from_file_helper()
         assert stream.tell() == 2
@@ -1172,6 +1643,8 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(exc_info.exception.errors, [])
 
     def _do_upload_mock_call_helper(self, blob, client, content_type, size):
+        from google.cloud.storage._helpers import _ChecksumReader
+
         self.assertEqual(blob._do_upload.call_count, 1)
         mock_call = blob._do_upload.mock_calls[0]
         call_name, pos_args, kwargs = mock_call
@@ -1183,7 +1656,9 @@ class Test_Blob(unittest.TestCase):
         self.assertIsNone(pos_args[4])  # num_retries
         self.assertEqual(kwargs, {})
 
-        return pos_args[1]
+        reader = pos_args[1]
+        self.assertIsInstance(reader, _ChecksumReader)
+        return reader._stream
 
     def test_upload_from_filename(self):
         from google.cloud._testing import _NamedTemporaryFile
@@ -1216,6 +1691,210 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(stream.mode, 'rb')
         self.assertEqual(stream.name, temp.name)
 
+    def _make_composite_blob(self, **kwargs):
+        bucket = mock.Mock(spec=['name', 'path', 'delete_blobs'])
+        bucket.name = 'name'
+        bucket.path = '/b/name'
+        blob = self._make_one('blob-name', bucket=bucket, **kwargs)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob._upload_component = mock.Mock(spec=[])
+        blob.compose = mock.Mock(spec=[])
+        return blob
+
+    def _composite_state_helper(self, filename, upload_id, uploaded):
+        import json
+        import os
+
+        file_stat = os.stat(filename)
+        state = {
+            'bucket': 'name',
+            'name': 'blob-name',
+            'size': file_stat.st_size,
+            'mtime': file_stat.st_mtime,
+            'ranges': [[0, 3], [4, 7], [8, 9]],
+            'upload_id': upload_id,
+            'uploaded': uploaded,
+        }
+        with open(filename + '.gcs-upload-state', 'w') as file_obj:
+            json.dump(state, file_obj)
+
+    def test_upload_from_filename_composite(self):
+        import os
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_composite_blob()
+        client = mock.sentinel.client
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'0123456789')
+
+            blob.upload_from_filename(
+                temp.name, content_type=u'text/plain', client=client,
+                parallelism=3)
+            state_exists = os.path.exists(temp.name + '.gcs-upload-state')
+
+        self.assertFalse(state_exists)
+        self.assertEqual(blob.content_type, u'text/plain')
+        calls = sorted(
+            blob._upload_component.mock_calls, key=lambda call: call[1][2])
+        self.assertEqual(
+            [call[1][1:] for call in calls],
+            [(temp.name, 0, 3, u'text/plain', client),
+             (temp.name, 4, 7, u'text/plain', client),
+             (temp.name, 8, 9, u'text/plain', client)])
+        components = [call[1][0] for call in calls]
+        for index, component in enumerate(components):
+            self.assertTrue(component.name.startswith(
+                u'blob-name.__component-'))
+            self.assertTrue(component.name.endswith(
+                u'-%d__' % (index,)))
+            self.assertIs(component.bucket, blob.bucket)
+            self.assertEqual(component.chunk_size, blob._SLICE_CHUNK_SIZE)
+        blob.compose.assert_called_once_with(components, client=client)
+        blob.bucket.delete_blobs.assert_called_once_with(
+            components, on_error=mock.ANY, client=client)
+        # Components which are already gone are ignored.
+        on_error = blob.bucket.delete_blobs.call_args[1]['on_error']
+        self.assertIsNone(on_error(components[0]))
+
+    def test_upload_from_filename_composite_resumes(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_composite_blob()
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'0123456789')
+            self._composite_state_helper(temp.name, 'abc', [0, 2])
+
+            blob.upload_from_filename(temp.name, parallelism=3)
+
+        blob._upload_component.assert_called_once_with(
+            mock.ANY, temp.name, 4, 7, u'application/octet-stream', None)
+        component = blob._upload_component.mock_calls[0][1][0]
+        self.assertEqual(component.name, u'blob-name.__component-abc-1__')
+        composed = blob.compose.mock_calls[0][1][0]
+        self.assertEqual(
+            [source.name for source in composed],
+            [u'blob-name.__component-abc-0__',
+             u'blob-name.__component-abc-1__',
+             u'blob-name.__component-abc-2__'])
+
+    def test_upload_from_filename_composite_w_failure(self):
+        import json
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_composite_blob()
+
+        def upload_component(component, filename, start, end,
+                             content_type, client):
+            if start == 4:
+                raise RuntimeError('boom')
+
+        blob._upload_component.side_effect = upload_component
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'0123456789')
+
+            with self.assertRaises(RuntimeError):
+                blob.upload_from_filename(temp.name, parallelism=3)
+
+            with open(temp.name + '.gcs-upload-state') as file_obj:
+                state = json.load(file_obj)
+
+        self.assertNotIn(1, state['uploaded'])
+        self.assertEqual(state['ranges'], [[0, 3], [4, 7], [8, 9]])
+        blob.compose.assert_not_called()
+        blob.bucket.delete_blobs.assert_not_called()
+
+    def test_upload_from_filename_composite_w_encryption_key(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_composite_blob(encryption_key=b'01' * 16)
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'0123456789')
+
+            with self.assertRaises(ValueError):
+                blob.upload_from_filename(temp.name, parallelism=3)
+
+        blob._upload_component.assert_not_called()
+
+    def _composite_fallback_helper(self, data, chunk_size_multiple):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_composite_blob()
+        blob._CHUNK_SIZE_MULTIPLE = chunk_size_multiple
+        blob._do_upload = mock.Mock(return_value={}, spec=[])
+        client = mock.sentinel.client
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(data)
+
+            blob.upload_from_filename(
+                temp.name, content_type=u'text/plain', client=client,
+                parallelism=3)
+
+        blob._upload_component.assert_not_called()
+        blob.compose.assert_not_called()
+        blob.bucket.delete_blobs.assert_not_called()
+        self._do_upload_mock_call_helper(
+            blob, client, u'text/plain', len(data))
+
+    def test_upload_from_filename_composite_w_empty_file(self):
+        self._composite_fallback_helper(b'', 1)
+
+    def test_upload_from_filename_composite_w_file_in_one_part(self):
+        self._composite_fallback_helper(b'0123456789', 10)
+
+    def test__upload_component(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_one('blob-name', bucket=None)
+        component = mock.Mock(spec=['upload_from_file'])
+        uploaded = []
+
+        def upload_from_file(stream, **kwargs):
+            uploaded.append((stream.read(), kwargs))
+
+        component.upload_from_file.side_effect = upload_from_file
+        client = mock.sentinel.client
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'0123456789')
+
+            blob._upload_component(
+                component, temp.name, 2, 5, u'text/plain', client)
+
+        self.assertEqual(uploaded, [
+            (b'2345', {'size': 4, 'content_type': u'text/plain',
+                       'client': client}),
+        ])
+
+    def test__compose_components_recursive(self):
+        from google.cloud.storage.blob import Blob
+
+        blob = self._make_one('blob-name', bucket=_Bucket())
+        components = [
+            self._make_one('part-%d' % (index,), bucket=blob.bucket)
+            for index in range(65)
+        ]
+        client = mock.sentinel.client
+        with mock.patch.object(Blob, 'compose', autospec=True) as compose:
+            intermediates = blob._compose_components(
+                components, u'text/plain', client)
+
+        self.assertEqual(
+            [intermediate.name for intermediate in intermediates],
+            ['part-0-composed', 'part-32-composed'])
+        for intermediate in intermediates:
+            self.assertEqual(intermediate.content_type, u'text/plain')
+        self.assertEqual(compose.mock_calls, [
+            mock.call(intermediates[0], components[:32], client=client),
+            mock.call(intermediates[1], components[32:64], client=client),
+            mock.call(blob, intermediates + components[64:], client=client),
+        ])
+        self.assertEqual(blob.content_type, u'text/plain')
+
     def _upload_from_string_helper(self, data, **kwargs):
         from google.cloud._helpers import _to_bytes
 
@@ -2183,6 +2862,117 @@ class Test__quote(unittest.TestCase):
             self._call_fut(None)
 
 
+class Test__slice_ranges(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args):
+        from google.cloud.storage.blob import _slice_ranges
+
+        return _slice_ranges(*args)
+
+    def test_even(self):
+        self.assertEqual(
+            self._call_fut(12, 3, 1), [(0, 3), (4, 7), (8, 11)])
+
+    def test_rounds_up_to_multiple(self):
+        self.assertEqual(self._call_fut(10, 4, 4), [(0, 3), (4, 7), (8, 9)])
+
+    def test_more_slices_than_bytes(self):
+        self.assertEqual(self._call_fut(2, 8, 1), [(0, 0), (1, 1)])
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut(0, 4, 1), [])
+
+
+class Test__call_concurrently(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args):
+        from google.cloud.storage.blob import _call_concurrently
+
+        return _call_concurrently(*args)
+
+    def test_success(self):
+        result = self._call_fut(pow, 2, [(2, 3), (3, 2), (4, 0)])
+        self.assertEqual(result, [8, 9, 1])
+
+    def test_failure(self):
+        with self.assertRaises(ZeroDivisionError):
+            self._call_fut(divmod, 1, [(1, 1), (1, 0), (2, 1)])
+
+
+class Test__load_upload_state(unittest.TestCase):
+
+    @staticmethod
+    def _call_fut(*args):
+        from google.cloud.storage.blob import _load_upload_state
+
+        return _load_upload_state(*args)
+
+    def test_missing(self):
+        expected = {'name': 'blob-name', 'ranges': [(0, 1)]}
+        state = self._call_fut('/does/not/exist', expected)
+        self.assertEqual(state['name'], 'blob-name')
+        self.assertEqual(state['ranges'], [(0, 1)])
+        self.assertEqual(state['uploaded'], [])
+        self.assertEqual(len(state['upload_id']), 32)
+
+    def test_round_trip(self):
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.storage.blob import _save_upload_state
+
+        expected = {'name': 'blob-name', 'ranges': [(0, 1), (2, 3)]}
+        with _NamedTemporaryFile() as temp:
+            state = self._call_fut(temp.name, expected)
+            state['uploaded'].append(1)
+            _save_upload_state(temp.name, state)
+            loaded = self._call_fut(temp.name, expected)
+
+        self.assertEqual(loaded['upload_id'], state['upload_id'])
+        self.assertEqual(loaded['uploaded'], [1])
+
+    def test_mismatch(self):
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.storage.blob import _save_upload_state
+
+        expected = {'name': 'blob-name', 'ranges': [(0, 1)]}
+        with _NamedTemporaryFile() as temp:
+            state = self._call_fut(temp.name, expected)
+            state['uploaded'].append(0)
+            _save_upload_state(temp.name, state)
+            expected['ranges'] = [(0, 2)]
+            loaded = self._call_fut(temp.name, expected)
+
+        self.assertNotEqual(loaded['upload_id'], state['upload_id'])
+        self.assertEqual(loaded['uploaded'], [])
+
+
+class Test_FileSlice(unittest.TestCase):
+
+    @staticmethod
+    def _make_one(*args):
+        from google.cloud.storage.blob import _FileSlice
+
+        return _FileSlice(*args)
+
+    def test_read(self):
+        stream = self._make_one(io.BytesIO(b'0123456789'), 3, 5)
+        self.assertEqual(stream.tell(), 0)
+        self.assertEqual(stream.read(2), b'34')
+        self.assertEqual(stream.tell(), 2)
+        self.assertEqual(stream.read(), b'567')
+        self.assertEqual(stream.read(1), b'')
+
+    def test_seek(self):
+        stream = self._make_one(io.BytesIO(b'0123456789'), 3, 5)
+        self.assertEqual(stream.seek(0, os.SEEK_END), 5)
+        self.assertEqual(stream.seek(-2, os.SEEK_CUR), 3)
+        self.assertEqual(stream.read(), b'67')
+        self.assertEqual(stream.seek(1), 1)
+        self.assertEqual(stream.read(2), b'45')
+        self.assertEqual(stream.seek(100), 5)
+
+
 class Test__maybe_rewind(unittest.TestCase):
 
     @staticmethod
@@ -2307,8 +3097,11 @@ class _Signer(object):
 
 class _Client(object):
 
-    def __init__(self, connection):
+    current_batch = None
+
+    def __init__(self, connection, metadata_cache=None):
         self._base_connection = connection
+        self.metadata_cache = metadata_cache
 
     @property
     def _connection(self):
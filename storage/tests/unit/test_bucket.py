@@ -13,6 +13,9 @@
 # limitations under the License.
 
 import datetime
+import os
+import shutil
+import tempfile
 import unittest
 
 import mock
@@ -31,6 +34,25 @@ def _create_signing_credentials():
     return credentials
 
 
+class Test__make_pooled_transport(unittest.TestCase):
+
+    def _call_fut(self, credentials, pool_size):
+        from google.cloud.storage.bucket import _make_pooled_transport
+
+        return _make_pooled_transport(credentials, pool_size)
+
+    def test_it(self):
+        import google.auth.credentials
+        from google.auth.transport.requests import AuthorizedSession
+
+        credentials = mock.Mock(spec=google.auth.credentials.Credentials)
+        transport = self._call_fut(credentials, 20)
+        self.assertIsInstance(transport, AuthorizedSession)
+        self.assertIs(transport.credentials, credentials)
+        adapter = transport.get_adapter('https://www.googleapis.com/')
+        self.assertEqual(adapter._pool_maxsize, 20)
+
+
 class Test_Bucket(unittest.TestCase):
 
     def _make_one(self, client=None, name=None, properties=None):
@@ -242,6 +264,49 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['method'], 'GET')
         self.assertEqual(kw['path'], '/b/%s/o/%s' % (NAME, BLOB_NAME))
 
+    def test_get_blob_w_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        NAME = 'name'
+        BLOB_NAME = 'blob-name'
+        connection = _Connection({'name': BLOB_NAME, 'size': '3'})
+        client = _Client(connection, metadata_cache=MetadataCache())
+        bucket = self._make_one(name=NAME)
+        first = bucket.get_blob(BLOB_NAME, client=client)
+        second = bucket.get_blob(BLOB_NAME, client=client)
+        self.assertEqual(first.size, 3)
+        self.assertEqual(second.size, 3)
+        self.assertEqual(second.name, BLOB_NAME)
+        self.assertEqual(len(connection._requested), 1)
+        cache = client.metadata_cache
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_get_blob_miss_w_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        connection = _Connection()
+        client = _Client(connection, metadata_cache=MetadataCache())
+        bucket = self._make_one(name='name')
+        self.assertIsNone(bucket.get_blob('nonesuch', client=client))
+        self.assertEqual(len(client.metadata_cache), 0)
+
+    def test_list_blobs_refreshes_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        NAME = 'name'
+        items = [{'name': 'cached', 'generation': '2', 'size': '5'},
+                 {'name': 'uncached', 'generation': '1'}]
+        connection = _Connection({'items': items})
+        client = _Client(connection, metadata_cache=MetadataCache())
+        client.metadata_cache.put(
+            '/b/name/o/cached', {'name': 'cached', 'generation': '1'})
+        bucket = self._make_one(client=client, name=NAME)
+        list(bucket.list_blobs())
+
+        cache = client.metadata_cache
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get('/b/name/o/cached')['size'], '5')
+
     def test_list_blobs_defaults(self):
         NAME = 'name'
         connection = _Connection({'items': []})
@@ -479,6 +544,284 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw[1]['method'], 'DELETE')
         self.assertEqual(kw[1]['path'], '/b/%s/o/%s' % (NAME, NONESUCH))
 
+    def _bulk_helper(self, method_name, results, *args, **kwargs):
+        NAME = 'name'
+        client = _Client(_Connection())
+        bucket = self._make_one(client=client, name=NAME)
+        sent = []
+
+        def send_batches(client, requests, max_workers):
+            sent.append((client, list(requests), max_workers))
+            return list(results)
+
+        patch_send = mock.patch(
+            'google.cloud.storage.bucket._send_batches',
+            side_effect=send_batches)
+        patch_max = mock.patch(
+            'google.cloud.storage.bucket._max_concurrent_requests',
+            return_value=3)
+        with patch_send, patch_max as max_batches:
+            found = getattr(bucket, method_name)(*args, **kwargs)
+
+        self.assertEqual(len(sent), 1)
+        self.assertIs(sent[0][0], client)
+        if kwargs.get('max_workers') is None:
+            max_batches.assert_called_once_with(client)
+            self.assertEqual(sent[0][2], 3)
+        else:
+            max_batches.assert_not_called()
+            self.assertEqual(sent[0][2], kwargs['max_workers'])
+        return bucket, sent[0][1], found
+
+    def test_bulk_delete(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud.storage.blob import Blob
+
+        not_found = NotFound('miss')
+        blob = Blob('blob-name2', bucket=None)
+        bucket, requests, found = self._bulk_helper(
+            'bulk_delete', ['', not_found], iter(['blob-name1', blob]))
+
+        self.assertEqual(requests, [
+            ('DELETE', '/b/name/o/blob-name1', None, None),
+            ('DELETE', '/b/name/o/blob-name2', None, None),
+        ])
+        self.assertEqual(found, [None, not_found])
+
+    def test_bulk_delete_w_max_workers(self):
+        _, requests, found = self._bulk_helper(
+            'bulk_delete', [''], ['blob-name'], max_workers=8)
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(found, [None])
+
+    def test_bulk_copy(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud.storage.blob import Blob
+
+        client = _Client(_Connection())
+        source = self._make_one(client=client, name='source')
+        dest = self._make_one(client=client, name='dest')
+        blob1 = Blob('blob-name1', bucket=source)
+        blob2 = Blob('blob-name2', bucket=source)
+        not_found = NotFound('miss')
+        bucket, requests, found = self._bulk_helper(
+            'bulk_copy', [{'name': 'new-name1', 'size': '3'}, not_found],
+            [blob1, blob2], dest, new_names=['new-name1', 'new-name2'])
+
+        self.assertEqual(requests, [
+            ('POST', '/b/source/o/blob-name1/copyTo/b/dest/o/new-name1',
+             None, None),
+            ('POST', '/b/source/o/blob-name2/copyTo/b/dest/o/new-name2',
+             None, None),
+        ])
+        self.assertEqual(len(found), 2)
+        self.assertIsInstance(found[0], Blob)
+        self.assertIs(found[0].bucket, dest)
+        self.assertEqual(found[0].name, 'new-name1')
+        self.assertEqual(found[0].size, 3)
+        self.assertIs(found[1], not_found)
+
+    def test_bulk_copy_wo_new_names(self):
+        from google.cloud.storage.blob import Blob
+
+        client = _Client(_Connection())
+        dest = self._make_one(client=client, name='dest')
+        blob = Blob('blob-name', bucket=dest)
+        _, requests, found = self._bulk_helper(
+            'bulk_copy', [{}], [blob], dest)
+        self.assertEqual(requests, [
+            ('POST', '/b/dest/o/blob-name/copyTo/b/dest/o/blob-name',
+             None, None),
+        ])
+        self.assertEqual(found[0].name, 'blob-name')
+
+    def test_bulk_copy_w_new_names_mismatch(self):
+        from google.cloud.storage.blob import Blob
+
+        bucket = self._make_one(name='name')
+        blob = Blob('blob-name', bucket=bucket)
+        with self.assertRaises(ValueError):
+            bucket.bulk_copy([blob], bucket, new_names=['one', 'two'])
+
+    def test_bulk_update_acl_w_current_acl(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud.storage.blob import Blob
+
+        bucket = self._make_one(name='name')
+        blob1 = Blob('blob-name1', bucket=bucket)
+        blob2 = Blob('blob-name2', bucket=bucket)
+        for blob in (blob1, blob2):
+            blob.acl.loaded = True
+            blob.acl.all().grant_read()
+        permissive = [{'entity': 'allUsers', 'role': 'READER'}]
+        not_found = NotFound('miss')
+        _, requests, found = self._bulk_helper(
+            'bulk_update_acl', [{'acl': permissive}, not_found],
+            [blob1, blob2])
+
+        self.assertEqual(requests, [
+            ('PATCH', '/b/name/o/blob-name1', {'acl': permissive},
+             {'projection': 'full'}),
+            ('PATCH', '/b/name/o/blob-name2', {'acl': permissive},
+             {'projection': 'full'}),
+        ])
+        self.assertEqual(found, [blob1, not_found])
+        self.assertEqual(list(blob1.acl), permissive)
+
+    def test_bulk_update_acl_w_predefined(self):
+        from google.cloud.storage.blob import Blob
+
+        bucket = self._make_one(name='name')
+        blob = Blob('blob-name', bucket=bucket)
+        _, requests, found = self._bulk_helper(
+            'bulk_update_acl', [{}], [blob], predefined='public-read')
+
+        self.assertEqual(requests, [
+            ('PATCH', '/b/name/o/blob-name', {'acl': []},
+             {'projection': 'full', 'predefinedAcl': 'publicRead'}),
+        ])
+        self.assertEqual(found, [blob])
+        self.assertTrue(blob.acl.loaded)
+        self.assertEqual(list(blob.acl), [])
+
+    def test_bulk_update_acl_w_invalid_predefined(self):
+        bucket = self._make_one(name='name')
+        with self.assertRaises(ValueError):
+            bucket.bulk_update_acl([], predefined='bogus')
+
+    def test_bulk_patch(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud.storage.blob import Blob
+
+        bucket = self._make_one(name='name')
+        blob1 = Blob('blob-name1', bucket=bucket)
+        blob1.content_type = 'text/plain'
+        blob2 = Blob('blob-name2', bucket=bucket)
+        blob2.metadata = {'color': 'red'}
+        not_found = NotFound('miss')
+        _, requests, found = self._bulk_helper(
+            'bulk_patch',
+            [{'name': 'blob-name1', 'contentType': 'text/plain'}, not_found],
+            [blob1, blob2])
+
+        self.assertEqual(requests, [
+            ('PATCH', '/b/name/o/blob-name1', {'contentType': 'text/plain'},
+             {'projection': 'full'}),
+            ('PATCH', '/b/name/o/blob-name2', {'metadata': {'color': 'red'}},
+             {'projection': 'full'}),
+        ])
+        self.assertEqual(found, [blob1, not_found])
+        self.assertEqual(blob1._changes, set())
+        self.assertEqual(blob2._changes, set(['metadata']))
+
+    def _download_many_helper(self, destination, contents, **kw):
+        from google.cloud.storage.blob import Blob
+
+        bucket = self._make_one(name='name')
+        transport = object()
+        downloaded = []
+
+        def download_with_transport(blob, transport_, file_obj):
+            self.assertIs(transport_, transport)
+            downloaded.append(blob.name)
+            data = contents[blob.name]
+            if isinstance(data, Exception):
+                file_obj.write(b'partial')
+                raise data
+            file_obj.write(data)
+
+        patch_transport = mock.patch(
+            'google.cloud.storage.bucket._make_pooled_transport',
+            return_value=transport)
+        patch_download = mock.patch.object(
+            Blob, '_download_with_transport', autospec=True,
+            side_effect=download_with_transport)
+        with patch_transport as make_transport, patch_download:
+            results = bucket.download_many(
+                ['a.txt', Blob('sub/b.txt', bucket=bucket), 'missing'],
+                destination, **kw)
+
+        make_transport.assert_called_once_with(
+            bucket.client._credentials, kw.get('max_workers', 16))
+        self.assertEqual(sorted(downloaded), ['a.txt', 'missing', 'sub/b.txt'])
+        return results
+
+    def test_download_many_to_directory(self):
+        from google.cloud.exceptions import NotFound
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        not_found = NotFound('missing')
+        results = self._download_many_helper(directory, {
+            'a.txt': b'A', 'sub/b.txt': b'B', 'missing': not_found,
+        }, max_workers=2)
+
+        self.assertEqual(results, [None, None, not_found])
+        self.assertEqual(sorted(os.listdir(directory)), ['a.txt', 'sub'])
+        with open(os.path.join(directory, 'sub', 'b.txt'), 'rb') as file_obj:
+            self.assertEqual(file_obj.read(), b'B')
+
+    def test_download_many_to_directory_w_hostile_name(self):
+        from google.cloud.storage.blob import Blob
+
+        parent = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, parent)
+        directory = os.path.join(parent, 'dest')
+        os.mkdir(directory)
+        bucket = self._make_one(name='name')
+
+        patch_transport = mock.patch(
+            'google.cloud.storage.bucket._make_pooled_transport')
+        patch_download = mock.patch.object(
+            Blob, '_download_with_transport', autospec=True)
+        with patch_transport, patch_download as download:
+            results = bucket.download_many(
+                ['../escape.txt', 'a/../../escape.txt', '/etc/escape.txt'],
+                directory)
+
+        self.assertEqual([type(result) for result in results],
+                         [ValueError] * 3)
+        download.assert_not_called()
+        self.assertEqual(os.listdir(parent), ['dest'])
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_download_many_to_directory_w_file_in_the_way(self):
+        from google.cloud.storage.blob import Blob
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        open(os.path.join(directory, 'sub'), 'wb').close()
+        bucket = self._make_one(name='name')
+
+        patch_transport = mock.patch(
+            'google.cloud.storage.bucket._make_pooled_transport')
+        patch_download = mock.patch.object(
+            Blob, '_download_with_transport', autospec=True)
+        with patch_transport, patch_download as download:
+            result, = bucket.download_many(['sub/b.txt'], directory)
+
+        self.assertIsInstance(result, OSError)
+        download.assert_not_called()
+
+    def test_download_many_w_callback(self):
+        from google.cloud.exceptions import NotFound
+
+        received = {}
+        error = ValueError('callback failed')
+
+        def callback(blob, data):
+            received[blob.name] = data
+            if blob.name == 'sub/b.txt':
+                raise error
+
+        not_found = NotFound('missing')
+        results = self._download_many_helper(callback, {
+            'a.txt': b'A', 'sub/b.txt': b'B', 'missing': not_found,
+        })
+
+        self.assertEqual(results, [None, error, not_found])
+        self.assertEqual(received, {'a.txt': b'A', 'sub/b.txt': b'B'})
+
     def test_copy_blobs_wo_name(self):
         SOURCE = 'source'
         DEST = 'dest'
@@ -1339,7 +1682,11 @@ class _Connection(object):
 
 class _Client(object):
 
-    def __init__(self, connection, project=None):
+    current_batch = None
+    _credentials = object()
+
+    def __init__(self, connection, project=None, metadata_cache=None):
         self._connection = connection
         self._base_connection = connection
         self.project = project
+        self.metadata_cache = metadata_cache
@@ -0,0 +1,381 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import mock
+
+
+class TestMetadataCache(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.cache import MetadataCache
+
+        return MetadataCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_constructor_defaults(self):
+        cache = self._make_one()
+        self.assertEqual(cache.max_size, 1024)
+        self.assertEqual(cache.ttl, 60.0)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+        self.assertEqual(len(cache), 0)
+
+    def test_get_miss(self):
+        cache = self._make_one()
+        self.assertIsNone(cache.get('/b/name'))
+        self.assertEqual(cache.misses, 1)
+
+    def test_put_and_get(self):
+        cache = self._make_one()
+        properties = {'name': 'name', 'metadata': {'a': 'b'}}
+        cache.put('/b/name', properties)
+        properties['metadata']['a'] = 'changed'
+
+        found = cache.get('/b/name')
+        self.assertEqual(found, {'name': 'name', 'metadata': {'a': 'b'}})
+        self.assertEqual(cache.hits, 1)
+        # Callers get a copy, which they may modify.
+        found['metadata']['a'] = 'changed'
+        self.assertEqual(cache.get('/b/name')['metadata'], {'a': 'b'})
+
+    def test_get_expired(self):
+        cache = self._make_one(ttl=10)
+        with mock.patch('time.time', return_value=100.0):
+            cache.put('/b/name', {})
+        with mock.patch('time.time', return_value=109.0):
+            self.assertEqual(cache.get('/b/name'), {})
+        with mock.patch('time.time', return_value=110.0):
+            self.assertIsNone(cache.get('/b/name'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(cache), 0)
+
+    def test_put_evicts_least_recently_used(self):
+        cache = self._make_one(max_size=2)
+        cache.put('/b/one', {})
+        cache.put('/b/two', {})
+        cache.get('/b/one')
+        cache.put('/b/three', {})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('/b/two'))
+        self.assertEqual(cache.get('/b/one'), {})
+        self.assertEqual(cache.get('/b/three'), {})
+
+    def test_put_older_version(self):
+        cache = self._make_one()
+        newer = {'generation': '2', 'metageneration': '1'}
+        cache.put('/b/b/o/o', newer)
+        cache.put('/b/b/o/o', {'generation': '1', 'metageneration': '5'})
+        self.assertEqual(cache.get('/b/b/o/o'), newer)
+
+    def test_refresh_wo_entry(self):
+        cache = self._make_one()
+        cache.refresh('/b/name', {'metageneration': '2'})
+        self.assertEqual(len(cache), 0)
+
+    def test_refresh_w_newer_version(self):
+        cache = self._make_one()
+        cache.put('/b/name', {'metageneration': '1', 'x': 'old'})
+        cache.refresh('/b/name', {'metageneration': '2', 'x': 'new'})
+        self.assertEqual(cache.get('/b/name')['x'], 'new')
+
+    def test_refresh_w_same_version(self):
+        cache = self._make_one()
+        cache.put('/b/name', {'metageneration': '1', 'x': 'full'})
+        cache.refresh('/b/name', {'metageneration': '1'})
+        self.assertEqual(cache.get('/b/name')['x'], 'full')
+
+    def test_refresh_holds_lock(self):
+        cache = self._make_one()
+        cache.put('/b/name', {'metageneration': '1'})
+        cache._lock = mock.MagicMock()
+        cache.refresh('/b/name', {'metageneration': '2'})
+        cache._lock.__enter__.assert_called_once_with()
+        self.assertEqual(cache.get('/b/name'), {'metageneration': '2'})
+
+    def test_invalidate(self):
+        cache = self._make_one()
+        cache.put('/b/name', {})
+        cache.invalidate('/b/name')
+        cache.invalidate('/b/missing')
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate_request(self):
+        cache = self._make_one()
+        paths = ['/b/src', '/b/src/o/a%2Fb', '/b/dst', '/b/dst/o/c',
+                 '/b/other/o/c']
+        for path in paths:
+            cache.put(path, {})
+
+        cache.invalidate_request(
+            '/storage/v1/b/src/o/a%2Fb/rewriteTo/b/dst/o/c')
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get('/b/src/o/a%2Fb'))
+        self.assertIsNone(cache.get('/b/dst/o/c'))
+
+        cache.invalidate_request('/storage/v1/b/src/defaultObjectAcl')
+        self.assertIsNone(cache.get('/b/src'))
+        self.assertEqual(cache.get('/b/dst'), {})
+
+    def test_clear(self):
+        cache = self._make_one()
+        cache.put('/b/name', {})
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+def _make_blob(name, generation=1, size=None):
+    from google.cloud.storage.blob import Blob
+
+    bucket = mock.Mock(path='/b/bucket', spec=['name', 'path'])
+    bucket.name = 'bucket'
+    blob = Blob(name, bucket=bucket)
+    properties = {'name': name, 'generation': str(generation)}
+    if size is not None:
+        properties['size'] = str(size)
+    blob._set_properties(properties)
+    return blob
+
+
+class TestDownloadCache(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.cache import DownloadCache
+
+        return DownloadCache
+
+    def _make_one(self, **kw):
+        import shutil
+        import tempfile
+
+        parent = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, parent)
+        directory = os.path.join(parent, 'cache')
+        return self._get_target_class()(directory, **kw)
+
+    @staticmethod
+    def _add(cache, blob, data):
+        with cache.adding(blob) as cache_file:
+            cache_file.write(data)
+
+    @staticmethod
+    def _read(cache, blob):
+        import io
+
+        file_obj = io.BytesIO()
+        if cache.read_into(blob, file_obj):
+            return file_obj.getvalue()
+        return None
+
+    def test_constructor(self):
+        cache = self._make_one()
+        self.assertTrue(os.path.isdir(cache.directory))
+        self.assertEqual(cache.max_bytes, 1024 * 1024 * 1024)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions),
+                         (0, 0, 0))
+        # Sharing an existing directory.
+        self._get_target_class()(cache.directory)
+
+    def test_constructor_w_file(self):
+        import tempfile
+
+        with tempfile.NamedTemporaryFile() as temp:
+            with self.assertRaises(OSError):
+                self._get_target_class()(temp.name)
+
+    def test_add_and_read(self):
+        cache = self._make_one()
+        blob = _make_blob('a/b', size=3)
+        self.assertIsNone(self._read(cache, blob))
+        self.assertNotIn(blob, cache)
+
+        self._add(cache, blob, b'abc')
+        self.assertIn(blob, cache)
+        self.assertEqual(self._read(cache, blob), b'abc')
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.size(), 3)
+
+        # Other generations and blobs are separate entries.
+        self.assertIsNone(self._read(cache, _make_blob('a/b', generation=2)))
+        self.assertIsNone(self._read(cache, _make_blob('a/c')))
+
+    def test_read_copies_outside_lock(self):
+        import contextlib
+        from google.cloud.storage import cache as MUT
+
+        cache = self._make_one()
+        blob = _make_blob('a')
+        self._add(cache, blob, b'abc')
+
+        held = []
+        file_lock = MUT._file_lock
+
+        @contextlib.contextmanager
+        def _file_lock(filename, shared=False):
+            with file_lock(filename, shared=shared):
+                held.append(shared)
+                yield
+                held.pop()
+
+        writes = []
+
+        class _File(object):
+            def write(self, data):
+                writes.append((data, list(held)))
+
+        with mock.patch.object(MUT, '_file_lock', new=_file_lock):
+            self.assertTrue(cache.read_into(blob, _File()))
+        self.assertEqual(writes, [(b'abc', [])])
+
+    def test_read_w_size_mismatch(self):
+        cache = self._make_one()
+        self._add(cache, _make_blob('a'), b'abc')
+        self.assertIsNone(self._read(cache, _make_blob('a', size=4)))
+        self.assertEqual(cache.misses, 1)
+
+    def test_adding_w_error(self):
+        cache = self._make_one()
+        blob = _make_blob('a')
+        with self.assertRaises(KeyError):
+            with cache.adding(blob) as cache_file:
+                cache_file.write(b'partial')
+                raise KeyError('failed')
+        self.assertNotIn(blob, cache)
+        self.assertEqual(os.listdir(cache.directory), [])
+
+    def test_add_file(self):
+        import tempfile
+
+        cache = self._make_one()
+        blob = _make_blob('a')
+        with tempfile.NamedTemporaryFile() as temp:
+            temp.write(b'contents')
+            temp.flush()
+            cache.add_file(blob, temp.name)
+        self.assertEqual(self._read(cache, blob), b'contents')
+
+    def test_add_wo_listing_directory(self):
+        cache = self._make_one(max_bytes=10)
+        self._add(cache, _make_blob('a'), b'x' * 4)
+
+        with mock.patch('os.listdir') as listdir:
+            self._add(cache, _make_blob('b'), b'x' * 4)
+            self._add(cache, _make_blob('a'), b'x' * 6)  # Replaces.
+        listdir.assert_not_called()
+        self.assertEqual(cache._read_total(), 10)
+        self.assertEqual(cache.size(), 10)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_add_w_unreadable_total(self):
+        cache = self._make_one()
+        self._add(cache, _make_blob('a'), b'abc')
+        with open(cache._size_filename(), 'w') as size_file:
+            size_file.write('garbage')
+
+        self._add(cache, _make_blob('b'), b'defg')
+        self.assertEqual(cache._read_total(), 7)
+
+    def test_evicts_below_max_bytes(self):
+        cache = self._make_one(max_bytes=10)
+        blobs = [_make_blob(name) for name in 'abcdef']
+        for index, blob in enumerate(blobs[:5]):
+            self._add(cache, blob, b'x' * 2)
+            os.utime(cache._path(blob), (1000 + index, 1000 + index))
+
+        self._add(cache, blobs[5], b'x' * 2)
+        self.assertEqual(cache.evictions, 2)
+        self.assertNotIn(blobs[0], cache)
+        self.assertNotIn(blobs[1], cache)
+        self.assertEqual(cache.size(), 8)
+        self.assertEqual(cache._read_total(), 8)
+
+    def test_evicts_all(self):
+        cache = self._make_one(max_bytes=0)
+        self._add(cache, _make_blob('a'), b'abc')
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache._read_total(), 0)
+
+    def test_evict_w_removed_download(self):
+        cache = self._make_one()
+        stat = os.stat
+
+        def _stat(path):
+            if os.path.basename(path) == 'gone':
+                raise OSError(path)
+            return stat(path)
+
+        open(os.path.join(cache.directory, 'gone'), 'wb').close()
+        with mock.patch('os.stat', new=_stat):
+            self._add(cache, _make_blob('a'), b'abc')
+        self.assertEqual(cache._read_total(), 3)
+
+    def test_evicts_least_recently_used(self):
+        cache = self._make_one(max_bytes=10)
+        blobs = [_make_blob(name) for name in 'abc']
+        for index, blob in enumerate(blobs[:2]):
+            self._add(cache, blob, b'x' * 4)
+            os.utime(cache._path(blob), (1000 + index, 1000 + index))
+        self._read(cache, blobs[0])  # Now most recently used.
+
+        self._add(cache, blobs[2], b'x' * 4)
+        self.assertIn(blobs[0], cache)
+        self.assertNotIn(blobs[1], cache)
+        self.assertIn(blobs[2], cache)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.size(), 8)
+
+    def test_evict_removes_stale_downloads(self):
+        from google.cloud.storage.cache import _STALE_TEMP_SECONDS
+
+        cache = self._make_one()
+        stale = os.path.join(cache.directory, '.tmp-stale')
+        fresh = os.path.join(cache.directory, '.tmp-fresh')
+        for path in (stale, fresh):
+            open(path, 'wb').close()
+        os.utime(stale, (1000, 1000))
+
+        with mock.patch('time.time',
+                        return_value=1001 + _STALE_TEMP_SECONDS):
+            self._add(cache, _make_blob('a'), b'abc')
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(fresh))
+
+    def test_clear(self):
+        cache = self._make_one()
+        self._add(cache, _make_blob('a'), b'abc')
+        cache.clear()
+        self.assertEqual(cache.size(), 0)
+        self.assertEqual(sorted(os.listdir(cache.directory)),
+                         ['.lock', '.size'])
+        self.assertEqual(cache._read_total(), 0)
+
+
+class Test__TeeWriter(unittest.TestCase):
+
+    def test_write(self):
+        import io
+        from google.cloud.storage.cache import _TeeWriter
+
+        file_obj, copy_obj = io.BytesIO(), io.BytesIO()
+        writer = _TeeWriter(file_obj, copy_obj)
+        writer.write(b'abc')
+        writer.write(b'def')
+        self.assertEqual(file_obj.getvalue(), b'abcdef')
+        self.assertEqual(copy_obj.getvalue(), b'abcdef')
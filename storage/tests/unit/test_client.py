@@ -46,6 +46,24 @@ class TestClient(unittest.TestCase):
         self.assertIs(client._connection.credentials, CREDENTIALS)
         self.assertIsNone(client.current_batch)
         self.assertEqual(list(client._batch_stack), [])
+        self.assertIsNone(client.metadata_cache)
+        self.assertIsNone(client.download_cache)
+
+    def test_ctor_w_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        cache = MetadataCache()
+        client = self._make_one(project='PROJECT',
+                                credentials=_make_credentials(),
+                                metadata_cache=cache)
+        self.assertIs(client.metadata_cache, cache)
+
+    def test_ctor_w_download_cache(self):
+        cache = object()
+        client = self._make_one(project='PROJECT',
+                                credentials=_make_credentials(),
+                                download_cache=cache)
+        self.assertIs(client.download_cache, cache)
 
     def test__push_batch_and__pop_batch(self):
         from google.cloud.storage.batch import Batch
@@ -332,6 +350,24 @@ class TestClient(unittest.TestCase):
         self.assertEqual(parse_qs(urlparse(http._called_with['uri']).query),
                          parse_qs(urlparse(URI).query))
 
+    def test_list_buckets_refreshes_metadata_cache(self):
+        from google.cloud.storage.cache import MetadataCache
+
+        cache = MetadataCache()
+        cache.put('/b/cached', {'name': 'cached', 'metageneration': '1'})
+        client = self._make_one(project='PROJECT',
+                                credentials=_make_credentials(),
+                                metadata_cache=cache)
+        client._http_internal = _Http(
+            {'status': '200', 'content-type': 'application/json'},
+            b'{"items": [{"name": "cached", "metageneration": "2"}, '
+            b'{"name": "other", "metageneration": "1"}]}',
+        )
+        buckets = list(client.list_buckets())
+        self.assertEqual(len(buckets), 2)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get('/b/cached')['metageneration'], '2')
+
     def test_list_buckets_all_arguments(self):
         from six.moves.urllib.parse import parse_qs
         from six.moves.urllib.parse import urlparse
@@ -0,0 +1,343 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import mock
+
+
+def _make_blob(name=u'blob-name', **properties):
+    from google.cloud.storage.blob import Blob
+
+    bucket = mock.Mock(path='/b/name', client=None, spec=['path', 'client'])
+    blob = Blob(name, bucket=bucket)
+    blob._set_properties(dict(properties, name=name))
+    return blob
+
+
+def _make_ranged_transport(data):
+    from six.moves import http_client
+
+    transport = mock.Mock(spec=['request'])
+
+    def request(method, url, data=None, headers=None):
+        start, _, end = headers['range'][len('bytes='):].partition('-')
+        return mock.Mock(
+            status_code=http_client.PARTIAL_CONTENT, headers={},
+            content=content[int(start):int(end) + 1],
+            spec=['status_code', 'headers', 'content'])
+
+    content = data
+    transport.request.side_effect = request
+    return transport
+
+
+class TestBlobReader(unittest.TestCase):
+
+    DATA = b'0123456789abcdefghij'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobReader
+
+        return BlobReader
+
+    def _make_one(self, blob, **kw):
+        return self._get_target_class()(blob, **kw)
+
+    def _make_reader(self, **kw):
+        blob = _make_blob(size=str(len(self.DATA)))
+        transport = _make_ranged_transport(self.DATA)
+        blob._make_transport = mock.Mock(return_value=transport, spec=[])
+        return self._make_one(blob, **kw), transport
+
+    @staticmethod
+    def _requested_ranges(transport):
+        return [call[1]['headers']['range']
+                for call in transport.request.call_args_list]
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.fileio import DEFAULT_BLOCK_SIZE
+
+        reader, transport = self._make_reader()
+        self.assertEqual(reader.block_size, DEFAULT_BLOCK_SIZE)
+        self.assertTrue(reader.readable())
+        self.assertTrue(reader.seekable())
+        self.assertFalse(reader.writable())
+        self.assertEqual(reader.tell(), 0)
+        transport.request.assert_not_called()
+
+    def test_ctor_wo_size(self):
+        blob = _make_blob()
+        blob._make_transport = mock.Mock(spec=[])
+
+        def reload(client=None):
+            blob._set_properties({'name': blob.name, 'size': '10'})
+
+        blob.reload = mock.Mock(side_effect=reload, spec=[])
+        client = object()
+        reader = self._make_one(blob, client=client)
+        blob.reload.assert_called_once_with(client=client)
+        self.assertEqual(reader.seek(0, os.SEEK_END), 10)
+
+    def test_read_sequential_w_read_ahead(self):
+        reader, transport = self._make_reader(block_size=4, read_ahead=2)
+        self.assertEqual(reader.read(3), b'012')
+        self.assertEqual(reader.read(6), b'345678')
+        self.assertEqual(reader.read(), b'9abcdefghij')
+        self.assertEqual(reader.read(), b'')
+        self.assertEqual(self._requested_ranges(transport), [
+            'bytes=0-7', 'bytes=8-15', 'bytes=16-19'])
+
+    def test_seek_reads_single_blocks(self):
+        reader, transport = self._make_reader(block_size=4, read_ahead=3)
+        self.assertEqual(reader.seek(-3, os.SEEK_END), 17)
+        self.assertEqual(reader.read(), b'hij')
+        reader.seek(5)
+        self.assertEqual(reader.read(2), b'56')
+        reader.seek(-4, os.SEEK_CUR)
+        self.assertEqual(reader.read(2), b'34')
+        self.assertEqual(self._requested_ranges(transport), [
+            'bytes=16-19', 'bytes=4-7', 'bytes=0-3'])
+
+    def test_cache_evicts_least_recently_used(self):
+        reader, transport = self._make_reader(
+            block_size=4, cache_blocks=2, read_ahead=1)
+        for position in (0, 8, 0, 16, 0, 8):
+            reader.seek(position)
+            reader.read(1)
+        self.assertEqual(self._requested_ranges(transport), [
+            'bytes=0-3', 'bytes=8-11', 'bytes=16-19', 'bytes=8-11'])
+
+    def test_seek_invalid(self):
+        reader, _ = self._make_reader()
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+        with self.assertRaises(ValueError):
+            reader.seek(0, 5)
+
+    def test_readinto_w_error(self):
+        from six.moves import http_client
+        from google.cloud.exceptions import NotFound
+
+        reader, transport = self._make_reader()
+        transport.request.side_effect = None
+        transport.request.return_value = mock.Mock(
+            status_code=http_client.NOT_FOUND, headers={}, content=b'',
+            spec=['status_code', 'headers', 'content'])
+        with self.assertRaises(NotFound):
+            reader.read(1)
+
+
+class _FakeUpload(object):
+    """Reads chunks from the stream like a resumable upload."""
+
+    def __init__(self, stream, chunk_size):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.bytes_uploaded = 0
+        self.finished = False
+        self.chunks = []
+
+    def transmit_next_chunk(self, transport):
+        assert self.stream.tell() == self.bytes_uploaded
+        chunk = self.stream.read(self.chunk_size)
+        self.chunks.append(chunk)
+        self.bytes_uploaded += len(chunk)
+        self.finished = len(chunk) < self.chunk_size
+        response = mock.Mock(spec=['json'])
+        response.json.return_value = {
+            'name': 'blob-name', 'size': str(self.bytes_uploaded)}
+        return response
+
+
+class TestBlobWriter(unittest.TestCase):
+
+    CHUNK_SIZE = 256 * 1024
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobWriter
+
+        return BlobWriter
+
+    def _make_one(self, blob, **kw):
+        return self._get_target_class()(blob, **kw)
+
+    def _make_writer(self, **kw):
+        blob = _make_blob()
+        uploads = []
+
+        def initiate(client, stream, content_type, size, num_retries,
+                     chunk_size=None):
+            self.assertEqual(stream.tell(), 0)
+            self.assertIsNone(size)
+            uploads.append(_FakeUpload(stream, chunk_size))
+            return uploads[-1], mock.sentinel.transport
+
+        blob._initiate_resumable_upload = mock.Mock(
+            side_effect=initiate, spec=[])
+        blob._check_checksums = mock.Mock(spec=[])
+        writer = self._make_one(blob, chunk_size=self.CHUNK_SIZE, **kw)
+        return writer, uploads
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.fileio import DEFAULT_CHUNK_SIZE
+
+        writer = self._make_one(_make_blob())
+        self.assertEqual(writer.chunk_size, DEFAULT_CHUNK_SIZE)
+        self.assertIsNone(writer.content_type)
+        self.assertIsNone(writer.client)
+        self.assertTrue(writer.writable())
+        self.assertFalse(writer.readable())
+
+    def test_ctor_w_blob_chunk_size(self):
+        blob = _make_blob()
+        blob.chunk_size = 2 * self.CHUNK_SIZE
+        writer = self._make_one(blob)
+        self.assertEqual(writer.chunk_size, 2 * self.CHUNK_SIZE)
+
+    def test_ctor_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_make_blob(), chunk_size=1000)
+
+    def test_write_in_chunks(self):
+        data = os.urandom(self.CHUNK_SIZE * 2 + 10)
+        writer, uploads = self._make_writer(content_type=u'text/plain')
+        blob = writer.blob
+
+        writer.write(data[:10])
+        self.assertEqual(uploads, [])
+        writer.write(data[10:self.CHUNK_SIZE * 2 + 5])
+        upload, = uploads
+        self.assertEqual(len(upload.chunks), 2)
+        # Uploaded data is not kept.
+        self.assertEqual(len(writer._buffer._data), 5)
+        writer.write(data[self.CHUNK_SIZE * 2 + 5:])
+        self.assertEqual(writer.tell(), len(data))
+        writer.close()
+
+        self.assertTrue(writer.closed)
+        self.assertEqual(b''.join(upload.chunks), data)
+        self.assertEqual([len(chunk) for chunk in upload.chunks],
+                         [self.CHUNK_SIZE, self.CHUNK_SIZE, 10])
+        blob._initiate_resumable_upload.assert_called_once_with(
+            None, writer._buffer, u'text/plain', None, None,
+            chunk_size=self.CHUNK_SIZE)
+        self.assertEqual(blob.size, len(data))
+        checksums, md5_hash, crc32c, action = (
+            blob._check_checksums.call_args[0])
+        self.assertIs(checksums, writer._checksums)
+        self.assertEqual(action, 'uploading')
+
+    def test_write_exact_chunks(self):
+        data = b'x' * self.CHUNK_SIZE
+        writer, uploads = self._make_writer()
+        writer.write(data)
+        writer.close()
+
+        upload, = uploads
+        self.assertEqual(upload.chunks, [data, b''])
+
+    def test_close_small_upload(self):
+        from google.cloud.storage.blob import Blob
+
+        writer, uploads = self._make_writer(content_type=u'text/plain')
+        writer.write(b'abc')
+        writer.write(bytearray(b'def'))
+        with mock.patch.object(Blob, 'upload_from_file',
+                               autospec=True) as upload_from_file:
+            writer.close()
+            writer.close()  # No-op.
+
+        self.assertEqual(uploads, [])
+        blob, stream = upload_from_file.call_args[0]
+        self.assertIs(blob, writer.blob)
+        self.assertEqual(upload_from_file.call_args[1], {
+            'size': 6, 'content_type': u'text/plain', 'client': None})
+        stream.seek(0)
+        self.assertEqual(stream.read(), b'abcdef')
+
+    def test_write_w_invalid_response(self):
+        from six.moves import http_client
+        from google.cloud.exceptions import ServiceUnavailable
+        from google.resumable_media import InvalidResponse
+
+        writer, uploads = self._make_writer()
+        writer.write(b'x' * 10)
+        response = mock.Mock(
+            status_code=http_client.SERVICE_UNAVAILABLE, content=b'',
+            spec=['status_code', 'content'])
+        with mock.patch.object(_FakeUpload, 'transmit_next_chunk',
+                               side_effect=InvalidResponse(response)):
+            with self.assertRaises(ServiceUnavailable):
+                writer.write(b'x' * self.CHUNK_SIZE)
+
+    def test_context_manager(self):
+        from google.cloud.storage.blob import Blob
+
+        writer, _ = self._make_writer()
+        with mock.patch.object(Blob, 'upload_from_file',
+                               autospec=True) as upload_from_file:
+            with writer:
+                writer.write(b'abc')
+
+        self.assertTrue(writer.closed)
+        upload_from_file.assert_called_once()
+
+    def test_context_manager_w_error(self):
+        from google.cloud.storage.blob import Blob
+
+        writer, uploads = self._make_writer()
+        with mock.patch.object(Blob, 'upload_from_file',
+                               autospec=True) as upload_from_file:
+            with self.assertRaises(KeyError):
+                with writer:
+                    writer.write(b'partial')
+                    raise KeyError('failed')
+
+        self.assertTrue(writer.closed)
+        upload_from_file.assert_not_called()
+
+    def test_write_after_close(self):
+        writer, _ = self._make_writer()
+        with mock.patch('google.cloud.storage.blob.Blob.upload_from_file'):
+            writer.close()
+        with self.assertRaises(ValueError):
+            writer.write(b'late')
+
+
+class Test_ChunkBuffer(unittest.TestCase):
+
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage.fileio import _ChunkBuffer
+
+        return _ChunkBuffer()
+
+    def test_read_seek_and_discard(self):
+        buffer_ = self._make_one()
+        buffer_.write(b'abcdef')
+        self.assertEqual(buffer_.end, 6)
+        self.assertEqual(buffer_.read(4), b'abcd')
+        buffer_.discard_before(4)
+        self.assertEqual(buffer_.tell(), 4)
+        buffer_.write(b'gh')
+        self.assertEqual(buffer_.read(), b'efgh')
+        self.assertEqual(buffer_.seek(0, os.SEEK_END), 8)
+        self.assertEqual(buffer_.seek(5), 5)
+        self.assertEqual(buffer_.read(1), b'f')
+        with self.assertRaises(ValueError):
+            buffer_.seek(3)
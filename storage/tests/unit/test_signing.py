@@ -0,0 +1,194 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+_INFO = {
+    'client_email': 'service@example.com',
+    'private_key': '<not a key>',
+}
+
+
+def _make_signer():
+    signer = mock.Mock(spec=['sign'])
+    # Signatures whose base64 encoding has characters quoted in URLs.
+    signer.sign.side_effect = lambda message: b'\xfb\xff' + message.encode(
+        'utf-8')[:8]
+    return signer
+
+
+def _make_blob(name, bucket_name='my-bucket'):
+    from google.cloud.storage.blob import Blob
+
+    bucket = mock.Mock(path='/b/' + bucket_name, spec=['name', 'path'])
+    bucket.name = bucket_name
+    return Blob(name, bucket=bucket)
+
+
+class _FakePool(object):
+    """Run the work of a process pool in this process."""
+
+    def __init__(self, processes, initializer, initargs):
+        self.processes = processes
+        self.terminated = False
+        self.chunks = None
+        initializer(*initargs)
+
+    def map(self, func, iterable):
+        self.chunks = list(iterable)
+        return [func(chunk) for chunk in self.chunks]
+
+    def terminate(self):
+        self.terminated = True
+
+
+class TestSignedUrlGenerator(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.signing import SignedUrlGenerator
+
+        return SignedUrlGenerator
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _from_info(self, **kw):
+        from google.auth import crypt
+
+        signer = _make_signer()
+        with mock.patch.object(crypt.RSASigner, 'from_service_account_info',
+                               return_value=signer) as from_info:
+            generator = self._get_target_class().from_service_account_info(
+                _INFO, **kw)
+        from_info.assert_called_once_with(_INFO)
+        return generator
+
+    def test_ctor_defaults(self):
+        signer = _make_signer()
+        generator = self._make_one(signer, 'service@example.com')
+        self.assertIs(generator.signer, signer)
+        self.assertEqual(generator.signer_email, 'service@example.com')
+        self.assertEqual(generator.api_access_endpoint,
+                         'https://storage.googleapis.com')
+
+    def test_from_service_account_json(self):
+        import json
+        import os
+        import tempfile
+        from google.auth import crypt
+
+        fd, filename = tempfile.mkstemp()
+        self.addCleanup(os.remove, filename)
+        with os.fdopen(fd, 'w') as file_obj:
+            json.dump(_INFO, file_obj)
+
+        klass = self._get_target_class()
+        with mock.patch.object(crypt.RSASigner, 'from_service_account_info',
+                               return_value=_make_signer()):
+            generator = klass.from_service_account_json(
+                filename, api_access_endpoint='http://localhost')
+        self.assertEqual(generator.signer_email, 'service@example.com')
+        self.assertEqual(generator.api_access_endpoint, 'http://localhost')
+        self.assertEqual(generator._service_account_info, _INFO)
+
+    def test_from_credentials(self):
+        import google.auth.credentials
+
+        credentials = mock.Mock(
+            signer=_make_signer(), signer_email='service@example.com',
+            spec=google.auth.credentials.Signing)
+        generator = self._get_target_class().from_credentials(credentials)
+        self.assertIs(generator.signer, credentials.signer)
+        self.assertIsNone(generator._service_account_info)
+
+    def test_from_credentials_wo_signing(self):
+        with self.assertRaises(AttributeError):
+            self._get_target_class().from_credentials(object())
+
+    def test_sign_matches_generate_signed_url(self):
+        import google.auth.credentials
+        from google.cloud.credentials import generate_signed_url
+
+        generator = self._from_info()
+        credentials = mock.Mock(
+            signer_email='service@example.com',
+            spec=google.auth.credentials.Signing)
+        credentials.sign_bytes.side_effect = generator.signer.sign
+        blob = _make_blob(u'p\xe9ch\xe9s/a b.txt')
+        optional = {
+            'content_md5': 'bWQ1', 'content_type': 'text/plain',
+            'response_type': 'text/html',
+            'response_disposition': 'attachment; filename=a.txt',
+            'generation': '12345',
+        }
+
+        for kw in ({}, optional):
+            url = generator.sign(blob, 1000, method='PUT', **kw)
+            expected = generate_signed_url(
+                credentials, u'/my-bucket/p%C3%A9ch%C3%A9s%2Fa%20b.txt', 1000,
+                api_access_endpoint='https://storage.googleapis.com',
+                method='PUT', **kw)
+            self.assertEqual(url, expected)
+
+    def test_sign_w_timedelta(self):
+        import datetime
+
+        generator = self._make_one(_make_signer(), 'service@example.com')
+        now = datetime.datetime(2017, 1, 1)
+        with mock.patch('google.cloud.credentials._NOW', return_value=now):
+            url = generator.sign(_make_blob('a'), datetime.timedelta(hours=1))
+        self.assertIn('&Expires=1483232400&', url)
+
+    def test_sign_many(self):
+        generator = self._make_one(_make_signer(), 'service@example.com')
+        blobs = [_make_blob('a'), _make_blob('b')]
+        urls = generator.sign_many([
+            (blobs[0], 'GET', 1000), (blobs[1], 'DELETE', 2000)])
+        self.assertEqual(urls, [
+            generator.sign(blobs[0], 1000),
+            generator.sign(blobs[1], 2000, method='DELETE'),
+        ])
+
+    def test_sign_many_w_processes(self):
+        generator = self._from_info(api_access_endpoint='http://localhost')
+        requests = [(_make_blob(str(index)), 'GET', 1000 + index)
+                    for index in range(10)]
+        pools = []
+
+        def make_pool(processes, initializer, initargs):
+            pools.append(_FakePool(processes, initializer, initargs))
+            return pools[-1]
+
+        with mock.patch('multiprocessing.Pool', side_effect=make_pool):
+            with mock.patch('google.auth.crypt.RSASigner.'
+                            'from_service_account_info',
+                            return_value=_make_signer()):
+                urls = generator.sign_many(requests, processes=2)
+
+        self.assertEqual(urls, generator.sign_many(requests))
+        self.assertTrue(urls[0].startswith('http://localhost/my-bucket/0?'))
+        pool, = pools
+        self.assertEqual(pool.processes, 2)
+        self.assertEqual([len(chunk) for chunk in pool.chunks],
+                         [2, 2, 2, 2, 2])
+        self.assertTrue(pool.terminated)
+
+    def test_sign_many_w_processes_wo_key(self):
+        generator = self._make_one(_make_signer(), 'service@example.com')
+        with self.assertRaises(ValueError):
+            generator.sign_many([(_make_blob('a'), 'GET', 1000)], processes=2)
@@ -0,0 +1,501 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+def _make_blob(name, data=None, mtime=None, **properties):
+    import base64
+    import hashlib
+    from google.cloud.storage.blob import Blob
+
+    blob = Blob(name, bucket=mock.Mock(path='/b/name', spec=['path']))
+    if data is not None:
+        properties['size'] = str(len(data))
+        properties['md5Hash'] = base64.b64encode(
+            hashlib.md5(data).digest()).decode('ascii')
+    if mtime is not None:
+        properties['metadata'] = {'goog-reserved-file-mtime': str(mtime)}
+    blob._set_properties(dict(properties, name=name))
+    return blob
+
+
+class _TempDirMixin(object):
+
+    def setUp(self):
+        self.local_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.local_dir)
+
+    def _write_file(self, relative, data, mtime=None):
+        filename = os.path.join(self.local_dir, *relative.split('/'))
+        dirname = os.path.dirname(filename)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        with open(filename, 'wb') as file_obj:
+            file_obj.write(data)
+        if mtime is not None:
+            os.utime(filename, (mtime, mtime))
+        return filename
+
+
+class Test__list_local(_TempDirMixin, unittest.TestCase):
+
+    def _call_fut(self, local_dir):
+        from google.cloud.storage.transfer_manager import _list_local
+
+        return _list_local(local_dir)
+
+    def test_it(self):
+        self._write_file('a.txt', b'abc')
+        self._write_file('sub/dir/b.txt', b'de')
+        self._write_file('big.bin.gcs-upload-state', b'{}')
+
+        files = self._call_fut(self.local_dir)
+        self.assertEqual(sorted(files), ['a.txt', 'sub/dir/b.txt'])
+        self.assertEqual(files['sub/dir/b.txt'].st_size, 2)
+
+
+class Test__list_remote(unittest.TestCase):
+
+    def _call_fut(self, bucket, prefix, client):
+        from google.cloud.storage.transfer_manager import _list_remote
+
+        return _list_remote(bucket, prefix, client)
+
+    def test_it(self):
+        from google.cloud.storage.transfer_manager import _LIST_FIELDS
+
+        blobs = [_make_blob(name) for name in (
+            'photos/', 'photos/a.jpg', 'photos/2017/', 'photos/2017/b.jpg')]
+        bucket = mock.Mock(spec=['list_blobs'])
+        bucket.list_blobs.return_value = iter(blobs)
+        client = object()
+
+        found = self._call_fut(bucket, 'photos/', client)
+        self.assertEqual(found, {'a.jpg': blobs[1], '2017/b.jpg': blobs[3]})
+        bucket.list_blobs.assert_called_once_with(
+            prefix='photos/', fields=_LIST_FIELDS, client=client)
+
+    def test_wo_prefix(self):
+        blob = _make_blob('a.jpg')
+        bucket = mock.Mock(spec=['list_blobs'])
+        bucket.list_blobs.return_value = iter([blob])
+
+        self.assertEqual(self._call_fut(bucket, '', None), {'a.jpg': blob})
+        self.assertIsNone(bucket.list_blobs.call_args[1]['prefix'])
+
+
+class Test__blob_mtime(unittest.TestCase):
+
+    def _call_fut(self, blob):
+        from google.cloud.storage.transfer_manager import _blob_mtime
+
+        return _blob_mtime(blob)
+
+    def test_wo_metadata(self):
+        self.assertIsNone(self._call_fut(_make_blob('a')))
+
+    def test_w_mtime(self):
+        self.assertEqual(self._call_fut(_make_blob('a', mtime='123.5')), 123)
+
+    def test_w_invalid_mtime(self):
+        self.assertIsNone(self._call_fut(_make_blob('a', mtime='never')))
+
+
+class Test__needs_transfer(_TempDirMixin, unittest.TestCase):
+
+    def _call_fut(self, filename, blob):
+        from google.cloud.storage.transfer_manager import _needs_transfer
+
+        return _needs_transfer(filename, os.stat(filename), blob)
+
+    def test_different_size(self):
+        filename = self._write_file('a', b'abc', mtime=1000)
+        blob = _make_blob('a', b'abcd', mtime=1000)
+        self.assertTrue(self._call_fut(filename, blob))
+
+    def test_same_mtime(self):
+        filename = self._write_file('a', b'abc', mtime=1000)
+        # Not hashed, so different contents of the same size go unnoticed.
+        blob = _make_blob('a', b'xyz', mtime=1000)
+        self.assertFalse(self._call_fut(filename, blob))
+
+    def test_different_mtime_same_md5(self):
+        filename = self._write_file('a', b'abc', mtime=1000)
+        blob = _make_blob('a', b'abc', mtime=2000)
+        self.assertFalse(self._call_fut(filename, blob))
+
+    def test_wo_mtime_different_md5(self):
+        filename = self._write_file('a', b'abc', mtime=1000)
+        blob = _make_blob('a', b'xyz')
+        self.assertTrue(self._call_fut(filename, blob))
+
+    def test_w_crc32c(self):
+        filename = self._write_file('a', b'abc')
+        blob = _make_blob('a', size='3', crc32c='Nks/tw==')
+        self.assertFalse(self._call_fut(filename, blob))
+
+    def test_wo_checksums(self):
+        filename = self._write_file('a', b'abc')
+        blob = _make_blob('a', size='3')
+        self.assertTrue(self._call_fut(filename, blob))
+
+
+class Test_sync(_TempDirMixin, unittest.TestCase):
+
+    def _call_fut(self, *args, **kw):
+        from google.cloud.storage.transfer_manager import sync
+
+        return sync(*args, **kw)
+
+    @staticmethod
+    def _make_bucket(*blobs):
+        from google.cloud.storage.bucket import Bucket
+
+        client = mock.Mock(_http=object(), spec=['_http'])
+        bucket = Bucket(client=client, name='name')
+        bucket.list_blobs = mock.Mock(return_value=iter(blobs), spec=[])
+        return bucket
+
+    def test_invalid_direction(self):
+        with self.assertRaises(ValueError):
+            self._call_fut(self.local_dir, self._make_bucket(),
+                           direction='sideways')
+
+    def test_upload(self):
+        from google.cloud.storage.blob import Blob
+
+        self._write_file('same.txt', b'same', mtime=1000)
+        self._write_file('changed.txt', b'new contents', mtime=2000)
+        self._write_file('dir/new.bin', b'\x00' * 10, mtime=3000)
+        bucket = self._make_bucket(
+            _make_blob('pre/same.txt', b'same', mtime=1000),
+            _make_blob('pre/changed.txt', b'old', mtime=1000))
+        client = mock.Mock(_http=object(), spec=['_http'])
+
+        uploaded = []
+
+        def upload_from_filename(blob, filename, client=None,
+                                 parallelism=None):
+            uploaded.append(
+                (blob.name, filename, dict(blob.metadata), parallelism))
+
+        with mock.patch.object(Blob, 'upload_from_filename', autospec=True,
+                               side_effect=upload_from_filename):
+            result = self._call_fut(
+                self.local_dir, bucket, prefix='pre/', client=client,
+                max_workers=2, parallel_threshold=10, parallelism=3)
+
+        self.assertEqual(result.transferred, ['changed.txt', 'dir/new.bin'])
+        self.assertEqual(result.deleted, [])
+        self.assertEqual(sorted(uploaded), [
+            ('pre/changed.txt', os.path.join(self.local_dir, 'changed.txt'),
+             {'goog-reserved-file-mtime': '2000'}, 3),
+            ('pre/dir/new.bin', os.path.join(self.local_dir, 'dir', 'new.bin'),
+             {'goog-reserved-file-mtime': '3000'}, 3),
+        ])
+
+    def test_upload_small_files_not_in_parts(self):
+        from google.cloud.storage.blob import Blob
+
+        self._write_file('a.txt', b'abc')
+        bucket = self._make_bucket()
+
+        with mock.patch.object(Blob, 'upload_from_filename',
+                               autospec=True) as upload:
+            self._call_fut(self.local_dir, bucket)
+
+        blob, filename = upload.call_args[0]
+        self.assertEqual(blob.name, 'a.txt')
+        self.assertIsNone(upload.call_args[1]['parallelism'])
+
+    def test_upload_w_delete(self):
+        from google.cloud.exceptions import NotFound
+
+        bucket = self._make_bucket(
+            _make_blob('gone.txt', b'x'), _make_blob('also-gone.txt', b'x'))
+        bucket.bulk_delete = mock.Mock(
+            return_value=[None, NotFound('gone')], spec=[])
+
+        result = self._call_fut(self.local_dir, bucket, delete=True)
+        self.assertEqual(result.transferred, [])
+        self.assertEqual(result.deleted, ['also-gone.txt', 'gone.txt'])
+        blobs = bucket.bulk_delete.call_args[0][0]
+        self.assertEqual([blob.name for blob in blobs],
+                         ['also-gone.txt', 'gone.txt'])
+
+    def test_upload_w_delete_error(self):
+        from google.cloud.exceptions import Forbidden
+
+        bucket = self._make_bucket(_make_blob('gone.txt', b'x'))
+        error = Forbidden('nope')
+        bucket.bulk_delete = mock.Mock(return_value=[error], spec=[])
+
+        with self.assertRaises(Forbidden):
+            self._call_fut(self.local_dir, bucket, delete=True)
+
+    def test_download(self):
+        from google.cloud.storage.blob import Blob
+
+        self._write_file('same.txt', b'same', mtime=1000)
+        self._write_file('extra.txt', b'extra')
+        bucket = self._make_bucket(
+            _make_blob('same.txt', b'same', mtime=1000),
+            _make_blob('sub/new.txt', b'new', mtime=5000),
+            _make_blob('big.bin', b'\x00' * 20))
+
+        def download_to_filename(blob, filename, client=None,
+                                 parallelism=None):
+            with open(filename, 'wb') as file_obj:
+                file_obj.write(b'\x00' * blob.size)
+
+        with mock.patch.object(Blob, 'download_to_filename', autospec=True,
+                               side_effect=download_to_filename) as download:
+            result = self._call_fut(
+                self.local_dir, bucket, direction='download', delete=True,
+                parallel_threshold=10)
+
+        self.assertEqual(result.transferred, ['big.bin', 'sub/new.txt'])
+        self.assertEqual(result.deleted, ['extra.txt'])
+        self.assertEqual(
+            sorted(self._list()), ['big.bin', 'same.txt', 'sub/new.txt'])
+        new_filename = os.path.join(self.local_dir, 'sub', 'new.txt')
+        self.assertEqual(os.stat(new_filename).st_mtime, 5000)
+        parallelisms = sorted(
+            (call[0][0].name, call[1]['parallelism'])
+            for call in download.call_args_list)
+        self.assertEqual(parallelisms, [('big.bin', 4), ('sub/new.txt', None)])
+
+    def test_download_w_hostile_name(self):
+        from google.cloud.storage.blob import Blob
+
+        bucket = self._make_bucket(
+            _make_blob('ok.txt', b'ok'),
+            _make_blob('../escape.txt', b'escape'))
+
+        with mock.patch.object(Blob, 'download_to_filename',
+                               autospec=True) as download:
+            with self.assertRaises(ValueError):
+                self._call_fut(self.local_dir, bucket, direction='download')
+
+        download.assert_not_called()
+        self.assertEqual(self._list(), {})
+
+    def test_download_w_file_in_the_way(self):
+        from google.cloud.storage.blob import Blob
+
+        self._write_file('sub', b'file')
+        bucket = self._make_bucket(_make_blob('sub/new.txt', b'new'))
+
+        with mock.patch.object(Blob, 'download_to_filename',
+                               autospec=True) as download:
+            with self.assertRaises(OSError):
+                self._call_fut(self.local_dir, bucket, direction='download')
+
+        download.assert_not_called()
+
+    def test_default_max_workers(self):
+        from google.cloud.storage.blob import _call_concurrently
+        from google.cloud.storage.transfer_manager import DEFAULT_MAX_WORKERS
+
+        with mock.patch('google.cloud.storage.transfer_manager.'
+                        '_call_concurrently',
+                        wraps=_call_concurrently) as call_concurrently:
+            self._call_fut(self.local_dir, self._make_bucket())
+
+        self.assertEqual(call_concurrently.call_args[0][1],
+                         DEFAULT_MAX_WORKERS)
+
+    def _concurrent_uploads_helper(self, http, parallel_threshold):
+        import threading
+        from google.cloud.storage.blob import Blob
+
+        for name in ('a.txt', 'b.txt', 'c.txt'):
+            self._write_file(name, b'data')
+        bucket = self._make_bucket()
+        bucket.client._http = http
+        lock = threading.Lock()
+        active = [0]
+        overlapped = threading.Event()
+
+        def upload_from_filename(blob, filename, client=None,
+                                 parallelism=None):
+            with lock:
+                active[0] += 1
+                if active[0] > 1:
+                    overlapped.set()
+            overlapped.wait(0.1)
+            with lock:
+                active[0] -= 1
+
+        with mock.patch.object(Blob, 'upload_from_filename', autospec=True,
+                               side_effect=upload_from_filename):
+            self._call_fut(self.local_dir, bucket,
+                           parallel_threshold=parallel_threshold)
+        return overlapped.is_set()
+
+    def test_default_uploads_concurrently(self):
+        self.assertTrue(self._concurrent_uploads_helper(object(), 10))
+
+    def test_uploads_in_parts_one_at_a_time_wo_pooled_http(self):
+        self.assertFalse(self._concurrent_uploads_helper(object(), 1))
+
+    def test_uploads_in_parts_concurrently_w_pooled_http(self):
+        from google.cloud._http import PooledHttp
+
+        self.assertTrue(
+            self._concurrent_uploads_helper(PooledHttp(object, size=2), 1))
+
+    def _list(self):
+        from google.cloud.storage.transfer_manager import _list_local
+
+        return _list_local(self.local_dir)
+
+
+class Test_copy_many(unittest.TestCase):
+
+    def _call_fut(self, *args, **kw):
+        from google.cloud.storage.transfer_manager import copy_many
+
+        return copy_many(*args, **kw)
+
+    @staticmethod
+    def _make_pair(name, client=None):
+        from google.cloud.storage.blob import Blob
+
+        source = _make_blob(name)
+        bucket = mock.Mock(path='/b/dest', client=client,
+                           spec=['path', 'client'])
+        return source, Blob(name, bucket=bucket)
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut([]), [])
+
+    def test_invalid_storage_class(self):
+        with self.assertRaises(ValueError):
+            self._call_fut([self._make_pair('a')], storage_class='WARM')
+
+    def test_it(self):
+        import threading
+        from google.cloud._http import PooledHttp
+        from google.cloud.exceptions import Forbidden
+        from google.cloud.storage.blob import Blob
+
+        pairs = [self._make_pair(name) for name in ('big', 'small', 'denied')]
+        sources = {source.name: source for source, _ in pairs}
+        client = mock.Mock(_http=PooledHttp(object, size=3), spec=['_http'])
+        progress = []
+        lock = threading.Lock()
+
+        def rewrite(destination, source, token=None, client=None):
+            self.assertIs(source, sources[destination.name])
+            self.assertEqual(destination.storage_class, 'COLDLINE')
+            if destination.name == 'denied':
+                raise Forbidden('nope')
+            if destination.name == 'big' and token != 'second':
+                return ('first' if token is None else 'second',
+                        (2 if token else 1) * 10, 30)
+            return None, 30, 30
+
+        def progress_callback(source, destination, rewritten, total):
+            with lock:
+                progress.append((destination.name, rewritten, total))
+
+        with mock.patch.object(Blob, 'rewrite', autospec=True,
+                               side_effect=rewrite) as mocked:
+            results = self._call_fut(
+                pairs, max_workers=3, client=client, storage_class='COLDLINE',
+                progress_callback=progress_callback)
+
+        self.assertIs(results[0], pairs[0][1])
+        self.assertIs(results[1], pairs[1][1])
+        self.assertIsInstance(results[2], Forbidden)
+        self.assertEqual(
+            [(name, rewritten) for name, rewritten, _ in progress
+             if name == 'big'],
+            [('big', 10), ('big', 20), ('big', 30)])
+        self.assertIn(('small', 30, 30), progress)
+        self.assertEqual(mocked.call_count, 5)
+        for call in mocked.call_args_list:
+            self.assertIs(call[1]['client'], client)
+
+    def test_w_default_max_workers(self):
+        from google.cloud._http import PooledHttp
+        from google.cloud.storage.blob import Blob
+        from google.cloud.storage.blob import _call_concurrently
+
+        client = mock.Mock(_http=PooledHttp(object, size=3), spec=['_http'])
+        pairs = [self._make_pair(str(index), client=client)
+                 for index in range(2)]
+
+        with mock.patch.object(Blob, 'rewrite', autospec=True,
+                               return_value=(None, 0, 0)):
+            with mock.patch('google.cloud.storage.transfer_manager.'
+                            '_call_concurrently',
+                            wraps=_call_concurrently) as call_concurrently:
+                results = self._call_fut(pairs)
+
+        self.assertEqual(results, [pair[1] for pair in pairs])
+        self.assertEqual(call_concurrently.call_args[0][1], 3)
+
+    def test_w_max_workers_wo_pooled_http(self):
+        from google.cloud.storage.blob import Blob
+
+        client = mock.Mock(_http=object(), spec=['_http'])
+        pairs = [self._make_pair(str(index), client=client)
+                 for index in range(2)]
+
+        with mock.patch.object(Blob, 'rewrite', autospec=True) as rewrite:
+            with self.assertRaises(ValueError):
+                self._call_fut(pairs, max_workers=16)
+
+        rewrite.assert_not_called()
+
+    def test_w_default_max_workers_wo_pooled_http(self):
+        from google.cloud.storage.blob import Blob
+
+        client = mock.Mock(_http=object(), spec=['_http'])
+        pairs = [self._make_pair(str(index), client=client)
+                 for index in range(2)]
+
+        with mock.patch.object(Blob, 'rewrite', autospec=True,
+                               return_value=(None, 0, 0)):
+            results = self._call_fut(pairs)
+
+        self.assertEqual(results, [pair[1] for pair in pairs])
+
+    def test_w_transport_error(self):
+        import socket
+        from google.cloud.storage.blob import Blob
+
+        client = mock.Mock(_http=object(), spec=['_http'])
+        pairs = [self._make_pair(name, client=client)
+                 for name in ('broken', 'ok')]
+        error = socket.error('connection reset')
+
+        def rewrite(destination, source, token=None, client=None):
+            if destination.name == 'broken':
+                raise error
+            return None, 0, 0
+
+        with mock.patch.object(Blob, 'rewrite', autospec=True,
+                               side_effect=rewrite):
+            results = self._call_fut(pairs)
+
+        self.assertEqual(results, [error, pairs[1][1]])